@@ -0,0 +1,839 @@
+#!/usr/bin/env python3
+"""
+Pre-bake the glyphs of a compiled font into packed atlas pages.
+
+NanoVG (through fontstash) rasterizes an icon the first time it is drawn at a
+given size, which shows up as a hitch when a screen full of new icons opens.
+This script rasterizes every glyph of ``compiled_fonts/<font>/<font>.ttf`` ahead of
+time at a set of pixel sizes, packs the bitmaps into PNG pages with a skyline
+bin packer, and writes a JSON metrics table (page, rectangle, UVs, bearings and
+advance of every glyph at every size) for an application to preload.
+
+The pages are 8-bit grayscale coverage, the same single channel alpha texture
+fontstash uploads, and sizes are interpreted the way fontstash interprets
+``nvgFontSize``: the distance between the ``hhea`` ascent and descent.  With
+``--mode sdf`` the pages hold signed distance fields at a single size instead,
+one small texture a shader can draw at any size.  The outlines are read with
+:class:`ttf.TrueTypeFont` and rasterized with NumPy, so neither FreeType nor an
+imaging library is needed.
+
+Example::
+
+    ./atlas.py --font-name fontawesome --sizes 16,24,32
+    ./atlas.py --font-name fontawesome --mode sdf --benchmark
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import math
+import os
+import re
+import struct
+import sys
+import time
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # only needed to rasterize, reported by build_atlas
+    np = None
+
+import generate
+import ttf
+
+
+class AtlasError(Exception):
+    """Raised by :func:`build_atlas` when the atlas cannot be built."""
+
+
+DEFAULT_SIZES = (16, 24, 32, 48)
+DEFAULT_PAGE_SIZE = 1024
+
+# Samples per pixel along each axis, the coverage of a pixel is the fraction of
+# its SUPERSAMPLE x SUPERSAMPLE samples inside the outline.
+SUPERSAMPLE = 4
+
+# Empty pixels around every glyph on a page, so linear filtering does not bleed
+# a neighbour in.
+PADDING = 1
+
+# Maximum distance (in samples) between a flattened curve and the true curve.
+FLATTEN_TOLERANCE = 0.2
+
+# What the pages hold: the antialiased ``coverage`` of every glyph at every size,
+# or the signed distance field (``sdf``) of every glyph at a single size, which
+# a shader can threshold at any scale.
+MODES = ("coverage", "sdf")
+
+# Size the distance fields are computed at, and how far (in pixels at that
+# size) they extend on either side of the outline.
+DEFAULT_SDF_SIZE = 24
+DEFAULT_SPREAD = 4
+
+# Upper bound on glyphs x pixels x edges of one vectorized distance field batch.
+# Batches whose temporaries stay in the CPU cache are faster than larger ones:
+# 1 << 16 renders about 3x as many glyphs per second as 1 << 21.
+BATCH_ELEMENTS = 1 << 16
+
+# Coordinate of the edges padding a batch, far outside any glyph.
+FAR = 1e6
+
+# Version of the metrics file layout, bump when ``METRICS_FIELDS`` changes.
+METRICS_VERSION = 1
+
+# The columns of every row of ``glyphs`` in the metrics file.
+METRICS_FIELDS = (
+    "name", "codepoint", "size", "page", "x", "y", "width", "height",
+    "u0", "v0", "u1", "v1", "bearing_x", "bearing_y", "advance"
+)
+
+
+########################################################################################
+# Rasterization                                                                        #
+########################################################################################
+def _contour_curves(contour):
+    """
+    Yield the segments of a TrueType ``contour`` as ``(start, control, end)``
+    points, ``control`` is ``None`` for straight lines.  The on-curve points
+    implied between two consecutive off-curve points are made explicit.
+    """
+    points = []
+    for i, (x, y, on_curve) in enumerate(contour):
+        points.append((x, y, on_curve))
+        nx, ny, next_on_curve = contour[(i + 1) % len(contour)]
+        if not on_curve and not next_on_curve:
+            points.append(((x + nx) / 2.0, (y + ny) / 2.0, True))
+
+    start = next(i for i, point in enumerate(points) if point[2])
+    points = points[start:] + points[:start + 1]
+
+    current = points[0][:2]
+    control = None
+    for x, y, on_curve in points[1:]:
+        if not on_curve:
+            control = (x, y)
+            continue
+        yield current, control, (x, y)
+        current = (x, y)
+        control = None
+
+
+def glyph_edges(contours, scale, left, top, supersample=SUPERSAMPLE):
+    """
+    Flatten ``contours`` (font units, y up) into a NumPy ``(N, 4)`` array of line
+    segments ``x0, y0, x1, y1`` in sample coordinates (y down) of a bitmap whose
+    top left corner is the pixel ``(left, top)``, with ``scale`` pixels per font
+    unit.
+    """
+    factor = scale * supersample
+    edges = []
+    for contour in contours:
+        if not contour:
+            continue
+        for p0, control, p1 in _contour_curves(contour):
+            if control is None:
+                edges.append((p0[0], p0[1], p1[0], p1[1]))
+                continue
+            # The chord of a quadratic segment is at most |p0 - 2c + p1| / 8 away
+            # from the curve, split until that is below the tolerance.
+            dx = p0[0] - 2 * control[0] + p1[0]
+            dy = p0[1] - 2 * control[1] + p1[1]
+            count = max(int(math.ceil(math.sqrt(
+                math.hypot(dx, dy) * factor / (8.0 * FLATTEN_TOLERANCE)
+            ))), 1)
+            previous = p0
+            for step in range(1, count + 1):
+                t = step / float(count)
+                mt = 1.0 - t
+                point = (
+                    mt * mt * p0[0] + 2 * mt * t * control[0] + t * t * p1[0],
+                    mt * mt * p0[1] + 2 * mt * t * control[1] + t * t * p1[1]
+                )
+                edges.append((previous[0], previous[1], point[0], point[1]))
+                previous = point
+
+    edges = np.array(edges, dtype=np.float64).reshape(-1, 4)
+    edges[:, 0::2] = edges[:, 0::2] * factor - left * supersample
+    edges[:, 1::2] = -edges[:, 1::2] * factor - top * supersample
+    return edges
+
+
+def rasterize(edges, width, height, supersample=SUPERSAMPLE):
+    """
+    Return the ``(height, width)`` ``uint8`` coverage of the outline made of
+    ``edges`` (see :func:`glyph_edges`), filled with the non-zero winding rule
+    TrueType uses.
+
+    Every edge is intersected with every sample row at once; each crossing adds
+    the direction of its edge to the first sample right of it, and a running sum
+    along the row is the winding number of every sample.
+    """
+    rows = height * supersample
+    columns = width * supersample
+    edges = edges[edges[:, 1] != edges[:, 3]]  # horizontal edges never cross a row
+    x0, y0, x1, y1 = edges.T
+
+    # Half open [low, high) so a row through a vertex is crossed exactly once
+    ys = np.arange(rows) + 0.5
+    low = np.minimum(y0, y1)
+    high = np.maximum(y0, y1)
+    edge, row = np.nonzero((ys >= low[:, None]) & (ys < high[:, None]))
+
+    t = (ys[row] - y0[edge]) / (y1[edge] - y0[edge])
+    crossing = x0[edge] + t * (x1[edge] - x0[edge])
+    column = np.clip(np.floor(crossing - 0.5) + 1, 0, columns).astype(np.intp)
+    direction = np.where(y1[edge] > y0[edge], 1, -1)
+
+    winding = np.bincount(
+        row * (columns + 1) + column, weights=direction, minlength=rows * (columns + 1)
+    ).reshape(rows, columns + 1)[:, :columns].cumsum(axis=1)
+    inside = (winding != 0).reshape(height, supersample, width, supersample)
+    samples = supersample * supersample
+    coverage = inside.sum(axis=(1, 3), dtype=np.int32)
+    return ((coverage * 255 + samples // 2) // samples).astype(np.uint8)
+
+
+def glyph_box(contours, scale):
+    """
+    Return the pixel box ``(left, top, right, bottom)`` (y down, relative to the
+    pen position on the baseline) covering ``contours`` at ``scale``.
+    """
+    xs = [x for contour in contours for x, _, _ in contour]
+    ys = [y for contour in contours for _, y, _ in contour]
+    if not xs:
+        return 0, 0, 0, 0
+    return (int(math.floor(min(xs) * scale)), int(math.floor(-max(ys) * scale)),
+            int(math.ceil(max(xs) * scale)), int(math.ceil(-min(ys) * scale)))
+
+
+def _rasterize_glyphs(job):
+    """
+    Rasterize one chunk of glyphs at every size, run in a worker process.
+
+    ``job`` is ``(scales, supersample, [(index, contours), ...])``, with ``scales``
+    as ``[(size, scale), ...]``.  Returns ``[(index, size, left, top, bitmap), ...]``.
+    """
+    scales, supersample, glyphs = job
+    bitmaps = []
+    for index, contours in glyphs:
+        for size, scale in scales:
+            left, top, right, bottom = glyph_box(contours, scale)
+            if right == left or bottom == top:
+                bitmap = np.zeros((0, 0), dtype=np.uint8)
+            else:
+                edges = glyph_edges(contours, scale, left, top, supersample)
+                bitmap = rasterize(edges, right - left, bottom - top, supersample)
+            bitmaps.append((index, size, left, top, bitmap))
+    return bitmaps
+
+
+def distance_fields(batch, spread):
+    """
+    Return the signed distance field of every ``(edges, width, height)`` outline
+    in ``batch`` (edges as from :func:`glyph_edges` with ``supersample=1``) as
+    ``(height, width)`` ``uint8`` arrays: ``128`` on the outline, growing inside
+    and shrinking outside until ``255`` / ``0`` at ``spread`` pixels away.
+
+    The whole batch is one vectorized computation over a ``(glyphs, pixels,
+    edges)`` array, shorter glyphs being padded with far away, horizontal edges
+    and unused pixels; keep ``glyphs x pixels x edges`` near
+    :data:`BATCH_ELEMENTS`.  The sign is the non-zero winding number of every
+    pixel center, counted along a ray to the right through the same edges.
+    """
+    max_edges = max(len(edges) for edges, _, _ in batch)
+    max_pixels = max(width * height for _, width, height in batch)
+    segments = np.full((len(batch), max_edges, 4), FAR, dtype=np.float32)
+    points = np.zeros((len(batch), max_pixels, 2), dtype=np.float32)
+    for i, (edges, width, height) in enumerate(batch):
+        segments[i, :len(edges)] = edges
+        ys, xs = np.divmod(np.arange(width * height), width)
+        points[i, :width * height, 0] = xs + 0.5
+        points[i, :width * height, 1] = ys + 0.5
+
+    # (glyphs, 1, edges) against (glyphs, pixels, 1)
+    x0, y0, x1, y1 = (segments[:, None, :, i] for i in range(4))
+    px = points[:, :, 0, None]
+    py = points[:, :, 1, None]
+    dx = x1 - x0
+    dy = y1 - y0
+
+    # Distance to the closest point of every segment
+    t = np.clip(((px - x0) * dx + (py - y0) * dy) / np.maximum(dx * dx + dy * dy, 1e-12), 0, 1)
+    ex = px - x0 - t * dx
+    ey = py - y0 - t * dy
+    distance = np.sqrt((ex * ex + ey * ey).min(axis=2))
+
+    # Half open in y, so a ray through a vertex crosses exactly one of its edges
+    crosses = (y0 <= py) != (y1 <= py)
+    crossing = x0 + (py - y0) * dx / np.where(dy == 0, 1, dy)
+    winding = np.where(crosses & (crossing > px), np.sign(dy), 0).sum(axis=2)
+
+    signed = np.where(winding != 0, distance, -distance)
+    values = np.clip(np.rint(127.5 + signed * 127.5 / spread), 0, 255).astype(np.uint8)
+    return [
+        values[i, :width * height].reshape(height, width)
+        for i, (_, width, height) in enumerate(batch)
+    ]
+
+
+def _distance_glyphs(job):
+    """
+    Compute the distance fields of one chunk of glyphs, run in a worker process.
+
+    ``job`` is ``(size, scale, spread, [(index, contours), ...])``, the result is
+    as for :func:`_rasterize_glyphs`.  Glyphs of similar cost are batched
+    together for :func:`distance_fields`, so little work goes to padding.
+    """
+    size, scale, spread, glyphs = job
+    bitmaps = []
+    pending = []
+    for index, contours in glyphs:
+        left, top, right, bottom = glyph_box(contours, scale)
+        if right == left or bottom == top:
+            bitmaps.append((index, size, 0, 0, np.zeros((0, 0), dtype=np.uint8)))
+            continue
+        # The field extends ``spread`` pixels past the outline on every side
+        left, top = left - spread, top - spread
+        width, height = right + spread - left, bottom + spread - top
+        pending.append((index, left, top, glyph_edges(contours, scale, left, top, 1),
+                        width, height))
+
+    pending.sort(key=lambda glyph: (glyph[4] * glyph[5], len(glyph[3])))
+    start = 0
+    while start < len(pending):
+        # Costs only grow along ``pending``, so the last glyph of a batch is its widest
+        end = start + 1
+        while end < len(pending):
+            cost = (end + 1 - start) * pending[end][4] * pending[end][5] * max(
+                len(glyph[3]) for glyph in pending[start:end + 1]
+            )
+            if cost > BATCH_ELEMENTS:
+                break
+            end += 1
+        batch = pending[start:end]
+        fields = distance_fields([(edges, width, height) for _, _, _, edges, width, height in batch],
+                                 spread)
+        for (index, left, top, _, _, _), field in zip(batch, fields):
+            bitmaps.append((index, size, left, top, field))
+        start = end
+    return bitmaps
+
+
+########################################################################################
+# Packing                                                                              #
+########################################################################################
+class SkylinePacker(object):
+    """
+    Bottom-left skyline bin packer for one ``width`` x ``height`` page.
+
+    The skyline is the upper outline of everything placed so far, as a list of
+    ``[x, y, width]`` segments (y grows downwards).  A rectangle goes where it
+    ends up highest (lowest ``y + height``), ties broken by the least wasted
+    area under it and then the leftmost position.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.skyline = [[0, 0, width]]
+
+    def _fit(self, i, width, height):
+        """Return the ``(y, waste)`` of a ``width`` x ``height`` rectangle at segment ``i``."""
+        x = self.skyline[i][0]
+        if x + width > self.width:
+            return None
+        y = 0
+        remaining = width
+        for sx, sy, sw in self.skyline[i:]:
+            if remaining <= 0:
+                break
+            y = max(y, sy)
+            remaining -= sw
+        if y + height > self.height:
+            return None
+
+        waste = 0
+        remaining = width
+        for sx, sy, sw in self.skyline[i:]:
+            if remaining <= 0:
+                break
+            waste += (y - sy) * min(sw, remaining)
+            remaining -= sw
+        return y, waste
+
+    def insert(self, width, height):
+        """Place a ``width`` x ``height`` rectangle, return its ``(x, y)`` or ``None`` if full."""
+        best = None
+        for i in range(len(self.skyline)):
+            fit = self._fit(i, width, height)
+            if fit is None:
+                continue
+            key = (fit[0] + height, fit[1], self.skyline[i][0])
+            if best is None or key < best[0]:
+                best = (key, i, fit[0])
+        if best is None:
+            return None
+
+        _, i, y = best
+        x = self.skyline[i][0]
+        self.skyline.insert(i, [x, y + height, width])
+        # Trim (or drop) the segments now under the new one
+        end = x + width
+        j = i + 1
+        while j < len(self.skyline) and self.skyline[j][0] < end:
+            segment = self.skyline[j]
+            shrink = end - segment[0]
+            if segment[2] <= shrink:
+                del self.skyline[j]
+                continue
+            segment[0] += shrink
+            segment[2] -= shrink
+            break
+        # Merge neighbours at the same height
+        j = 0
+        while j < len(self.skyline) - 1:
+            if self.skyline[j][1] == self.skyline[j + 1][1]:
+                self.skyline[j][2] += self.skyline.pop(j + 1)[2]
+            else:
+                j += 1
+        return x, y
+
+
+def pack(sizes, page_size):
+    """
+    Pack rectangles of ``sizes`` (``[(width, height), ...]``) onto as few
+    ``page_size`` x ``page_size`` pages as a first fit over
+    :class:`SkylinePacker` pages manages, tallest first.  Returns
+    ``(placements, pages)`` with ``placements[i] = (page, x, y)``.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0], i))
+    placements = [None] * len(sizes)
+    pages = []
+    for i in order:
+        width, height = sizes[i]
+        if width > page_size or height > page_size:
+            raise AtlasError("a {0}x{1} glyph does not fit on a {2}x{2} page.".format(
+                width, height, page_size
+            ))
+        for page, packer in enumerate(pages):
+            position = packer.insert(width, height)
+            if position is not None:
+                break
+        else:
+            pages.append(SkylinePacker(page_size, page_size))
+            page = len(pages) - 1
+            position = pages[page].insert(width, height)
+        placements[i] = (page, position[0], position[1])
+    return placements, len(pages)
+
+
+########################################################################################
+# Output                                                                               #
+########################################################################################
+def encode_png(pixels):
+    """Return the bytes of an 8-bit grayscale PNG of the 2D ``uint8`` array ``pixels``."""
+    height, width = pixels.shape
+
+    def chunk(tag, data):
+        return (struct.pack(">I", len(data)) + tag + data +
+                struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+    # Every scanline is prefixed with its filter type, 0 (none)
+    scanlines = np.zeros((height, width + 1), dtype=np.uint8)
+    scanlines[:, 1:] = pixels
+    return b"".join([
+        b"\x89PNG\r\n\x1a\n",
+        chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)),
+        chunk(b"IDAT", zlib.compress(scanlines.tobytes(), 9)),
+        chunk(b"IEND", b"")
+    ])
+
+
+def _write_if_changed(path, data):
+    """Atomically write ``data`` (bytes) to ``path`` unless it already holds it."""
+    if generate.sha256_of_file(path) == hashlib.sha256(data).hexdigest():
+        return False
+    ttf.atomic_write(path, data)
+    return True
+
+
+def atlas_name(font_name, mode="coverage"):
+    """The prefix of the files :func:`build_atlas` writes for ``font_name`` in ``mode``."""
+    return "{0}-{1}".format(font_name, "atlas" if mode == "coverage" else mode)
+
+
+def page_file_name(font_name, page, mode="coverage"):
+    return "{0}-{1}.png".format(atlas_name(font_name, mode), page)
+
+
+def read_glyphs(font_path):
+    """
+    Return ``(glyphs, ascent, descent)`` for the font at ``font_path``:
+    ``[(name, codepoint, advance, contours), ...]`` for every mapped glyph, and
+    its ``hhea`` ascent and (positive) descent.  Raises :class:`AtlasError`.
+    """
+    if not os.path.exists(font_path):
+        raise AtlasError(
+            "[{0}] does not exist.  Make sure you already generated it (with `rake`).".format(
+                font_path
+            )
+        )
+    try:
+        with ttf.TrueTypeFont(font_path) as font:
+            ascent, descent = font.vertical_metrics(typographic=False)
+            advances = font.advances()
+            cmap = font.cmap()
+            glyphs = []
+            for name, code in font.icons(private_use_only=False):
+                gid = cmap[code]
+                glyphs.append((name, code, advances[gid], ttf.decode_glyph(font.glyph_data(gid))))
+    except (IOError, OSError, ttf.TTFError) as e:
+        raise AtlasError("could not read [{0}]: {1}".format(font_path, e)) from e
+    if not glyphs:
+        raise AtlasError("[{0}] has no mapped glyphs.".format(font_path))
+    return glyphs, ascent, descent
+
+
+def render_atlas(glyphs, scales, page_size=DEFAULT_PAGE_SIZE, mode="coverage",
+                 supersample=SUPERSAMPLE, spread=DEFAULT_SPREAD, jobs=None):
+    """
+    Render ``glyphs`` (as returned by :func:`read_glyphs`) at every ``(size,
+    scale)`` of ``scales`` in ``mode`` (see :data:`MODES`, ``sdf`` takes a single
+    size) with a pool of ``jobs`` processes (default: one per CPU, ``1`` works in
+    this process), and pack them onto ``page_size`` square pages.
+
+    Returns ``(rows, pages)``: the metrics row (:data:`METRICS_FIELDS`) of every
+    glyph at every size, and the pages as 2D ``uint8`` arrays.
+    """
+    if mode not in MODES:
+        raise AtlasError("unknown atlas mode {0!r}, expected one of {1}.".format(
+            mode, ", ".join(MODES)
+        ))
+    if mode == "sdf" and len(scales) != 1:
+        raise AtlasError("a distance field atlas has exactly one size, got {0}.".format(
+            [size for size, _ in scales]
+        ))
+
+    work = [(i, contours) for i, (_, _, _, contours) in enumerate(glyphs)]
+    jobs = jobs or os.cpu_count() or 1
+    chunk_count = 1 if jobs == 1 else 4 * jobs
+    if mode == "coverage":
+        chunks = [(scales, supersample, work[i::chunk_count]) for i in range(chunk_count)]
+        worker = _rasterize_glyphs
+    else:
+        # Largest first, so every chunk gets its share of the expensive glyphs
+        size, scale = scales[0]
+        def area(glyph):
+            left, top, right, bottom = glyph_box(glyph[1], scale)
+            return (right - left) * (bottom - top)
+
+        work.sort(key=area, reverse=True)
+        chunks = [(size, scale, spread, work[i::chunk_count]) for i in range(chunk_count)]
+        worker = _distance_glyphs
+    if jobs == 1:
+        results = [worker(job) for job in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(worker, chunks))
+    bitmaps = sorted(
+        (bitmap for result in results for bitmap in result),
+        key=lambda bitmap: (bitmap[1], glyphs[bitmap[0]][1])
+    )
+
+    packed = [i for i, bitmap in enumerate(bitmaps) if bitmap[4].size]
+    placements, page_count = pack(
+        [(bitmaps[i][4].shape[1] + 2 * PADDING, bitmaps[i][4].shape[0] + 2 * PADDING)
+         for i in packed],
+        page_size
+    )
+    pages = [np.zeros((page_size, page_size), dtype=np.uint8) for _ in range(page_count)]
+    positions = {}
+    for i, (page, x, y) in zip(packed, placements):
+        bitmap = bitmaps[i][4]
+        x += PADDING
+        y += PADDING
+        pages[page][y:y + bitmap.shape[0], x:x + bitmap.shape[1]] = bitmap
+        positions[i] = (page, x, y)
+
+    scale_of = dict(scales)
+    rows = []
+    for i, (index, size, left, top, bitmap) in enumerate(bitmaps):
+        name, code, advance, _ = glyphs[index]
+        page, x, y = positions.get(i, (-1, 0, 0))
+        height, width = bitmap.shape
+        rows.append([
+            name, code, size, page, x, y, width, height,
+            round(x / float(page_size), 6), round(y / float(page_size), 6),
+            round((x + width) / float(page_size), 6), round((y + height) / float(page_size), 6),
+            left, -top, round(advance * scale_of[size], 4)
+        ])
+    return rows, pages
+
+
+def _check_options(mode, sizes, supersample, spread):
+    """Raise :class:`AtlasError` unless the options of :func:`build_atlas` make sense."""
+    if np is None:
+        raise AtlasError("NumPy is needed to rasterize the atlas: `pip install numpy`.")
+    if mode not in MODES:
+        raise AtlasError("unknown atlas mode {0!r}, expected one of {1}.".format(
+            mode, ", ".join(MODES)
+        ))
+    if not sizes or any(size < 1 for size in sizes):
+        raise AtlasError("the atlas sizes must be positive, got {0}.".format(list(sizes)))
+    if mode == "sdf" and len(set(sizes)) != 1:
+        raise AtlasError("a distance field atlas has exactly one size, got {0}.".format(
+            list(sizes)
+        ))
+    if supersample < 1:
+        raise AtlasError("the supersampling factor must be at least 1.")
+    if spread < 1:
+        raise AtlasError("the distance field spread must be at least 1 pixel.")
+
+
+def build_atlas(font_name, font_path, out_dir, sizes=None, page_size=DEFAULT_PAGE_SIZE,
+                mode="coverage", supersample=SUPERSAMPLE, spread=DEFAULT_SPREAD, jobs=None):
+    """
+    Render every mapped glyph of the font at ``font_path`` with
+    :func:`render_atlas` and write ``{font_name}-atlas-{page}.png`` and
+    ``{font_name}-atlas.json`` (``{font_name}-sdf-*`` in ``sdf`` mode) to
+    ``out_dir``.  Files whose content did not change are left alone.
+
+    ``coverage`` mode rasterizes at each pixel size in ``sizes`` (default:
+    :data:`DEFAULT_SIZES`), antialiased by ``supersample`` samples per pixel
+    along each axis.  ``sdf`` mode computes the signed distance field of every
+    glyph at the single size in ``sizes`` (default: :data:`DEFAULT_SDF_SIZE`),
+    extending ``spread`` pixels past the outline (so the bitmaps and bearings
+    include that margin); scale every metric by ``size / sdf_size`` to draw at
+    another size.
+
+    Every row of ``glyphs`` in the metrics file lists :data:`METRICS_FIELDS`:
+    the page and pixel rectangle of the bitmap (without the padding), its UVs,
+    the offset from the pen position on the baseline to the left / top edge of
+    the bitmap (y up, as FreeType reports them) and the advance, all in pixels.
+    Glyphs without an outline (``space``) have an empty rectangle on page
+    ``-1``.
+
+    Returns a dict with the keys ``glyphs`` (rows written), ``pages``,
+    ``written``, ``skipped`` and ``seconds``.
+    """
+    start = time.time()
+    if sizes is None:
+        sizes = DEFAULT_SIZES if mode == "coverage" else (DEFAULT_SDF_SIZE,)
+    _check_options(mode, sizes, supersample, spread)
+    glyphs, ascent, descent = read_glyphs(font_path)
+
+    # fontstash: nvgFontSize(size) maps ascent - descent (hhea) to size pixels
+    scales = [(size, size / float(ascent + descent)) for size in sorted(set(sizes))]
+    rows, pages = render_atlas(glyphs, scales, page_size=page_size, mode=mode,
+                               supersample=supersample, spread=spread, jobs=jobs)
+
+    name = atlas_name(font_name, mode)
+    metrics = {
+        "version": METRICS_VERSION,
+        "font": font_name,
+        "mode": mode,
+        "spread": spread if mode == "sdf" else 0,
+        "units_per_em": ascent + descent,
+        "sizes": [
+            {"size": size, "scale": round(scale, 8), "ascent": round(ascent * scale, 4),
+             "descent": round(descent * scale, 4)}
+            for size, scale in scales
+        ],
+        "pages": [
+            {"file": page_file_name(font_name, page, mode), "width": page_size,
+             "height": page_size}
+            for page in range(len(pages))
+        ],
+        "fields": list(METRICS_FIELDS),
+        "glyphs": rows
+    }
+
+    written = []
+    skipped = []
+    try:
+        os.makedirs(out_dir, exist_ok=True)
+        outputs = [
+            (os.path.join(out_dir, page_file_name(font_name, page, mode)), encode_png(pixels))
+            for page, pixels in enumerate(pages)
+        ]
+        outputs.append((
+            os.path.join(out_dir, "{0}.json".format(name)),
+            json.dumps(metrics, separators=(",", ":")).encode("utf-8") + b"\n"
+        ))
+        for path, data in outputs:
+            (written if _write_if_changed(path, data) else skipped).append(path)
+
+        # Pages of an earlier, larger atlas would otherwise linger
+        stale = re.compile(r"^{0}-(\d+)\.png$".format(re.escape(name)))
+        for entry in os.listdir(out_dir):
+            match = stale.match(entry)
+            if match and int(match.group(1)) >= len(pages):
+                os.remove(os.path.join(out_dir, entry))
+    except (IOError, OSError) as e:
+        raise AtlasError("could not write the atlas to [{0}]: {1}".format(out_dir, e)) from e
+
+    return {
+        "glyphs": len(rows),
+        "pages": len(pages),
+        "written": written,
+        "skipped": skipped,
+        "seconds": time.time() - start
+    }
+
+
+def benchmark(font_path, counts, sizes=None, page_size=DEFAULT_PAGE_SIZE, mode="coverage",
+              supersample=SUPERSAMPLE, spread=DEFAULT_SPREAD, jobs=None):
+    """
+    Time :func:`render_atlas` (rendering and packing, nothing is written) for
+    every icon count in ``counts``, cycling through the glyphs of the font at
+    ``font_path`` for counts larger than the font.  The other arguments are as
+    for :func:`build_atlas`.
+
+    Returns ``[(count, bitmaps, seconds), ...]``, ``bitmaps`` being ``count``
+    times the number of sizes.
+    """
+    if sizes is None:
+        sizes = DEFAULT_SIZES if mode == "coverage" else (DEFAULT_SDF_SIZE,)
+    _check_options(mode, sizes, supersample, spread)
+    glyphs, ascent, descent = read_glyphs(font_path)
+    # Skip the empty glyphs, they would only flatter the numbers
+    glyphs = [glyph for glyph in glyphs if glyph[3]]
+    scales = [(size, size / float(ascent + descent)) for size in sorted(set(sizes))]
+
+    results = []
+    for count in counts:
+        work = [glyphs[i % len(glyphs)] for i in range(count)]
+        start = time.time()
+        rows, _ = render_atlas(work, scales, page_size=page_size, mode=mode,
+                               supersample=supersample, spread=spread, jobs=jobs)
+        results.append((count, len(rows), time.time() - start))
+    return results
+
+
+def parse_sizes(value):
+    """``argparse`` type of ``--sizes``: a comma separated list of pixel sizes."""
+    try:
+        sizes = [int(size) for size in value.split(",") if size.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected comma separated integers, got {0!r}".format(value))
+    if not sizes or any(size < 1 for size in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive integers, got {0!r}".format(value))
+    return sizes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rasterize a compiled font into packed atlas pages and a metrics table."
+    )
+    parser.add_argument(
+        "--font-name",
+        default=generate.FONT_NAME,
+        help="Font to rasterize (default: {0}).".format(generate.FONT_NAME)
+    )
+    parser.add_argument(
+        "--font",
+        help="The compiled font to rasterize (default: compiled_fonts/<font>/<font>.ttf)."
+    )
+    parser.add_argument(
+        "--out-dir",
+        help="Where the pages and metrics are written (default: atlas/<font>)."
+    )
+    parser.add_argument(
+        "--mode",
+        choices=MODES,
+        default="coverage",
+        help="Antialiased coverage at every size, or a signed distance field usable at "
+             "any size (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        help="Comma separated pixel sizes (as given to nvgFontSize) to rasterize (default: "
+             "{0}, or {1} for the single size of --mode sdf).".format(
+                 ",".join(str(size) for size in DEFAULT_SIZES), DEFAULT_SDF_SIZE
+             )
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help="Width and height of every atlas page in pixels (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--supersample",
+        type=int,
+        default=SUPERSAMPLE,
+        help="Samples per pixel along each axis in coverage mode (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--spread",
+        type=int,
+        default=DEFAULT_SPREAD,
+        help="Pixels the distance field extends past the outline in sdf mode "
+             "(default: %(default)s)."
+    )
+    parser.add_argument(
+        "--benchmark",
+        nargs="?",
+        const="100,1000,10000",
+        metavar="COUNTS",
+        help="Instead of writing the atlas, report glyphs per second rendering this many "
+             "icons (comma separated, default: %(const)s) with one and with --jobs processes."
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes rasterizing glyphs (default: %(default)s)."
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.page_size < 1:
+        parser.error("--page-size must be positive")
+
+    font_name = args.font_name
+    here = os.path.dirname(os.path.abspath(__file__))
+    font_path = args.font or os.path.join(
+        here, "compiled_fonts", font_name, "{0}.ttf".format(font_name)
+    )
+
+    if args.benchmark:
+        try:
+            counts = parse_sizes(args.benchmark)
+        except argparse.ArgumentTypeError as e:
+            parser.error("--benchmark: {0}".format(e))
+        print("{0:>8}  {1:>8}  {2:>8}  {3:>10}".format("icons", "jobs", "seconds", "glyphs/s"))
+        for jobs in sorted(set([1, args.jobs])):
+            try:
+                results = benchmark(font_path, counts, sizes=args.sizes,
+                                    page_size=args.page_size, mode=args.mode,
+                                    supersample=args.supersample, spread=args.spread,
+                                    jobs=jobs)
+            except AtlasError as e:
+                sys.stderr.write("Critical: {0}\n".format(e))
+                sys.exit(1)
+            for count, bitmaps, seconds in results:
+                print("{0:>8}  {1:>8}  {2:>8.2f}  {3:>10.0f}".format(
+                    count, jobs, seconds, bitmaps / seconds if seconds > 0 else float("inf")
+                ))
+        sys.exit(0)
+
+    out_dir = args.out_dir or os.path.join(here, "atlas", font_name)
+    try:
+        result = build_atlas(font_name, font_path, out_dir, sizes=args.sizes,
+                             page_size=args.page_size, mode=args.mode,
+                             supersample=args.supersample, spread=args.spread, jobs=args.jobs)
+    except AtlasError as e:
+        sys.stderr.write("Critical: {0}\n".format(e))
+        sys.exit(1)
+
+    print("Rasterized [{0}] glyphs onto [{1}] pages in {2:.2f}s.".format(
+        result["glyphs"], result["pages"], result["seconds"]
+    ))
+    for path in result["written"]:
+        print("Wrote [{0}].".format(os.path.relpath(path)))
+    for path in result["skipped"]:
+        print("Unchanged, skipped [{0}].".format(os.path.relpath(path)))
@@ -0,0 +1,975 @@
+#!/usr/bin/env python3
+"""
+Time the whole pipeline on synthetic icon sets far larger than ``icons/fontawesome``.
+
+Icon directories of (by default) 1000, 10000 and 50000 SVGs are made by cycling
+through the fontawesome icons, rotating and scaling every copy a little so that
+each one converts to a different outline.  Each stage then runs on its own in a
+fresh process, so that its peak resident set size is its own:
+
+``scan``
+    List the icon directory and read every SVG (what every build starts with).
+``compile``
+    Compile the font and css with ``svg2ttf.py`` (the native replacement for
+    ``rake``), with an empty glyph cache.
+``recompile``
+    The same with every glyph cached, as when rebuilding after a small change.
+``parse_ttf`` / ``parse_css``
+    Read the icons back from the font and from the css (``generate.read_icons``).
+``generate``
+    Emit the header, python bindings and examples (``generate.generate``).
+
+Past 2048 icons the codepoints continue in the Supplementary Private Use Area,
+every icon read back from the font is checked against the codepoint registry.
+
+The timings, peak RSS and output sizes are printed and written to a JSON file.
+Comparing it against the file of a previous release with ``--compare`` reports
+(and fails on) the stages that got slower.
+
+The code ``generate.py`` emits is benchmarked with a C++ compiler instead:
+``--styles`` compiles the outputs in every ``--style`` (and imports the python
+bindings), ``--lookup`` times the ``--lookup`` tables and ``--embed`` the
+``--embed-font`` resource in every format.
+
+Example::
+
+    ./benchmark.py --counts 1000,10000 --output before.json
+    ./benchmark.py --counts 1000,10000 --compare before.json
+    ./benchmark.py --styles --include-dir ../nanogui/include
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import math
+import multiprocessing
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+
+import buildreport
+import generate
+import svg2ttf
+
+
+class BenchmarkError(Exception):
+    """Raised when the benchmark cannot run."""
+
+
+RESULTS_VERSION = 1
+DEFAULT_COUNTS = (1000, 10000, 50000)
+STAGES = ("scan", "compile", "recompile", "parse_ttf", "parse_css", "generate")
+
+# The synthetic font, written to <scratch>/<count>/
+FONT_NAME = "synthetic"
+FONT_LICENSE = "synthetic icons made from Font Awesome Free: https://fontawesome.com/license/free"
+
+# Stages faster than this are too noisy to call a regression
+MIN_SECONDS = 0.1
+
+_SVG_OPEN_RE = re.compile(r"<svg\b[^>]*>")
+_VIEWBOX_RE = re.compile(r'viewBox="([^"]*)"')
+
+
+def perturb_svg(data, index):
+    """
+    Return the SVG ``data`` with its content rotated by up to 8 degrees and
+    scaled by 90% to 100% about the center of its ``viewBox``, varying with
+    ``index``.  Index 0 is left unchanged.
+    """
+    if index == 0:
+        return data
+    viewbox = _VIEWBOX_RE.search(data)
+    opening = _SVG_OPEN_RE.search(data)
+    end = data.rfind("</svg>")
+    if viewbox is None or opening is None or end < 0:
+        raise BenchmarkError("cannot perturb an SVG without an <svg viewBox> element")
+    x, y, width, height = [float(value) for value in _viewbox_values(viewbox.group(1))]
+    cx, cy = x + width / 2.0, y + height / 2.0
+    angle = (index * 37) % 17 - 8
+    scale = 0.9 + ((index * 13) % 11) / 100.0
+    group = '<g transform="translate({0:g} {1:g}) rotate({2}) scale({3:g}) translate({4:g} {5:g})">'.format(
+        cx, cy, angle, scale, -cx, -cy
+    )
+    return data[:opening.end()] + group + data[opening.end():end] + "</g>" + data[end:]
+
+
+def _viewbox_values(value):
+    values = value.replace(",", " ").split()
+    if len(values) != 4:
+        raise BenchmarkError("invalid viewBox [{0}]".format(value))
+    return values
+
+
+def synthesize(source_dir, svg_dir, count):
+    """
+    Write ``count`` SVGs to ``svg_dir``, cycling through the ones in
+    ``source_dir``: copy ``k`` of ``icon.svg`` is ``icon-k.svg``, perturbed by
+    :func:`perturb_svg`.
+    """
+    sources = sorted(entry[:-len(".svg")] for entry in os.listdir(source_dir) if entry.endswith(".svg"))
+    if not sources:
+        raise BenchmarkError("there are no .svg icons in [{0}]".format(source_dir))
+    contents = []
+    for name in sources:
+        with open(os.path.join(source_dir, name + ".svg"), "r") as svg:
+            contents.append(svg.read())
+
+    os.makedirs(svg_dir)
+    for i in range(count):
+        copy, source = divmod(i, len(sources))
+        with open(os.path.join(svg_dir, "{0}-{1}.svg".format(sources[source], copy)), "w") as svg:
+            svg.write(perturb_svg(contents[source], i))
+
+
+def _paths(work):
+    fonts_dir = os.path.join(work, "compiled_fonts", FONT_NAME)
+    return {
+        "svg_dir": os.path.join(work, "icons", FONT_NAME),
+        "ttf": os.path.join(fonts_dir, "{0}.ttf".format(FONT_NAME)),
+        "css": os.path.join(fonts_dir, "{0}.css".format(FONT_NAME)),
+        "cache": os.path.join(work, "cache"),
+        "nanogui": os.path.join(work, "nanogui", FONT_NAME)
+    }
+
+
+def _compile(work, jobs):
+    paths = _paths(work)
+    config = {
+        "font_name": FONT_NAME,
+        "input": paths["svg_dir"],
+        "output": os.path.dirname(paths["ttf"]),
+        "no_hash": True,
+        # what generate.read_css_icons expects
+        "css_selector": ".{{font_name}}-icon-{{glyph}}"
+    }
+    svg2ttf.compile_font(config, jobs=jobs, root=work, cache=svg2ttf.GlyphCache(paths["cache"]))
+
+
+def _run_stage(stage, work, count, jobs):
+    """Run ``stage`` on the icons in ``work``, returns ``(seconds, peak_rss, peak_rss_children)``."""
+    paths = _paths(work)
+    start = time.perf_counter()
+    if stage == "scan":
+        for entry in sorted(os.listdir(paths["svg_dir"])):
+            if entry.endswith(".svg"):
+                with open(os.path.join(paths["svg_dir"], entry), "rb") as svg:
+                    svg.read()
+    elif stage in ("compile", "recompile"):
+        _compile(work, jobs)
+    elif stage == "parse_ttf":
+        generate.read_icons(paths["ttf"], FONT_NAME)
+    elif stage == "parse_css":
+        generate.read_icons(paths["css"], FONT_NAME)
+    elif stage == "generate":
+        generate.generate(FONT_NAME, paths["ttf"], paths["nanogui"], FONT_LICENSE,
+                          expected_count=count, force=True)
+    else:
+        raise BenchmarkError("unknown stage [{0}]".format(stage))
+    seconds = time.perf_counter() - start
+    return seconds, buildreport.peak_rss(), buildreport.peak_rss(children=True)
+
+
+def check_round_trip(work):
+    """
+    Raise :class:`BenchmarkError` unless the icons read back from the font
+    compiled in ``work`` have the codepoints of its registry, returns the highest
+    codepoint.
+    """
+    paths = _paths(work)
+    icons = generate.read_icons(paths["ttf"], FONT_NAME)
+    registry = svg2ttf.CodepointRegistry.load(svg2ttf.registry_path(paths["svg_dir"]))
+    if sorted(icons) != sorted(registry.codepoints.items()):
+        raise BenchmarkError("the icons of {0} did not survive the round trip".format(work))
+    return max(code for _, code in icons)
+
+
+def output_sizes(work):
+    """The sizes in bytes of the font, css and generated files in ``work``."""
+    paths = _paths(work)
+    sizes = {
+        "ttf": os.path.getsize(paths["ttf"]),
+        "css": os.path.getsize(paths["css"])
+    }
+    for key, name in (("header", "{0}.h"), ("bindings", "constants_{0}.cpp"),
+                      ("cpp_example", "example_{0}.cpp"), ("py_example", "example_{0}.py")):
+        sizes[key] = os.path.getsize(os.path.join(paths["nanogui"], name.format(FONT_NAME)))
+    return sizes
+
+
+def run(counts=DEFAULT_COUNTS, source_dir=None, jobs=None, progress=None):
+    """
+    Benchmark every stage for synthetic icon sets of each of ``counts`` icons made
+    from ``source_dir`` (default: ``icons/fontawesome``), compiling with ``jobs``
+    processes.  ``progress`` is called with a message before each step.
+
+    Returns a dict ready to be written as JSON: the ``version`` of the format, the
+    environment, and a ``results`` list with one ``{"icons", "last_codepoint",
+    "stages", "sizes"}`` per count (see :func:`check_round_trip`), where ``stages`` maps every stage to its ``seconds``, ``peak_rss``
+    and ``peak_rss_children`` (bytes, ``None`` where unknown).
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    source_dir = source_dir or os.path.join(here, "icons", "fontawesome")
+    jobs = jobs or os.cpu_count() or 1
+    progress = progress or (lambda message: None)
+
+    results = []
+    scratch = tempfile.mkdtemp(prefix="nanogui-benchmark-")
+    # Every stage in a new interpreter, not one that already peaked earlier
+    context = multiprocessing.get_context("spawn")
+    try:
+        for count in counts:
+            work = os.path.join(scratch, str(count))
+            progress("Synthesizing {0} icons.".format(count))
+            synthesize(source_dir, _paths(work)["svg_dir"], count)
+
+            stages = {}
+            for stage in STAGES:
+                progress("  {0}".format(stage))
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    seconds, peak_rss, peak_rss_children = pool.submit(
+                        _run_stage, stage, work, count, jobs
+                    ).result()
+                stages[stage] = {
+                    "seconds": seconds,
+                    "peak_rss": peak_rss,
+                    "peak_rss_children": peak_rss_children
+                }
+            results.append({
+                "icons": count,
+                "last_codepoint": check_round_trip(work),
+                "stages": stages,
+                "sizes": output_sizes(work)
+            })
+            shutil.rmtree(work, ignore_errors=True)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    return {
+        "version": RESULTS_VERSION,
+        "revision": _revision(here),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "jobs": jobs,
+        "results": results
+    }
+
+
+def _revision(here):
+    """The git commit being benchmarked, ``None`` outside of a checkout."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=here, stderr=subprocess.DEVNULL,
+            universal_newlines=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, current, threshold):
+    """
+    Return ``[(icons, stage, before, after), ...]`` for the stages of ``current``
+    more than ``threshold`` times slower than in ``baseline`` (both as returned
+    by :func:`run`).  Stages under :data:`MIN_SECONDS` in both are ignored.
+    """
+    if baseline.get("version") != RESULTS_VERSION:
+        raise BenchmarkError("the baseline is not a version {0} benchmark.".format(RESULTS_VERSION))
+    before = dict((result["icons"], result["stages"]) for result in baseline["results"])
+    regressions = []
+    for result in current["results"]:
+        for stage, timing in sorted(result["stages"].items()):
+            old = before.get(result["icons"], {}).get(stage)
+            if old is None or max(old["seconds"], timing["seconds"]) < MIN_SECONDS:
+                continue
+            if timing["seconds"] > threshold * old["seconds"]:
+                regressions.append((result["icons"], stage, old["seconds"], timing["seconds"]))
+    return regressions
+
+
+# Libraries the decompress-once loader of each embed format links to.
+EMBED_LIBRARIES = {"raw": [], "zlib": ["-lz"], "woff2": ["-lwoff2dec"]}
+
+# Stands in for NanoGUI's python/python.h when pybind11 is not installed, so the
+# bindings still compile.  The pybind11 templates are most of the real cost of
+# each attribute, so the measured difference between the styles is smaller than
+# in a NanoGUI build.  PY_VERSION_HEX is not defined either, so the "lazy"
+# bindings would compile their (eager) Python < 3.7 fallback: they are only
+# benchmarked with pybind11.
+PYTHON_H_STUB = textwrap.dedent('''\
+    #pragma once
+    #include <string>
+    namespace py {
+    struct int_ { explicit int_(int value); int value; };
+    struct object { object &operator=(const int_ &value); };
+    struct module {
+        module def_submodule(const char *name);
+        object attr(const char *name);
+    };
+    }
+''')
+
+PYTHON_H_PYBIND11 = textwrap.dedent('''\
+    #pragma once
+    #include <pybind11/pybind11.h>
+    namespace py = pybind11;
+''')
+
+# Wraps the bindings of one style in an extension module, to time importing it.
+IMPORT_MODULE = textwrap.dedent('''\
+    #include "python.h"
+    void register_constants_{name}(py::module &m);
+    PYBIND11_MODULE({module}, m) {{ register_constants_{name}(m); }}
+''')
+
+# Run in a fresh interpreter: prints the seconds spent importing the module, or
+# (with "memory") the bytes the import allocated.
+IMPORT_SCRIPT = textwrap.dedent('''\
+    import sys, time, tracemalloc
+    sys.path.insert(0, sys.argv[1])
+    if sys.argv[3] == "memory":
+        tracemalloc.start()
+    begin = time.perf_counter()
+    __import__(sys.argv[2])
+    seconds = time.perf_counter() - begin
+    print(tracemalloc.get_traced_memory()[0] if sys.argv[3] == "memory" else seconds)
+''')
+
+
+def _best_of(command, repeat, what):
+    """Run ``command`` ``repeat`` times, return the fastest ``(seconds, output)``."""
+    best = None
+    for _ in range(repeat):
+        begin = time.time()
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                universal_newlines=True)
+        output = proc.communicate()[0]
+        seconds = time.time() - begin
+        if proc.returncode != 0:
+            raise BenchmarkError("could not {0}:\n{1}".format(what, output))
+        if best is None or seconds < best[0]:
+            best = (seconds, output)
+    return best
+
+
+def _pybind11_flags():
+    """The include flags for pybind11 and Python, or ``None`` if pybind11 is not installed."""
+    try:
+        import pybind11
+        import sysconfig
+    except ImportError:
+        return None
+    return ["-I" + pybind11.get_include(), "-I" + sysconfig.get_paths()["include"]]
+
+
+def _write_styles(scratch, font_name, icons, license):
+    """
+    Render ``icons`` in every one of :data:`generate.STYLES` into ``scratch/<style>`` (the
+    header in ``scratch/<style>/nanogui``), and ``python.h`` into
+    ``scratch/stub``.  Returns the pybind11 include flags (``None`` when the stub
+    python.h is used).
+    """
+    cdefs, longest = generate.make_cdefs(font_name, icons)
+    stub_dir = os.path.join(scratch, "stub")
+    os.makedirs(stub_dir)
+    pybind11_flags = _pybind11_flags()
+    with open(os.path.join(stub_dir, "python.h"), "w") as f:
+        f.write(PYTHON_H_STUB if pybind11_flags is None else PYTHON_H_PYBIND11)
+
+    for style in generate.STYLES:
+        style_dir = os.path.join(scratch, style)
+        os.makedirs(os.path.join(style_dir, "nanogui"))
+        for path, content in [
+            (os.path.join(style_dir, "nanogui", "{0}.h".format(font_name)),
+             generate.render_header(font_name, license, cdefs, longest, style=style)),
+            (os.path.join(style_dir, "constants_{0}.cpp".format(font_name)),
+             generate.render_python_bindings(font_name, license, cdefs, style=style)),
+            (os.path.join(style_dir, "example_{0}.cpp".format(font_name)),
+             generate.render_cpp_example(font_name, cdefs, style=style))
+        ]:
+            with open(path, "w") as f:
+                f.write(content)
+    return pybind11_flags
+
+
+def benchmark_styles(font_name, icons, license, cxx="c++", flags=("-std=c++11", "-O2"),
+                     include_dirs=(), repeat=3):
+    """
+    Render ``icons`` (``[(name, codepoint), ...]``) in every one of :data:`generate.STYLES`
+    and compile the results with ``cxx``.  The python bindings are always
+    compiled (against pybind11 when it is installed, else against
+    :data:`PYTHON_H_STUB`, except for the ``"lazy"`` ones, which need pybind11);
+    the C++ example only when ``include_dirs`` has the NanoGUI include
+    directories (and those of its dependencies).
+
+    Returns ``[(style, file, seconds, object_bytes), ...]``, the best of
+    ``repeat`` compiles each.
+    """
+    scratch = tempfile.mkdtemp(prefix="nanogui-benchmark-")
+    try:
+        pybind11_flags = _write_styles(scratch, font_name, icons, license)
+        extra = pybind11_flags or []
+        results = []
+        for style in generate.STYLES:
+            style_dir = os.path.join(scratch, style)
+            units = []
+            if style != "lazy" or pybind11_flags is not None:
+                units.append(("constants_{0}.cpp".format(font_name), ["-DNANOGUI_PYTHON"]))
+            if include_dirs:
+                units.append(("example_{0}.cpp".format(font_name), []))
+            for source, defines in units:
+                obj = os.path.join(style_dir, os.path.splitext(source)[0] + ".o")
+                command = [cxx] + list(flags) + defines + [
+                    "-I" + style_dir, "-I" + os.path.join(scratch, "stub")
+                ] + ["-I" + d for d in include_dirs] + extra + [
+                    "-c", os.path.join(style_dir, source), "-o", obj
+                ]
+                seconds, _ = _best_of(command, repeat, "compile [{0}]".format(source))
+                results.append((style, source, seconds, os.path.getsize(obj)))
+        return results
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def benchmark_imports(font_name, icons, license, cxx="c++", flags=("-std=c++11", "-O2"),
+                      repeat=5):
+    """
+    Build the python bindings of every one of :data:`generate.STYLES` into an extension
+    module (this needs pybind11), and import each in a fresh interpreter.
+
+    Returns ``[(style, seconds, allocated_bytes), ...]``: the fastest of
+    ``repeat`` imports, and the memory the import allocated (as seen by
+    ``tracemalloc``).
+    """
+    import sysconfig
+
+    scratch = tempfile.mkdtemp(prefix="nanogui-benchmark-")
+    try:
+        pybind11_flags = _write_styles(scratch, font_name, icons, license)
+        if pybind11_flags is None:
+            raise BenchmarkError("measuring the import time needs pybind11 (pip install pybind11).")
+
+        link = ["-shared", "-fPIC"]
+        if sys.platform == "darwin":
+            link += ["-undefined", "dynamic_lookup"]
+        suffix = sysconfig.get_config_var("EXT_SUFFIX") or ".so"
+        script = os.path.join(scratch, "import_module.py")
+        with open(script, "w") as f:
+            f.write(IMPORT_SCRIPT)
+
+        results = []
+        for style in generate.STYLES:
+            style_dir = os.path.join(scratch, style)
+            module = "{0}_{1}".format(font_name, style)
+            with open(os.path.join(style_dir, "module.cpp"), "w") as f:
+                f.write(IMPORT_MODULE.format(name=font_name, module=module))
+            _best_of([cxx] + list(flags) + link + ["-DNANOGUI_PYTHON"] + [
+                "-I" + style_dir, "-I" + os.path.join(scratch, "stub")
+            ] + pybind11_flags + [
+                os.path.join(style_dir, "constants_{0}.cpp".format(font_name)),
+                os.path.join(style_dir, "module.cpp"),
+                "-o", os.path.join(style_dir, module + suffix)
+            ], 1, "build the {0} module".format(style))
+
+            # The interpreter start up is the same for every style, only the
+            # time spent inside the import is reported.
+            seconds = min(
+                float(_best_of([sys.executable, script, style_dir, module, "time"], 1,
+                               "import the {0} module".format(style))[1])
+                for _ in range(repeat)
+            )
+            allocated = int(_best_of([sys.executable, script, style_dir, module, "memory"], 1,
+                                     "import the {0} module".format(style))[1])
+            results.append((style, seconds, allocated))
+        return results
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+# Times looking icons up by name and by codepoint in the perfect hash tables of
+# a generated header, against a linear scan of the table and std::unordered_map.
+# Prints one "direction method nanoseconds_per_lookup" line per measurement.
+LOOKUP_BENCHMARK = textwrap.dedent('''\
+    #include "{name}.h"
+    #include <algorithm>
+    #include <chrono>
+    #include <cstdio>
+    #include <cstring>
+    #include <random>
+    #include <string>
+    #include <unordered_map>
+    #include <vector>
+
+    static const std::size_t COUNT = sizeof({NAME}_ICONS_BY_NAME) / sizeof({NAME}_ICONS_BY_NAME[0]);
+    static long long checksum = 0;
+
+    template <typename Key, typename Lookup>
+    static void measure(const char *direction, const char *method, const std::vector<Key> &keys,
+                        std::size_t lookups, Lookup lookup) {{
+        auto begin = std::chrono::steady_clock::now();
+        for (std::size_t i = 0; i < lookups; ++i)
+            checksum += lookup(keys[i % keys.size()]);
+        std::chrono::duration<double, std::nano> elapsed = std::chrono::steady_clock::now() - begin;
+        std::printf("%s %s %.3f\\n", direction, method, elapsed.count() / lookups);
+    }}
+
+    int main() {{
+        std::vector<std::string> names;
+        std::vector<int> codepoints;
+        std::unordered_map<std::string, int> byName;
+        std::unordered_map<int, const char *> byCodepoint;
+        for (const auto &icon : {NAME}_ICONS_BY_NAME) {{
+            names.emplace_back(icon.name);
+            codepoints.push_back(icon.codepoint);
+            byName.emplace(icon.name, icon.codepoint);
+            byCodepoint.emplace(icon.codepoint, icon.name);
+        }}
+        std::mt19937 random(1234);
+        std::shuffle(names.begin(), names.end(), random);
+        std::shuffle(codepoints.begin(), codepoints.end(), random);
+
+        // A scan compares half the table on average, keep its total work bounded
+        const std::size_t lookups = {lookups};
+        const std::size_t scans = std::max<std::size_t>(lookups / COUNT, 100);
+
+        measure("name", "perfect_hash", names, lookups, [](const std::string &name) {{
+            return {name}IconCodepoint(name.data(), name.size());
+        }});
+        measure("name", "linear_scan", names, scans, [](const std::string &name) {{
+            for (const auto &icon : {NAME}_ICONS_BY_NAME) {{
+                if (std::strncmp(icon.name, name.data(), name.size()) == 0 &&
+                    icon.name[name.size()] == '\\0')
+                    return icon.codepoint;
+            }}
+            return 0;
+        }});
+        measure("name", "unordered_map", names, lookups, [&byName](const std::string &name) {{
+            auto found = byName.find(name);
+            return found == byName.end() ? 0 : found->second;
+        }});
+        measure("codepoint", "perfect_hash", codepoints, lookups, [](int codepoint) {{
+            return (int) ({name}IconName(codepoint) != nullptr);
+        }});
+        measure("codepoint", "linear_scan", codepoints, scans, [](int codepoint) {{
+            for (const auto &icon : {NAME}_ICONS_BY_NAME) {{
+                if (icon.codepoint == codepoint)
+                    return 1;
+            }}
+            return 0;
+        }});
+        measure("codepoint", "unordered_map", codepoints, lookups, [&byCodepoint](int codepoint) {{
+            return (int) (byCodepoint.find(codepoint) != byCodepoint.end());
+        }});
+        // keep the lookups from being optimized away
+        std::fprintf(stderr, "%lld\\n", checksum);
+        return 0;
+    }}
+''')
+
+# The methods LOOKUP_BENCHMARK compares, in the order it reports them.
+LOOKUP_METHODS = ("perfect_hash", "linear_scan", "unordered_map")
+
+
+def synthetic_icons(count, first_codepoint=0xF0000):
+    """
+    Return ``count`` made up ``[(name, codepoint), ...]`` with names shaped like
+    those of real icon fonts, for benchmarks needing more icons than a font has.
+    """
+    words = ("arrow", "circle", "solid", "outline", "file", "user", "chevron", "alt")
+    return [
+        ("{0}-{1}-{2}".format(words[i % len(words)], words[(i // 7) % len(words)], i),
+         first_codepoint + i)
+        for i in range(count)
+    ]
+
+
+def benchmark_lookup(counts=(1000, 10000, 50000), cxx="c++", flags=("-std=c++11", "-O2"),
+                     lookups=2000000):
+    """
+    For every icon count in ``counts``, render the lookup tables of that many
+    :func:`synthetic_icons` (see ``lookup`` of :func:`generate.render_header`), and time
+    ``lookups`` random lookups by name and by codepoint in them, against a
+    linear scan of the table and ``std::unordered_map``, compiled with ``cxx``.
+
+    Returns ``[(count, direction, {method: nanoseconds_per_lookup}), ...]``
+    with ``direction`` ``"name"`` or ``"codepoint"`` and the methods of
+    :data:`LOOKUP_METHODS`.
+    """
+    scratch = tempfile.mkdtemp(prefix="nanogui-benchmark-")
+    font_name = "benchmark"
+    try:
+        results = []
+        for count in counts:
+            cdefs, longest = generate.make_cdefs(font_name, synthetic_icons(count))
+            with open(os.path.join(scratch, "{0}.h".format(font_name)), "w") as f:
+                f.write(generate.render_header(font_name, "benchmark", cdefs, longest, lookup=True))
+            source = os.path.join(scratch, "lookup.cpp")
+            with open(source, "w") as f:
+                f.write(LOOKUP_BENCHMARK.format(
+                    name=font_name, NAME=font_name.upper(), lookups=lookups
+                ))
+            program = os.path.join(scratch, "lookup")
+            _best_of([cxx] + list(flags) + [source, "-o", program], 1,
+                     "compile the lookup benchmark")
+            proc = subprocess.Popen([program], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    universal_newlines=True)
+            output = proc.communicate()[0]
+            if proc.returncode != 0:
+                raise BenchmarkError("the lookup benchmark failed.")
+
+            timings = {}
+            for line in output.splitlines():
+                direction, method, nanoseconds = line.split()
+                timings.setdefault(direction, {})[method] = float(nanoseconds)
+            for direction in ("name", "codepoint"):
+                results.append((count, direction, timings[direction]))
+        return results
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+# Times the first call of {name}FontData and reading the bytes it returns once (a
+# fresh process, so the pages of the embedded data are not yet touched either),
+# then a second call.  Prints the size, a checksum of the bytes and both times.
+EMBED_BENCHMARK = textwrap.dedent('''\
+    #include <nanogui/{name}.h>
+    #include <chrono>
+    #include <cstdio>
+
+    int main() {{
+        auto begin = std::chrono::steady_clock::now();
+        std::size_t size = 0;
+        const unsigned char *data = {name}FontData(&size);
+        unsigned long checksum = 0;
+        for (std::size_t i = 0; data != nullptr && i < size; ++i)
+            checksum = (checksum * 31 + data[i]) & 0xFFFFFFFFul;
+        std::chrono::duration<double> first = std::chrono::steady_clock::now() - begin;
+        begin = std::chrono::steady_clock::now();
+        std::size_t again = 0;
+        data = {name}FontData(&again);
+        std::chrono::duration<double> second = std::chrono::steady_clock::now() - begin;
+        if (data == nullptr || again != size)
+            return 1;
+        std::printf("%zu %lu %.9f %.9f\\n", size, checksum, first.count(), second.count());
+        return 0;
+    }}
+''')
+
+
+def benchmark_embed(font_name, ttf_path, cxx="c++", flags=("-std=c++11", "-O2"), repeat=5):
+    """
+    Compile ``resource_{font_name}.cpp`` embedding the font ``ttf_path`` in every
+    one of :data:`generate.EMBED_FORMATS` with ``cxx``, link it to
+    :data:`EMBED_BENCHMARK` and run that ``repeat`` times, checking the bytes
+    loaded are those of the font (for ``"woff2"``, only that there are some).
+
+    Returns ``(results, skipped)``, ``results`` being ``[(format, payload_bytes,
+    object_bytes, compile_seconds, first_load_seconds, again_seconds), ...]``
+    with the fastest run of each, and ``skipped`` ``[(format, reason), ...]``
+    for the formats whose encoder or library is missing.
+    """
+    with open(ttf_path, "rb") as f:
+        ttf_data = f.read()
+    checksum = 0
+    for byte in bytearray(ttf_data):
+        checksum = (checksum * 31 + byte) & 0xFFFFFFFF
+
+    scratch = tempfile.mkdtemp(prefix="nanogui-benchmark-")
+    try:
+        os.makedirs(os.path.join(scratch, "nanogui"))
+        main = os.path.join(scratch, "main.cpp")
+        with open(main, "w") as f:
+            f.write(EMBED_BENCHMARK.format(name=font_name))
+        results = []
+        skipped = []
+        for embed in generate.EMBED_FORMATS:
+            try:
+                data = generate.embedded_font_data(ttf_path, embed)
+            except generate.GenerateError as e:
+                skipped.append((embed, str(e)))
+                continue
+            with open(os.path.join(scratch, "nanogui", "{0}.h".format(font_name)), "w") as f:
+                f.write(generate.render_header(font_name, "benchmark", [], 0, embed=embed))
+            source = os.path.join(scratch, "resource_{0}.cpp".format(font_name))
+            with open(source, "w") as f:
+                f.write(generate.render_font_resource(font_name, data, embed=embed,
+                                             ttf_size=len(ttf_data)))
+
+            obj = os.path.join(scratch, "resource_{0}.o".format(font_name))
+            program = os.path.join(scratch, "embed")
+            try:
+                compile_seconds, _ = _best_of(
+                    [cxx] + list(flags) + ["-I" + scratch, "-c", source, "-o", obj], 1,
+                    "compile the {0} resource".format(embed)
+                )
+                _best_of([cxx] + list(flags) + ["-I" + scratch, main, obj, "-o", program] +
+                         EMBED_LIBRARIES[embed], 1, "link the {0} resource".format(embed))
+            except BenchmarkError as e:
+                # the decoders are optional, the raw font always has to build
+                if embed == "raw":
+                    raise
+                lines = str(e).splitlines()
+                errors = [line.strip() for line in lines[1:] if "error" in line]
+                skipped.append((embed, lines[0].rstrip(":") + (
+                    ", " + errors[0] if errors else ""
+                )))
+                continue
+
+            best = None
+            for _ in range(repeat):
+                proc = subprocess.Popen([program], stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE, universal_newlines=True)
+                output = proc.communicate()[0]
+                if proc.returncode != 0:
+                    raise BenchmarkError("the {0} resource did not load.".format(embed))
+                size, loaded, first, again = output.split()
+                if embed != "woff2" and (int(size), int(loaded)) != (len(ttf_data), checksum):
+                    raise BenchmarkError("the {0} resource loaded the wrong bytes.".format(embed))
+                if best is None or float(first) < best[0]:
+                    best = (float(first), float(again))
+            results.append((embed, len(data), os.path.getsize(obj), compile_seconds) + best)
+        return results, skipped
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def _megabytes(value):
+    return "-" if value is None else "{0:.0f}M".format(value / (1024.0 * 1024.0))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time every stage of the pipeline on large synthetic icon sets."
+    )
+    parser.add_argument(
+        "--counts",
+        default=",".join(str(count) for count in DEFAULT_COUNTS),
+        help="Comma separated numbers of icons to synthesize (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--icons",
+        default=os.path.join("icons", "fontawesome"),
+        help="Directory of SVGs the synthetic icons are made from (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--output",
+        default="benchmark.json",
+        help="Where to write the results as JSON (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="Results of an earlier run to compare against, exits with 1 if a stage got slower."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="How many times slower a stage may get with --compare (default: %(default)s)."
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes compiling the icons (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--styles",
+        action="store_true",
+        help="Compile the outputs of generate.py in every --style and report the compile "
+             "time and object size (and, with pybind11 installed, the import time of the "
+             "bindings), instead of timing the pipeline."
+    )
+    parser.add_argument(
+        "--lookup",
+        action="store_true",
+        help="Time looking up icons by name and by codepoint in the --lookup tables of "
+             "--counts made up icons, against a linear scan and std::unordered_map, "
+             "instead of timing the pipeline."
+    )
+    parser.add_argument(
+        "--embed",
+        action="store_true",
+        help="Compile the --embed-font resource in every format and report its size against "
+             "the time the font takes to load the first time, instead of timing the pipeline."
+    )
+    parser.add_argument(
+        "--font-name",
+        default=generate.FONT_NAME,
+        help="Compiled font of --styles and --embed (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--merged",
+        metavar="NAME",
+        help="Read the icons of --font-name from the font NAME it was merged into, for --styles "
+             "(and embed NAME with --embed)."
+    )
+    parser.add_argument(
+        "--cxx",
+        default=os.environ.get("CXX", "c++"),
+        help="C++ compiler used by --styles, --lookup and --embed (default: $CXX or c++)."
+    )
+    parser.add_argument(
+        "--include-dir",
+        action="append",
+        default=[],
+        help="NanoGUI (and dependency) include directory, for --styles to also compile the "
+             "C++ example.  Can be repeated."
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    try:
+        counts = [int(count) for count in args.counts.split(",") if count]
+    except ValueError:
+        parser.error("--counts expects comma separated icon counts")
+    if not counts or any(count < 1 for count in counts):
+        parser.error("--counts must be positive")
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    compiled_name = args.merged or args.font_name
+    font_dir = os.path.join(here, "compiled_fonts", compiled_name)
+    ttf_file = os.path.join(font_dir, "{0}.ttf".format(compiled_name))
+    if args.styles:
+        source_file = ttf_file
+        if not os.path.exists(ttf_file):
+            source_file = os.path.join(font_dir, "{0}.css".format(compiled_name))
+        try:
+            icons = generate.read_icons(source_file, args.font_name,
+                                        merged=args.merged is not None)
+            results = benchmark_styles(args.font_name, icons, generate.FONT_LICENSE,
+                                       cxx=args.cxx, include_dirs=args.include_dir)
+        except (BenchmarkError, generate.GenerateError, IOError, OSError) as e:
+            sys.stderr.write("Critical: {0}\n".format(e))
+            sys.exit(1)
+
+        print("Compiled the [{0}] icons of {1} with {2}:".format(
+            len(icons), args.font_name, args.cxx
+        ))
+        for style, source, seconds, size in results:
+            print("  {0:<8} {1:<32} {2:7.2f}s {3:>10} bytes".format(style, source, seconds, size))
+        if not args.include_dir:
+            print("Pass --include-dir for NanoGUI to also compile the C++ example.")
+
+        if _pybind11_flags() is None:
+            print("Install pybind11 to also compile the lazy bindings (without it only "
+                  "their eager fallback would be), and measure the import time of the "
+                  "bindings.")
+            sys.exit(0)
+        try:
+            results = benchmark_imports(args.font_name, icons, generate.FONT_LICENSE,
+                                        cxx=args.cxx)
+        except (BenchmarkError, generate.GenerateError, IOError, OSError) as e:
+            sys.stderr.write("Critical: {0}\n".format(e))
+            sys.exit(1)
+        print("Imported the python bindings:")
+        for style, seconds, allocated in results:
+            print("  {0:<8} {1:9.2f}ms {2:>10} bytes allocated".format(
+                style, 1000.0 * seconds, allocated
+            ))
+        sys.exit(0)
+
+    if args.lookup:
+        try:
+            results = benchmark_lookup(counts, cxx=args.cxx)
+        except (BenchmarkError, generate.GenerateError, IOError, OSError) as e:
+            sys.stderr.write("Critical: {0}\n".format(e))
+            sys.exit(1)
+
+        print("Nanoseconds per lookup, compiled with {0}:".format(args.cxx))
+        print("  {0:>7} {1:<10} {2}".format(
+            "icons", "by", " ".join("{0:>14}".format(method) for method in LOOKUP_METHODS)
+        ))
+        for count, direction, timings in results:
+            print("  {0:>7} {1:<10} {2}".format(count, direction, " ".join(
+                "{0:>14.1f}".format(timings[method]) for method in LOOKUP_METHODS
+            )))
+        sys.exit(0)
+
+    if args.embed:
+        try:
+            if not os.path.exists(ttf_file):
+                raise BenchmarkError("[{0}] does not exist.".format(ttf_file))
+            results, skipped = benchmark_embed(compiled_name, ttf_file, cxx=args.cxx)
+        except (BenchmarkError, generate.GenerateError, IOError, OSError) as e:
+            sys.stderr.write("Critical: {0}\n".format(e))
+            sys.exit(1)
+
+        print("Embedded {0} ({1} bytes), compiled with {2}:".format(
+            os.path.relpath(ttf_file), os.path.getsize(ttf_file), args.cxx
+        ))
+        print("  {0:<6} {1:>10} {2:>10} {3:>9} {4:>12} {5:>10}".format(
+            "format", "payload", "object", "compile", "first load", "again"
+        ))
+        for embed, payload, size, seconds, first, again in results:
+            print("  {0:<6} {1:>10} {2:>10} {3:>8.2f}s {4:>10.3f}ms {5:>8.0f}ns".format(
+                embed, payload, size, seconds, 1000.0 * first, 1e9 * again
+            ))
+        for embed, reason in skipped:
+            print("  {0:<6} skipped: {1}".format(embed, reason))
+        sys.exit(0)
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare, "r") as f:
+                baseline = json.load(f)
+        except (IOError, OSError, ValueError) as e:
+            sys.stderr.write("Critical: could not read [{0}]: {1}\n".format(args.compare, e))
+            sys.exit(1)
+
+    try:
+        results = run(counts, source_dir=args.icons, jobs=args.jobs,
+                      progress=lambda message: print(message, flush=True))
+    except (BenchmarkError, svg2ttf.SVGError, generate.GenerateError, IOError, OSError) as e:
+        sys.stderr.write("Critical: {0}\n".format(e))
+        sys.exit(1)
+
+    print("Seconds (peak RSS) with {0} processes:".format(results["jobs"]))
+    print("  {0:>7} {1:>10} {2}".format(
+        "icons", "last", " ".join("{0:>16}".format(stage) for stage in STAGES)
+    ))
+    for result in results["results"]:
+        print("  {0:>7} {1:>10} {2}".format(result["icons"], "U+{0:04X}".format(
+            result["last_codepoint"]
+        ), " ".join(
+            "{0:>9.3f} ({1:>4})".format(
+                result["stages"][stage]["seconds"], _megabytes(result["stages"][stage]["peak_rss"])
+            ) for stage in STAGES
+        )))
+    print("Output sizes in bytes:")
+    keys = sorted(results["results"][0]["sizes"]) if results["results"] else []
+    print("  {0:>7} {1}".format("icons", " ".join("{0:>12}".format(key) for key in keys)))
+    for result in results["results"]:
+        print("  {0:>7} {1}".format(result["icons"], " ".join(
+            "{0:>12}".format(result["sizes"][key]) for key in keys
+        )))
+
+    try:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+    except (IOError, OSError) as e:
+        sys.stderr.write("Critical: could not write [{0}]: {1}\n".format(args.output, e))
+        sys.exit(1)
+    print("Wrote [{0}].".format(args.output))
+
+    if baseline is not None:
+        try:
+            regressions = compare(baseline, results, args.threshold)
+        except (BenchmarkError, KeyError, TypeError) as e:
+            sys.stderr.write("Critical: could not compare against [{0}]: {1}\n".format(args.compare, e))
+            sys.exit(1)
+        for icons, stage, before, after in regressions:
+            print("Slower: {0} with {1} icons took {2:.3f}s, was {3:.3f}s ({4:.2f}x).".format(
+                stage, icons, after, before, after / before
+            ))
+        if regressions:
+            sys.exit(1)
+        print("No stage got more than {0:g}x slower than in [{1}].".format(args.threshold, args.compare))
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Per-stage timings of a build, recorded by ``./manufacture.py`` and ``./generate.py``
+with ``--profile`` (printed at the end) and ``--report report.json`` (written as JSON
+for a build dashboard to keep track of).
+
+Stages nest, and their names are paths: ``./manufacture.py --all`` records
+``fontawesome``, ``fontawesome/compile``, ``fontawesome/generate``,
+``fontawesome/generate/read``, and so on.  Every stage records
+
+``wall_seconds`` / ``cpu_seconds``
+    Wall clock and CPU time, the latter including the child processes that
+    finished during the stage (e.g. the ones converting the icons).
+``peak_rss`` / ``peak_rss_children``
+    The high-water mark of the resident set size of the process (and of its
+    largest child) when the stage ended, in bytes.  It never goes down, so a stage
+    raising it is the one that used the memory.  ``None`` where unknown.
+``bytes_read`` / ``bytes_written`` / ``glyphs``
+    What the stage reports having read, written, and how many glyphs it
+    processed.  The bytes of a stage include those of the stages within it.
+
+One stage can also be profiled (``--profile-stage``), with :mod:`cProfile` into
+``profile-{stage}.prof`` (see :mod:`pstats`), or with :mod:`tracemalloc` into
+``profile-{stage}.txt`` (the lines allocating the most memory that is still
+allocated when the stage ends, and the peak).
+
+Example::
+
+    report = BuildReport(profile_stage="generate/render")
+    with report.stage("generate") as stage:
+        ...
+        stage.add(glyphs=len(icons))
+    report.write("report.json", "generate.py")
+"""
+
+import argparse
+import contextlib
+import cProfile
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # not on Windows, the peak RSS is then not recorded
+    resource = None
+
+
+class ReportError(Exception):
+    """Raised when a build report cannot be written or read."""
+
+
+REPORT_VERSION = 1
+PROFILE_TOOLS = ("cprofile", "tracemalloc")
+COUNTERS = ("bytes_read", "bytes_written", "glyphs")
+
+# tracemalloc: the number of allocation sites listed
+TRACEMALLOC_TOP = 25
+
+
+def peak_rss(children=False):
+    """
+    Peak resident set size in bytes of this process (or, with ``children``, of its
+    largest waited-for child).  None where the ``resource`` module is missing.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else
+                               resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes everywhere but macOS
+    return peak if sys.platform == "darwin" else 1024 * peak
+
+
+def _cpu_seconds():
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+class Stage(object):
+    """
+    One stage being recorded, see :meth:`BuildReport.stage`.  Set ``failed`` when
+    the stage fails without raising.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.counters = dict((counter, 0) for counter in COUNTERS)
+        self.failed = False
+
+    def add(self, **counts):
+        """Add to the ``bytes_read``, ``bytes_written`` and ``glyphs`` of the stage."""
+        for counter, value in counts.items():
+            if counter not in self.counters:
+                raise ReportError("unknown counter [{0}]".format(counter))
+            self.counters[counter] += value
+
+
+class _NoStage(object):
+    failed = False
+
+    def add(self, **counts):
+        pass
+
+
+class BuildReport(object):
+    """
+    Records the stages run within :meth:`stage`.  When ``enabled`` is ``False``
+    nothing is recorded at all.  The stage named ``profile_stage`` (its whole name,
+    or the part after any ``/``) is profiled with ``profile_tool`` (one of
+    :data:`PROFILE_TOOLS`), writing the profile to ``profile_dir`` (default: the
+    current directory).
+    """
+
+    def __init__(self, enabled=True, profile_stage=None, profile_tool="cprofile",
+                 profile_dir=None):
+        if profile_tool not in PROFILE_TOOLS:
+            raise ReportError("Invalid profile tool [{0}], expected one of {1}.".format(
+                profile_tool, ", ".join(PROFILE_TOOLS)
+            ))
+        self.enabled = enabled
+        self.profile_stage = profile_stage
+        self.profile_tool = profile_tool
+        self.profile_dir = profile_dir or os.curdir
+        self.stages = []
+        self.started = datetime.datetime.now(datetime.timezone.utc)
+        self._start = time.perf_counter()
+        self._open = []
+
+    def _profiled(self, name):
+        wanted = self.profile_stage
+        return wanted is not None and (name == wanted or name.endswith("/" + wanted))
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Record the stage ``name`` (within the stage open, if any) while the
+        ``with`` block runs.  Yields the :class:`Stage`, to :meth:`Stage.add` what
+        it read, wrote and processed.  A stage that raises is recorded too, as
+        ``failed``.
+        """
+        if not self.enabled:
+            yield _NoStage()
+            return
+
+        parent = self._open[-1] if self._open else None
+        current = Stage(name if parent is None else "{0}/{1}".format(parent.name, name))
+        profiler = None
+        tracing = False
+        if self._profiled(current.name):
+            if self.profile_tool == "cprofile":
+                profiler = cProfile.Profile()
+            elif not tracemalloc.is_tracing():
+                tracemalloc.start()
+                tracing = True
+
+        self._open.append(current)
+        failed = True
+        cpu = _cpu_seconds()
+        start = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield current
+            failed = False
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            wall = time.perf_counter() - start
+            cpu = _cpu_seconds() - cpu
+            self._open.pop()
+            record = {
+                "name": current.name,
+                "wall_seconds": wall,
+                "cpu_seconds": cpu,
+                "peak_rss": peak_rss(),
+                "peak_rss_children": peak_rss(children=True),
+                "failed": failed or current.failed
+            }
+            record.update(current.counters)
+            self.stages.append(record)
+            if parent is not None:
+                parent.add(bytes_read=current.counters["bytes_read"],
+                           bytes_written=current.counters["bytes_written"])
+                # the stages within one work on the same glyphs
+                parent.counters["glyphs"] = max(parent.counters["glyphs"],
+                                                current.counters["glyphs"])
+            if profiler is not None or tracing:
+                record["profile"] = self._dump(current.name, profiler)
+
+    def _dump(self, name, profiler):
+        path = os.path.join(self.profile_dir, "profile-{0}.{1}".format(
+            name.replace("/", "-"), "prof" if profiler is not None else "txt"
+        ))
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            if profiler is not None:
+                profiler.dump_stats(path)
+                return path
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            with open(path, "w") as f:
+                f.write("{0}: {1} bytes allocated, {2} at the peak\n".format(name, current, peak))
+                for statistic in snapshot.statistics("lineno")[:TRACEMALLOC_TOP]:
+                    f.write("{0}\n".format(statistic))
+        except (IOError, OSError) as e:
+            raise ReportError("could not write the profile [{0}]: {1}".format(path, e)) from e
+        return path
+
+    def extend(self, stages):
+        """Add the ``stages`` recorded by another report (e.g. in a worker process)."""
+        if self.enabled:
+            self.stages.extend(stages)
+
+    def to_dict(self, tool):
+        """The report of the run of ``tool`` (e.g. ``"generate.py"``) as a JSON ready dict."""
+        return {
+            "version": REPORT_VERSION,
+            "tool": tool,
+            "started": self.started.isoformat(),
+            "wall_seconds": time.perf_counter() - self._start,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "stages": self.stages
+        }
+
+    def write(self, path, tool):
+        """Write :meth:`to_dict` to ``path`` as JSON."""
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(self.to_dict(tool), f, indent=2, sort_keys=True)
+                f.write("\n")
+        except (IOError, OSError) as e:
+            raise ReportError("could not write the report [{0}]: {1}".format(path, e)) from e
+
+
+def _megabytes(value):
+    return "-" if value is None else "{0:.1f}M".format(value / (1024.0 * 1024.0))
+
+
+def format_stages(stages):
+    """The ``stages`` of a report as a table, one line per stage."""
+    lines = ["  {0:<40} {1:>9} {2:>9} {3:>9} {4:>10} {5:>10} {6:>7}".format(
+        "stage", "wall", "cpu", "peak rss", "read", "written", "glyphs"
+    )]
+    for record in stages:
+        depth = record["name"].count("/")
+        name = "  " * depth + record["name"].rsplit("/", 1)[-1]
+        if record.get("failed"):
+            name += " (failed)"
+        lines.append("  {0:<40} {1:>8.3f}s {2:>8.3f}s {3:>9} {4:>10} {5:>10} {6:>7}".format(
+            name, record["wall_seconds"], record["cpu_seconds"], _megabytes(record["peak_rss"]),
+            record["bytes_read"], record["bytes_written"], record["glyphs"]
+        ))
+    return "\n".join(lines)
+
+
+def ordered(stages):
+    """
+    The ``stages`` of a report in the order they started: stages are recorded
+    when they end, so every stage comes after the ones within it.
+    """
+    children = {}
+    for index, record in enumerate(stages):
+        parent = record["name"].rpartition("/")[0]
+        children.setdefault(parent, []).append(index)
+    result = []
+
+    def visit(name):
+        for index in children.get(name, []):
+            result.append(stages[index])
+            visit(stages[index]["name"])
+    visit("")
+    return result
+
+
+def add_arguments(parser):
+    """Add the ``--profile``, ``--report``, ``--profile-stage`` and ``--profile-tool`` options."""
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the wall and CPU time, peak memory, bytes read and written and glyphs "
+             "of every stage at the end."
+    )
+    parser.add_argument(
+        "--report",
+        metavar="FILE",
+        help="Write the time, memory and counts of every stage to FILE as JSON."
+    )
+    parser.add_argument(
+        "--profile-stage",
+        metavar="STAGE",
+        help="Also profile STAGE (e.g. compile or generate/render) into "
+             "profile-STAGE.prof / .txt, next to the --report if any, see --profile-tool."
+    )
+    parser.add_argument(
+        "--profile-tool",
+        choices=PROFILE_TOOLS,
+        default="cprofile",
+        help="How --profile-stage profiles: the time spent in every function, or the "
+             "memory allocated by every line (default: %(default)s)."
+    )
+
+
+def from_arguments(args):
+    """The :class:`BuildReport` asked for by the options of :func:`add_arguments`."""
+    return BuildReport(
+        enabled=bool(args.profile or args.report or args.profile_stage),
+        profile_stage=args.profile_stage,
+        profile_tool=args.profile_tool,
+        profile_dir=os.path.dirname(args.report) if args.report else None
+    )
+
+
+def finish(report, args, tool):
+    """Print (``--profile``) and write (``--report``) the ``report`` of the run of ``tool``."""
+    if args.profile:
+        print("Stages of {0}:".format(tool))
+        print(format_stages(ordered(report.stages)))
+    for record in report.stages:
+        if "profile" in record:
+            print("Profiled [{0}] into [{1}].".format(record["name"], record["profile"]))
+    if args.report:
+        report.write(args.report, tool)
+        print("Wrote the build report [{0}].".format(args.report))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Print the stages of a build report (written with --report)."
+    )
+    parser.add_argument("report", help="The report.json to print.")
+    args = parser.parse_args()
+    try:
+        with open(args.report, "r") as f:
+            report = json.load(f)
+        if report.get("version") != REPORT_VERSION:
+            raise ReportError("[{0}] is not a version {1} build report.".format(
+                args.report, REPORT_VERSION
+            ))
+        print("{0} started {1}, {2:.2f}s:".format(
+            report["tool"], report["started"], report["wall_seconds"]
+        ))
+        print(format_stages(ordered(report["stages"])))
+    except (IOError, OSError, ValueError, KeyError, ReportError) as e:
+        sys.stderr.write("Critical: {0}\n".format(e))
+        sys.exit(1)
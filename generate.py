@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 
+import argparse
 import os
 import codecs
+import hashlib
 from io import BytesIO
+import json
 import re
 import sys
 import textwrap
+import time
+import zlib
+
+import buildreport
+import iconmanifest
+import ttf
 
 
 # vvv These are updated by ./manufacture.py
@@ -14,491 +23,1903 @@ FONT_NAME = "fontawesome"
 FONT_LICENSE = "CC-BY-SA 4.0: https://github.com/FortAwesome/Font-Awesome/blob/master/LICENSE.txt"
 # ^^^ These are updated by ./manufacture.py
 
-if __name__ == "__main__":
-    # Make sure we're in the same directory to avoid overwriting things
-    file_loc = os.path.dirname(os.path.abspath(__file__))
-    curr_dir = os.path.abspath(os.getcwd())
+# Records the hashes of the inputs and rendered outputs of the last run, stored
+# next to the generated files in nanogui/{FONT_NAME}.
+BUILD_MANIFEST_NAME = ".generate-manifest.json"
+BUILD_MANIFEST_VERSION = 1
+
+
+# How the icons are emitted.  "define" is one #define per icon, and the example /
+# bindings repeat one statement per icon.  "table" adds an enum class and a
+# constexpr table of every icon, which the example and bindings loop over, so
+# they compile in a fraction of the time into much smaller objects.  "lazy" is
+# "table", but the python module creates its ICON_* attributes on first access
+# (a module level __getattr__ / __dir__) rather than all of them on import.
+STYLES = ("define", "table", "lazy")
+
+# How resource_{FONT_NAME}.cpp embeds the font.  "raw" is the .ttf itself, read in
+# place by fontstash.  "zlib" is the .ttf deflated, and "woff2" the .ttf compressed
+# into WOFF2 (by fontTools), both decompressed into memory on first use (linking
+# zlib / the woff2 decoder), a smaller binary for a slower first load.
+EMBED_FORMATS = ("raw", "zlib", "woff2")
+
+_EMBED_DESCRIPTIONS = {
+    "raw": "embedded as is",
+    "zlib": "inflated from zlib on the first call",
+    "woff2": "decoded from WOFF2 on the first call"
+}
+
+
+class GenerateError(Exception):
+    """Raised by :func:`generate` when the NanoGUI utilities cannot be generated."""
+
+
+def read_css_icons(css_file, font_name):
+    """
+    Return ``[(name, codepoint), ...]`` by scanning the fontcustom css file.  Only
+    works when the ``css_selector`` in ``config/fontcustom.yml`` is exactly
+    ``.{{font_name}}-icon-{{glyph}}``.
+    """
+    # fontcusom generates something like
+    # .fontname-icon-location:before { content: "\e724"; }
+    icon_re = re.compile(r'\.{name}-icon-(.+):before {{ content: "\\(.+)"; }}'.format(name=font_name))
+    icons = []
+    with codecs.open(css_file, "r", "utf-8") as css:
+        for line in css:
+            match = icon_re.match(line)
+            if match:
+                icon_name, icon_code = match.groups()
+                icons.append((icon_name, int(icon_code, 16)))
+    return icons
+
+
+def read_icons(css_or_ttf_path, font_name, merged=False):
+    """
+    Return ``[(name, codepoint), ...]`` from either the fontcustom css file or the
+    compiled font, depending on the extension of ``css_or_ttf_path``.  When
+    ``merged``, the font holds the icons of several fonts (see
+    ``svg2ttf.merge_fonts``) and only those of ``font_name`` are returned.  Icons
+    sharing the glyph of another (``svg2ttf.py --dedupe``) have its codepoint, and
+    come after it.
+    """
+    try:
+        if css_or_ttf_path.lower().endswith(".css"):
+            # the selectors of every font already carry its name
+            return read_css_icons(css_or_ttf_path, font_name)
+        icons = ttf.read_icons(css_or_ttf_path)
+        aliases = ttf.read_aliases(css_or_ttf_path)
+        if aliases:
+            codepoints = dict(icons)
+            for alias, name in sorted(aliases.items()):
+                if alias in codepoints or name not in codepoints:
+                    raise GenerateError("[{0}] does not match the font, compile it again.".format(
+                        ttf.aliases_path(css_or_ttf_path)
+                    ))
+                icons.append((alias, codepoints[name]))
+            icons.sort(key=lambda icon: icon[1])
+        if merged:
+            prefix = "{0}-".format(font_name)
+            icons = [
+                (name[len(prefix):], codepoint) for name, codepoint in icons
+                if name.startswith(prefix)
+            ]
+        return icons
+    except Exception as e:
+        raise GenerateError(
+            "error processing file [{0}]: {1}".format(css_or_ttf_path, e)
+        ) from e
+
+
+def check_svg_names(icons, svg_dir):
+    """
+    Compare the icon names read from the compiled font against the ``.svg`` files
+    in ``svg_dir``.  Returns ``(missing, extra)``: SVGs with no glyph in the font,
+    and glyphs with no SVG.  Both are sorted lists of icon names.
+    """
+    svg_names = set(
+        entry[:-len(".svg")] for entry in os.listdir(svg_dir) if entry.endswith(".svg")
+    )
+    font_names = set(name for name, _ in icons)
+    return sorted(svg_names - font_names), sorted(font_names - svg_names)
 
-    if file_loc != curr_dir:
-        sys.stderr.write(
-            "Please execute this script in directory [{0}]\n".format(file_loc)
-        )
-        sys.exit(1)
 
-    # Make sure the CSS file exists / has been generated
-    css_file = os.path.abspath(
-        os.path.join(
-            file_loc,
-            "compiled_fonts",
-            FONT_NAME,
-            "{name}.css".format(name=FONT_NAME)
-        )
-    )
-    if not os.path.exists(css_file):
-        sys.stderr.write(
-            "[{0}] does not exist.  Make sure you already generated it (with `rake`).\n".format(
-                css_file
-            )
-        )
-        sys.exit(1)
+def sha256_of_file(path):
+    """Return the hex sha256 digest of ``path``, or ``None`` if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (IOError, OSError):
+        return None
 
-    # Generate header file
+
+def load_build_manifest(path):
+    """Return the previous build manifest, or ``None`` if missing / unusable."""
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != BUILD_MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def write_if_changed(outputs):
+    """
+    Write every ``(path, content)`` pair in ``outputs`` whose content differs from
+    what is already on disk.  Unchanged files are left alone so their mtimes do
+    not trigger downstream recompilation.
+
+    Returns ``(written, skipped, digests)`` where ``digests`` maps each path to the
+    sha256 of its rendered content.
+    """
+    written = []
+    skipped = []
+    digests = {}
+    for path, content in outputs:
+        data = content if isinstance(content, bytes) else content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        digests[path] = digest
+        if sha256_of_file(path) == digest:
+            skipped.append(path)
+        else:
+            ttf.atomic_write(path, data)
+            written.append(path)
+
+    return written, skipped, digests
+
+
+def icon_identifier(icon_name):
+    """The ``X`` of the ``#define {FONT_NAME}_ICON_X`` of the icon ``icon_name``."""
+    return icon_name.replace("-", "_").upper()
+
+
+def make_cdefs(font_name, icons):
+    """
+    Return ``(cdefs, longest)`` for the ``[(name, codepoint), ...]`` in ``icons``.
+    ``cdefs`` is ``[(icon_name, icon_def, icon_code), ...]`` where ``icon_def`` is
+    ``#define {FONT_NAME}_ICON_{ICON_NAME}`` and ``icon_code`` is the zero-filled
+    hex codepoint, and ``longest`` is the length of the longest ``icon_def``.
+    """
     cdefs = []
-    num_matches = 0
     longest = 0
+    for icon_name, codepoint in icons:
+        icon_def = "#define {font}_ICON_{icon}".format(
+            font=font_name.upper(),
+            icon=icon_identifier(icon_name)
+        )
+        # {code:0>8X} format spec says using code variable, align it to the right
+        # and make it a fixed width of 8 upper case hex characters, padding with a
+        # 0.  AKA zero-fill on the left until 8 char long
+        icon_code = "0x{code:0>8X}".format(code=codepoint)
+        cdefs.append((icon_name, icon_def, icon_code))
+        longest = max(longest, len(icon_def))
+
+    return cdefs, longest
+
+
+def read_icon_metrics(ttf_path, icons):
+    """
+    Return ``(metrics, em_size)`` for the ``[(name, codepoint), ...]`` in
+    ``icons``, read from the ``hmtx`` and ``glyf`` tables of the compiled font at
+    ``ttf_path``.  ``metrics[i]`` is ``(advance, xMin, yMin, xMax, yMax)`` of
+    ``icons[i]`` in ems (font units divided by the units per em, y up from the
+    baseline).  ``em_size`` is the size of an em relative to the size given to
+    ``nvgFontSize``, which fontstash maps to the ``hhea`` ascent - descent.
+    """
     try:
-        # fontcusom generates something like
-        # .fontname-icon-location:before { content: "\e724"; }
-        icon_re = re.compile(r'\.{name}-icon-(.+):before {{ content: "\\(.+)"; }}'.format(name=FONT_NAME))
-        with codecs.open(css_file, "r", "utf-8") as css:
-            for line in css:
-                match = icon_re.match(line)
-                if match:
-                    num_matches += 1
-                    icon_name, icon_code = match.groups()
-                    icon_def = "#define {font}_ICON_{icon}".format(
-                        font=FONT_NAME.upper(),
-                        icon=icon_name.replace("-", "_").upper()
-                    )
-                    # {code:0>8} format spec says using code variable, align it to
-                    # the right and make it a fixed width of 8 characters, padding
-                    # with a 0.  AKA zero-fill on the left until 8 char long
-                    icon_code = "0x{code:0>8}".format(code=icon_code.upper())
-                    cdefs.append((icon_name, icon_def, icon_code))
-                    longest = max(longest, len(icon_def))
+        with ttf.TrueTypeFont(ttf_path) as font:
+            units_per_em = float(font.units_per_em)
+            ascent, descent = font.vertical_metrics(typographic=False)
+            advances = font.advances()
+            cmap = font.cmap()
+            metrics = []
+            for name, codepoint in icons:
+                gid = cmap[codepoint]
+                metrics.append(tuple(
+                    value / units_per_em
+                    for value in (advances[gid],) + tuple(font.glyph_bounds(gid))
+                ))
     except Exception as e:
-        sys.stderr.write(
-            "Critical: error processing file [{0}]: {1}\n".format(css_file, e)
-        )
-        sys.exit(1)
-
-
-    if num_matches == EXPECTED_NUM_ICONS:
-        print("Found exactly [{0}] icons, as expected.".format(num_matches))
-    else:
-        sys.stderr.write(
-            "Found [{0}] icons, expected [{1}]\n".format(num_matches,
-                                                        EXPECTED_NUM_ICONS)
-        )
-        sys.exit(1)
-
-    if not os.path.isdir("nanogui"):
-        try:
-            os.mkdir("nanogui")
-        except Exception as e:
-            sys.stderr.write(
-                "Critical: could not make directory ./nanogui: {0}\n".format(e)
-            )
-            sys.exit(1)
-
-    containment = "nanogui/{name}".format(name=FONT_NAME)
-    if not os.path.isdir(containment):
-        try:
-            os.mkdir(containment)
-        except Exception as e:
-            sys.stderr.write(
-                "Critical: could not make directory {0}: {1}\n".format(
-                    containment, e
-                )
-            )
-            sys.exit(1)
-
-    font_header_file_path = "{containment}/{name}.h".format(
-        containment=containment, name=FONT_NAME
+        raise GenerateError(
+            "error reading the icon metrics of [{0}]: {1}".format(ttf_path, e)
+        ) from e
+    return metrics, units_per_em / (ascent + descent)
+
+
+def icon_hash(data):
+    """
+    The 64 bit hash of the bytes ``data``, as computed by the ``{name}IconHash``
+    emitted by :func:`render_header`: eight (little endian) bytes at a time are
+    multiplied in, folding the high half into the low half after each.
+    """
+    value = 0xCBF29CE484222325 ^ len(data)
+    for i in range(0, len(data), 8):
+        chunk = int.from_bytes(data[i:i + 8], "little")
+        value = ((value ^ chunk) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        value ^= value >> 32
+    return value
+
+
+def icon_mix(value):
+    """
+    Scramble the bits of the 64 bit ``value`` (the splitmix64 finalizer), as the
+    ``{name}IconMix`` emitted by :func:`render_header` does.
+    """
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return value ^ (value >> 31)
+
+
+# Spreads the seeds of perfect_hash over the 64 bits before mixing them in.
+SEED_MULTIPLIER = 0x9E3779B97F4A7C15
+
+# The seeds perfect_hash tries per bucket: a few dozen suffice for 100000 keys,
+# running out means a bucket cannot be placed (or the keys are not distinct).
+MAX_SEED = 1 << 12
+
+
+def perfect_hash(hashes):
+    """
+    Build a minimal perfect hash of the distinct 64 bit ``hashes`` with the hash
+    and displace algorithm.  Returns ``(seeds, slots)``, both as long as
+    ``hashes``: hash ``h`` falls in the bucket ``b = h % n`` and lives in slot
+    ``-seeds[b] - 1`` when ``seeds[b]`` is negative, else in slot
+    ``icon_mix(h ^ seeds[b] * SEED_MULTIPLIER) % n``.  ``slots[s]`` is the index
+    of the hash in slot ``s``.
+
+    Buckets are placed largest first, trying seeds until every hash of the bucket
+    lands on a distinct free slot; the buckets of a single hash then fill the
+    remaining slots directly.  Raises :class:`GenerateError` if ``hashes`` are
+    not distinct, or a bucket finds no seed up to :data:`MAX_SEED`.
+    """
+    count = len(hashes)
+    if len(set(hashes)) != count:
+        raise GenerateError("could not build a perfect hash of {0} keys, {1} are repeated.".format(
+            count, count - len(set(hashes))
+        ))
+    buckets = [[] for _ in range(count)]
+    for i, value in enumerate(hashes):
+        buckets[value % count].append(i)
+
+    seeds = [0] * count
+    slots = [None] * count
+    order = sorted(range(count), key=lambda bucket: -len(buckets[bucket]))
+    singles = []
+    for bucket in order:
+        members = buckets[bucket]
+        if len(members) == 1:
+            singles.append(bucket)
+            continue
+        if not members:
+            break
+        seed = 1
+        while True:
+            scramble = (seed * SEED_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF
+            positions = [icon_mix(hashes[i] ^ scramble) % count for i in members]
+            if len(set(positions)) == len(members) and all(
+                slots[position] is None for position in positions
+            ):
+                break
+            seed += 1
+            if seed > MAX_SEED:
+                raise GenerateError("could not build a perfect hash, no seed places the {0} "
+                                    "keys of a bucket.".format(len(members)))
+        seeds[bucket] = seed
+        for i, position in zip(members, positions):
+            slots[position] = i
+
+    free = [position for position in range(count) if slots[position] is None]
+    for bucket, position in zip(singles, free):
+        seeds[bucket] = -position - 1
+        slots[position] = buckets[bucket][0]
+    return seeds, slots
+
+
+def _cpp_int_rows(values, per_row=12):
+    """``values`` as the rows of a C++ array initializer, ``per_row`` to a line."""
+    return "".join(
+        "    {0},\n".format(", ".join(str(value) for value in values[i:i + per_row]))
+        for i in range(0, len(values), per_row)
     )
-    try:
-        font_header_file = open(font_header_file_path, "w")
-        font_header_file.write(textwrap.dedent(r'''
-            /*
-                 NanoGUI was developed by Wenzel Jakob <wenzel.jakob@epfl.ch>.
-                 The widget drawing code is based on the NanoVG demo application
-                 by Mikko Mononen.
-
-                 All rights reserved. Use of this source code is governed by a
-                 BSD-style license that can be found in the LICENSE.txt file.
 
-                 This file represents the constants that can be used provided by the
-                 {name} font.
 
-                 License: {license}
+def _cpp_float(value):
+    """``value`` as a C++ ``float`` literal, e.g. ``0.875f``."""
+    return "{0!r}f".format(round(float(value), 6))
+
+
+def cdef_identifier(font_name, icon_def):
+    """The ``X`` of the ``#define {FONT_NAME}_ICON_X`` in ``icon_def``."""
+    return icon_def.split(" ")[1].split("{NAME}_ICON_".format(NAME=font_name.upper()))[1]
+
+
+def render_header(font_name, font_license, cdefs, longest, style="define", metrics=None,
+                  lookup=False, embed=None):
+    """
+    Return the contents of ``{font_name}.h``.  With ``style="table"`` the header
+    also has a ``{FontName}Icon`` enum class and a ``constexpr`` table of every
+    icon (see :data:`STYLES`), as does ``style="lazy"``.  With ``metrics`` (as
+    returned by :func:`read_icon_metrics`) it also has a ``constexpr`` table of
+    the advance and bounding box of every icon.  With ``lookup`` it also has
+    minimal perfect hash tables (see :func:`perfect_hash`) and the functions
+    looking up the codepoint of an icon name, and the name of a codepoint.  With
+    ``embed`` (one of :data:`EMBED_FORMATS`) it declares the function returning
+    the font embedded by :func:`render_font_resource`.
+    """
+    font_header_file = []
+    font_header_file.append(textwrap.dedent(r'''
+        /*
+             NanoGUI was developed by Wenzel Jakob <wenzel.jakob@epfl.ch>.
+             The widget drawing code is based on the NanoVG demo application
+             by Mikko Mononen.
+
+             All rights reserved. Use of this source code is governed by a
+             BSD-style license that can be found in the LICENSE.txt file.
+
+             This file represents the constants that can be used provided by the
+             {name} font.
+
+             License: {license}
+         */
+
+        /* Developer note: need to make a change to this file?
+         * Please raise an Issue on GitHub describing what needs to change.  This file
+         * was generated, so the scripts that generated it need to update as well.
+         */
+
+        #pragma once
+
+    '''.format(
+        name=font_name,
+        license=font_license
+    ).replace("\n", "", 1)))  # remove empty line at top
+
+    if style in ("table", "lazy"):
+        font_header_file.append(textwrap.dedent('''\
+            #include <cstddef>
+
+            /* The {NAME}_ICON_* macros are kept for existing code, define
+             * NANOGUI_{NAME}_NO_ICON_MACROS to use only the {Name}Icon enum and the
+             * {NAME}_ICONS table below.
              */
-
-            /* Developer note: need to make a change to this file?
-             * Please raise an Issue on GitHub describing what needs to change.  This file
-             * was generated, so the scripts that generated it need to update as well.
-             */
-
-            #pragma once
-
+            #ifndef NANOGUI_{NAME}_NO_ICON_MACROS
         '''.format(
-            name=FONT_NAME,
-            license=FONT_LICENSE
-        ).replace("\n", "", 1)))  # remove empty line at top
-
-        font_python_bindings_path = "{containment}/constants_{name}.cpp".format(
-            containment=containment, name=FONT_NAME
-        )
-        font_python_bindings = open(font_python_bindings_path, "w")
-        font_python_bindings.write(textwrap.dedent('''
-            #ifdef NANOGUI_PYTHON
+            NAME=font_name.upper(),
+            Name=font_name.capitalize()
+        )))
 
-            #include "python.h"
-            #include <nanogui/{name}.h>
+    for icon_name, icon_def, icon_code in cdefs:
+        # Generate the header file #define directive
+        font_header_file.append("{definition:<{longest}} {code}\n".format(
+            definition=icon_def,
+            longest=longest,
+            code=icon_code
+        ))
+
+    if style in ("table", "lazy"):
+        identifiers = [
+            (cdef_identifier(font_name, icon_def), icon_code)
+            for icon_name, icon_def, icon_code in cdefs
+        ]
+        widest = max([len(identifier) for identifier, _ in identifiers] + [0])
+        font_header_file.append(textwrap.dedent('''\
+            #endif
 
-            /* Python bindings for the {name} font.
-             *
-             * License: {license}
+            /* Every icon of the {name} font.  NanoGUI takes icons as an int, so use
+             * static_cast<int>({Name}Icon::X) (or {NAME}_ICON_X) where it wants one.
              */
+            enum class {Name}Icon : int {{
+        '''.format(
+            name=font_name,
+            NAME=font_name.upper(),
+            Name=font_name.capitalize()
+        )))
+        for identifier, icon_code in identifiers:
+            font_header_file.append("    {identifier:<{widest}} = {code},\n".format(
+                identifier=identifier,
+                widest=widest,
+                code=icon_code
+            ))
+        font_header_file.append(textwrap.dedent('''\
+            }};
 
-            /* Developer note: need to make a change to this file?
-             * Please raise an Issue on GitHub describing what needs to change.  This file
-             * was generated, so the scripts that generated it need to update as well.
+            /* An entry of {NAME}_ICONS: the name of the icon without the {NAME}_ICON_
+             * prefix, and its codepoint.
              */
+            struct {Name}IconEntry {{
+                const char *name;
+                int codepoint;
+            }};
 
-            void register_constants_{name}(py::module &m) {{
-                /* bindings for the {name} font */
-                {{
-                    #define C(name) g.attr("ICON_" #name) = py::int_({NAME}_ICON_##name);
-                    py::module g = m.def_submodule("{name}");
+            /* Every icon of the {name} font, sorted by codepoint. */
+            static constexpr {Name}IconEntry {NAME}_ICONS[] = {{
         '''.format(
-            name=FONT_NAME,
-            NAME=FONT_NAME.upper(),
-            license=FONT_LICENSE
+            name=font_name,
+            NAME=font_name.upper(),
+            Name=font_name.capitalize()
         )))
-
-        # Generate the full header file / python bindings
-        for icon_name, icon_def, icon_code in cdefs:
-            # icon_def is `#define {FONT_NAME.upper()}_ICON_X`
-
-            # Generate the header file #define directive
-            font_header_file.write("{definition:<{longest}} {code}\n".format(
-                definition=icon_def,
-                longest=longest,
+        for identifier, icon_code in identifiers:
+            font_header_file.append("    {{{name:<{widest}} {code}}},\n".format(
+                name='"{0}",'.format(identifier),
+                widest=widest + 3,
                 code=icon_code
             ))
+        font_header_file.append(textwrap.dedent('''\
+            }};
 
-            # Generate the python binding
-            cpp_def = icon_def.split(" ")[1]
-            py_def  = cpp_def.split("{NAME}_ICON_".format(NAME=FONT_NAME.upper()))[1]
-            pybind  = "C({0});".format(py_def)
-            py_name = "ICON_{0}".format(py_def)
-            font_python_bindings.write("        {pybind}\n".format(pybind=pybind))
-
-        # close the pybind
-        font_python_bindings.write(textwrap.dedent('''
-                    #undef C
-                }
-            }
+            static constexpr std::size_t {NAME}_ICON_COUNT = sizeof({NAME}_ICONS) / sizeof({NAME}_ICONS[0]);
+        '''.format(
+            NAME=font_name.upper()
+        )))
 
-            #endif
-        '''))
+    if metrics is not None:
+        icon_metrics, em_size = metrics
+        font_header_file.append(textwrap.dedent('''
+            /* The layout metrics of an icon in ems, y up from the baseline: how far the
+             * pen advances past it, and its bounding box.  Multiply by the size given to
+             * nvgFontSize and by {NAME}_EM_SIZE to get pixels.
+             */
+            struct {Name}IconMetrics {{
+                int codepoint;
+                float advance;
+                float xMin, yMin, xMax, yMax;
+            }};
 
-        font_header_file.close()
-        font_python_bindings.close()
+            /* fontstash scales the font so that its ascent - descent spans the size given
+             * to nvgFontSize, this is the size of an em relative to that.
+             */
+            static constexpr float {NAME}_EM_SIZE = {em_size};
 
-        # generate the example icon programs
-        cpp_example_path = "{containment}/example_{name}.cpp".format(
-            containment=containment, name=FONT_NAME
-        )
-        cpp_example = open(cpp_example_path, "w")
+            /* The metrics of every icon of the {name} font, sorted by codepoint. */
+            static constexpr {Name}IconMetrics {NAME}_ICON_METRICS[] = {{
+        '''.format(
+            name=font_name,
+            NAME=font_name.upper(),
+            Name=font_name.capitalize(),
+            em_size=_cpp_float(em_size)
+        )))
+        for (icon_name, icon_def, icon_code), values in zip(cdefs, icon_metrics):
+            font_header_file.append("    {{{code}, {values}}},\n".format(
+                code=icon_code,
+                values=", ".join(_cpp_float(value) for value in values)
+            ))
+        font_header_file.append(textwrap.dedent('''\
+            }};
 
-        # write the header of the cpp example
-        cpp_example.write(textwrap.dedent(r'''
-            /* Developer note: need to make a change to this file?
-             * Please raise an Issue on GitHub describing what needs to change.  This file
-             * was generated, so the scripts that generated it need to update as well.
+            /* The metrics of the icon with the given codepoint, or nullptr if the {name}
+             * font has no such icon.
              */
-
-            #include <nanogui/nanogui.h>
-            #include <nanogui/resources.h>
-            #include <nanogui/{name}.h>
-            using namespace nanogui;
-
-            // Custom theme for loading the {name} font
-            class {Name}Theme : public nanogui::Theme {{
-            public:
-                // This override informs NanoGUI to use this as the icon font.
-                virtual std::string defaultIconFont() const override {{ return "{name}"; }}
-
-                {Name}Theme(NVGcontext *ctx) : nanogui::Theme(ctx) {{
-                    // load the {name} font into memory
-                    m{Name}Font = nanogui::createFontMem(ctx, "{name}", "{name}.ttf");
-                    if (m{Name}Font == -1)
-                        throw std::runtime_error("Could not load the {name} font!");
-
-                    // TODO: you need to override the following default icon choices in your
-                    //       own application!  See documentation for nanogui::Theme.
-                    // mCheckBoxIcon             = ENTYPO_ICON_CHECK;
-                    // mCheckBoxIconExtraScale   = defaultCheckBoxIconExtraScale();
-                    // mMessageInformationIcon   = ENTYPO_ICON_INFO_WITH_CIRCLE;
-                    // mMessageQuestionIcon      = ENTYPO_ICON_HELP_WITH_CIRCLE;
-                    // mMessageWarningIcon       = ENTYPO_ICON_WARNING;
-                    // mMessageAltButtonIcon     = ENTYPO_ICON_CIRCLE_WITH_CROSS;
-                    // mMessagePrimaryButtonIcon = ENTYPO_ICON_CHECK;
-                    // mPopupChevronRightIcon    = ENTYPO_ICON_CHEVRON_RIGHT;
-                    // mPopupChevronLeftIcon     = ENTYPO_ICON_CHEVRON_LEFT;
-                    // mPopupIconExtraScale      = defaultPopupIconExtraScale();
-                    // mTabHeaderLeftIcon        = ENTYPO_ICON_ARROW_BOLD_LEFT;
-                    // mTabHeaderRightIcon       = ENTYPO_ICON_ARROW_BOLD_RIGHT;
-                    // mTextBoxUpIcon            = ENTYPO_ICON_CHEVRON_UP;
-                    // mTextBoxDownIcon          = ENTYPO_ICON_CHEVRON_DOWN;
-                    // mTextBoxIconExtraScale    = defaultTextBoxIconExtraScale();
+            static inline const {Name}IconMetrics *{name}IconMetrics(int codepoint) {{
+                int low = 0;
+                int high = (int) (sizeof({NAME}_ICON_METRICS) / sizeof({NAME}_ICON_METRICS[0]));
+                while (low < high) {{
+                    int middle = low + (high - low) / 2;
+                    if ({NAME}_ICON_METRICS[middle].codepoint < codepoint)
+                        low = middle + 1;
+                    else
+                        high = middle;
                 }}
+                if (low < (int) (sizeof({NAME}_ICON_METRICS) / sizeof({NAME}_ICON_METRICS[0])) &&
+                    {NAME}_ICON_METRICS[low].codepoint == codepoint)
+                    return &{NAME}_ICON_METRICS[low];
+                return nullptr;
+            }}
+        '''.format(
+            name=font_name,
+            NAME=font_name.upper(),
+            Name=font_name.capitalize()
+        )))
 
-                virtual ~{Name}Theme() {{ /* nothing to free */ }}
-
-            protected:
-                int m{Name}Font = -1;
+    if lookup and cdefs:
+        name_seeds, by_name = perfect_hash(
+            [icon_hash(icon_name.encode("utf-8")) for icon_name, _, _ in cdefs]
+        )
+        # Aliases (svg2ttf.py --dedupe) share the codepoint of an icon before them,
+        # they get keys no codepoint hashes to so IconName() names the icon itself.
+        codepoint_keys = []
+        seen = set()
+        for index, (_, _, icon_code) in enumerate(cdefs):
+            codepoint = int(icon_code, 16)
+            codepoint_keys.append(codepoint if codepoint not in seen else (1 << 32) + index)
+            seen.add(codepoint)
+        codepoint_seeds, by_codepoint = perfect_hash(codepoint_keys)
+        # slot of the name table holding every icon
+        name_slot = dict((icon, slot) for slot, icon in enumerate(by_name))
+        font_header_file.append(textwrap.dedent('''
+            #include <cstddef>
+            #include <cstdint>
+            #include <cstring>
+
+            /* Minimal perfect hash tables of the {name} icons: the name (as in the font,
+             * e.g. "address-book") and codepoint of every icon, each in the slot its
+             * name hashes to, and for every codepoint the slot of its icon.  A lookup
+             * hashes the key once and compares a single entry, it never allocates.
+             */
+            struct {Name}IconName {{
+                const char *name;
+                int codepoint;
             }};
 
-            class {Name}Screen : public nanogui::Screen {{
-            public:
-                {Name}Screen(const Vector2i &size, const std::string &title, bool resizable)
-                    : nanogui::Screen(size, title, resizable) {{
-
-                    m{Name}Theme = new {Name}Theme(this->mNVGContext);
-                    this->setTheme(m{Name}Theme);
-                }}
-
-                virtual ~{Name}Screen() {{ /* nothing to free */ }}
+            static constexpr std::uint32_t {NAME}_ICON_HASH_SIZE = {count};
 
-                // allow <ESCAPE> to exit
-                virtual bool keyboardEvent(int key, int scancode, int action, int modifiers) override {{
-                    if (key == GLFW_KEY_ESCAPE && modifiers == 0) {{
-                        setVisible(false);
-                        return true;
+            static constexpr {Name}IconName {NAME}_ICONS_BY_NAME[] = {{
+        '''.format(
+            name=font_name,
+            NAME=font_name.upper(),
+            Name=font_name.capitalize(),
+            count=len(cdefs)
+        )))
+        for icon in by_name:
+            font_header_file.append('    {{"{name}", {code}}},\n'.format(
+                name=cdefs[icon][0].replace("\\", "\\\\").replace('"', '\\"'),
+                code=cdefs[icon][2]
+            ))
+        font_header_file.append("};\n\n")
+        font_header_file.append(
+            "static constexpr int {NAME}_ICON_NAME_SEEDS[] = {{\n".format(NAME=font_name.upper())
+        )
+        font_header_file.append(_cpp_int_rows(name_seeds))
+        font_header_file.append("};\n\n")
+        font_header_file.append(
+            "static constexpr int {NAME}_ICONS_BY_CODEPOINT[] = {{\n".format(NAME=font_name.upper())
+        )
+        font_header_file.append(_cpp_int_rows([name_slot[icon] for icon in by_codepoint]))
+        font_header_file.append("};\n\n")
+        font_header_file.append(
+            "static constexpr int {NAME}_ICON_CODEPOINT_SEEDS[] = {{\n".format(NAME=font_name.upper())
+        )
+        font_header_file.append(_cpp_int_rows(codepoint_seeds))
+        font_header_file.append("};\n")
+        font_header_file.append(textwrap.dedent('''
+            /* Scrambles the bits of `value` (the splitmix64 finalizer). */
+            static inline std::uint64_t {name}IconMix(std::uint64_t value) {{
+                value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9ull;
+                value = (value ^ (value >> 27)) * 0x94D049BB133111EBull;
+                return value ^ (value >> 31);
+            }}
+
+            /* 64 bit hash of the `size` bytes at `data`, eight (little endian) at a time. */
+            static inline std::uint64_t {name}IconHash(const char *data, std::size_t size) {{
+                std::uint64_t hash = 0xCBF29CE484222325ull ^ size;
+                for (std::size_t i = 0; i < size; i += 8) {{
+                    std::uint64_t chunk = 0;
+                    if (size - i >= 8) {{
+                        std::memcpy(&chunk, data + i, 8);
+            #if defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_BIG_ENDIAN__
+                        chunk = __builtin_bswap64(chunk);
+            #endif
+                    }} else {{
+                        for (std::size_t j = 0; i + j < size; ++j)
+                            chunk |= (std::uint64_t) (unsigned char) data[i + j] << (8 * j);
                     }}
-
-                    return Screen::keyboardEvent(key, scancode, action, modifiers);
+                    hash = (hash ^ chunk) * 0x9E3779B97F4A7C15ull;
+                    hash ^= hash >> 32;
                 }}
+                return hash;
+            }}
+
+            /* The slot of the key with the given `hash` in a table built with `seeds`. */
+            static inline std::uint32_t {name}IconSlot(const int *seeds, std::uint64_t hash) {{
+                int seed = seeds[hash % {NAME}_ICON_HASH_SIZE];
+                if (seed < 0)
+                    return (std::uint32_t) (-seed - 1);
+                return (std::uint32_t) (
+                    {name}IconMix(hash ^ ((std::uint64_t) seed * 0x9E3779B97F4A7C15ull)) %
+                    {NAME}_ICON_HASH_SIZE
+                );
+            }}
+
+            /* The codepoint of the {name} icon named `name` (`size` bytes, e.g.
+             * "address-book"), or 0 (which NanoGUI draws as no icon) if there is none.
+             */
+            static inline int {name}IconCodepoint(const char *name, std::size_t size) {{
+                const {Name}IconName &icon = {NAME}_ICONS_BY_NAME[
+                    {name}IconSlot({NAME}_ICON_NAME_SEEDS, {name}IconHash(name, size))
+                ];
+                if (std::strncmp(icon.name, name, size) != 0 || icon.name[size] != '\\0')
+                    return 0;
+                return icon.codepoint;
+            }}
+
+            static inline int {name}IconCodepoint(const char *name) {{
+                return {name}IconCodepoint(name, std::strlen(name));
+            }}
+
+            /* The name of the {name} icon with the given codepoint, or nullptr. */
+            static inline const char *{name}IconName(int codepoint) {{
+                // Codepoints are their own hash, mostly consecutive ones fill the buckets evenly
+                std::uint64_t hash = (std::uint32_t) codepoint;
+                const {Name}IconName &icon = {NAME}_ICONS_BY_NAME[
+                    {NAME}_ICONS_BY_CODEPOINT[{name}IconSlot({NAME}_ICON_CODEPOINT_SEEDS, hash)]
+                ];
+                return icon.codepoint == codepoint ? icon.name : nullptr;
+            }}
+        '''.format(
+            name=font_name,
+            NAME=font_name.upper(),
+            Name=font_name.capitalize()
+        )))
 
-            protected:
-                nanogui::ref<{Name}Theme> m{Name}Theme;
-            }};
-
-
-            // Convenience macro for creating an IconBox. Make sure you put a semicolon after the call to this macro!
-            #define ADD_ICON(parent, icon, boxWidth) \
-                new IconBox(parent, #icon, icon, boxWidth)
+    if embed is not None:
+        font_header_file.append(textwrap.dedent('''
+            #include <cstddef>
 
-            class IconBox : public Widget {{
-            public:
-                IconBox(Widget *parent, const std::string &name, int icon, int width)
-                    : Widget(parent) {{
+            /* The bytes of {name}.ttf ({embed}), and their number in `size`,
+             * or nullptr if they could not be decompressed (see resource_{name}.cpp).
+             * They stay valid until exit, nvgCreateFontMem can read them in place.
+             */
+            const unsigned char *{name}FontData(std::size_t *size);
+        '''.format(
+            name=font_name,
+            embed=_EMBED_DESCRIPTIONS[embed]
+        )))
 
-                    this->setLayout(new BoxLayout(Orientation::Horizontal));
+    return "".join(font_header_file)
+
+
+def render_metrics_bindings(font_name):
+    """
+    Return the statements exposing the metrics table of the header (see
+    :func:`render_header`) on the python submodule ``g``, indented by four spaces.
+    """
+    return textwrap.indent(textwrap.dedent('''\
+        /* The advance and bounding box of an icon, see {Name}IconMetrics */
+        g.attr("EM_SIZE") = py::float_({NAME}_EM_SIZE);
+        g.def("iconMetrics", [](int codepoint) {{
+            const {Name}IconMetrics *metrics = {name}IconMetrics(codepoint);
+            if (!metrics)
+                throw py::key_error("no {name} icon has the codepoint " + std::to_string(codepoint));
+            return py::make_tuple(metrics->advance, metrics->xMin, metrics->yMin,
+                                  metrics->xMax, metrics->yMax);
+        }}, py::arg("codepoint"),
+           "Return (advance, xMin, yMin, xMax, yMax) of the icon with the given codepoint, "
+           "in ems (multiply by the font size and EM_SIZE for pixels), y up from the baseline.");
+    '''.format(
+        name=font_name,
+        NAME=font_name.upper(),
+        Name=font_name.capitalize()
+    )), " " * 4)
+
+
+def render_lookup_bindings(font_name):
+    """
+    Return the statements exposing the perfect hash lookups of the header (see
+    :func:`render_header`) on the python submodule ``g``, indented by four spaces.
+    """
+    return textwrap.indent(textwrap.dedent('''\
+        /* Constant time lookups of the perfect hash tables, e.g. for icon names in configs */
+        g.def("iconCodepoint", [](const std::string &name) {{
+            int codepoint = {name}IconCodepoint(name.data(), name.size());
+            if (codepoint == 0)
+                throw py::key_error("no {name} icon is named '" + name + "'");
+            return codepoint;
+        }}, py::arg("name"),
+           "Return the codepoint of the icon with the given name (e.g. 'address-book').");
+        g.def("iconName", [](int codepoint) {{
+            const char *name = {name}IconName(codepoint);
+            if (!name)
+                throw py::key_error("no {name} icon has the codepoint " + std::to_string(codepoint));
+            return std::string(name);
+        }}, py::arg("codepoint"), "Return the name of the icon with the given codepoint.");
+    '''.format(
+        name=font_name
+    )), " " * 4)
+
+
+def render_python_bindings(font_name, font_license, cdefs, style="define", metrics=False,
+                           lookup=False):
+    """
+    Return the contents of ``constants_{font_name}.cpp``.  With ``style="table"``
+    the attributes are set in a loop over the table in the header.  With
+    ``style="lazy"`` (on Python 3.7+) the module gets a ``__getattr__`` that
+    looks the attributes up in that table on first access (a binary search of
+    the icon identifiers, sorted in the bindings), and a ``__dir__`` that lists
+    them.  With ``metrics`` the module also gets ``EM_SIZE`` and an
+    ``iconMetrics(codepoint)`` function, backed by the metrics table of the
+    header, and with ``lookup`` the ``iconCodepoint(name)`` and
+    ``iconName(codepoint)`` functions backed by its perfect hash tables.
+    """
+    font_python_bindings = []
+    font_python_bindings.append(textwrap.dedent('''
+        #ifdef NANOGUI_PYTHON
+
+        #include "python.h"
+        #include <nanogui/{name}.h>
+
+        /* Python bindings for the {name} font.
+         *
+         * License: {license}
+         */
+
+        /* Developer note: need to make a change to this file?
+         * Please raise an Issue on GitHub describing what needs to change.  This file
+         * was generated, so the scripts that generated it need to update as well.
+         */
+
+        void register_constants_{name}(py::module &m) {{
+            /* bindings for the {name} font */
+    '''.format(
+        name=font_name,
+        NAME=font_name.upper(),
+        license=font_license
+    )))
+
+    if style == "lazy":
+        # The indices of the {NAME}_ICONS entries in the (strcmp) order of their
+        # names, for __getattr__ to binary search
+        identifiers = [cdef_identifier(font_name, icon_def) for _, icon_def, _ in cdefs]
+        order = sorted(range(len(identifiers)), key=identifiers.__getitem__)
+        font_python_bindings[0] = font_python_bindings[0].replace(
+            "#include <nanogui/{0}.h>\n".format(font_name),
+            "#include <nanogui/{0}.h>\n".format(font_name) + textwrap.dedent('''\
+                #include <algorithm>
+                #include <cstring>
+                #include <iterator>
+
+                /* The indices of the {NAME}_ICONS sorted by name. */
+                static const int {NAME}_ICONS_BY_NAME_ORDER[] = {{
+            '''.format(NAME=font_name.upper())) + _cpp_int_rows(order) + "};\n", 1
+        )
+        font_python_bindings.append(textwrap.dedent('''\
+                py::module g = m.def_submodule("{name}");
+            #if PY_VERSION_HEX >= 0x03070000
+                /* The ICON_* attributes are looked up in {NAME}_ICONS on first access
+                 * (PEP 562) and then stored on the module, rather than all of them being
+                 * created when nanogui is imported.  The functions only hold a weak
+                 * reference to the module (which holds them).
+                 */
+                py::weakref module(g);
+                g.def("__getattr__", [module](const std::string &attr) -> py::object {{
+                    if (attr.compare(0, 5, "ICON_") == 0 && attr.find('\\0') == std::string::npos) {{
+                        const char *name = attr.c_str() + 5;
+                        const int *end = std::end({NAME}_ICONS_BY_NAME_ORDER);
+                        const int *found = std::lower_bound(
+                            std::begin({NAME}_ICONS_BY_NAME_ORDER), end, name,
+                            [](int index, const char *name) {{
+                                return std::strcmp({NAME}_ICONS[index].name, name) < 0;
+                            }}
+                        );
+                        if (found != end && std::strcmp({NAME}_ICONS[*found].name, name) == 0) {{
+                            py::int_ value({NAME}_ICONS[*found].codepoint);
+                            py::object g = module();
+                            if (!g.is_none())
+                                g.attr(attr.c_str()) = value;
+                            return value;
+                        }}
+                    }}
+                    PyErr_SetString(PyExc_AttributeError,
+                                    ("module 'nanogui.{name}' has no attribute '" + attr + "'").c_str());
+                    throw py::error_already_set();
+                }});
+                g.def("__dir__", [module]() {{
+                    py::list names;
+                    py::object g = module();
+                    for (auto key : g.attr("__dict__")) {{
+                        if (std::string(py::str(key)).compare(0, 5, "ICON_") != 0)
+                            names.append(key);
+                    }}
+                    for (const auto &icon : {NAME}_ICONS)
+                        names.append(std::string("ICON_") + icon.name);
+                    return names;
+                }});
+            #else
+                for (const auto &icon : {NAME}_ICONS)
+                    g.attr((std::string("ICON_") + icon.name).c_str()) = py::int_(icon.codepoint);
+            #endif
+        '''.format(
+            name=font_name,
+            NAME=font_name.upper()
+        )))
+        if metrics:
+            font_python_bindings.append(render_metrics_bindings(font_name))
+        if lookup:
+            font_python_bindings.append(render_lookup_bindings(font_name))
+        font_python_bindings.append("}\n\n#endif\n")
+        return "".join(font_python_bindings)
+
+    if style == "table":
+        font_python_bindings.append(textwrap.indent(textwrap.dedent('''\
+            py::module g = m.def_submodule("{name}");
+            for (const auto &icon : {NAME}_ICONS)
+                g.attr((std::string("ICON_") + icon.name).c_str()) = py::int_(icon.codepoint);
+        '''.format(
+            name=font_name,
+            NAME=font_name.upper()
+        )), " " * 4))
+        if metrics:
+            font_python_bindings.append(render_metrics_bindings(font_name))
+        if lookup:
+            font_python_bindings.append(render_lookup_bindings(font_name))
+        font_python_bindings.append("}\n\n#endif\n")
+        return "".join(font_python_bindings)
+
+    font_python_bindings.append(textwrap.indent(textwrap.dedent('''\
+            {{
+                #define C(name) g.attr("ICON_" #name) = py::int_({NAME}_ICON_##name);
+                py::module g = m.def_submodule("{name}");
+    '''.format(
+        name=font_name,
+        NAME=font_name.upper()
+    )), " " * 4))
+
+    for icon_name, icon_def, icon_code in cdefs:
+        # icon_def is `#define {font_name.upper()}_ICON_X`
+        cpp_def = icon_def.split(" ")[1]
+        py_def  = cpp_def.split("{NAME}_ICON_".format(NAME=font_name.upper()))[1]
+        pybind  = "C({0});".format(py_def)
+        font_python_bindings.append("        {pybind}\n".format(pybind=pybind))
+
+    # close the pybind
+    font_python_bindings.append("\n        #undef C\n")
+    if metrics:
+        font_python_bindings.append(textwrap.indent(render_metrics_bindings(font_name), " " * 4))
+    if lookup:
+        font_python_bindings.append(textwrap.indent(render_lookup_bindings(font_name), " " * 4))
+    font_python_bindings.append(textwrap.dedent('''\
+            }
+        }
+
+        #endif
+    '''))
+
+    return "".join(font_python_bindings)
+
+
+def render_cpp_example(font_name, cdefs, style="define", merged=None, embed=None):
+    """
+    Return the contents of ``example_{font_name}.cpp``: a browser with a filter
+    box that only creates the widgets for the icons on screen.  The flat list of
+    icons it shows is a static array (``style="define"``), or built from the
+    table in the header (``style="table"`` / ``"lazy"``).  The icons are loaded
+    from ``{merged}.ttf`` when they are part of the ``merged`` font, and from
+    ``resource_{font_name}.cpp`` with ``embed`` (see :func:`render_font_resource`).
+    """
+    cpp_example = []
+    if embed is None:
+        load_font = textwrap.dedent('''\
+            // load the {font} font into memory
+                            m{Name}Font = nanogui::createFontMem(ctx, "{font}", "{font}.ttf");''')
+    else:
+        load_font = textwrap.dedent('''\
+            // the {font} font embedded by resource_{name}.cpp, used in place (not freed)
+                            std::size_t size = 0;
+                            const unsigned char *data = {name}FontData(&size);
+                            m{Name}Font = data == nullptr ? -1 : nvgCreateFontMem(
+                                ctx, "{font}", const_cast<unsigned char *>(data), (int) size, 0);''')
+    load_font = load_font.format(
+        name=font_name,
+        Name=font_name.capitalize(),
+        font=merged or font_name
+    )
 
-                    auto *b = new Button(this, "", icon);
-                    b->setFixedWidth(40);
+    # write the header of the cpp example
+    cpp_example.append(textwrap.dedent(r'''
+        /* Developer note: need to make a change to this file?
+         * Please raise an Issue on GitHub describing what needs to change.  This file
+         * was generated, so the scripts that generated it need to update as well.
+         */
+
+        #include <nanogui/nanogui.h>
+        #include <nanogui/resources.h>
+        #include <nanogui/{name}.h>
+        #include <algorithm>
+        #include <cctype>
+        #include <cmath>
+        #include <iterator>
+        #include <string>
+        #include <utility>
+        #include <vector>
+        using namespace nanogui;
+
+        // Custom theme for loading the {name} font
+        class {Name}Theme : public nanogui::Theme {{
+        public:
+            // This override informs NanoGUI to use this as the icon font.
+            virtual std::string defaultIconFont() const override {{ return "{font}"; }}
+
+            {Name}Theme(NVGcontext *ctx) : nanogui::Theme(ctx) {{
+                {load_font}
+                if (m{Name}Font == -1)
+                    throw std::runtime_error("Could not load the {font} font!");
+
+                // TODO: you need to override the following default icon choices in your
+                //       own application!  See documentation for nanogui::Theme.
+                // mCheckBoxIcon             = ENTYPO_ICON_CHECK;
+                // mCheckBoxIconExtraScale   = defaultCheckBoxIconExtraScale();
+                // mMessageInformationIcon   = ENTYPO_ICON_INFO_WITH_CIRCLE;
+                // mMessageQuestionIcon      = ENTYPO_ICON_HELP_WITH_CIRCLE;
+                // mMessageWarningIcon       = ENTYPO_ICON_WARNING;
+                // mMessageAltButtonIcon     = ENTYPO_ICON_CIRCLE_WITH_CROSS;
+                // mMessagePrimaryButtonIcon = ENTYPO_ICON_CHECK;
+                // mPopupChevronRightIcon    = ENTYPO_ICON_CHEVRON_RIGHT;
+                // mPopupChevronLeftIcon     = ENTYPO_ICON_CHEVRON_LEFT;
+                // mPopupIconExtraScale      = defaultPopupIconExtraScale();
+                // mTabHeaderLeftIcon        = ENTYPO_ICON_ARROW_BOLD_LEFT;
+                // mTabHeaderRightIcon       = ENTYPO_ICON_ARROW_BOLD_RIGHT;
+                // mTextBoxUpIcon            = ENTYPO_ICON_CHEVRON_UP;
+                // mTextBoxDownIcon          = ENTYPO_ICON_CHEVRON_DOWN;
+                // mTextBoxIconExtraScale    = defaultTextBoxIconExtraScale();
+            }}
+
+            virtual ~{Name}Theme() {{ /* nothing to free */ }}
+
+        protected:
+            int m{Name}Font = -1;
+        }};
+
+        class {Name}Screen : public nanogui::Screen {{
+        public:
+            {Name}Screen(const Vector2i &size, const std::string &title, bool resizable)
+                : nanogui::Screen(size, title, resizable) {{
+
+                m{Name}Theme = new {Name}Theme(this->mNVGContext);
+                this->setTheme(m{Name}Theme);
+            }}
+
+            virtual ~{Name}Screen() {{ /* nothing to free */ }}
+
+            // allow <ESCAPE> to exit
+            virtual bool keyboardEvent(int key, int scancode, int action, int modifiers) override {{
+                if (key == GLFW_KEY_ESCAPE && modifiers == 0) {{
+                    setVisible(false);
+                    return true;
+                }}
 
-                    auto *text = new TextBox(this, name);
-                    text->setDefaultValue(name);
-                    text->setEditable(true);
-                    /* Return false essentially makes it not possible to actually edit this text
-                     * box, but keeping it editable=true allows selection for copy-paste.  If the
-                     * text box is not editable, then the user cannot highlight it.
-                     */
-                    text->setCallback([](const std::string &) {{ return false; }});
-                    text->setFont("mono-bold");
-                    text->setFixedWidth(width - 40);
+                return Screen::keyboardEvent(key, scancode, action, modifiers);
+            }}
+
+        protected:
+            nanogui::ref<{Name}Theme> m{Name}Theme;
+        }};
+
+
+        class IconBox : public Widget {{
+        public:
+            IconBox(Widget *parent, int width, int height)
+                : Widget(parent) {{
+
+                this->setLayout(new BoxLayout(Orientation::Horizontal));
+
+                mButton = new Button(this, "", 0);
+                mButton->setFixedSize({{40, height}});
+
+                mText = new TextBox(this, "");
+                mText->setEditable(true);
+                /* Return false essentially makes it not possible to actually edit this text
+                 * box, but keeping it editable=true allows selection for copy-paste.  If the
+                 * text box is not editable, then the user cannot highlight it.
+                 */
+                mText->setCallback([](const std::string &) {{ return false; }});
+                mText->setFont("mono-bold");
+                mText->setFixedSize({{width - 40, height}});
+            }}
+
+            // Boxes are recycled: this makes the box show a different icon.
+            void setIcon(const std::string &name, int icon) {{
+                mButton->setIcon(icon);
+                mText->setValue(name);
+                mText->setDefaultValue(name);
+            }}
+
+        protected:
+            Button *mButton;
+            TextBox *mText;
+        }};
+
+        /* Shows a (filtered) window of a flat list of icons.  Only as many IconBoxes as
+         * fit on screen are ever created, scrolling and filtering just recycles them, so
+         * neither layout nor drawing gets slower as the font grows.
+         */
+        class IconBrowser : public Widget {{
+        public:
+            IconBrowser(Widget *parent, std::vector<std::pair<std::string, int>> icons,
+                        int width, int height, int columns = 2, int rowHeight = 28)
+                : Widget(parent), mIcons(std::move(icons)), mColumns(columns) {{
+
+                this->setLayout(new BoxLayout(Orientation::Vertical, Alignment::Minimum, 0, 6));
+
+                auto *tools = new Widget(this);
+                tools->setLayout(new BoxLayout(Orientation::Horizontal, Alignment::Middle, 0, 6));
+                auto *filter = new TextBox(tools, "");
+                filter->setEditable(true);
+                filter->setPlaceholder("filter (press enter)");
+                filter->setAlignment(TextBox::Alignment::Left);
+                filter->setFixedWidth(width / 2);
+                filter->setCallback([this](const std::string &value) {{
+                    this->setFilter(value);
+                    return true;
+                }});
+                mCount = new Label(tools, "");
+                mCount->setFixedWidth(width / 2 - 6);
+
+                mScroll = new Slider(this);
+                mScroll->setFixedWidth(width);
+                mScroll->setCallback([this](float value) {{
+                    this->scrollTo((int) std::round(value * this->maxFirstRow()));
+                }});
+
+                auto *grid = new Widget(this);
+                grid->setLayout(new GridLayout(Orientation::Horizontal, columns, Alignment::Minimum, 0, 2));
+                // whatever is left below the filter and the slider
+                int rows = std::max((height - 70) / (rowHeight + 2), 1);
+                for (int i = 0; i < rows * columns; ++i)
+                    mBoxes.push_back(new IconBox(grid, width / columns - 2, rowHeight));
+
+                setFilter("");
+            }}
+
+            // Only show the icons whose name contains `value` (ignoring case, '-' matches '_').
+            void setFilter(const std::string &value) {{
+                std::string needle = value;
+                for (auto &c : needle)
+                    c = c == '-' || c == ' ' ? '_' : (char) std::toupper((unsigned char) c);
+
+                mVisible.clear();
+                for (size_t i = 0; i < mIcons.size(); ++i) {{
+                    if (mIcons[i].first.find(needle) != std::string::npos)
+                        mVisible.push_back(i);
+                }}
+                mFirstRow = 0;
+                update();
+            }}
+
+            void scrollTo(int row) {{
+                mFirstRow = row;
+                update();
+            }}
+
+            virtual bool scrollEvent(const Vector2i &p, const Vector2f &rel) override {{
+                if (rel.y() == 0)
+                    return Widget::scrollEvent(p, rel);
+                scrollTo(mFirstRow - (int) std::round(rel.y() * 3));
+                return true;
+            }}
+
+        protected:
+            int maxFirstRow() const {{
+                int rows = ((int) mVisible.size() + mColumns - 1) / mColumns;
+                return std::max(rows - (int) mBoxes.size() / mColumns, 0);
+            }}
+
+            void update() {{
+                mFirstRow = std::min(std::max(mFirstRow, 0), maxFirstRow());
+                for (size_t i = 0; i < mBoxes.size(); ++i) {{
+                    size_t index = (size_t) mFirstRow * mColumns + i;
+                    mBoxes[i]->setVisible(index < mVisible.size());
+                    if (index < mVisible.size()) {{
+                        const auto &icon = mIcons[mVisible[index]];
+                        mBoxes[i]->setIcon(icon.first, icon.second);
+                    }}
                 }}
-            }};
 
+                int maxRow = maxFirstRow();
+                mScroll->setValue(maxRow > 0 ? (float) mFirstRow / maxRow : 0.0f);
+                mCount->setCaption(std::to_string(mVisible.size()) + " of " +
+                                   std::to_string(mIcons.size()) + " icons");
+            }}
+
+            std::vector<std::pair<std::string, int>> mIcons; // every icon, (name, codepoint)
+            std::vector<size_t> mVisible;                    // indices of the icons matching the filter
+            std::vector<IconBox *> mBoxes;                   // the recycled boxes, row major
+            int mColumns;
+            int mFirstRow = 0;
+            Label *mCount;
+            Slider *mScroll;
+        }};
+    '''.format(
+        name=font_name,
+        Name=font_name.capitalize(),
+        font=merged or font_name,
+        load_font=load_font
+    )).lstrip())
+
+    # The browser only needs the icons as a flat list
+    if style in ("table", "lazy"):
+        cpp_example.append(textwrap.dedent('''
+            // Every icon of the font, the browser shows a (filtered) window of this list.
+            static std::vector<std::pair<std::string, int>> allIcons() {{
+                std::vector<std::pair<std::string, int>> icons;
+                icons.reserve({NAME}_ICON_COUNT);
+                for (const auto &icon : {NAME}_ICONS)
+                    icons.emplace_back(std::string("{NAME}_ICON_") + icon.name, icon.codepoint);
+                return icons;
+            }}
+        '''.format(
+            NAME=font_name.upper()
+        )))
+    else:
+        cpp_example.append(textwrap.dedent('''
+            // Every icon of the font, the browser shows a (filtered) window of this list.
+            #define ICON(icon) {#icon, icon}
+            static const std::pair<const char *, int> ICONS[] = {
+        '''))
+        for icon_name, icon_def, icon_code in cdefs:
+            # icon_def is `#define FONTNAME_ICON_X`
+            cpp_def = icon_def.split(" ")[1]
+            cpp_example.append("    ICON({cpp_def}),\n".format(cpp_def=cpp_def))
+        cpp_example.append(textwrap.dedent('''\
+            };
+            #undef ICON
 
-            int main(int /* argc */, char ** /* argv */) {{
-                nanogui::init();
+            static std::vector<std::pair<std::string, int>> allIcons() {
+                return std::vector<std::pair<std::string, int>>(std::begin(ICONS), std::end(ICONS));
+            }
+        '''))
 
-                /* scoped variables */ {{
-                    static constexpr int width      = 1000;
-                    static constexpr int half_width = width / 2;
-                    static constexpr int height     = 800;
+    # close out the cpp example
+    cpp_example.append(textwrap.dedent('''
+
+        int main(int /* argc */, char ** /* argv */) {{
+            nanogui::init();
 
-                    // create a fixed size screen with one window
-                    {Name}Screen *screen = new {Name}Screen({{width, height}}, "NanoGUI {Name} Icons", false);
+            /* scoped variables */ {{
+                static constexpr int width  = 1000;
+                static constexpr int height = 800;
 
-                    // create the custom theme now so that all children will inherit it
-                    Window *window = new Window(screen, "");
-                    window->setPosition({{0, 0}});
-                    window->setFixedSize({{width, height}});
+                // create a fixed size screen with one window
+                {Name}Screen *screen = new {Name}Screen({{width, height}}, "NanoGUI {Name} Icons", false);
+
+                // create the custom theme now so that all children will inherit it
+                Window *window = new Window(screen, "");
+                window->setPosition({{0, 0}});
+                window->setFixedSize({{width, height}});
+                window->setLayout(new BoxLayout(Orientation::Vertical, Alignment::Minimum, 10));
+
+                // however many icons there are, only the boxes that fit are created
+                new IconBrowser(window, allIcons(), width - 20, height - 20);
+
+                screen->performLayout();
+                screen->setVisible(true);
+
+                nanogui::mainloop();
+            }}
+
+            nanogui::shutdown();
+            return 0;
+        }}
+    '''.format(
+        Name=font_name.capitalize()
+    )))
+
+    return "".join(cpp_example)
+
+
+def render_py_example(font_name, merged=None):
+    """
+    Return the contents of ``example_{font_name}.py``: the same browser as the
+    C++ example.  The icons are enumerated with ``dir()`` / ``getattr()``, which
+    works in every style (the ``__dict__`` of a lazy module only has the icons
+    used so far).  ``merged`` is as in :func:`render_cpp_example`.
+    """
+    return textwrap.dedent('''
+        # Developer note: need to make a change to this file?
+        # Please raise an Issue on GitHub describing what needs to change.  This file
+        # was generated, so the scripts that generated it need to update as well.
+
+        import gc
+
+        import nanogui
+        from nanogui import Screen, Window, Widget, GridLayout, Button, TextBox, Label, Slider, BoxLayout, Orientation, Alignment, Theme
+        from nanogui import {name}
+
+
+        class {Name}Theme(nanogui.Theme):
+            # This override informs NanoGUI to use this as the icon font.
+            def defaultIconFont(self):
+                return "{font}"
+
+            def __init__(self, ctx):
+                super({Name}Theme, self).__init__(ctx)
+                self.m{Name}Font = nanogui.createFontMem(ctx, "{font}", "{font}.ttf")
+                if self.m{Name}Font == -1:
+                    raise RuntimeError("Could not load the {font} font!")
+
+                # TODO: you need to override the following default icon choices in your
+                #       own application!  See documentation for nanogui::Theme.
+                # self.mCheckBoxIcon             = entypo.ICON_CHECK
+                # self.mCheckBoxIconExtraScale   = self.defaultCheckBoxIconExtraScale()
+                # self.mMessageInformationIcon   = entypo.ICON_INFO_WITH_CIRCLE
+                # self.mMessageQuestionIcon      = entypo.ICON_HELP_WITH_CIRCLE
+                # self.mMessageWarningIcon       = entypo.ICON_WARNING
+                # self.mMessageAltButtonIcon     = entypo.ICON_CIRCLE_WITH_CROSS
+                # self.mMessagePrimaryButtonIcon = entypo.ICON_CHECK
+                # self.mPopupChevronRightIcon    = entypo.ICON_CHEVRON_RIGHT
+                # self.mPopupChevronLeftIcon     = entypo.ICON_CHEVRON_LEFT
+                # self.mPopupIconExtraScale      = self.defaultPopupIconExtraScale()
+                # self.mTabHeaderLeftIcon        = entypo.ICON_ARROW_BOLD_LEFT
+                # self.mTabHeaderRightIcon       = entypo.ICON_ARROW_BOLD_RIGHT
+                # self.mTextBoxUpIcon            = entypo.ICON_CHEVRON_UP
+                # self.mTextBoxDownIcon          = entypo.ICON_CHEVRON_DOWN
+                # self.mTextBoxIconExtraScale    = self.defaultTextBoxIconExtraScale()
+
+
+        class EscapeScreen(nanogui.Screen):
+            def __init__(self, size, title, resizable):
+                super(EscapeScreen, self).__init__(size, title, resizable)
+
+            # allow <ESCAPE> to exit
+            def keyboardEvent(self, key, scancode, action, modifiers):
+                if key == nanogui.glfw.KEY_ESCAPE and modifiers == 0:
+                    self.setVisible(False)
+                    return True
+
+                return super(EscapeScreen, self).keyboardEvent(key, scancode, action, modifiers)
+
+
+        class IconBox(nanogui.Widget):
+            def __init__(self, parent, width, height):
+                super(IconBox, self).__init__(parent)
+
+                self.setLayout(BoxLayout(Orientation.Horizontal))
+
+                self.button = Button(self, "", 0)
+                self.button.setFixedSize((40, height))
+
+                self.text = TextBox(self, "")
+                self.text.setEditable(True)
+                # Return false essentially makes it not possible to actually edit this text
+                # box, but keeping it editable=true allows selection for copy-paste.  If the
+                # text box is not editable, then the user cannot highlight it.
+                self.text.setCallback(lambda x: False)
+                self.text.setFont("mono-bold")
+                self.text.setFixedSize((width - 40, height))
+
+            # Boxes are recycled: this makes the box show a different icon.
+            def setIcon(self, name, icon):
+                self.button.setIcon(icon)
+                self.text.setValue(name)
+                self.text.setDefaultValue(name)
+
+
+        class IconBrowser(nanogui.Widget):
+            """
+            Shows a (filtered) window of the icons of ``module``.  Only as many IconBoxes
+            as fit on screen are ever created, scrolling and filtering just recycles them,
+            so neither layout nor drawing gets slower as the font grows.
+            """
+
+            def __init__(self, parent, module, width, height, columns=2, row_height=28):
+                super(IconBrowser, self).__init__(parent)
+                self.module = module
+                # Only the names are kept, the value of an icon is looked up when shown
+                self.names = [key for key in dir(module) if key.startswith("ICON_")]
+                self.visible = self.names
+                self.columns = columns
+                self.first_row = 0
+
+                self.setLayout(BoxLayout(Orientation.Vertical, Alignment.Minimum, 0, 6))
+
+                tools = Widget(self)
+                tools.setLayout(BoxLayout(Orientation.Horizontal, Alignment.Middle, 0, 6))
+                search = TextBox(tools, "")
+                search.setEditable(True)
+                search.setPlaceholder("filter (press enter)")
+                search.setAlignment(TextBox.Alignment.Left)
+                search.setFixedWidth(width // 2)
+
+                def set_filter(value):
+                    self.setFilter(value)
+                    return True
+
+                search.setCallback(set_filter)
+                self.count = Label(tools, "")
+                self.count.setFixedWidth(width // 2 - 6)
+
+                self.scroll = Slider(self)
+                self.scroll.setFixedWidth(width)
+                self.scroll.setCallback(
+                    lambda value: self.scrollTo(int(round(value * self.maxFirstRow())))
+                )
 
-                    // attach a vertical scroll panel
-                    auto vscroll = new VScrollPanel(window);
-                    vscroll->setFixedSize({{width, height}});
+                grid = Widget(self)
+                grid.setLayout(GridLayout(Orientation.Horizontal, columns, Alignment.Minimum, 0, 2))
+                # whatever is left below the filter and the slider
+                rows = max((height - 70) // (row_height + 2), 1)
+                self.boxes = [
+                    IconBox(grid, width // columns - 2, row_height)
+                    for _ in range(rows * columns)
+                ]
+
+                self.setFilter("")
+
+            # Only show the icons whose name contains `value` (ignoring case, '-' matches '_').
+            def setFilter(self, value):
+                needle = value.upper().replace("-", "_").replace(" ", "_")
+                self.visible = [name for name in self.names if needle in name]
+                self.first_row = 0
+                self.update()
+
+            def scrollTo(self, row):
+                self.first_row = row
+                self.update()
+
+            def scrollEvent(self, p, rel):
+                if rel[1] == 0:
+                    return super(IconBrowser, self).scrollEvent(p, rel)
+                self.scrollTo(self.first_row - int(round(rel[1] * 3)))
+                return True
+
+            def maxFirstRow(self):
+                rows = (len(self.visible) + self.columns - 1) // self.columns
+                return max(rows - len(self.boxes) // self.columns, 0)
+
+            def update(self):
+                max_row = self.maxFirstRow()
+                self.first_row = min(max(self.first_row, 0), max_row)
+                start = self.first_row * self.columns
+                for i, box in enumerate(self.boxes):
+                    index = start + i
+                    box.setVisible(index < len(self.visible))
+                    if index < len(self.visible):
+                        name = self.visible[index]
+                        box.setIcon(name, getattr(self.module, name))
+
+                self.scroll.setValue(float(self.first_row) / max_row if max_row > 0 else 0.0)
+                self.count.setCaption("{{0}} of {{1}} icons".format(len(self.visible), len(self.names)))
+
+
+        if __name__ == "__main__":
+            nanogui.init()
+
+            width  = 1000
+            height = 800
+
+            # create a fixed size screen with one window
+            screen = EscapeScreen((width, height), "NanoGUI {Name} Icons", False)
+
+            # NOTE: if doing a custom screen derived class, for some reason if you
+            #       load a custom theme object and call setTheme in the constructor
+            #       of the derived theme class it will not work.  You can load the
+            #       theme in the constructor, but just make sure to call setTheme
+            #       after the constructor is finished (as we are doing here)
+            #
+            #       Setting the theme of the screen means that all children created
+            #       after this point will use this as their theme (rather than the
+            #       default NanoGUI theme).
+            theme = {Name}Theme(screen.nvgContext())
+            screen.setTheme(theme)
+            window = Window(screen, "")
+            window.setPosition((0, 0))
+            window.setFixedSize((width, height))
+            window.setLayout(BoxLayout(Orientation.Vertical, Alignment.Minimum, 10))
+
+            # however many icons there are, only the boxes that fit are created
+            browser = IconBrowser(window, {name}, width - 20, height - 20)
+
+            screen.performLayout()
+            screen.drawAll()
+            screen.setVisible(True)
+
+            nanogui.mainloop()
+
+            del screen
+            gc.collect()
+
+            nanogui.shutdown()
+    '''.format(
+        name=font_name,
+        Name=font_name.capitalize(),
+        font=merged or font_name
+    )).lstrip()
+
+
+def embedded_font_data(ttf_path, embed):
+    """
+    The bytes embedding the font ``ttf_path`` for ``embed`` (one of
+    :data:`EMBED_FORMATS`), always made from the ``.ttf`` so that they match it:
+    the ``.ttf`` itself, compressed by :func:`zlib.compress`, or into WOFF2 by
+    fontTools.  Raises :class:`GenerateError` if fontTools (or the brotli it
+    writes WOFF2 with) is not installed.
+    """
+    with open(ttf_path, "rb") as f:
+        data = f.read()
+    if embed == "zlib":
+        return zlib.compress(data, 9)
+    if embed == "woff2":
+        try:
+            from fontTools.ttLib import woff2
+            woff2_data = BytesIO()
+            woff2.compress(BytesIO(data), woff2_data)
+        except ImportError as e:
+            raise GenerateError("Embedding woff2 needs fontTools and brotli: {0}".format(e))
+        return woff2_data.getvalue()
+    return data
+
+
+def render_font_resource(font_name, data, embed="raw", ttf_size=None):
+    """
+    Return the contents of ``resource_{font_name}.cpp``: the ``data`` of the font
+    in a 16 byte aligned array, and the ``{font_name}FontData`` function declared
+    by :func:`render_header` returning it.  With ``embed="raw"`` ``data`` is the
+    ``.ttf``, returned as is.  With ``"zlib"`` it is the ``.ttf`` (``ttf_size``
+    bytes) compressed by :func:`zlib.compress`, and with ``"woff2"`` the font
+    compressed into WOFF2, decompressed once, on the first call (see
+    :func:`embedded_font_data`).
+    """
+    if embed not in EMBED_FORMATS:
+        raise GenerateError("Invalid embed format [{0}], expected one of {1}.".format(
+            embed, ", ".join(EMBED_FORMATS)
+        ))
+    includes = {
+        "raw": [],
+        "zlib": ["vector", "zlib.h"],
+        "woff2": ["algorithm", "string", "woff2/decode.h", "woff2/output.h"]
+    }[embed]
+    loaders = {
+        "raw": '''\
+            const unsigned char *{name}FontData(std::size_t *size) {{
+                *size = sizeof({NAME}_FONT_DATA);
+                return {NAME}_FONT_DATA;
+            }}
+        ''',
+        "zlib": '''\
+            const unsigned char *{name}FontData(std::size_t *size) {{
+                // inflated once (thread safe since C++11), freed at exit
+                static const std::vector<unsigned char> font = [] {{
+                    std::vector<unsigned char> font({ttf_size});
+                    uLongf length = (uLongf) font.size();
+                    if (uncompress(font.data(), &length, {NAME}_FONT_DATA,
+                                   (uLong) sizeof({NAME}_FONT_DATA)) != Z_OK || length != font.size())
+                        font.clear();
+                    return font;
+                }}();
+                *size = font.size();
+                return font.empty() ? nullptr : font.data();
+            }}
+        ''',
+        "woff2": '''\
+            const unsigned char *{name}FontData(std::size_t *size) {{
+                // decoded once (thread safe since C++11), freed at exit
+                static const std::string font = [] {{
+                    std::string font(std::min(woff2::ComputeWOFF2FinalSize(
+                        {NAME}_FONT_DATA, sizeof({NAME}_FONT_DATA)), woff2::kDefaultMaxSize), '\\0');
+                    woff2::WOFF2StringOut out(&font);
+                    if (woff2::ConvertWOFF2ToTTF({NAME}_FONT_DATA, sizeof({NAME}_FONT_DATA), &out))
+                        font.resize(out.Size());
+                    else
+                        font.clear();
+                    return font;
+                }}();
+                *size = font.size();
+                return font.empty() ? nullptr : reinterpret_cast<const unsigned char *>(font.data());
+            }}
+        '''
+    }
+    if embed == "raw":
+        what = "{0}.ttf, {1} bytes".format(font_name, len(data))
+    elif embed == "zlib":
+        what = "{0}.ttf deflated to {1} bytes from {2}".format(font_name, len(data), ttf_size)
+    else:
+        what = "{0}.woff2, {1} bytes".format(font_name, len(data))
+
+    resource = [textwrap.dedent('''\
+        /* Developer note: need to make a change to this file?
+         * Please raise an Issue on GitHub describing what needs to change.  This file
+         * was generated, so the scripts that generated it need to update as well.
+         */
+
+        #include <nanogui/{name}.h>
+        #include <cstddef>
+    '''.format(name=font_name))]
+    resource += ["#include <{0}>\n".format(include) for include in includes]
+    resource.append(textwrap.dedent('''
+        // {what}
+        alignas(16) static const unsigned char {NAME}_FONT_DATA[] = {{
+    '''.format(what=what, NAME=font_name.upper())))
+    resource.append(_cpp_int_rows(bytearray(data), per_row=20))
+    resource.append("};\n\n")
+    resource.append(textwrap.dedent(loaders[embed]).format(
+        name=font_name,
+        NAME=font_name.upper(),
+        ttf_size=ttf_size
+    ))
+    return "".join(resource)
+
+
+def generator_digests():
+    """
+    Return the sha256 of this file, ``ttf.py`` and ``iconmanifest.py``, which
+    (together with the inputs) determine the rendered outputs.  Computed once per process: a long
+    running worker keeps rendering with the code it imported, even if the files
+    change on disk.
+    """
+    global _GENERATOR_DIGESTS
+    if _GENERATOR_DIGESTS is None:
+        _GENERATOR_DIGESTS = {
+            "generator": sha256_of_file(os.path.abspath(__file__)),
+            "reader": sha256_of_file(os.path.abspath(ttf.__file__)),
+            "icon_manifest": sha256_of_file(os.path.abspath(iconmanifest.__file__))
+        }
+    return _GENERATOR_DIGESTS
+
+
+_GENERATOR_DIGESTS = None
+
+
+def generate(font_name, css_or_ttf_path, out_dir, license, expected_count=None,
+             svg_dir=None, force=False, style="define", metrics=False, lookup=False,
+             icon_manifest=False, merged=None, embed=None, report=None):
+    """
+    Generate the NanoGUI header, python bindings, and examples for a font.
+
+    ``css_or_ttf_path`` is the compiled font (``.ttf`` / ``.otf``) or the fontcustom
+    css file to read the icons from, and the four outputs are written to
+    ``out_dir`` (created if needed).  When ``expected_count`` is given, the font
+    must contain exactly that many icons.  When ``svg_dir`` is given, the icon
+    names must match the ``.svg`` files in it.  Outputs whose content did not
+    change are not touched, and nothing is parsed at all when the build manifest
+    in ``out_dir`` says everything is up to date, unless ``force`` is set.
+    ``style`` is one of :data:`STYLES`.  With ``metrics``, the advance and bounding
+    box of every icon are read from the font and emitted in the header and python
+    bindings (the icons must then be read from a compiled font, not a css file).
+    With ``lookup``, the header and python bindings get constant time lookups of
+    the codepoint of an icon name and back.  With ``icon_manifest``, the binary
+    ``{font_name}.icons`` manifest (see :mod:`iconmanifest`, with the metrics if
+    ``metrics`` is set) and its C++ reader ``icon_manifest.h`` are written too.
+    When ``font_name`` was merged with other fonts into the font ``merged`` (see
+    ``svg2ttf.merge_fonts``), ``css_or_ttf_path`` is the merged font, only the
+    icons of ``font_name`` are read from it, and the examples load ``merged``.
+    With ``embed`` (one of :data:`EMBED_FORMATS`), the font is embedded in
+    ``resource_{font_name}.cpp`` (see :func:`render_font_resource`), which the
+    header declares and the C++ example loads it from.  The ``check``, ``read``,
+    ``validate``, ``metrics``, ``render`` and ``write`` stages are recorded in
+    ``report`` (a :class:`buildreport.BuildReport`), if given.
+
+    Raises :class:`GenerateError` if anything goes wrong.  Returns a dict with the
+    keys
+
+    ``outputs``
+        The paths of all four outputs, two more with ``icon_manifest`` and one
+        more with ``embed``.
+    ``written`` / ``skipped``
+        The outputs that were (re)written, and those left alone.
+    ``removed``
+        The outputs of the previous run this run no longer asks for (e.g. the
+        ``icon_manifest`` ones), which were deleted.
+    ``up_to_date``
+        ``True`` if the build manifest short circuited the run.
+    ``num_icons``
+        The number of icons found, or ``None`` when up to date.
+    ``seconds``
+        Wall clock time spent.
+    """
+    start = time.time()
+    for name in (font_name, merged):
+        if name is not None and not re.match(r"^[a-zA-Z]{1}[a-zA-Z0-9]*$", name):
+            raise GenerateError("Invalid font name [{0}].".format(name))
+    if style not in STYLES:
+        raise GenerateError("Invalid style [{0}], expected one of {1}.".format(
+            style, ", ".join(STYLES)
+        ))
+    if metrics and css_or_ttf_path.lower().endswith(".css"):
+        raise GenerateError(
+            "The icon metrics are read from the compiled font, not [{0}].".format(css_or_ttf_path)
+        )
+    if embed is not None:
+        if embed not in EMBED_FORMATS:
+            raise GenerateError("Invalid embed format [{0}], expected one of {1}.".format(
+                embed, ", ".join(EMBED_FORMATS)
+            ))
+        if css_or_ttf_path.lower().endswith(".css"):
+            raise GenerateError(
+                "The embedded font is the compiled font, not [{0}].".format(css_or_ttf_path)
+            )
+        # every font merged would embed (and define) the same font
+        if merged is not None:
+            raise GenerateError("Embed the merged font [{0}] on its own, not in [{1}].".format(
+                merged, font_name
+            ))
 
-                    // vscroll should only have *ONE* child. this is what `wrapper` is for
-                    auto wrapper = new Widget(vscroll);
-                    wrapper->setFixedSize({{width, height}});
-                    wrapper->setLayout(new GridLayout());// defaults: 2 columns
+    if not os.path.exists(css_or_ttf_path):
+        raise GenerateError(
+            "[{0}] does not exist.  Make sure you already generated it (with `rake`).".format(
+                css_or_ttf_path
+            )
+        )
 
-                    ////////////////////////////////////////////////////////////////////////
-                    ////////////////////////////////////////////////////////////////////////
-                    ////////////////////////////////////////////////////////////////////////
-        '''.format(
-            name=FONT_NAME,
-            Name=FONT_NAME.capitalize()
-        )).lstrip())
+    outputs = [
+        os.path.join(out_dir, "{name}.h".format(name=font_name)),
+        os.path.join(out_dir, "constants_{name}.cpp".format(name=font_name)),
+        os.path.join(out_dir, "example_{name}.cpp".format(name=font_name)),
+        os.path.join(out_dir, "example_{name}.py".format(name=font_name))
+    ]
+    if icon_manifest:
+        outputs += [
+            os.path.join(out_dir, "{name}.icons".format(name=font_name)),
+            os.path.join(out_dir, "icon_manifest.h")
+        ]
+    if embed is not None:
+        outputs.append(os.path.join(out_dir, "resource_{name}.cpp".format(name=font_name)))
+
+    # If neither the font source nor the generator changed since the last run,
+    # and every output still has the content we recorded, there is nothing to do.
+    build_manifest_path = os.path.join(out_dir, BUILD_MANIFEST_NAME)
+    build_inputs = {
+        os.path.splitext(css_or_ttf_path)[1][1:]: sha256_of_file(css_or_ttf_path),
+        "options": [font_name, license, expected_count, style, metrics, lookup, icon_manifest,
+                    merged]
+    }
+    aliases_digest = sha256_of_file(ttf.aliases_path(css_or_ttf_path))
+    if aliases_digest is not None:
+        build_inputs["aliases"] = aliases_digest
+    if embed is not None:
+        # the embedded bytes are made from the font, already an input
+        build_inputs["embed"] = [embed]
+    if report is None:
+        report = buildreport.BuildReport(enabled=False)
+    source_size = os.path.getsize(css_or_ttf_path)
+    with report.stage("check") as stage:
+        stage.add(bytes_read=source_size)
+        build_inputs.update(generator_digests())
+        previous = load_build_manifest(build_manifest_path)
+        up_to_date = False
+        if not force and previous is not None and previous.get("inputs") == build_inputs:
+            previous_outputs = previous.get("outputs", {})
+            up_to_date = bool(previous_outputs) and all(
+                sha256_of_file(os.path.join(out_dir, name)) == digest
+                for name, digest in previous_outputs.items()
+            )
+    if up_to_date:
+        return {
+            "outputs": outputs,
+            "written": [],
+            "skipped": outputs,
+            "removed": [],
+            "up_to_date": True,
+            "num_icons": None,
+            "seconds": time.time() - start
+        }
+
+    with report.stage("read") as stage:
+        icons = read_icons(css_or_ttf_path, font_name, merged=merged is not None)
+        stage.add(bytes_read=source_size, glyphs=len(icons))
+
+    with report.stage("validate"):
+        if merged is not None and not icons:
+            raise GenerateError("[{0}] has no icons of the {1} font.".format(
+                css_or_ttf_path, font_name
+            ))
+        if expected_count is not None and len(icons) != expected_count:
+            raise GenerateError(
+                "Found [{0}] icons, expected [{1}]".format(len(icons), expected_count)
+            )
 
-        for icon_name, icon_def, icon_code in cdefs:
-            # icon_def is `#define FONTNAME_ICON_X`
-            cpp_def = icon_def.split(" ")[1]
-            cpp_example.write("        ADD_ICON(wrapper, {cpp_def}, half_width);\n".format(cpp_def=cpp_def))
+        # The glyph names in the font should be exactly the SVG file names, anything
+        # else means the font is stale (run `rake` again).
+        if svg_dir is not None:
+            missing, extra = check_svg_names(icons, svg_dir)
+            if missing or extra:
+                problems = [
+                    "No glyph for [{0}.svg] in [{1}].".format(name, css_or_ttf_path)
+                    for name in missing
+                ] + [
+                    "Glyph [{0}] has no svg in [{1}].".format(name, svg_dir)
+                    for name in extra
+                ]
+                raise GenerateError("\n".join(problems))
+
+    icon_metrics = None
+    if metrics:
+        with report.stage("metrics") as stage:
+            icon_metrics = read_icon_metrics(css_or_ttf_path, icons)
+            stage.add(bytes_read=source_size, glyphs=len(icons))
+
+    with report.stage("render") as stage:
+        stage.add(glyphs=len(icons))
+        cdefs, longest = make_cdefs(font_name, icons)
+        if embed is not None:
+            embedded = embedded_font_data(css_or_ttf_path, embed)
+            stage.add(bytes_read=source_size)
+        try:
+            contents = [
+                render_header(font_name, license, cdefs, longest, style=style, metrics=icon_metrics,
+                              lookup=lookup, embed=embed),
+                render_python_bindings(font_name, license, cdefs, style=style, metrics=metrics,
+                                       lookup=lookup),
+                render_cpp_example(font_name, cdefs, style=style, merged=merged, embed=embed),
+                render_py_example(font_name, merged=merged)
+            ]
+            if icon_manifest:
+                manifest_metrics, em_size = icon_metrics or (None, None)
+                contents += [
+                    iconmanifest.build_manifest(icons, manifest_metrics, em_size),
+                    iconmanifest.CPP_READER
+                ]
+            if embed is not None:
+                contents.append(render_font_resource(font_name, embedded, embed=embed,
+                                                     ttf_size=source_size))
+        except Exception as e:
+            raise GenerateError(
+                "unknown error generating NanoGUI utilities: {0}".format(e)
+            ) from e
 
-        # close out the cpp example
-        cpp_example.write(textwrap.dedent('''
-                    ////////////////////////////////////////////////////////////////////////
-                    ////////////////////////////////////////////////////////////////////////
-                    ////////////////////////////////////////////////////////////////////////
+    # Only touch the outputs whose content actually changed
+    with report.stage("write") as stage:
+        try:
+            os.makedirs(out_dir, exist_ok=True)
+            written, skipped, digests = write_if_changed(zip(outputs, contents))
+            stage.add(bytes_written=sum(os.path.getsize(path) for path in written))
+
+            # What the previous run wrote and this one did not would no longer
+            # match the header (only plain names in out_dir are ever recorded).
+            # Removed before the build manifest forgets them, so a failed removal
+            # is retried by the next run.
+            removed = []
+            current = set(os.path.basename(path) for path in outputs)
+            for name in sorted((previous or {}).get("outputs", {})):
+                path = os.path.join(out_dir, name)
+                if name not in current and name == os.path.basename(name) and \
+                        os.path.isfile(path):
+                    os.remove(path)
+                    removed.append(path)
+
+            ttf.atomic_write(build_manifest_path, json.dumps({
+                "version": BUILD_MANIFEST_VERSION,
+                "inputs": build_inputs,
+                "outputs": dict(
+                    (os.path.basename(path), digest) for path, digest in digests.items()
+                )
+            }, indent=2, sort_keys=True).encode("utf-8"))
+        except (IOError, OSError) as e:
+            raise GenerateError(
+                "could not write NanoGUI utilities: {0}".format(e)
+            ) from e
+
+    return {
+        "outputs": outputs,
+        "written": written,
+        "skipped": skipped,
+        "removed": removed,
+        "up_to_date": False,
+        "num_icons": len(icons),
+        "seconds": time.time() - start
+    }
 
-                    screen->performLayout();
-                    screen->setVisible(true);
 
-                    nanogui::mainloop();
-                }
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate the NanoGUI header, python bindings, and examples."
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the build manifest and re-render every output."
+    )
+    parser.add_argument(
+        "--css",
+        action="store_true",
+        help="Scan the fontcustom css file for icons instead of reading the compiled TTF."
+    )
+    parser.add_argument(
+        "--font-name",
+        default=FONT_NAME,
+        help="Font to generate utilities for (default: {0}).".format(FONT_NAME)
+    )
+    parser.add_argument(
+        "--license",
+        default=FONT_LICENSE,
+        help="License information for the font (default: the FONT_LICENSE variable)."
+    )
+    parser.add_argument(
+        "--expected-num-icons",
+        type=int,
+        default=None,
+        help="Number of icons the font must contain (default: {0} for {1}, any number for "
+             "other fonts).".format(EXPECTED_NUM_ICONS, FONT_NAME)
+    )
+    parser.add_argument(
+        "--style",
+        choices=STYLES,
+        default="define",
+        help="define: one #define per icon, and one statement per icon in the example "
+             "and bindings.  table: also an enum class and a constexpr table of every "
+             "icon, which the example and bindings loop over.  lazy: table, but the "
+             "python module creates its ICON_* attributes on first access "
+             "(default: %(default)s)."
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Also emit the advance and bounding box of every icon (read from the compiled "
+             "font) in the header and python bindings."
+    )
+    parser.add_argument(
+        "--lookup",
+        action="store_true",
+        help="Also emit perfect hash tables looking up the codepoint of an icon name (and "
+             "the name of a codepoint) in constant time, in the header and python bindings."
+    )
+    parser.add_argument(
+        "--icon-manifest",
+        action="store_true",
+        help="Also write the binary {font}.icons manifest of the icon names, codepoints "
+             "(and with --metrics, metrics) and the icon_manifest.h reader for it."
+    )
+    parser.add_argument(
+        "--merged",
+        metavar="NAME",
+        help="Read the icons of --font-name from the font NAME it was merged into (with "
+             "./manufacture.py --merge NAME), which the examples then load."
+    )
+    parser.add_argument(
+        "--embed-font",
+        choices=EMBED_FORMATS,
+        metavar="FORMAT",
+        help="Also write resource_{font}.cpp embedding the compiled font (raw: the .ttf "
+             "used in place, zlib: the .ttf deflated, woff2: the .ttf as WOFF2, "
+             "decompressed on first use), which the C++ example loads the font from."
+    )
+    buildreport.add_arguments(parser)
+    args = parser.parse_args()
+
+    # The command line overrides what ./manufacture.py patched in above, which
+    # lets `./manufacture.py --all` build several fonts at once without editing
+    # this file.
+    font_name = args.font_name
+    expected_count = args.expected_num_icons
+    if expected_count is None and font_name == FONT_NAME:
+        expected_count = EXPECTED_NUM_ICONS
+    file_loc = os.path.dirname(os.path.abspath(__file__))
 
-                nanogui::shutdown();
-                return 0;
-            }
-        ''').replace("\n", "", 1))
-        cpp_example.close()
+    # The icons are read from the compiled TTF (cmap + post tables) by default.
+    # The css file is only needed with --css, or when there is no TTF.
+    # A merged font holds the icons of several fonts
+    compiled_name = args.merged or font_name
+    font_dir = os.path.join(file_loc, "compiled_fonts", compiled_name)
+    ttf_file = os.path.join(font_dir, "{name}.ttf".format(name=compiled_name))
+    css_file = os.path.join(font_dir, "{name}.css".format(name=compiled_name))
+    if args.css or not os.path.exists(ttf_file):
+        source_file = css_file
+    else:
+        source_file = ttf_file
 
-        # <3 python
-        py_example_path = "{containment}/example_{name}.py".format(
-            containment=containment, name=FONT_NAME
-        )
-        with open(py_example_path, "w") as py_example:
-            py_example.write(textwrap.dedent('''
-                # Developer note: need to make a change to this file?
-                # Please raise an Issue on GitHub describing what needs to change.  This file
-                # was generated, so the scripts that generated it need to update as well.
-
-                import gc
-
-                import nanogui
-                from nanogui import Screen, Window, Widget, GridLayout, VScrollPanel, Button, TextBox, BoxLayout, Orientation, Theme
-                from nanogui import {name}
-
-
-                class {Name}Theme(nanogui.Theme):
-                    # This override informs NanoGUI to use this as the icon font.
-                    def defaultIconFont(self):
-                        return "{name}"
-
-                    def __init__(self, ctx):
-                        super({Name}Theme, self).__init__(ctx)
-                        self.m{Name}Font = nanogui.createFontMem(ctx, "{name}", "{name}.ttf")
-                        if self.m{Name}Font == -1:
-                            raise RuntimeError("Could not load the {name} font!")
-
-                        # TODO: you need to override the following default icon choices in your
-                        #       own application!  See documentation for nanogui::Theme.
-                        # self.mCheckBoxIcon             = entypo.ICON_CHECK
-                        # self.mCheckBoxIconExtraScale   = self.defaultCheckBoxIconExtraScale()
-                        # self.mMessageInformationIcon   = entypo.ICON_INFO_WITH_CIRCLE
-                        # self.mMessageQuestionIcon      = entypo.ICON_HELP_WITH_CIRCLE
-                        # self.mMessageWarningIcon       = entypo.ICON_WARNING
-                        # self.mMessageAltButtonIcon     = entypo.ICON_CIRCLE_WITH_CROSS
-                        # self.mMessagePrimaryButtonIcon = entypo.ICON_CHECK
-                        # self.mPopupChevronRightIcon    = entypo.ICON_CHEVRON_RIGHT
-                        # self.mPopupChevronLeftIcon     = entypo.ICON_CHEVRON_LEFT
-                        # self.mPopupIconExtraScale      = self.defaultPopupIconExtraScale()
-                        # self.mTabHeaderLeftIcon        = entypo.ICON_ARROW_BOLD_LEFT
-                        # self.mTabHeaderRightIcon       = entypo.ICON_ARROW_BOLD_RIGHT
-                        # self.mTextBoxUpIcon            = entypo.ICON_CHEVRON_UP
-                        # self.mTextBoxDownIcon          = entypo.ICON_CHEVRON_DOWN
-                        # self.mTextBoxIconExtraScale    = self.defaultTextBoxIconExtraScale()
-
-
-                class EscapeScreen(nanogui.Screen):
-                    def __init__(self, size, title, resizable):
-                        super(EscapeScreen, self).__init__(size, title, resizable)
-
-                    # allow <ESCAPE> to exit
-                    def keyboardEvent(self, key, scancode, action, modifiers):
-                        if key == nanogui.glfw.KEY_ESCAPE and modifiers == 0:
-                            self.setVisible(False)
-                            return True
-
-                        return super(EscapeScreen, self).keyboardEvent(key, scancode, action, modifiers)
-
-
-                class IconBox(nanogui.Widget):
-                    def __init__(self, parent, name, icon, width):
-                        super(IconBox, self).__init__(parent)
-
-                        self.setLayout(nanogui.BoxLayout(nanogui.Orientation.Horizontal))
-
-                        b = nanogui.Button(self, "", icon)
-                        b.setFixedWidth(40)
-
-                        text = nanogui.TextBox(self, name)
-                        text.setDefaultValue(name)
-                        text.setEditable(True)
-                        # Return false essentially makes it not possible to actually edit this text
-                        # box, but keeping it editable=true allows selection for copy-paste.  If the
-                        # text box is not editable, then the user cannot highlight it.
-                        text.setCallback(lambda x: False)
-                        text.setFont("mono-bold")
-                        text.setFixedWidth(width - 40)
-
-
-                if __name__ == "__main__":
-                    nanogui.init()
-
-                    width      = 1000
-                    half_width = width // 2
-                    height     = 800
-
-                    # create a fixed size screen with one window
-                    screen = EscapeScreen((width, height), "NanoGUI {Name} Icons", False)
-
-                    # NOTE: if doing a custom screen derived class, for some reason if you
-                    #       load a custom theme object and call setTheme in the constructor
-                    #       of the derived theme class it will not work.  You can load the
-                    #       theme in the constructor, but just make sure to call setTheme
-                    #       after the constructor is finished (as we are doing here)
-                    #
-                    #       Setting the theme of the screen means that all children created
-                    #       after this point will use this as their theme (rather than the
-                    #       default NanoGUI theme).
-                    theme = {Name}Theme(screen.nvgContext())
-                    screen.setTheme(theme)
-                    window = Window(screen, "")
-                    window.setPosition((0, 0))
-                    window.setFixedSize((width, height))
-
-                    # attach a vertical scroll panel
-                    vscroll = VScrollPanel(window)
-                    vscroll.setFixedSize((width, height))
-
-                    # vscroll should only have *ONE* child. this is what `wrapper` is for
-                    wrapper = Widget(vscroll)
-                    wrapper.setFixedSize((width, height))
-                    wrapper.setLayout(GridLayout())  # defaults: 2 columns
-
-                    # NOTE: don't __dict__ crawl in real code!
-                    # this is just because it's more convenient to do this for enumerating all
-                    # of the icons -- see cpp example for alternative...
-                    for key in {name}.__dict__.keys():
-                        if key.startswith("ICON_"):
-                            IconBox(wrapper, key, {name}.__dict__[key], half_width)
-
-                    screen.performLayout()
-                    screen.drawAll()
-                    screen.setVisible(True)
-
-                    nanogui.mainloop()
-
-                    del screen
-                    gc.collect()
-
-                    nanogui.shutdown()
-            '''.format(
-                name=FONT_NAME,
-                Name=FONT_NAME.capitalize()
-            )).lstrip())
-    except Exception as e:
-        sys.stderr.write(
-            "Critical: unknown error generating NanoGUI utilities: {0}\n".format(e)
-        )
+    svg_dir = os.path.join(file_loc, "icons", font_name)
+    containment = os.path.join(file_loc, "nanogui", font_name)
+    report = buildreport.from_arguments(args)
+    try:
+        with report.stage(font_name), report.stage("generate"):
+            result = generate(
+                font_name,
+                source_file,
+                containment,
+                args.license,
+                expected_count=expected_count,
+                svg_dir=svg_dir if os.path.isdir(svg_dir) else None,
+                force=args.force,
+                style=args.style,
+                metrics=args.metrics,
+                lookup=args.lookup,
+                icon_manifest=args.icon_manifest,
+                merged=args.merged,
+                embed=args.embed_font,
+                report=report
+            )
+    except (GenerateError, buildreport.ReportError) as e:
+        # The report of a failed run still says which stage failed
+        try:
+            buildreport.finish(report, args, "generate.py")
+        except buildreport.ReportError:
+            pass
+        sys.stderr.write("Critical: {0}\n".format(e))
         sys.exit(1)
 
+    if result["up_to_date"]:
+        print("Up to date: skipped [{0}] unchanged files in {1}.".format(
+            len(result["skipped"]), os.path.relpath(containment)
+        ))
+    else:
+        print("Found exactly [{0}] icons, as expected.".format(result["num_icons"]))
+        for path in result["written"]:
+            print("Wrote [{0}].".format(os.path.relpath(path)))
+        for path in result["skipped"]:
+            print("Unchanged, skipped [{0}].".format(os.path.relpath(path)))
+        for path in result["removed"]:
+            print("Removed [{0}], no longer generated.".format(os.path.relpath(path)))
+
+    try:
+        buildreport.finish(report, args, "generate.py")
+    except buildreport.ReportError as e:
+        sys.stderr.write("Critical: {0}\n".format(e))
+        sys.exit(1)
@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+A compact, versioned binary manifest of the icons of a font, written next to the
+header by ``./generate.py --icon-manifest``.  Tools that need the icon names,
+codepoints or metrics can memory-map it instead of parsing the css file, the
+header or the font: nothing is decoded up front, so opening a manifest of 50000
+icons takes as long as opening one of ten.
+
+All numbers are little endian, and every section starts on a four byte boundary::
+
+    header       magic "NGIM", u16 version, u16 flags, u32 count, f32 em size,
+                 u32 offsets of the codepoints, names, by name and metrics
+                 sections, u32 offset and size of the string table
+    codepoints   u32[count]      sorted ascending
+    names        u32[count + 1]  string table offset of the name of each
+                                 codepoint, the name ends at the next offset
+                                 (the last one is the size of the string table)
+    by name      u32[count]      indices of the codepoints, sorted by name
+    metrics      f32[count * 5]  advance, xMin, yMin, xMax, yMax of each
+                                 codepoint in ems (only if flags & HAS_METRICS)
+    strings      the utf-8 names, each followed by a NUL
+
+:data:`CPP_READER` is the matching header-only C++ reader (``icon_manifest.h``).
+
+Example::
+
+    with IconManifest("nanogui/fontawesome/fontawesome.icons") as manifest:
+        print(len(manifest), hex(manifest.codepoint("address-book")))
+"""
+
+import argparse
+from array import array
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import textwrap
+import time
+
+
+class ManifestError(Exception):
+    """Raised when an icon manifest cannot be written or parsed."""
+
+
+MAGIC = b"NGIM"
+VERSION = 1
+
+# flags
+HAS_METRICS = 0x1
+
+HEADER = struct.Struct("<4sHHIf6I")
+METRICS_FIELDS = ("advance", "xMin", "yMin", "xMax", "yMax")
+
+# memoryview.cast uses the native byte order and sizes, elsewhere the sections
+# are read into arrays instead.
+_ZERO_COPY = sys.byteorder == "little" and array("I").itemsize == 4
+
+
+def _align(size):
+    return (size + 3) & ~3
+
+
+def build_manifest(icons, metrics=None, em_size=None):
+    """
+    Return the manifest of the ``[(name, codepoint), ...]`` in ``icons`` as bytes.
+    ``metrics`` and ``em_size`` are optional, as returned by
+    :func:`generate.read_icon_metrics` for the same ``icons``.  Icons may share a
+    codepoint (aliases, see ``svg2ttf.py --dedupe``), looking the codepoint up
+    then finds the first of them in ``icons``.
+    """
+    order = sorted(range(len(icons)), key=lambda i: icons[i][1])
+    codepoints = [icons[i][1] for i in order]
+    names = [icons[i][0].encode("utf-8") for i in order]
+    if len(set(names)) != len(names):
+        raise ManifestError("Every icon needs its own name.")
+
+    name_offsets = [0]
+    for name in names:
+        name_offsets.append(name_offsets[-1] + len(name) + 1)
+    by_name = sorted(range(len(names)), key=lambda i: names[i])
+    strings = b"".join(name + b"\0" for name in names)
+
+    count = len(icons)
+    codepoints_offset = HEADER.size
+    names_offset = codepoints_offset + 4 * count
+    by_name_offset = names_offset + 4 * (count + 1)
+    end = by_name_offset + 4 * count
+    sections = [
+        struct.pack("<{0}I".format(count), *codepoints),
+        struct.pack("<{0}I".format(count + 1), *name_offsets),
+        struct.pack("<{0}I".format(count), *by_name)
+    ]
+
+    flags = 0
+    metrics_offset = 0
+    if metrics is not None:
+        flags |= HAS_METRICS
+        metrics_offset = end
+        end += 4 * len(METRICS_FIELDS) * count
+        sections.append(struct.pack(
+            "<{0}f".format(len(METRICS_FIELDS) * count),
+            *(value for i in order for value in metrics[i])
+        ))
+
+    strings_offset = end
+    sections.append(strings + b"\0" * (_align(len(strings)) - len(strings)))
+    header = HEADER.pack(MAGIC, VERSION, flags, count, em_size or 0.0, codepoints_offset,
+                         names_offset, by_name_offset, metrics_offset, strings_offset,
+                         len(strings))
+    return header + b"".join(sections)
+
+
+class IconManifest(object):
+    """
+    A memory-mapped icon manifest.
+
+    ``path`` is the manifest to open.  Use as a context manager, or call
+    :meth:`close` when done.  Lookups by name and by codepoint are binary
+    searches of the mapped file, and :attr:`codepoints` is a view of it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._views = []
+        self._file = open(path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < HEADER.size:
+                raise ManifestError("[{0}] is too small to be an icon manifest.".format(path))
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except:
+            self._file.close()
+            raise
+
+        try:
+            self._read_header()
+        except:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        # The mapping cannot be closed while views of it are alive
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self.codepoints = self._name_offsets = self._by_name = self._metrics = None
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read_header(self):
+        data = self._data
+        (magic, self.version, self.flags, count, self.em_size, codepoints_offset,
+         names_offset, by_name_offset, metrics_offset, strings_offset,
+         strings_size) = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ManifestError("[{0}] is not an icon manifest.".format(self.path))
+        if self.version > VERSION:
+            raise ManifestError(
+                "[{0}] is a version {1} icon manifest, this reader knows up to {2}.".format(
+                    self.path, self.version, VERSION
+                )
+            )
+
+        self.codepoints = self._section(codepoints_offset, count, "I")
+        self._name_offsets = self._section(names_offset, count + 1, "I")
+        self._by_name = self._section(by_name_offset, count, "I")
+        self._metrics = None
+        if self.has_metrics:
+            self._metrics = self._section(metrics_offset, len(METRICS_FIELDS) * count, "f")
+        if strings_offset + strings_size > len(data) or (
+                count and self._name_offsets[count] != strings_size):
+            raise ManifestError("[{0}] has a truncated string table.".format(self.path))
+        self._strings_offset = strings_offset
+
+    def _section(self, offset, length, code):
+        end = offset + 4 * length
+        if offset % 4 or end > len(self._data):
+            raise ManifestError("[{0}] has a truncated or misaligned section.".format(self.path))
+        if not _ZERO_COPY:
+            return array(code, struct.unpack_from("<{0}{1}".format(length, code), self._data, offset))
+        view = memoryview(self._data)
+        part = view[offset:end]
+        section = part.cast(code)
+        self._views.extend((view, part, section))
+        return section
+
+    @property
+    def has_metrics(self):
+        return bool(self.flags & HAS_METRICS)
+
+    def __len__(self):
+        return len(self.codepoints)
+
+    def _name_bytes(self, index):
+        start = self._strings_offset + self._name_offsets[index]
+        return self._data[start:self._strings_offset + self._name_offsets[index + 1] - 1]
+
+    def name_at(self, index):
+        """The name of the icon with the ``index``-th smallest codepoint."""
+        return self._name_bytes(index).decode("utf-8")
+
+    def icons(self):
+        """Yield ``(name, codepoint)`` of every icon, by codepoint."""
+        for index, codepoint in enumerate(self.codepoints):
+            yield self.name_at(index), codepoint
+
+    def _index(self, codepoint):
+        index = bisect.bisect_left(self.codepoints, codepoint)
+        if index == len(self.codepoints) or self.codepoints[index] != codepoint:
+            raise KeyError("no icon has the codepoint 0x{0:X}".format(codepoint))
+        return index
+
+    def codepoint(self, name):
+        """The codepoint of the icon named ``name``, raises ``KeyError`` if none."""
+        key = name.encode("utf-8")
+        lo, hi = 0, len(self._by_name)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._name_bytes(self._by_name[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self._by_name) and self._name_bytes(self._by_name[lo]) == key:
+            return self.codepoints[self._by_name[lo]]
+        raise KeyError("no icon is named {0!r}".format(name))
+
+    def name(self, codepoint):
+        """The name of the icon with the given codepoint, raises ``KeyError`` if none."""
+        return self.name_at(self._index(codepoint))
+
+    def metrics(self, codepoint):
+        """
+        ``(advance, xMin, yMin, xMax, yMax)`` of the icon with the given codepoint
+        in ems, raises ``KeyError`` if none (see :func:`generate.read_icon_metrics`).
+        """
+        if self._metrics is None:
+            raise ManifestError("[{0}] was written without metrics.".format(self.path))
+        start = len(METRICS_FIELDS) * self._index(codepoint)
+        return tuple(self._metrics[start:start + len(METRICS_FIELDS)])
+
+
+# The C++ reader, written next to the manifest as icon_manifest.h.  It works on
+# the bytes of the manifest however they got into memory (mmap, bin2c, ...).
+CPP_READER = textwrap.dedent('''\
+    #pragma once
+
+    #include <cstddef>
+    #include <cstdint>
+    #include <cstring>
+
+    /* Reads the icon manifests written by `./generate.py --icon-manifest`, see
+     * iconmanifest.py for the layout.  Nothing is copied: map or embed the file,
+     * and keep it alive as long as the reader.
+     *
+     *     IconManifest manifest;
+     *     int icon = manifest.open(data, size) ? manifest.codepoint("address-book") : 0;
+     */
+    class IconManifest {
+    public:
+        struct Metrics {
+            float advance;
+            float xMin, yMin, xMax, yMax;
+        };
+
+        static constexpr std::uint16_t VERSION = %(version)d;
+
+        /* Check the header of the `size` bytes at `data`, false if they are not a
+         * (complete) manifest this reader understands.
+         */
+        bool open(const void *data, std::size_t size) {
+            mData = static_cast<const unsigned char *>(data);
+            mCount = 0;
+            if (size < %(header_size)d || std::memcmp(mData, "%(magic)s", 4) != 0 || u16(4) > VERSION)
+                return false;
+            std::uint32_t count = u32(8);
+            mFlags = u16(6);
+            mEmSize = f32(12);
+            mCodepoints = u32(16);
+            mNames = u32(20);
+            mByName = u32(24);
+            mMetrics = u32(28);
+            mStrings = u32(32);
+            std::uint32_t strings = u32(36);
+            if (mCodepoints + 4ull * count > size || mNames + 4ull * (count + 1) > size ||
+                mByName + 4ull * count > size || mStrings + (std::uint64_t) strings > size ||
+                (hasMetrics() && mMetrics + %(metrics_size)dull * count > size))
+                return false;
+            mCount = count;
+            return true;
+        }
+
+        std::uint32_t size() const { return mCount; }
+        bool hasMetrics() const { return (mFlags & %(has_metrics)d) != 0; }
+        // The size of an em relative to the font size, 0 without metrics
+        float emSize() const { return mEmSize; }
+
+        // The `index`-th smallest codepoint and its name
+        int codepointAt(std::uint32_t index) const { return (int) u32(mCodepoints + 4 * index); }
+        const char *nameAt(std::uint32_t index) const {
+            return reinterpret_cast<const char *>(mData + mStrings + u32(mNames + 4 * index));
+        }
+
+        // The codepoint of the icon named `name` (`size` bytes), or 0 if there is none
+        int codepoint(const char *name, std::size_t size) const {
+            std::uint32_t lo = 0, hi = mCount;
+            while (lo < hi) {
+                std::uint32_t mid = lo + (hi - lo) / 2;
+                if (compare(u32(mByName + 4 * mid), name, size) < 0)
+                    lo = mid + 1;
+                else
+                    hi = mid;
+            }
+            if (lo < mCount && compare(u32(mByName + 4 * lo), name, size) == 0)
+                return codepointAt(u32(mByName + 4 * lo));
+            return 0;
+        }
+
+        int codepoint(const char *name) const { return codepoint(name, std::strlen(name)); }
+
+        // The name of the icon with the given codepoint, or nullptr
+        const char *name(int codepoint) const {
+            std::uint32_t index = find(codepoint);
+            return index < mCount ? nameAt(index) : nullptr;
+        }
+
+        // The metrics of the icon with the given codepoint in `metrics`, false if none
+        bool metrics(int codepoint, Metrics &metrics) const {
+            std::uint32_t index = find(codepoint);
+            if (!hasMetrics() || index >= mCount)
+                return false;
+            const std::size_t at = mMetrics + %(metrics_size)d * (std::size_t) index;
+            metrics = Metrics{f32(at), f32(at + 4), f32(at + 8), f32(at + 12), f32(at + 16)};
+            return true;
+        }
+
+    protected:
+        std::uint16_t u16(std::size_t at) const {
+            return (std::uint16_t) (mData[at] | mData[at + 1] << 8);
+        }
+
+        std::uint32_t u32(std::size_t at) const {
+            return (std::uint32_t) mData[at] | (std::uint32_t) mData[at + 1] << 8 |
+                   (std::uint32_t) mData[at + 2] << 16 | (std::uint32_t) mData[at + 3] << 24;
+        }
+
+        float f32(std::size_t at) const {
+            std::uint32_t bits = u32(at);
+            float value;
+            std::memcpy(&value, &bits, sizeof(value));
+            return value;
+        }
+
+        // Index of `codepoint` in the codepoints section, mCount if it is not there
+        std::uint32_t find(int codepoint) const {
+            std::uint32_t lo = 0, hi = mCount;
+            while (lo < hi) {
+                std::uint32_t mid = lo + (hi - lo) / 2;
+                if (u32(mCodepoints + 4 * mid) < (std::uint32_t) codepoint)
+                    lo = mid + 1;
+                else
+                    hi = mid;
+            }
+            return lo < mCount && u32(mCodepoints + 4 * lo) == (std::uint32_t) codepoint ? lo : mCount;
+        }
+
+        // Compares the name of the `index`-th codepoint to `name`, as bytes
+        int compare(std::uint32_t index, const char *name, std::size_t size) const {
+            std::uint32_t start = u32(mNames + 4 * index);
+            std::size_t length = u32(mNames + 4 * (index + 1)) - start - 1;
+            int order = std::memcmp(mData + mStrings + start, name, length < size ? length : size);
+            if (order != 0)
+                return order;
+            return length < size ? -1 : length > size ? 1 : 0;
+        }
+
+        const unsigned char *mData = nullptr;
+        std::uint32_t mCount = 0;
+        std::uint16_t mFlags = 0;
+        float mEmSize = 0.0f;
+        std::uint32_t mCodepoints = 0, mNames = 0, mByName = 0, mMetrics = 0, mStrings = 0;
+    };
+''') % {
+    "version": VERSION,
+    "header_size": HEADER.size,
+    "magic": MAGIC.decode("ascii"),
+    "has_metrics": HAS_METRICS,
+    "metrics_size": 4 * len(METRICS_FIELDS)
+}
+
+
+def benchmark(counts=(1000, 10000, 50000), repeat=5):
+    """
+    Time opening a manifest of each of ``counts`` synthetic icons and looking up
+    one name, against loading the same icons from json.  Returns
+    ``[(count, manifest_bytes, manifest_seconds, json_bytes, json_seconds), ...]``.
+    """
+    from benchmark import synthetic_icons
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="iconmanifest-") as scratch:
+        for count in counts:
+            icons = synthetic_icons(count)
+            name = icons[count // 2][0]
+            manifest_path = os.path.join(scratch, "{0}.icons".format(count))
+            json_path = os.path.join(scratch, "{0}.json".format(count))
+            with open(manifest_path, "wb") as f:
+                f.write(build_manifest(icons))
+            with open(json_path, "w") as f:
+                json.dump(dict(icons), f)
+
+            def load_manifest():
+                with IconManifest(manifest_path) as manifest:
+                    return manifest.codepoint(name)
+
+            def load_json():
+                with open(json_path) as f:
+                    return json.load(f)[name]
+
+            timings = []
+            for load in (load_manifest, load_json):
+                best = None
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    load()
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                timings.append(best)
+            results.append((count, os.path.getsize(manifest_path), timings[0],
+                            os.path.getsize(json_path), timings[1]))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="List the icons of a binary icon manifest (see generate.py --icon-manifest)."
+    )
+    parser.add_argument("manifest", nargs="?", help="The .icons file to list.")
+    parser.add_argument(
+        "--benchmark",
+        nargs="?",
+        const="1000,10000,50000",
+        metavar="COUNTS",
+        help="Time opening manifests of synthetic icons (comma separated counts, "
+             "default: %(const)s) against loading the same icons from json."
+    )
+    args = parser.parse_args()
+
+    if args.benchmark:
+        try:
+            counts = [int(count) for count in args.benchmark.split(",") if count]
+        except ValueError:
+            parser.error("--benchmark expects comma separated icon counts")
+        print("Opening and looking up one name:")
+        print("  {0:>7} {1:>12} {2:>10} {3:>12} {4:>10}".format(
+            "icons", "manifest", "open", "json", "load"
+        ))
+        for count, manifest_size, manifest_seconds, json_size, json_seconds in benchmark(counts):
+            print("  {0:>7} {1:>10} B {2:>8.3f}ms {3:>10} B {4:>8.3f}ms".format(
+                count, manifest_size, 1000.0 * manifest_seconds, json_size, 1000.0 * json_seconds
+            ))
+        sys.exit(0)
+
+    if args.manifest is None:
+        parser.error("expected a manifest to list (or --benchmark)")
+    try:
+        with IconManifest(args.manifest) as manifest:
+            for name, code in manifest.icons():
+                print("{0:<50} 0x{1:08X}".format(name, code))
+    except (IOError, OSError, ManifestError) as e:
+        sys.stderr.write("Critical: {0}\n".format(e))
+        sys.exit(1)
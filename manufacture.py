@@ -1,12 +1,29 @@
 #!/usr/bin/env python3
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import os
 import re
+import subprocess
 import sys
 import textwrap
+import time
+
+import atlas
+import buildreport
+import generate
+import svg2ttf
+import ttf
+import watch
+
+def manufacture_foncutstom_config(ymlPath, fontName, manifestPath=None):
+    # fontcustom keeps its own manifest, by default .fontcustom-manifest.json in the
+    # current directory.  Batch builds give every font its own.
+    if manifestPath is None:
+        manifest_yml = ""
+    else:
+        manifest_yml = 'manifest: "{0}"\n'.format(manifestPath)
 
-def manufacture_foncutstom_config(ymlPath, fontName):
     config_yml = textwrap.dedent('''
         font_name: "{fontName}"
         # VERY IMPORTANT!  The css_selector must be EXACTLY
@@ -22,7 +39,7 @@ def manufacture_foncutstom_config(ymlPath, fontName):
         force: false
         debug: false
         quiet: false
-
+        {manifest}
         input:
             vectors: "icons/{fontName}"
 
@@ -35,7 +52,7 @@ def manufacture_foncutstom_config(ymlPath, fontName):
         - scss
         - css
         - preview
-    '''.format(fontName=fontName))
+    '''.format(fontName=fontName, manifest=manifest_yml))
 
     # write to config/fontcustom.yml
     try:
@@ -131,6 +148,570 @@ def manufacture_generate(generatePath, fontName, fontLicense, numIcons):
         sys.exit(1)
 
 
+def count_icons(font_dir):
+    """Return the number of ``.svg`` icons in ``font_dir``, exits if there are none."""
+    if not os.path.isdir(font_dir):
+        sys.stderr.write("Internal error: [{0}] is not a directory?\n".format(font_dir))
+        sys.exit(1)
+
+    all_icons = [icon for icon in os.listdir(font_dir) if icon.endswith(".svg")]
+    if len(all_icons) == 0:
+        sys.stderr.write(
+            "Error: there are no .svg icons in the directory {0}\n".format(font_dir)
+        )
+        sys.exit(1)
+
+    return len(all_icons)
+
+
+# SVGs handed to a validation worker at once
+VALIDATE_CHUNK = 64
+
+
+def _validate_svgs(paths):
+    """Process pool entry point: ``[(path, errors, warnings), ...]`` for the SVGs at ``paths``."""
+    results = []
+    for path in paths:
+        try:
+            with open(path, "rb") as svg:
+                errors, warnings = svg2ttf.check_svg(svg.read())
+        except (IOError, OSError) as e:
+            errors, warnings = [str(e)], []
+        results.append((path, errors, warnings))
+    return results
+
+
+def validate_fonts(here, fontNames, jobs):
+    """
+    Check every ``.svg`` in ``icons/{fontName}`` of all of ``fontNames`` before
+    anything is compiled, so that every problem is found in one pass.  The
+    directories are scanned while ``jobs`` processes parse the SVGs found so far
+    (see :func:`svg2ttf.check_svg`), and every icon name is indexed by the C
+    identifier :func:`generate.make_cdefs` makes of it, which must be valid and
+    must not be shared with another icon (``arrow-up.svg`` and ``arrow_up.svg``).
+    This only validates: the SVGs are not modified, their viewBox and transforms
+    are applied when :mod:`svg2ttf` converts them (``fontcustom`` gets them as
+    they are).
+
+    Returns ``{fontName: (numIcons, errors, warnings)}``, every message naming its file.
+    """
+    results = {}
+    futures = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for fontName in fontNames:
+            errors = []
+            identifiers = {}
+            chunk = []
+            with os.scandir(os.path.join(here, "icons", fontName)) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".svg"):
+                        continue
+                    identifier = generate.icon_identifier(entry.name[:-len(".svg")])
+                    identifiers.setdefault(identifier, []).append(entry.path)
+                    chunk.append(entry.path)
+                    if len(chunk) == VALIDATE_CHUNK:
+                        futures.append((fontName, pool.submit(_validate_svgs, chunk)))
+                        chunk = []
+            if chunk:
+                futures.append((fontName, pool.submit(_validate_svgs, chunk)))
+
+            for identifier, paths in identifiers.items():
+                define = "{0}_ICON_{1}".format(fontName.upper(), identifier)
+                if not re.match(r"^[A-Z0-9_]+$", identifier):
+                    errors.extend(
+                        "[{0}]: {1} is not a valid C identifier".format(path, define)
+                        for path in paths
+                    )
+                if len(paths) > 1:
+                    errors.append("[{0}]: all of them would be {1}".format(
+                        "], [".join(sorted(paths)), define
+                    ))
+            results[fontName] = (sum(len(paths) for paths in identifiers.values()), errors, [])
+
+        for fontName, future in futures:
+            _, errors, warnings = results[fontName]
+            for path, svg_errors, svg_warnings in future.result():
+                errors.extend("[{0}]: {1}".format(path, error) for error in svg_errors)
+                warnings.extend("[{0}]: {1}".format(path, warning) for warning in svg_warnings)
+
+    for _, errors, warnings in results.values():
+        errors.sort()
+        warnings.sort()
+    return results
+
+
+def validate_or_exit(here, fontNames, jobs):
+    """
+    Run :func:`validate_fonts`, print the warnings, and exit listing every error
+    if there are any.  Returns ``{fontName: numIcons}``.
+    """
+    start = time.time()
+    results = validate_fonts(here, fontNames, jobs)
+    failed = False
+    counts = {}
+    for fontName in fontNames:
+        numIcons, errors, warnings = results[fontName]
+        font_dir = os.path.join(here, "icons", fontName)
+        print(">>> Found {0} icons in {1}.".format(numIcons, font_dir))
+        for warning in warnings:
+            sys.stderr.write("Warning: {0}\n".format(warning))
+        if numIcons == 0:
+            errors = ["there are no .svg icons in the directory {0}".format(font_dir)]
+        for error in errors:
+            sys.stderr.write("Error: {0}\n".format(error))
+        failed = failed or bool(errors)
+        counts[fontName] = numIcons
+    if failed:
+        sys.stderr.write("Critical: fix the icons above (or pass --no-validate).\n")
+        sys.exit(1)
+    print(">>> Validated {0} icons in {1:.2f}s.".format(sum(counts.values()), time.time() - start))
+    return counts
+
+
+def validate_license(license):
+    """Exits if ``license`` has no URL in it or spans more than one line."""
+    if "http" not in license:
+        sys.stderr.write(textwrap.dedent('''
+            Please include a URL to the official license of the font you wish to embed
+            into NanoGUI.  The license information is included in the generated header
+            file and python bindings.
+        '''))
+        sys.exit(1)
+
+    if len(license.split(r"\n")) > 1 or len(license.split(r"\r")) > 1:
+        sys.stderr.write(textwrap.dedent('''
+            The license information must be on one line, make sure there are no newline
+            characters or carriage returns in the input you provided.
+        '''))
+        sys.exit(1)
+
+
+def ask_license(font_name):
+    """Prompt for (and validate) the license information of ``font_name``."""
+    if sys.version[0] == "3":
+        user_input = lambda x: input(x)
+    else:
+        user_input = lambda x: raw_input(x)
+
+    print(textwrap.dedent('''\
+        >>> Please enter the license information for the {font_name} font, including a
+            URL to the official license.  For example, the Font Awesome 5 Free license
+            icons are governed by CC-BY-SA 4.0, so you would enter:
+
+                CC-BY-SA 4.0: https://github.com/FortAwesome/Font-Awesome/blob/master/LICENSE.txt
+
+            Any input without 'http' in it will be rejected.  Input must be on one line.
+    '''.format(
+        font_name=font_name
+    )))
+    try:
+        license = user_input("    license> ")
+    except:
+        sys.stderr.write("\n\nGoodbye...\n")
+        sys.exit(1)
+
+    validate_license(license)
+    return license
+
+
+def _file_sizes(paths):
+    """The total size of the files in ``paths`` that exist."""
+    return sum(os.path.getsize(path) for path in paths if os.path.isfile(path))
+
+
+def _svg_sizes(svg_dir):
+    return _file_sizes(
+        os.path.join(svg_dir, entry) for entry in os.listdir(svg_dir) if entry.endswith(".svg")
+    )
+
+
+def build_font(here, fontName, fontLicense, numIcons, compiler="native", glyphJobs=1,
+               atlasSizes=None, report=None, simplify=None, dedupe=False, cache=None):
+    """
+    Run the whole pipeline (compile then ``generate.py``) for one font.  Every font
+    has its own ``config/fontcustom-{fontName}.yml`` and fontcustom manifest, and
+    :func:`generate.generate` receives its settings as arguments instead of being
+    patched, so any number of these can run at the same time.
+
+    ``compiler`` is ``"native"`` to compile with ``svg2ttf.py`` (using ``glyphJobs``
+    processes and the :class:`svg2ttf.GlyphCache` ``cache``, by default the one in
+    ``.svg2ttf-cache``, simplifying the outlines to within ``simplify`` font units
+    if set, see :func:`svg2ttf.simplify_glyphs`, and making icons with the same
+    outline aliases with ``dedupe``, see :func:`svg2ttf.dedupe_glyphs`), or
+    ``"fontcustom"`` to run ``rake``.  With ``atlasSizes``, the glyphs are also
+    pre-rasterized into ``atlas/{fontName}`` by :func:`atlas.build_atlas`.
+    The ``{fontName}/compile``, ``{fontName}/generate/...`` and ``{fontName}/atlas``
+    stages are recorded in ``report`` (a :class:`buildreport.BuildReport`), if given.
+
+    Returns ``(fontName, success, seconds, output, stages)``, ``stages`` being
+    those recorded in ``report`` (to pass them on from a worker process).
+    """
+    start = time.time()
+    if report is None:
+        report = buildreport.BuildReport(enabled=False)
+    output = []
+    try:
+        with report.stage(fontName) as stage:
+            success = _build_font(here, fontName, fontLicense, numIcons, compiler, glyphJobs,
+                                  atlasSizes, report, simplify, dedupe, cache, output)
+            stage.failed = not success
+    except buildreport.ReportError as e:
+        output.append("Critical: {0}\n".format(e))
+        success = False
+    return fontName, success, time.time() - start, "".join(output), report.stages
+
+
+def _build_font(here, fontName, fontLicense, numIcons, compiler, glyphJobs, atlasSizes,
+                report, simplify, dedupe, cache, output):
+    """The stages of :func:`build_font`, returns ``True`` if all of them succeeded."""
+    config_path = os.path.join(here, "config", "fontcustom-{0}.yml".format(fontName))
+    manufacture_foncutstom_config(
+        config_path,
+        fontName,
+        manifestPath="config/.fontcustom-manifest-{0}.json".format(fontName)
+    )
+
+    svg_dir = os.path.join(here, "icons", fontName)
+    font_dir = os.path.join(here, "compiled_fonts", fontName)
+    ttf_path = os.path.join(font_dir, "{0}.ttf".format(fontName))
+    if compiler == "native":
+        if cache is None:
+            cache = svg2ttf.GlyphCache(os.path.join(here, svg2ttf.DEFAULT_CACHE_DIR))
+        try:
+            with report.stage("compile") as stage:
+                result = svg2ttf.compile_font(
+                    svg2ttf.read_config(config_path), jobs=glyphJobs, root=here,
+                    cache=cache, simplify=simplify, dedupe=dedupe
+                )
+                stage.add(bytes_read=_svg_sizes(svg_dir), glyphs=result["glyphs"],
+                          bytes_written=_file_sizes([result["ttf"], result["css"]]))
+        except (svg2ttf.SVGError, ttf.TTFError, IOError, OSError, ValueError) as e:
+            output.append("Critical: {0}\n".format(e))
+            return False
+        # {fontName}_{md5}.ttf when the config does not set no_hash
+        ttf_path = result["ttf"]
+        output.append("Compiled [{0}] icons ([{1}] cached, [{2}] aliases) in {3:.2f}s.\n".format(
+            result["glyphs"], result["cached"], result["aliases"], result["seconds"]
+        ))
+        for path in result["removed"]:
+            output.append("Removed [{0}], replaced by the compiled font.\n".format(path))
+    else:
+        command = ["rake", "customfont:compile_font[{0}]".format(fontName)]
+        with report.stage("compile") as stage:
+            try:
+                proc = subprocess.Popen(
+                    command, cwd=here, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                    universal_newlines=True
+                )
+                output.append(proc.communicate()[0])
+            except Exception as e:
+                output.append("Could not run {0}: {1}\n".format(" ".join(command), e))
+                stage.failed = True
+                return False
+
+            if proc.returncode != 0:
+                stage.failed = True
+                return False
+            stage.add(bytes_read=_svg_sizes(svg_dir), glyphs=numIcons, bytes_written=_file_sizes(
+                [ttf_path, os.path.join(font_dir, "{0}.css".format(fontName))]
+            ))
+
+    # generate.py runs in this (already warm) worker rather than a new interpreter
+    try:
+        with report.stage("generate"):
+            result = generate.generate(
+                fontName,
+                ttf_path,
+                os.path.join(here, "nanogui", fontName),
+                fontLicense,
+                expected_count=numIcons,
+                svg_dir=svg_dir,
+                report=report
+            )
+    except generate.GenerateError as e:
+        output.append("Critical: {0}\n".format(e))
+        return False
+
+    output.append("Wrote {0} and skipped {1} unchanged files in nanogui/{2}.\n".format(
+        len(result["written"]), len(result["skipped"]), fontName
+    ))
+
+    if atlasSizes:
+        try:
+            with report.stage("atlas") as stage:
+                result = atlas.build_atlas(
+                    fontName,
+                    ttf_path,
+                    os.path.join(here, "atlas", fontName),
+                    sizes=atlasSizes,
+                    jobs=glyphJobs
+                )
+                stage.add(bytes_read=_file_sizes([ttf_path]), glyphs=result["glyphs"],
+                          bytes_written=_file_sizes(result["written"]))
+        except atlas.AtlasError as e:
+            output.append("Critical: {0}\n".format(e))
+            return False
+        output.append("Rasterized [{0}] glyphs onto [{1}] atlas pages in {2:.2f}s.\n".format(
+            result["glyphs"], result["pages"], result["seconds"]
+        ))
+    return True
+
+
+def manufacture_batch(here, fonts, jobs, compiler="native", atlasSizes=None, report=None,
+                      simplify=None, dedupe=False):
+    """
+    Build every ``(fontName, fontLicense, numIcons)`` in ``fonts`` in a process
+    pool of ``jobs`` workers (see :func:`build_font` for ``atlasSizes``, ``report``,
+    ``simplify`` and ``dedupe``).  Returns ``True`` if every font built successfully.
+    """
+    print(">>> Building {0} fonts with {1} workers.".format(len(fonts), jobs))
+    start = time.time()
+    results = []
+    # Spare CPUs (fewer fonts than CPUs) go to converting the icons of each font
+    glyph_jobs = max((os.cpu_count() or 1) // max(min(jobs, len(fonts)), 1), 1)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(build_font, here, fontName, fontLicense, numIcons, compiler,
+                        glyph_jobs, atlasSizes, report, simplify, dedupe)
+            for fontName, fontLicense, numIcons in fonts
+        ]
+        for future in as_completed(futures):
+            fontName, success, seconds, output, stages = future.result()
+            results.append((fontName, success, seconds))
+            if report is not None:
+                report.extend(stages)
+            print(">>> [{0}] {1} in {2:.2f}s.".format(
+                fontName, "built" if success else "FAILED", seconds
+            ))
+            if not success:
+                sys.stderr.write(textwrap.indent(output, "    "))
+    wall = time.time() - start
+
+    # The per-font times were measured while sharing the CPUs with the other
+    # workers, their sum is no measure of a serial (--jobs 1) run.
+    print(">>> Wall clock {0:.2f}s, sum of per-font times {1:.2f}s.".format(
+        wall, sum(seconds for _, _, seconds in results)
+    ))
+
+    failed = sorted(fontName for fontName, success, _ in results if not success)
+    if failed:
+        sys.stderr.write("Failed to build: {0}\n".format(", ".join(failed)))
+    return not failed
+
+
+def manufacture_merged(here, mergedName, fonts, jobs, atlasSizes=None, report=None,
+                       simplify=None, dedupe=False, cache=None):
+    """
+    Compile every ``(fontName, fontLicense, numIcons)`` in ``fonts`` into the one
+    font ``compiled_fonts/{mergedName}`` with :func:`svg2ttf.merge_fonts` (using
+    ``jobs`` processes), then generate the utilities of every font in
+    ``nanogui/{fontName}`` as usual, except that they use the merged font.  With
+    ``atlasSizes``, the merged font is pre-rasterized into ``atlas/{mergedName}``.
+    The ``{mergedName}/compile``, ``{mergedName}/{fontName}/generate/...`` and
+    ``{mergedName}/atlas`` stages are recorded in ``report``, if given.  With
+    ``simplify``, the outlines are simplified to within that many font units, with
+    ``dedupe`` icons with the outline of another (of any font) become its aliases.
+    ``cache`` is as in :func:`build_font`.  Returns ``True`` if everything built successfully.
+    """
+    print(">>> Merging {0} fonts into {1}.".format(len(fonts), mergedName))
+    if report is None:
+        report = buildreport.BuildReport(enabled=False)
+    try:
+        with report.stage(mergedName) as stage:
+            success = _merge_fonts(here, mergedName, fonts, jobs, atlasSizes, report, simplify,
+                                   dedupe, cache)
+            stage.failed = not success
+    except buildreport.ReportError as e:
+        sys.stderr.write("Critical: {0}\n".format(e))
+        return False
+    return success
+
+
+def _merge_fonts(here, mergedName, fonts, jobs, atlasSizes, report, simplify, dedupe, cache):
+    """The stages of :func:`manufacture_merged`."""
+    if cache is None:
+        cache = svg2ttf.GlyphCache(os.path.join(here, svg2ttf.DEFAULT_CACHE_DIR))
+    # every font is converted with the options of its own config, as in a batch
+    for fontName, _, _ in fonts:
+        manufacture_foncutstom_config(
+            os.path.join(here, "config", "fontcustom-{0}.yml".format(fontName)),
+            fontName,
+            manifestPath="config/.fontcustom-manifest-{0}.json".format(fontName)
+        )
+    try:
+        with report.stage("compile") as stage:
+            merged = svg2ttf.merge_fonts(
+                mergedName, [fontName for fontName, _, _ in fonts], jobs=jobs, root=here,
+                cache=cache, simplify=simplify, dedupe=dedupe
+            )
+            stage.add(
+                bytes_read=sum(_svg_sizes(os.path.join(here, "icons", fontName))
+                               for fontName, _, _ in fonts),
+                bytes_written=_file_sizes([merged["ttf"], merged["css"]]),
+                glyphs=merged["glyphs"]
+            )
+    except (svg2ttf.SVGError, ttf.TTFError, IOError, OSError, ValueError) as e:
+        sys.stderr.write("Critical: {0}\n".format(e))
+        return False
+    print(">>> Compiled [{0}] icons ([{1}] cached, [{2}] aliases) in {3:.2f}s.".format(
+        merged["glyphs"], merged["cached"], merged["aliases"], merged["seconds"]
+    ))
+
+    for fontName, fontLicense, numIcons in fonts:
+        first, last = merged["ranges"][fontName]
+        try:
+            with report.stage(fontName), report.stage("generate"):
+                result = generate.generate(
+                    fontName,
+                    merged["ttf"],
+                    os.path.join(here, "nanogui", fontName),
+                    fontLicense,
+                    expected_count=numIcons,
+                    svg_dir=os.path.join(here, "icons", fontName),
+                    merged=mergedName,
+                    report=report
+                )
+        except generate.GenerateError as e:
+            sys.stderr.write("Critical: {0}\n".format(e))
+            return False
+        print(">>> [{0}] U+{1:04X}..U+{2:04X}: wrote {3} and skipped {4} unchanged files "
+              "in nanogui/{0}.".format(fontName, first, last, len(result["written"]),
+                                      len(result["skipped"])))
+
+    if atlasSizes:
+        try:
+            with report.stage("atlas") as stage:
+                result = atlas.build_atlas(
+                    mergedName, merged["ttf"], os.path.join(here, "atlas", mergedName),
+                    sizes=atlasSizes, jobs=jobs
+                )
+                stage.add(bytes_read=_file_sizes([merged["ttf"]]), glyphs=result["glyphs"],
+                          bytes_written=_file_sizes(result["written"]))
+        except atlas.AtlasError as e:
+            sys.stderr.write("Critical: {0}\n".format(e))
+            return False
+        print(">>> Rasterized [{0}] glyphs onto [{1}] atlas pages in {2:.2f}s.".format(
+            result["glyphs"], result["pages"], result["seconds"]
+        ))
+    return True
+
+
+def _check_changed(paths):
+    """
+    :func:`svg2ttf.check_svg` the SVGs in ``paths`` that still exist, prints the
+    warnings and errors, returns whether there were no errors.
+    """
+    valid = True
+    for path in sorted(paths):
+        if not path.endswith(".svg") or not os.path.isfile(path):
+            continue
+        try:
+            with open(path, "rb") as svg:
+                errors, warnings = svg2ttf.check_svg(svg.read())
+        except (IOError, OSError) as e:
+            errors, warnings = [str(e)], []
+        for warning in warnings:
+            sys.stderr.write("Warning: [{0}]: {1}\n".format(path, warning))
+        for error in errors:
+            sys.stderr.write("Error: [{0}]: {1}\n".format(path, error))
+        valid = valid and not errors
+    return valid
+
+
+def watch_fonts(here, fonts, compiler="native", atlasSizes=None, simplify=None, dedupe=False,
+                mergedName=None, jobs=1, pollInterval=None, debounce=watch.DEFAULT_DEBOUNCE,
+                maxLatency=watch.DEFAULT_MAX_LATENCY, maxQueue=watch.DEFAULT_MAX_QUEUE):
+    """
+    Rebuild the ``(fontName, fontLicense, numIcons)`` in ``fonts`` whenever the
+    SVGs in ``icons/{fontName}`` change, until interrupted.  The changes are
+    collected into batches by :func:`watch.watch` (with inotify, or scanning every
+    ``pollInterval`` seconds), see it for ``debounce``, ``maxLatency`` and
+    ``maxQueue``.
+
+    Only the fonts that changed are rebuilt, with :func:`build_font` (or all of
+    them into ``mergedName`` with :func:`manufacture_merged`) in this process: the
+    last glyphs converted stay in memory, and ``generate.py`` only writes the
+    outputs that changed.  The changed SVGs are checked first, a font with errors
+    is left as it is until they are fixed.  Every rebuild prints its latency, from
+    the first change to the last output written.  Raises
+    :class:`watch.WatchError` if the icons cannot be watched.
+    """
+    licenses = dict((fontName, fontLicense) for fontName, fontLicense, _ in fonts)
+    directories = dict(
+        (os.path.join(here, "icons", fontName), fontName) for fontName in licenses
+    )
+    cache = svg2ttf.GlyphCache(os.path.join(here, svg2ttf.DEFAULT_CACHE_DIR), memory=True)
+
+    def rebuild(paths, first):
+        changed = {}
+        for path in paths:
+            # when events were lost, the whole directory is reported
+            if path in directories:
+                changed.setdefault(directories[path], set()).add(path)
+            elif path.endswith(".svg") and os.path.dirname(path) in directories:
+                changed.setdefault(directories[os.path.dirname(path)], set()).add(path)
+        valid = dict((fontName, _check_changed(changed[fontName])) for fontName in changed)
+
+        counts = {}
+        for fontName in (licenses if mergedName is not None else changed):
+            counts[fontName] = len([
+                entry for entry in os.listdir(os.path.join(here, "icons", fontName))
+                if entry.endswith(".svg")
+            ])
+            if counts[fontName] == 0:
+                sys.stderr.write("Error: there are no .svg icons in icons/{0}\n".format(fontName))
+                valid[fontName] = False
+
+        if mergedName is not None:
+            if not changed:
+                return
+            names = [mergedName]
+            if all(valid.values()):
+                success = manufacture_merged(
+                    here, mergedName,
+                    [(fontName, licenses[fontName], counts[fontName]) for fontName, _, _ in fonts],
+                    jobs, atlasSizes, simplify=simplify, dedupe=dedupe, cache=cache
+                )
+                results = [(mergedName, success)]
+            else:
+                results = [(mergedName, None)]
+        else:
+            results = []
+            for fontName in sorted(changed):
+                if not valid[fontName]:
+                    results.append((fontName, None))
+                    continue
+                _, success, _, output, _ = build_font(
+                    here, fontName, licenses[fontName], counts[fontName], compiler, jobs,
+                    atlasSizes, simplify=simplify, dedupe=dedupe, cache=cache
+                )
+                if not success:
+                    sys.stderr.write(textwrap.indent(output, "    "))
+                results.append((fontName, success))
+
+        latency = time.monotonic() - first
+        num_changed = sum(len(paths) for paths in changed.values())
+        for fontName, success in results:
+            if success is None:
+                print(">>> [{0}] {1} changes, not rebuilt until the errors above are fixed.".format(
+                    fontName, num_changed
+                ))
+            else:
+                print(">>> [{0}] {1} changes, {2} {3:.2f}s after the first one.".format(
+                    fontName, num_changed, "rebuilt" if success else "FAILED", latency
+                ))
+        sys.stdout.flush()
+
+    with watch.open_watcher(sorted(directories), pollInterval) as watcher:
+        print(">>> Watching {0} with {1}, press Ctrl+C to stop.".format(
+            ", ".join("icons/{0}".format(fontName) for fontName in sorted(licenses)),
+            watcher.kind
+        ))
+        sys.stdout.flush()
+        watch.watch(watcher, rebuild, debounce=debounce, max_latency=maxLatency,
+                    max_queue=maxQueue)
+
+
 if __name__ == "__main__":
     here = os.path.abspath(os.path.dirname(__file__))
     curr = os.path.abspath(os.curdir)
@@ -183,67 +764,226 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "font_name",
+        nargs="?",
         help="The font name to manufacture.",
         choices=font_dirs
     )
+    batch = parser.add_mutually_exclusive_group()
+    batch.add_argument(
+        "--all",
+        action="store_true",
+        help="Build every font in icons/ in parallel (compiles and runs generate.py)."
+    )
+    batch.add_argument(
+        "--fonts",
+        help="Comma separated fonts to build in parallel (compiles and runs generate.py)."
+    )
+    parser.add_argument(
+        "--license",
+        action="append",
+        default=[],
+        metavar="FONT=LICENSE",
+        help="License information for FONT in batch mode, instead of prompting for it."
+    )
+    parser.add_argument(
+        "--compiler",
+        choices=["native", "fontcustom"],
+        default="native",
+        help="Compile the fonts in batch mode with svg2ttf.py or with rake / fontcustom "
+             "(default: %(default)s)."
+    )
+    parser.add_argument(
+        "--merge",
+        metavar="NAME",
+        help="Compile the fonts of --all / --fonts into the single font NAME, each with "
+             "its own codepoint range, instead of one font each."
+    )
+    parser.add_argument(
+        "--simplify",
+        type=float,
+        nargs="?",
+        const=svg2ttf.DEFAULT_SIMPLIFY_TOLERANCE,
+        metavar="TOLERANCE",
+        help="Simplify the outlines in batch mode to within TOLERANCE font units "
+             "(default: %(const)s, see svg2ttf.py --simplify)."
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="In batch mode, make icons with the same outline as another its aliases "
+             "(see svg2ttf.py --dedupe)."
+    )
+    parser.add_argument(
+        "--atlas",
+        type=atlas.parse_sizes,
+        metavar="SIZES",
+        help="Also pre-rasterize every font in batch mode into atlas/<font> at these comma "
+             "separated pixel sizes (see atlas.py)."
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After building, rebuild every font of --all / --fonts whose icons change "
+             "until interrupted."
+    )
+    parser.add_argument(
+        "--poll",
+        type=float,
+        nargs="?",
+        const=watch.DEFAULT_POLL_INTERVAL,
+        metavar="SECONDS",
+        help="With --watch, scan the icons every SECONDS instead of using inotify "
+             "(default: %(const)s, also used when inotify is unavailable)."
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=watch.DEFAULT_DEBOUNCE,
+        metavar="SECONDS",
+        help="With --watch, rebuild once nothing changed for SECONDS (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--max-latency",
+        type=float,
+        default=watch.DEFAULT_MAX_LATENCY,
+        metavar="SECONDS",
+        help="With --watch, rebuild at the latest SECONDS after the first change, even if "
+             "the icons keep changing (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=watch.DEFAULT_MAX_QUEUE,
+        metavar="COUNT",
+        help="With --watch, rebuild as soon as COUNT files changed (default: %(default)s)."
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of fonts to build at once in batch mode, and of processes checking "
+             "the icons (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Do not check every SVG (and the C identifiers of their names) up front.  The "
+             "check only reports problems, it does not modify (normalize) any SVG."
+    )
+    buildreport.add_arguments(parser)
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.all or args.fonts:
+        if args.font_name:
+            parser.error("font_name cannot be combined with --all / --fonts")
+        if args.merge is not None:
+            if not re.match(r"^[a-zA-Z]{1}[a-zA-Z0-9]*$", args.merge):
+                parser.error("--merge: invalid font name {0}".format(args.merge))
+            if args.merge in font_dirs:
+                parser.error("--merge: {0} is already a font in {1}".format(args.merge, icons_dir))
+            if args.compiler != "native":
+                parser.error("--merge needs the native compiler")
+        if args.simplify is not None:
+            if args.simplify <= 0:
+                parser.error("--simplify must be positive")
+            if args.compiler != "native":
+                parser.error("--simplify needs the native compiler")
+        if args.dedupe and args.compiler != "native":
+            parser.error("--dedupe needs the native compiler")
+        if args.poll is not None and args.poll <= 0:
+            parser.error("--poll must be positive")
+        if args.debounce < 0 or args.max_latency <= 0 or args.max_queue < 1:
+            parser.error("--debounce, --max-latency and --max-queue must be positive")
+
+        if args.all:
+            batch_fonts = sorted(font_dirs)
+        else:
+            batch_fonts = [font for font in args.fonts.split(",") if font]
+            if not batch_fonts:
+                parser.error("--fonts: no font given")
+            for font in batch_fonts:
+                if font not in font_dirs:
+                    parser.error("--fonts: {0} is not a directory in {1}".format(
+                        font, icons_dir
+                    ))
+
+        licenses = {}
+        for entry in args.license:
+            font, sep, license = entry.partition("=")
+            if not sep:
+                parser.error("--license must be FONT=LICENSE, not {0}".format(entry))
+            validate_license(license)
+            licenses[font] = license
+
+        # Bad icons fail here, rather than after compiling every font
+        if args.no_validate:
+            counts = {}
+            for font in batch_fonts:
+                font_dir = os.path.join(icons_dir, font)
+                counts[font] = count_icons(font_dir)
+                print(">>> Found {0} icons in {1}.".format(counts[font], font_dir))
+        else:
+            counts = validate_or_exit(here, batch_fonts, args.jobs)
+
+        # Everything interactive happens up front, the pool only builds
+        fonts = []
+        for font in batch_fonts:
+            num_icons = counts[font]
+            license = licenses.get(font)
+            if license is None:
+                license = ask_license(font)
+            fonts.append((font, license, num_icons))
+
+        report = buildreport.from_arguments(args)
+        if args.merge is not None:
+            success = manufacture_merged(here, args.merge, fonts, args.jobs, args.atlas,
+                                         report, args.simplify, args.dedupe)
+        else:
+            success = manufacture_batch(here, fonts, args.jobs, args.compiler, args.atlas,
+                                        report, args.simplify, args.dedupe)
+        try:
+            buildreport.finish(report, args, "manufacture.py")
+        except buildreport.ReportError as e:
+            sys.stderr.write("Critical: {0}\n".format(e))
+            success = False
+        if args.watch:
+            try:
+                watch_fonts(here, fonts, args.compiler, args.atlas, args.simplify, args.dedupe,
+                            args.merge, args.jobs, args.poll, args.debounce, args.max_latency,
+                            args.max_queue)
+            except watch.WatchError as e:
+                sys.stderr.write("Critical: {0}\n".format(e))
+                sys.exit(1)
+            except KeyboardInterrupt:
+                print("\n>>> Stopped watching.")
+        sys.exit(0 if success else 1)
+
+    if not args.font_name:
+        parser.error("a font_name, --all, or --fonts is required")
+    if args.merge is not None:
+        parser.error("--merge needs --all or --fonts")
+    if args.profile or args.report or args.profile_stage:
+        parser.error("--profile, --report and --profile-stage need --all or --fonts")
+    if args.simplify is not None:
+        parser.error("--simplify needs --all or --fonts (or use ./svg2ttf.py --simplify)")
+    if args.dedupe:
+        parser.error("--dedupe needs --all or --fonts (or use ./svg2ttf.py --dedupe)")
+    if args.watch:
+        parser.error("--watch needs --all or --fonts")
     font_name = args.font_name
 
     # determine how many icons there are
-    font_dir = os.path.join(icons_dir, font_name)
-    if not os.path.isdir(font_dir):
-        sys.stderr.write("Internal error: [{0}] is not a directory?\n".format(font_dir))
-        sys.exit(1)
-
-    all_icons = [icon for icon in os.listdir(font_dir) if icon.endswith(".svg")]
-    if len(all_icons) == 0:
-        sys.stderr.write(
-            "Error: there are no .svg icons in the directory {0}\n".format(font_dir)
-        )
-        sys.exit(1)
-
-    num_icons = len(all_icons)
-    print(">>> Found {0} icons in {1}.".format(num_icons, font_dir))
-
-    # Get the license information
-    if sys.version[0] == "3":
-        user_input = lambda x: input(x)
+    if args.no_validate:
+        font_dir = os.path.join(icons_dir, font_name)
+        num_icons = count_icons(font_dir)
+        print(">>> Found {0} icons in {1}.".format(num_icons, font_dir))
     else:
-        user_input = lambda x: raw_input(x)
-
-    print(textwrap.dedent('''\
-        >>> Please enter the license information for the {font_name} font, including a
-            URL to the official license.  For example, the Font Awesome 5 Free license
-            icons are governed by CC-BY-SA 4.0, so you would enter:
-
-                CC-BY-SA 4.0: https://github.com/FortAwesome/Font-Awesome/blob/master/LICENSE.txt
-
-            Any input without 'http' in it will be rejected.  Input must be on one line.
-    '''.format(
-        font_name=font_name
-    )))
-    try:
-        license = user_input("    license> ")
-    except:
-        sys.stderr.write("\n\nGoodbye...\n")
-        sys.exit(1)
-
-    if "http" not in license:
-        sys.stderr.write(textwrap.dedent('''
-            Please include a URL to the official license of the font you wish to embed
-            into NanoGUI.  The license information is included in the generated header
-            file and python bindings.
-        '''))
-        sys.exit(1)
-
-    if len(license.split(r"\n")) > 1 or len(license.split(r"\r")) > 1:
-        sys.stderr.write(textwrap.dedent('''
-            The license information must be on one line, make sure there are no newline
-            characters or carriage returns in the input you provided.
-        '''))
-        sys.exit(1)
+        num_icons = validate_or_exit(here, [font_name], args.jobs)[font_name]
 
+    # Get the license information
+    license = ask_license(font_name)
 
     # Update configs/fontcustom.yml
     print(">>> Updating configs/fontcustom.yml.")
@@ -263,9 +1003,10 @@ if __name__ == "__main__":
     sys.stdout.write(textwrap.dedent('''\
         Done!
 
-        First, execute 'rake' in this directory.
+        First, execute 'rake' (or './svg2ttf.py', which does not need fontcustom) in this
+        directory.
 
         Then, run './generate.py' (or 'python generate.py' if you do not have python **3** installed).
-    '''))
-
 
+        To pre-rasterize the icons for preloading, also run './atlas.py'.
+    '''))
@@ -6,6 +6,13 @@
 #include <nanogui/nanogui.h>
 #include <nanogui/resources.h>
 #include <nanogui/fontawesome.h>
+#include <algorithm>
+#include <cctype>
+#include <cmath>
+#include <iterator>
+#include <string>
+#include <utility>
+#include <vector>
 using namespace nanogui;
 
 // Custom theme for loading the fontawesome font
@@ -71,41 +78,1086 @@ protected:
 };
 
 
-// Convenience macro for creating an IconBox. Make sure you put a semicolon after the call to this macro!
-#define ADD_ICON(parent, icon, boxWidth) \
-    new IconBox(parent, #icon, icon, boxWidth)
-
 class IconBox : public Widget {
 public:
-    IconBox(Widget *parent, const std::string &name, int icon, int width)
+    IconBox(Widget *parent, int width, int height)
         : Widget(parent) {
 
         this->setLayout(new BoxLayout(Orientation::Horizontal));
 
-        auto *b = new Button(this, "", icon);
-        b->setFixedWidth(40);
+        mButton = new Button(this, "", 0);
+        mButton->setFixedSize({40, height});
 
-        auto *text = new TextBox(this, name);
-        text->setDefaultValue(name);
-        text->setEditable(true);
+        mText = new TextBox(this, "");
+        mText->setEditable(true);
         /* Return false essentially makes it not possible to actually edit this text
          * box, but keeping it editable=true allows selection for copy-paste.  If the
          * text box is not editable, then the user cannot highlight it.
          */
-        text->setCallback([](const std::string &) { return false; });
-        text->setFont("mono-bold");
-        text->setFixedWidth(width - 40);
+        mText->setCallback([](const std::string &) { return false; });
+        mText->setFont("mono-bold");
+        mText->setFixedSize({width - 40, height});
+    }
+
+    // Boxes are recycled: this makes the box show a different icon.
+    void setIcon(const std::string &name, int icon) {
+        mButton->setIcon(icon);
+        mText->setValue(name);
+        mText->setDefaultValue(name);
+    }
+
+protected:
+    Button *mButton;
+    TextBox *mText;
+};
+
+/* Shows a (filtered) window of a flat list of icons.  Only as many IconBoxes as
+ * fit on screen are ever created, scrolling and filtering just recycles them, so
+ * neither layout nor drawing gets slower as the font grows.
+ */
+class IconBrowser : public Widget {
+public:
+    IconBrowser(Widget *parent, std::vector<std::pair<std::string, int>> icons,
+                int width, int height, int columns = 2, int rowHeight = 28)
+        : Widget(parent), mIcons(std::move(icons)), mColumns(columns) {
+
+        this->setLayout(new BoxLayout(Orientation::Vertical, Alignment::Minimum, 0, 6));
+
+        auto *tools = new Widget(this);
+        tools->setLayout(new BoxLayout(Orientation::Horizontal, Alignment::Middle, 0, 6));
+        auto *filter = new TextBox(tools, "");
+        filter->setEditable(true);
+        filter->setPlaceholder("filter (press enter)");
+        filter->setAlignment(TextBox::Alignment::Left);
+        filter->setFixedWidth(width / 2);
+        filter->setCallback([this](const std::string &value) {
+            this->setFilter(value);
+            return true;
+        });
+        mCount = new Label(tools, "");
+        mCount->setFixedWidth(width / 2 - 6);
+
+        mScroll = new Slider(this);
+        mScroll->setFixedWidth(width);
+        mScroll->setCallback([this](float value) {
+            this->scrollTo((int) std::round(value * this->maxFirstRow()));
+        });
+
+        auto *grid = new Widget(this);
+        grid->setLayout(new GridLayout(Orientation::Horizontal, columns, Alignment::Minimum, 0, 2));
+        // whatever is left below the filter and the slider
+        int rows = std::max((height - 70) / (rowHeight + 2), 1);
+        for (int i = 0; i < rows * columns; ++i)
+            mBoxes.push_back(new IconBox(grid, width / columns - 2, rowHeight));
+
+        setFilter("");
+    }
+
+    // Only show the icons whose name contains `value` (ignoring case, '-' matches '_').
+    void setFilter(const std::string &value) {
+        std::string needle = value;
+        for (auto &c : needle)
+            c = c == '-' || c == ' ' ? '_' : (char) std::toupper((unsigned char) c);
+
+        mVisible.clear();
+        for (size_t i = 0; i < mIcons.size(); ++i) {
+            if (mIcons[i].first.find(needle) != std::string::npos)
+                mVisible.push_back(i);
+        }
+        mFirstRow = 0;
+        update();
+    }
+
+    void scrollTo(int row) {
+        mFirstRow = row;
+        update();
+    }
+
+    virtual bool scrollEvent(const Vector2i &p, const Vector2f &rel) override {
+        if (rel.y() == 0)
+            return Widget::scrollEvent(p, rel);
+        scrollTo(mFirstRow - (int) std::round(rel.y() * 3));
+        return true;
     }
+
+protected:
+    int maxFirstRow() const {
+        int rows = ((int) mVisible.size() + mColumns - 1) / mColumns;
+        return std::max(rows - (int) mBoxes.size() / mColumns, 0);
+    }
+
+    void update() {
+        mFirstRow = std::min(std::max(mFirstRow, 0), maxFirstRow());
+        for (size_t i = 0; i < mBoxes.size(); ++i) {
+            size_t index = (size_t) mFirstRow * mColumns + i;
+            mBoxes[i]->setVisible(index < mVisible.size());
+            if (index < mVisible.size()) {
+                const auto &icon = mIcons[mVisible[index]];
+                mBoxes[i]->setIcon(icon.first, icon.second);
+            }
+        }
+
+        int maxRow = maxFirstRow();
+        mScroll->setValue(maxRow > 0 ? (float) mFirstRow / maxRow : 0.0f);
+        mCount->setCaption(std::to_string(mVisible.size()) + " of " +
+                           std::to_string(mIcons.size()) + " icons");
+    }
+
+    std::vector<std::pair<std::string, int>> mIcons; // every icon, (name, codepoint)
+    std::vector<size_t> mVisible;                    // indices of the icons matching the filter
+    std::vector<IconBox *> mBoxes;                   // the recycled boxes, row major
+    int mColumns;
+    int mFirstRow = 0;
+    Label *mCount;
+    Slider *mScroll;
 };
 
+// Every icon of the font, the browser shows a (filtered) window of this list.
+#define ICON(icon) {#icon, icon}
+static const std::pair<const char *, int> ICONS[] = {
+    ICON(FONTAWESOME_ICON_ADDRESS_BOOK),
+    ICON(FONTAWESOME_ICON_ADDRESS_CARD),
+    ICON(FONTAWESOME_ICON_ARROW_ALT_CIRCLE_DOWN),
+    ICON(FONTAWESOME_ICON_ARROW_ALT_CIRCLE_LEFT),
+    ICON(FONTAWESOME_ICON_ARROW_ALT_CIRCLE_RIGHT),
+    ICON(FONTAWESOME_ICON_ARROW_ALT_CIRCLE_UP),
+    ICON(FONTAWESOME_ICON_BELL),
+    ICON(FONTAWESOME_ICON_BELL_SLASH),
+    ICON(FONTAWESOME_ICON_BOOKMARK),
+    ICON(FONTAWESOME_ICON_BRANDS_500PX),
+    ICON(FONTAWESOME_ICON_BRANDS_ACCESSIBLE_ICON),
+    ICON(FONTAWESOME_ICON_BRANDS_ACCUSOFT),
+    ICON(FONTAWESOME_ICON_BRANDS_ADN),
+    ICON(FONTAWESOME_ICON_BRANDS_ADVERSAL),
+    ICON(FONTAWESOME_ICON_BRANDS_AFFILIATETHEME),
+    ICON(FONTAWESOME_ICON_BRANDS_ALGOLIA),
+    ICON(FONTAWESOME_ICON_BRANDS_AMAZON),
+    ICON(FONTAWESOME_ICON_BRANDS_AMAZON_PAY),
+    ICON(FONTAWESOME_ICON_BRANDS_AMILIA),
+    ICON(FONTAWESOME_ICON_BRANDS_ANDROID),
+    ICON(FONTAWESOME_ICON_BRANDS_ANGELLIST),
+    ICON(FONTAWESOME_ICON_BRANDS_ANGRYCREATIVE),
+    ICON(FONTAWESOME_ICON_BRANDS_ANGULAR),
+    ICON(FONTAWESOME_ICON_BRANDS_APP_STORE),
+    ICON(FONTAWESOME_ICON_BRANDS_APP_STORE_IOS),
+    ICON(FONTAWESOME_ICON_BRANDS_APPER),
+    ICON(FONTAWESOME_ICON_BRANDS_APPLE),
+    ICON(FONTAWESOME_ICON_BRANDS_APPLE_PAY),
+    ICON(FONTAWESOME_ICON_BRANDS_ASYMMETRIK),
+    ICON(FONTAWESOME_ICON_BRANDS_AUDIBLE),
+    ICON(FONTAWESOME_ICON_BRANDS_AUTOPREFIXER),
+    ICON(FONTAWESOME_ICON_BRANDS_AVIANEX),
+    ICON(FONTAWESOME_ICON_BRANDS_AVIATO),
+    ICON(FONTAWESOME_ICON_BRANDS_AWS),
+    ICON(FONTAWESOME_ICON_BRANDS_BANDCAMP),
+    ICON(FONTAWESOME_ICON_BRANDS_BEHANCE),
+    ICON(FONTAWESOME_ICON_BRANDS_BEHANCE_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_BIMOBJECT),
+    ICON(FONTAWESOME_ICON_BRANDS_BITBUCKET),
+    ICON(FONTAWESOME_ICON_BRANDS_BITCOIN),
+    ICON(FONTAWESOME_ICON_BRANDS_BITY),
+    ICON(FONTAWESOME_ICON_BRANDS_BLACK_TIE),
+    ICON(FONTAWESOME_ICON_BRANDS_BLACKBERRY),
+    ICON(FONTAWESOME_ICON_BRANDS_BLOGGER),
+    ICON(FONTAWESOME_ICON_BRANDS_BLOGGER_B),
+    ICON(FONTAWESOME_ICON_BRANDS_BLUETOOTH),
+    ICON(FONTAWESOME_ICON_BRANDS_BLUETOOTH_B),
+    ICON(FONTAWESOME_ICON_BRANDS_BTC),
+    ICON(FONTAWESOME_ICON_BRANDS_BUROMOBELEXPERTE),
+    ICON(FONTAWESOME_ICON_BRANDS_BUYSELLADS),
+    ICON(FONTAWESOME_ICON_BRANDS_CC_AMAZON_PAY),
+    ICON(FONTAWESOME_ICON_BRANDS_CC_AMEX),
+    ICON(FONTAWESOME_ICON_BRANDS_CC_APPLE_PAY),
+    ICON(FONTAWESOME_ICON_BRANDS_CC_DINERS_CLUB),
+    ICON(FONTAWESOME_ICON_BRANDS_CC_DISCOVER),
+    ICON(FONTAWESOME_ICON_BRANDS_CC_JCB),
+    ICON(FONTAWESOME_ICON_BRANDS_CC_MASTERCARD),
+    ICON(FONTAWESOME_ICON_BRANDS_CC_PAYPAL),
+    ICON(FONTAWESOME_ICON_BRANDS_CC_STRIPE),
+    ICON(FONTAWESOME_ICON_BRANDS_CC_VISA),
+    ICON(FONTAWESOME_ICON_BRANDS_CENTERCODE),
+    ICON(FONTAWESOME_ICON_BRANDS_CHROME),
+    ICON(FONTAWESOME_ICON_BRANDS_CLOUDSCALE),
+    ICON(FONTAWESOME_ICON_BRANDS_CLOUDSMITH),
+    ICON(FONTAWESOME_ICON_BRANDS_CLOUDVERSIFY),
+    ICON(FONTAWESOME_ICON_BRANDS_CODEPEN),
+    ICON(FONTAWESOME_ICON_BRANDS_CODIEPIE),
+    ICON(FONTAWESOME_ICON_BRANDS_CONNECTDEVELOP),
+    ICON(FONTAWESOME_ICON_BRANDS_CONTAO),
+    ICON(FONTAWESOME_ICON_BRANDS_CPANEL),
+    ICON(FONTAWESOME_ICON_BRANDS_CREATIVE_COMMONS),
+    ICON(FONTAWESOME_ICON_BRANDS_CSS3),
+    ICON(FONTAWESOME_ICON_BRANDS_CSS3_ALT),
+    ICON(FONTAWESOME_ICON_BRANDS_CUTTLEFISH),
+    ICON(FONTAWESOME_ICON_BRANDS_D_AND_D),
+    ICON(FONTAWESOME_ICON_BRANDS_DASHCUBE),
+    ICON(FONTAWESOME_ICON_BRANDS_DELICIOUS),
+    ICON(FONTAWESOME_ICON_BRANDS_DEPLOYDOG),
+    ICON(FONTAWESOME_ICON_BRANDS_DESKPRO),
+    ICON(FONTAWESOME_ICON_BRANDS_DEVIANTART),
+    ICON(FONTAWESOME_ICON_BRANDS_DIGG),
+    ICON(FONTAWESOME_ICON_BRANDS_DIGITAL_OCEAN),
+    ICON(FONTAWESOME_ICON_BRANDS_DISCORD),
+    ICON(FONTAWESOME_ICON_BRANDS_DISCOURSE),
+    ICON(FONTAWESOME_ICON_BRANDS_DOCHUB),
+    ICON(FONTAWESOME_ICON_BRANDS_DOCKER),
+    ICON(FONTAWESOME_ICON_BRANDS_DRAFT2DIGITAL),
+    ICON(FONTAWESOME_ICON_BRANDS_DRIBBBLE),
+    ICON(FONTAWESOME_ICON_BRANDS_DRIBBBLE_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_DROPBOX),
+    ICON(FONTAWESOME_ICON_BRANDS_DRUPAL),
+    ICON(FONTAWESOME_ICON_BRANDS_DYALOG),
+    ICON(FONTAWESOME_ICON_BRANDS_EARLYBIRDS),
+    ICON(FONTAWESOME_ICON_BRANDS_EDGE),
+    ICON(FONTAWESOME_ICON_BRANDS_ELEMENTOR),
+    ICON(FONTAWESOME_ICON_BRANDS_EMBER),
+    ICON(FONTAWESOME_ICON_BRANDS_EMPIRE),
+    ICON(FONTAWESOME_ICON_BRANDS_ENVIRA),
+    ICON(FONTAWESOME_ICON_BRANDS_ERLANG),
+    ICON(FONTAWESOME_ICON_BRANDS_ETHEREUM),
+    ICON(FONTAWESOME_ICON_BRANDS_ETSY),
+    ICON(FONTAWESOME_ICON_BRANDS_EXPEDITEDSSL),
+    ICON(FONTAWESOME_ICON_BRANDS_FACEBOOK),
+    ICON(FONTAWESOME_ICON_BRANDS_FACEBOOK_F),
+    ICON(FONTAWESOME_ICON_BRANDS_FACEBOOK_MESSENGER),
+    ICON(FONTAWESOME_ICON_BRANDS_FACEBOOK_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_FIREFOX),
+    ICON(FONTAWESOME_ICON_BRANDS_FIRST_ORDER),
+    ICON(FONTAWESOME_ICON_BRANDS_FIRSTDRAFT),
+    ICON(FONTAWESOME_ICON_BRANDS_FLICKR),
+    ICON(FONTAWESOME_ICON_BRANDS_FLIPBOARD),
+    ICON(FONTAWESOME_ICON_BRANDS_FLY),
+    ICON(FONTAWESOME_ICON_BRANDS_FONT_AWESOME),
+    ICON(FONTAWESOME_ICON_BRANDS_FONT_AWESOME_ALT),
+    ICON(FONTAWESOME_ICON_BRANDS_FONT_AWESOME_FLAG),
+    ICON(FONTAWESOME_ICON_BRANDS_FONTICONS),
+    ICON(FONTAWESOME_ICON_BRANDS_FONTICONS_FI),
+    ICON(FONTAWESOME_ICON_BRANDS_FORT_AWESOME),
+    ICON(FONTAWESOME_ICON_BRANDS_FORT_AWESOME_ALT),
+    ICON(FONTAWESOME_ICON_BRANDS_FORUMBEE),
+    ICON(FONTAWESOME_ICON_BRANDS_FOURSQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_FREE_CODE_CAMP),
+    ICON(FONTAWESOME_ICON_BRANDS_FREEBSD),
+    ICON(FONTAWESOME_ICON_BRANDS_GET_POCKET),
+    ICON(FONTAWESOME_ICON_BRANDS_GG),
+    ICON(FONTAWESOME_ICON_BRANDS_GG_CIRCLE),
+    ICON(FONTAWESOME_ICON_BRANDS_GIT),
+    ICON(FONTAWESOME_ICON_BRANDS_GIT_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_GITHUB),
+    ICON(FONTAWESOME_ICON_BRANDS_GITHUB_ALT),
+    ICON(FONTAWESOME_ICON_BRANDS_GITHUB_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_GITKRAKEN),
+    ICON(FONTAWESOME_ICON_BRANDS_GITLAB),
+    ICON(FONTAWESOME_ICON_BRANDS_GITTER),
+    ICON(FONTAWESOME_ICON_BRANDS_GLIDE),
+    ICON(FONTAWESOME_ICON_BRANDS_GLIDE_G),
+    ICON(FONTAWESOME_ICON_BRANDS_GOFORE),
+    ICON(FONTAWESOME_ICON_BRANDS_GOODREADS),
+    ICON(FONTAWESOME_ICON_BRANDS_GOODREADS_G),
+    ICON(FONTAWESOME_ICON_BRANDS_GOOGLE),
+    ICON(FONTAWESOME_ICON_BRANDS_GOOGLE_DRIVE),
+    ICON(FONTAWESOME_ICON_BRANDS_GOOGLE_PLAY),
+    ICON(FONTAWESOME_ICON_BRANDS_GOOGLE_PLUS),
+    ICON(FONTAWESOME_ICON_BRANDS_GOOGLE_PLUS_G),
+    ICON(FONTAWESOME_ICON_BRANDS_GOOGLE_PLUS_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_GOOGLE_WALLET),
+    ICON(FONTAWESOME_ICON_BRANDS_GRATIPAY),
+    ICON(FONTAWESOME_ICON_BRANDS_GRAV),
+    ICON(FONTAWESOME_ICON_BRANDS_GRIPFIRE),
+    ICON(FONTAWESOME_ICON_BRANDS_GRUNT),
+    ICON(FONTAWESOME_ICON_BRANDS_GULP),
+    ICON(FONTAWESOME_ICON_BRANDS_HACKER_NEWS),
+    ICON(FONTAWESOME_ICON_BRANDS_HACKER_NEWS_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_HIPS),
+    ICON(FONTAWESOME_ICON_BRANDS_HIRE_A_HELPER),
+    ICON(FONTAWESOME_ICON_BRANDS_HOOLI),
+    ICON(FONTAWESOME_ICON_BRANDS_HOTJAR),
+    ICON(FONTAWESOME_ICON_BRANDS_HOUZZ),
+    ICON(FONTAWESOME_ICON_BRANDS_HTML5),
+    ICON(FONTAWESOME_ICON_BRANDS_HUBSPOT),
+    ICON(FONTAWESOME_ICON_BRANDS_IMDB),
+    ICON(FONTAWESOME_ICON_BRANDS_INSTAGRAM),
+    ICON(FONTAWESOME_ICON_BRANDS_INTERNET_EXPLORER),
+    ICON(FONTAWESOME_ICON_BRANDS_IOXHOST),
+    ICON(FONTAWESOME_ICON_BRANDS_ITUNES),
+    ICON(FONTAWESOME_ICON_BRANDS_ITUNES_NOTE),
+    ICON(FONTAWESOME_ICON_BRANDS_JENKINS),
+    ICON(FONTAWESOME_ICON_BRANDS_JOGET),
+    ICON(FONTAWESOME_ICON_BRANDS_JOOMLA),
+    ICON(FONTAWESOME_ICON_BRANDS_JS),
+    ICON(FONTAWESOME_ICON_BRANDS_JS_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_JSFIDDLE),
+    ICON(FONTAWESOME_ICON_BRANDS_KEYCDN),
+    ICON(FONTAWESOME_ICON_BRANDS_KICKSTARTER),
+    ICON(FONTAWESOME_ICON_BRANDS_KICKSTARTER_K),
+    ICON(FONTAWESOME_ICON_BRANDS_KORVUE),
+    ICON(FONTAWESOME_ICON_BRANDS_LARAVEL),
+    ICON(FONTAWESOME_ICON_BRANDS_LASTFM),
+    ICON(FONTAWESOME_ICON_BRANDS_LASTFM_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_LEANPUB),
+    ICON(FONTAWESOME_ICON_BRANDS_LESS),
+    ICON(FONTAWESOME_ICON_BRANDS_LINE),
+    ICON(FONTAWESOME_ICON_BRANDS_LINKEDIN),
+    ICON(FONTAWESOME_ICON_BRANDS_LINKEDIN_IN),
+    ICON(FONTAWESOME_ICON_BRANDS_LINODE),
+    ICON(FONTAWESOME_ICON_BRANDS_LINUX),
+    ICON(FONTAWESOME_ICON_BRANDS_LYFT),
+    ICON(FONTAWESOME_ICON_BRANDS_MAGENTO),
+    ICON(FONTAWESOME_ICON_BRANDS_MAXCDN),
+    ICON(FONTAWESOME_ICON_BRANDS_MEDAPPS),
+    ICON(FONTAWESOME_ICON_BRANDS_MEDIUM),
+    ICON(FONTAWESOME_ICON_BRANDS_MEDIUM_M),
+    ICON(FONTAWESOME_ICON_BRANDS_MEDRT),
+    ICON(FONTAWESOME_ICON_BRANDS_MEETUP),
+    ICON(FONTAWESOME_ICON_BRANDS_MICROSOFT),
+    ICON(FONTAWESOME_ICON_BRANDS_MIX),
+    ICON(FONTAWESOME_ICON_BRANDS_MIXCLOUD),
+    ICON(FONTAWESOME_ICON_BRANDS_MIZUNI),
+    ICON(FONTAWESOME_ICON_BRANDS_MODX),
+    ICON(FONTAWESOME_ICON_BRANDS_MONERO),
+    ICON(FONTAWESOME_ICON_BRANDS_NAPSTER),
+    ICON(FONTAWESOME_ICON_BRANDS_NINTENDO_SWITCH),
+    ICON(FONTAWESOME_ICON_BRANDS_NODE),
+    ICON(FONTAWESOME_ICON_BRANDS_NODE_JS),
+    ICON(FONTAWESOME_ICON_BRANDS_NPM),
+    ICON(FONTAWESOME_ICON_BRANDS_NS8),
+    ICON(FONTAWESOME_ICON_BRANDS_NUTRITIONIX),
+    ICON(FONTAWESOME_ICON_BRANDS_ODNOKLASSNIKI),
+    ICON(FONTAWESOME_ICON_BRANDS_ODNOKLASSNIKI_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_OPENCART),
+    ICON(FONTAWESOME_ICON_BRANDS_OPENID),
+    ICON(FONTAWESOME_ICON_BRANDS_OPERA),
+    ICON(FONTAWESOME_ICON_BRANDS_OPTIN_MONSTER),
+    ICON(FONTAWESOME_ICON_BRANDS_OSI),
+    ICON(FONTAWESOME_ICON_BRANDS_PAGE4),
+    ICON(FONTAWESOME_ICON_BRANDS_PAGELINES),
+    ICON(FONTAWESOME_ICON_BRANDS_PALFED),
+    ICON(FONTAWESOME_ICON_BRANDS_PATREON),
+    ICON(FONTAWESOME_ICON_BRANDS_PAYPAL),
+    ICON(FONTAWESOME_ICON_BRANDS_PERISCOPE),
+    ICON(FONTAWESOME_ICON_BRANDS_PHABRICATOR),
+    ICON(FONTAWESOME_ICON_BRANDS_PHOENIX_FRAMEWORK),
+    ICON(FONTAWESOME_ICON_BRANDS_PHP),
+    ICON(FONTAWESOME_ICON_BRANDS_PIED_PIPER),
+    ICON(FONTAWESOME_ICON_BRANDS_PIED_PIPER_ALT),
+    ICON(FONTAWESOME_ICON_BRANDS_PIED_PIPER_PP),
+    ICON(FONTAWESOME_ICON_BRANDS_PINTEREST),
+    ICON(FONTAWESOME_ICON_BRANDS_PINTEREST_P),
+    ICON(FONTAWESOME_ICON_BRANDS_PINTEREST_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_PLAYSTATION),
+    ICON(FONTAWESOME_ICON_BRANDS_PRODUCT_HUNT),
+    ICON(FONTAWESOME_ICON_BRANDS_PUSHED),
+    ICON(FONTAWESOME_ICON_BRANDS_PYTHON),
+    ICON(FONTAWESOME_ICON_BRANDS_QQ),
+    ICON(FONTAWESOME_ICON_BRANDS_QUINSCAPE),
+    ICON(FONTAWESOME_ICON_BRANDS_QUORA),
+    ICON(FONTAWESOME_ICON_BRANDS_RAVELRY),
+    ICON(FONTAWESOME_ICON_BRANDS_REACT),
+    ICON(FONTAWESOME_ICON_BRANDS_REBEL),
+    ICON(FONTAWESOME_ICON_BRANDS_RED_RIVER),
+    ICON(FONTAWESOME_ICON_BRANDS_REDDIT),
+    ICON(FONTAWESOME_ICON_BRANDS_REDDIT_ALIEN),
+    ICON(FONTAWESOME_ICON_BRANDS_REDDIT_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_RENDACT),
+    ICON(FONTAWESOME_ICON_BRANDS_RENREN),
+    ICON(FONTAWESOME_ICON_BRANDS_REPLYD),
+    ICON(FONTAWESOME_ICON_BRANDS_RESOLVING),
+    ICON(FONTAWESOME_ICON_BRANDS_ROCKETCHAT),
+    ICON(FONTAWESOME_ICON_BRANDS_ROCKRMS),
+    ICON(FONTAWESOME_ICON_BRANDS_SAFARI),
+    ICON(FONTAWESOME_ICON_BRANDS_SASS),
+    ICON(FONTAWESOME_ICON_BRANDS_SCHLIX),
+    ICON(FONTAWESOME_ICON_BRANDS_SCRIBD),
+    ICON(FONTAWESOME_ICON_BRANDS_SEARCHENGIN),
+    ICON(FONTAWESOME_ICON_BRANDS_SELLCAST),
+    ICON(FONTAWESOME_ICON_BRANDS_SELLSY),
+    ICON(FONTAWESOME_ICON_BRANDS_SERVICESTACK),
+    ICON(FONTAWESOME_ICON_BRANDS_SHIRTSINBULK),
+    ICON(FONTAWESOME_ICON_BRANDS_SIMPLYBUILT),
+    ICON(FONTAWESOME_ICON_BRANDS_SISTRIX),
+    ICON(FONTAWESOME_ICON_BRANDS_SKYATLAS),
+    ICON(FONTAWESOME_ICON_BRANDS_SKYPE),
+    ICON(FONTAWESOME_ICON_BRANDS_SLACK),
+    ICON(FONTAWESOME_ICON_BRANDS_SLACK_HASH),
+    ICON(FONTAWESOME_ICON_BRANDS_SLIDESHARE),
+    ICON(FONTAWESOME_ICON_BRANDS_SNAPCHAT),
+    ICON(FONTAWESOME_ICON_BRANDS_SNAPCHAT_GHOST),
+    ICON(FONTAWESOME_ICON_BRANDS_SNAPCHAT_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_SOUNDCLOUD),
+    ICON(FONTAWESOME_ICON_BRANDS_SPEAKAP),
+    ICON(FONTAWESOME_ICON_BRANDS_SPOTIFY),
+    ICON(FONTAWESOME_ICON_BRANDS_STACK_EXCHANGE),
+    ICON(FONTAWESOME_ICON_BRANDS_STACK_OVERFLOW),
+    ICON(FONTAWESOME_ICON_BRANDS_STAYLINKED),
+    ICON(FONTAWESOME_ICON_BRANDS_STEAM),
+    ICON(FONTAWESOME_ICON_BRANDS_STEAM_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_STEAM_SYMBOL),
+    ICON(FONTAWESOME_ICON_BRANDS_STICKER_MULE),
+    ICON(FONTAWESOME_ICON_BRANDS_STRAVA),
+    ICON(FONTAWESOME_ICON_BRANDS_STRIPE),
+    ICON(FONTAWESOME_ICON_BRANDS_STRIPE_S),
+    ICON(FONTAWESOME_ICON_BRANDS_STUDIOVINARI),
+    ICON(FONTAWESOME_ICON_BRANDS_STUMBLEUPON),
+    ICON(FONTAWESOME_ICON_BRANDS_STUMBLEUPON_CIRCLE),
+    ICON(FONTAWESOME_ICON_BRANDS_SUPERPOWERS),
+    ICON(FONTAWESOME_ICON_BRANDS_SUPPLE),
+    ICON(FONTAWESOME_ICON_BRANDS_TELEGRAM),
+    ICON(FONTAWESOME_ICON_BRANDS_TELEGRAM_PLANE),
+    ICON(FONTAWESOME_ICON_BRANDS_TENCENT_WEIBO),
+    ICON(FONTAWESOME_ICON_BRANDS_THEMEISLE),
+    ICON(FONTAWESOME_ICON_BRANDS_TRELLO),
+    ICON(FONTAWESOME_ICON_BRANDS_TRIPADVISOR),
+    ICON(FONTAWESOME_ICON_BRANDS_TUMBLR),
+    ICON(FONTAWESOME_ICON_BRANDS_TUMBLR_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_TWITCH),
+    ICON(FONTAWESOME_ICON_BRANDS_TWITTER),
+    ICON(FONTAWESOME_ICON_BRANDS_TWITTER_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_TYPO3),
+    ICON(FONTAWESOME_ICON_BRANDS_UBER),
+    ICON(FONTAWESOME_ICON_BRANDS_UIKIT),
+    ICON(FONTAWESOME_ICON_BRANDS_UNIREGISTRY),
+    ICON(FONTAWESOME_ICON_BRANDS_UNTAPPD),
+    ICON(FONTAWESOME_ICON_BRANDS_USB),
+    ICON(FONTAWESOME_ICON_BRANDS_USSUNNAH),
+    ICON(FONTAWESOME_ICON_BRANDS_VAADIN),
+    ICON(FONTAWESOME_ICON_BRANDS_VIACOIN),
+    ICON(FONTAWESOME_ICON_BRANDS_VIADEO),
+    ICON(FONTAWESOME_ICON_BRANDS_VIADEO_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_VIBER),
+    ICON(FONTAWESOME_ICON_BRANDS_VIMEO),
+    ICON(FONTAWESOME_ICON_BRANDS_VIMEO_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_VIMEO_V),
+    ICON(FONTAWESOME_ICON_BRANDS_VINE),
+    ICON(FONTAWESOME_ICON_BRANDS_VK),
+    ICON(FONTAWESOME_ICON_BRANDS_VNV),
+    ICON(FONTAWESOME_ICON_BRANDS_VUEJS),
+    ICON(FONTAWESOME_ICON_BRANDS_WEIBO),
+    ICON(FONTAWESOME_ICON_BRANDS_WEIXIN),
+    ICON(FONTAWESOME_ICON_BRANDS_WHATSAPP),
+    ICON(FONTAWESOME_ICON_BRANDS_WHATSAPP_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_WHMCS),
+    ICON(FONTAWESOME_ICON_BRANDS_WIKIPEDIA_W),
+    ICON(FONTAWESOME_ICON_BRANDS_WINDOWS),
+    ICON(FONTAWESOME_ICON_BRANDS_WORDPRESS),
+    ICON(FONTAWESOME_ICON_BRANDS_WORDPRESS_SIMPLE),
+    ICON(FONTAWESOME_ICON_BRANDS_WPBEGINNER),
+    ICON(FONTAWESOME_ICON_BRANDS_WPEXPLORER),
+    ICON(FONTAWESOME_ICON_BRANDS_WPFORMS),
+    ICON(FONTAWESOME_ICON_BRANDS_XBOX),
+    ICON(FONTAWESOME_ICON_BRANDS_XING),
+    ICON(FONTAWESOME_ICON_BRANDS_XING_SQUARE),
+    ICON(FONTAWESOME_ICON_BRANDS_Y_COMBINATOR),
+    ICON(FONTAWESOME_ICON_BRANDS_YAHOO),
+    ICON(FONTAWESOME_ICON_BRANDS_YANDEX),
+    ICON(FONTAWESOME_ICON_BRANDS_YANDEX_INTERNATIONAL),
+    ICON(FONTAWESOME_ICON_BRANDS_YELP),
+    ICON(FONTAWESOME_ICON_BRANDS_YOAST),
+    ICON(FONTAWESOME_ICON_BRANDS_YOUTUBE),
+    ICON(FONTAWESOME_ICON_BRANDS_YOUTUBE_SQUARE),
+    ICON(FONTAWESOME_ICON_BUILDING),
+    ICON(FONTAWESOME_ICON_CALENDAR),
+    ICON(FONTAWESOME_ICON_CALENDAR_ALT),
+    ICON(FONTAWESOME_ICON_CALENDAR_CHECK),
+    ICON(FONTAWESOME_ICON_CALENDAR_MINUS),
+    ICON(FONTAWESOME_ICON_CALENDAR_PLUS),
+    ICON(FONTAWESOME_ICON_CALENDAR_TIMES),
+    ICON(FONTAWESOME_ICON_CARET_SQUARE_DOWN),
+    ICON(FONTAWESOME_ICON_CARET_SQUARE_LEFT),
+    ICON(FONTAWESOME_ICON_CARET_SQUARE_RIGHT),
+    ICON(FONTAWESOME_ICON_CARET_SQUARE_UP),
+    ICON(FONTAWESOME_ICON_CHART_BAR),
+    ICON(FONTAWESOME_ICON_CHECK_CIRCLE),
+    ICON(FONTAWESOME_ICON_CHECK_SQUARE),
+    ICON(FONTAWESOME_ICON_CIRCLE),
+    ICON(FONTAWESOME_ICON_CLIPBOARD),
+    ICON(FONTAWESOME_ICON_CLOCK),
+    ICON(FONTAWESOME_ICON_CLONE),
+    ICON(FONTAWESOME_ICON_CLOSED_CAPTIONING),
+    ICON(FONTAWESOME_ICON_COMMENT),
+    ICON(FONTAWESOME_ICON_COMMENT_ALT),
+    ICON(FONTAWESOME_ICON_COMMENTS),
+    ICON(FONTAWESOME_ICON_COMPASS),
+    ICON(FONTAWESOME_ICON_COPY),
+    ICON(FONTAWESOME_ICON_COPYRIGHT),
+    ICON(FONTAWESOME_ICON_CREDIT_CARD),
+    ICON(FONTAWESOME_ICON_DOT_CIRCLE),
+    ICON(FONTAWESOME_ICON_EDIT),
+    ICON(FONTAWESOME_ICON_ENVELOPE),
+    ICON(FONTAWESOME_ICON_ENVELOPE_OPEN),
+    ICON(FONTAWESOME_ICON_EYE_SLASH),
+    ICON(FONTAWESOME_ICON_FILE),
+    ICON(FONTAWESOME_ICON_FILE_ALT),
+    ICON(FONTAWESOME_ICON_FILE_ARCHIVE),
+    ICON(FONTAWESOME_ICON_FILE_AUDIO),
+    ICON(FONTAWESOME_ICON_FILE_CODE),
+    ICON(FONTAWESOME_ICON_FILE_EXCEL),
+    ICON(FONTAWESOME_ICON_FILE_IMAGE),
+    ICON(FONTAWESOME_ICON_FILE_PDF),
+    ICON(FONTAWESOME_ICON_FILE_POWERPOINT),
+    ICON(FONTAWESOME_ICON_FILE_VIDEO),
+    ICON(FONTAWESOME_ICON_FILE_WORD),
+    ICON(FONTAWESOME_ICON_FLAG),
+    ICON(FONTAWESOME_ICON_FOLDER),
+    ICON(FONTAWESOME_ICON_FOLDER_OPEN),
+    ICON(FONTAWESOME_ICON_FROWN),
+    ICON(FONTAWESOME_ICON_FUTBOL),
+    ICON(FONTAWESOME_ICON_GEM),
+    ICON(FONTAWESOME_ICON_HAND_LIZARD),
+    ICON(FONTAWESOME_ICON_HAND_PAPER),
+    ICON(FONTAWESOME_ICON_HAND_PEACE),
+    ICON(FONTAWESOME_ICON_HAND_POINT_DOWN),
+    ICON(FONTAWESOME_ICON_HAND_POINT_LEFT),
+    ICON(FONTAWESOME_ICON_HAND_POINT_RIGHT),
+    ICON(FONTAWESOME_ICON_HAND_POINT_UP),
+    ICON(FONTAWESOME_ICON_HAND_POINTER),
+    ICON(FONTAWESOME_ICON_HAND_ROCK),
+    ICON(FONTAWESOME_ICON_HAND_SCISSORS),
+    ICON(FONTAWESOME_ICON_HAND_SPOCK),
+    ICON(FONTAWESOME_ICON_HANDSHAKE),
+    ICON(FONTAWESOME_ICON_HDD),
+    ICON(FONTAWESOME_ICON_HEART),
+    ICON(FONTAWESOME_ICON_HOSPITAL),
+    ICON(FONTAWESOME_ICON_HOURGLASS),
+    ICON(FONTAWESOME_ICON_ID_BADGE),
+    ICON(FONTAWESOME_ICON_ID_CARD),
+    ICON(FONTAWESOME_ICON_IMAGE),
+    ICON(FONTAWESOME_ICON_IMAGES),
+    ICON(FONTAWESOME_ICON_KEYBOARD),
+    ICON(FONTAWESOME_ICON_LEMON),
+    ICON(FONTAWESOME_ICON_LIFE_RING),
+    ICON(FONTAWESOME_ICON_LIGHTBULB),
+    ICON(FONTAWESOME_ICON_LIST_ALT),
+    ICON(FONTAWESOME_ICON_MAP),
+    ICON(FONTAWESOME_ICON_MEH),
+    ICON(FONTAWESOME_ICON_MINUS_SQUARE),
+    ICON(FONTAWESOME_ICON_MONEY_BILL_ALT),
+    ICON(FONTAWESOME_ICON_MOON),
+    ICON(FONTAWESOME_ICON_NEWSPAPER),
+    ICON(FONTAWESOME_ICON_OBJECT_GROUP),
+    ICON(FONTAWESOME_ICON_OBJECT_UNGROUP),
+    ICON(FONTAWESOME_ICON_PAPER_PLANE),
+    ICON(FONTAWESOME_ICON_PAUSE_CIRCLE),
+    ICON(FONTAWESOME_ICON_PLAY_CIRCLE),
+    ICON(FONTAWESOME_ICON_PLUS_SQUARE),
+    ICON(FONTAWESOME_ICON_QUESTION_CIRCLE),
+    ICON(FONTAWESOME_ICON_REGISTERED),
+    ICON(FONTAWESOME_ICON_SAVE),
+    ICON(FONTAWESOME_ICON_SHARE_SQUARE),
+    ICON(FONTAWESOME_ICON_SMILE),
+    ICON(FONTAWESOME_ICON_SNOWFLAKE),
+    ICON(FONTAWESOME_ICON_SOLID_ADDRESS_BOOK),
+    ICON(FONTAWESOME_ICON_SOLID_ADDRESS_CARD),
+    ICON(FONTAWESOME_ICON_SOLID_ADJUST),
+    ICON(FONTAWESOME_ICON_SOLID_ALIGN_CENTER),
+    ICON(FONTAWESOME_ICON_SOLID_ALIGN_JUSTIFY),
+    ICON(FONTAWESOME_ICON_SOLID_ALIGN_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_ALIGN_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_AMBULANCE),
+    ICON(FONTAWESOME_ICON_SOLID_AMERICAN_SIGN_LANGUAGE_INTERPRETING),
+    ICON(FONTAWESOME_ICON_SOLID_ANCHOR),
+    ICON(FONTAWESOME_ICON_SOLID_ANGLE_DOUBLE_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_ANGLE_DOUBLE_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_ANGLE_DOUBLE_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_ANGLE_DOUBLE_UP),
+    ICON(FONTAWESOME_ICON_SOLID_ANGLE_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_ANGLE_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_ANGLE_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_ANGLE_UP),
+    ICON(FONTAWESOME_ICON_SOLID_ARCHIVE),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_ALT_CIRCLE_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_ALT_CIRCLE_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_ALT_CIRCLE_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_ALT_CIRCLE_UP),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_CIRCLE_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_CIRCLE_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_CIRCLE_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_CIRCLE_UP),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_ARROW_UP),
+    ICON(FONTAWESOME_ICON_SOLID_ARROWS_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_ARROWS_ALT_H),
+    ICON(FONTAWESOME_ICON_SOLID_ARROWS_ALT_V),
+    ICON(FONTAWESOME_ICON_SOLID_ASSISTIVE_LISTENING_SYSTEMS),
+    ICON(FONTAWESOME_ICON_SOLID_ASTERISK),
+    ICON(FONTAWESOME_ICON_SOLID_AT),
+    ICON(FONTAWESOME_ICON_SOLID_AUDIO_DESCRIPTION),
+    ICON(FONTAWESOME_ICON_SOLID_BACKWARD),
+    ICON(FONTAWESOME_ICON_SOLID_BALANCE_SCALE),
+    ICON(FONTAWESOME_ICON_SOLID_BAN),
+    ICON(FONTAWESOME_ICON_SOLID_BARCODE),
+    ICON(FONTAWESOME_ICON_SOLID_BARS),
+    ICON(FONTAWESOME_ICON_SOLID_BASEBALL_BALL),
+    ICON(FONTAWESOME_ICON_SOLID_BASKETBALL_BALL),
+    ICON(FONTAWESOME_ICON_SOLID_BATH),
+    ICON(FONTAWESOME_ICON_SOLID_BATTERY_EMPTY),
+    ICON(FONTAWESOME_ICON_SOLID_BATTERY_FULL),
+    ICON(FONTAWESOME_ICON_SOLID_BATTERY_HALF),
+    ICON(FONTAWESOME_ICON_SOLID_BATTERY_QUARTER),
+    ICON(FONTAWESOME_ICON_SOLID_BATTERY_THREE_QUARTERS),
+    ICON(FONTAWESOME_ICON_SOLID_BED),
+    ICON(FONTAWESOME_ICON_SOLID_BEER),
+    ICON(FONTAWESOME_ICON_SOLID_BELL),
+    ICON(FONTAWESOME_ICON_SOLID_BELL_SLASH),
+    ICON(FONTAWESOME_ICON_SOLID_BICYCLE),
+    ICON(FONTAWESOME_ICON_SOLID_BINOCULARS),
+    ICON(FONTAWESOME_ICON_SOLID_BIRTHDAY_CAKE),
+    ICON(FONTAWESOME_ICON_SOLID_BLIND),
+    ICON(FONTAWESOME_ICON_SOLID_BOLD),
+    ICON(FONTAWESOME_ICON_SOLID_BOLT),
+    ICON(FONTAWESOME_ICON_SOLID_BOMB),
+    ICON(FONTAWESOME_ICON_SOLID_BOOK),
+    ICON(FONTAWESOME_ICON_SOLID_BOOKMARK),
+    ICON(FONTAWESOME_ICON_SOLID_BOWLING_BALL),
+    ICON(FONTAWESOME_ICON_SOLID_BRAILLE),
+    ICON(FONTAWESOME_ICON_SOLID_BRIEFCASE),
+    ICON(FONTAWESOME_ICON_SOLID_BUG),
+    ICON(FONTAWESOME_ICON_SOLID_BUILDING),
+    ICON(FONTAWESOME_ICON_SOLID_BULLHORN),
+    ICON(FONTAWESOME_ICON_SOLID_BULLSEYE),
+    ICON(FONTAWESOME_ICON_SOLID_BUS),
+    ICON(FONTAWESOME_ICON_SOLID_CALCULATOR),
+    ICON(FONTAWESOME_ICON_SOLID_CALENDAR),
+    ICON(FONTAWESOME_ICON_SOLID_CALENDAR_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_CALENDAR_CHECK),
+    ICON(FONTAWESOME_ICON_SOLID_CALENDAR_MINUS),
+    ICON(FONTAWESOME_ICON_SOLID_CALENDAR_PLUS),
+    ICON(FONTAWESOME_ICON_SOLID_CALENDAR_TIMES),
+    ICON(FONTAWESOME_ICON_SOLID_CAMERA),
+    ICON(FONTAWESOME_ICON_SOLID_CAMERA_RETRO),
+    ICON(FONTAWESOME_ICON_SOLID_CAR),
+    ICON(FONTAWESOME_ICON_SOLID_CARET_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_CARET_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_CARET_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_CARET_SQUARE_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_CARET_SQUARE_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_CARET_SQUARE_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_CARET_SQUARE_UP),
+    ICON(FONTAWESOME_ICON_SOLID_CARET_UP),
+    ICON(FONTAWESOME_ICON_SOLID_CART_ARROW_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_CART_PLUS),
+    ICON(FONTAWESOME_ICON_SOLID_CERTIFICATE),
+    ICON(FONTAWESOME_ICON_SOLID_CHART_AREA),
+    ICON(FONTAWESOME_ICON_SOLID_CHART_BAR),
+    ICON(FONTAWESOME_ICON_SOLID_CHART_LINE),
+    ICON(FONTAWESOME_ICON_SOLID_CHART_PIE),
+    ICON(FONTAWESOME_ICON_SOLID_CHECK),
+    ICON(FONTAWESOME_ICON_SOLID_CHECK_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_CHECK_SQUARE),
+    ICON(FONTAWESOME_ICON_SOLID_CHESS),
+    ICON(FONTAWESOME_ICON_SOLID_CHESS_BISHOP),
+    ICON(FONTAWESOME_ICON_SOLID_CHESS_BOARD),
+    ICON(FONTAWESOME_ICON_SOLID_CHESS_KING),
+    ICON(FONTAWESOME_ICON_SOLID_CHESS_KNIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_CHESS_PAWN),
+    ICON(FONTAWESOME_ICON_SOLID_CHESS_QUEEN),
+    ICON(FONTAWESOME_ICON_SOLID_CHESS_ROOK),
+    ICON(FONTAWESOME_ICON_SOLID_CHEVRON_CIRCLE_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_CHEVRON_CIRCLE_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_CHEVRON_CIRCLE_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_CHEVRON_CIRCLE_UP),
+    ICON(FONTAWESOME_ICON_SOLID_CHEVRON_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_CHEVRON_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_CHEVRON_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_CHEVRON_UP),
+    ICON(FONTAWESOME_ICON_SOLID_CHILD),
+    ICON(FONTAWESOME_ICON_SOLID_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_CIRCLE_NOTCH),
+    ICON(FONTAWESOME_ICON_SOLID_CLIPBOARD),
+    ICON(FONTAWESOME_ICON_SOLID_CLOCK),
+    ICON(FONTAWESOME_ICON_SOLID_CLONE),
+    ICON(FONTAWESOME_ICON_SOLID_CLOSED_CAPTIONING),
+    ICON(FONTAWESOME_ICON_SOLID_CLOUD),
+    ICON(FONTAWESOME_ICON_SOLID_CLOUD_DOWNLOAD_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_CLOUD_UPLOAD_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_CODE),
+    ICON(FONTAWESOME_ICON_SOLID_CODE_BRANCH),
+    ICON(FONTAWESOME_ICON_SOLID_COFFEE),
+    ICON(FONTAWESOME_ICON_SOLID_COG),
+    ICON(FONTAWESOME_ICON_SOLID_COGS),
+    ICON(FONTAWESOME_ICON_SOLID_COLUMNS),
+    ICON(FONTAWESOME_ICON_SOLID_COMMENT),
+    ICON(FONTAWESOME_ICON_SOLID_COMMENT_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_COMMENTS),
+    ICON(FONTAWESOME_ICON_SOLID_COMPASS),
+    ICON(FONTAWESOME_ICON_SOLID_COMPRESS),
+    ICON(FONTAWESOME_ICON_SOLID_COPY),
+    ICON(FONTAWESOME_ICON_SOLID_COPYRIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_CREDIT_CARD),
+    ICON(FONTAWESOME_ICON_SOLID_CROP),
+    ICON(FONTAWESOME_ICON_SOLID_CROSSHAIRS),
+    ICON(FONTAWESOME_ICON_SOLID_CUBE),
+    ICON(FONTAWESOME_ICON_SOLID_CUBES),
+    ICON(FONTAWESOME_ICON_SOLID_CUT),
+    ICON(FONTAWESOME_ICON_SOLID_DATABASE),
+    ICON(FONTAWESOME_ICON_SOLID_DEAF),
+    ICON(FONTAWESOME_ICON_SOLID_DESKTOP),
+    ICON(FONTAWESOME_ICON_SOLID_DOLLAR_SIGN),
+    ICON(FONTAWESOME_ICON_SOLID_DOT_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_DOWNLOAD),
+    ICON(FONTAWESOME_ICON_SOLID_EDIT),
+    ICON(FONTAWESOME_ICON_SOLID_EJECT),
+    ICON(FONTAWESOME_ICON_SOLID_ELLIPSIS_H),
+    ICON(FONTAWESOME_ICON_SOLID_ELLIPSIS_V),
+    ICON(FONTAWESOME_ICON_SOLID_ENVELOPE),
+    ICON(FONTAWESOME_ICON_SOLID_ENVELOPE_OPEN),
+    ICON(FONTAWESOME_ICON_SOLID_ENVELOPE_SQUARE),
+    ICON(FONTAWESOME_ICON_SOLID_ERASER),
+    ICON(FONTAWESOME_ICON_SOLID_EURO_SIGN),
+    ICON(FONTAWESOME_ICON_SOLID_EXCHANGE_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_EXCLAMATION),
+    ICON(FONTAWESOME_ICON_SOLID_EXCLAMATION_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_EXCLAMATION_TRIANGLE),
+    ICON(FONTAWESOME_ICON_SOLID_EXPAND),
+    ICON(FONTAWESOME_ICON_SOLID_EXPAND_ARROWS_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_EXTERNAL_LINK_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_EXTERNAL_LINK_SQUARE_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_EYE),
+    ICON(FONTAWESOME_ICON_SOLID_EYE_DROPPER),
+    ICON(FONTAWESOME_ICON_SOLID_EYE_SLASH),
+    ICON(FONTAWESOME_ICON_SOLID_FAST_BACKWARD),
+    ICON(FONTAWESOME_ICON_SOLID_FAST_FORWARD),
+    ICON(FONTAWESOME_ICON_SOLID_FAX),
+    ICON(FONTAWESOME_ICON_SOLID_FEMALE),
+    ICON(FONTAWESOME_ICON_SOLID_FIGHTER_JET),
+    ICON(FONTAWESOME_ICON_SOLID_FILE),
+    ICON(FONTAWESOME_ICON_SOLID_FILE_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_FILE_ARCHIVE),
+    ICON(FONTAWESOME_ICON_SOLID_FILE_AUDIO),
+    ICON(FONTAWESOME_ICON_SOLID_FILE_CODE),
+    ICON(FONTAWESOME_ICON_SOLID_FILE_EXCEL),
+    ICON(FONTAWESOME_ICON_SOLID_FILE_IMAGE),
+    ICON(FONTAWESOME_ICON_SOLID_FILE_PDF),
+    ICON(FONTAWESOME_ICON_SOLID_FILE_POWERPOINT),
+    ICON(FONTAWESOME_ICON_SOLID_FILE_VIDEO),
+    ICON(FONTAWESOME_ICON_SOLID_FILE_WORD),
+    ICON(FONTAWESOME_ICON_SOLID_FILM),
+    ICON(FONTAWESOME_ICON_SOLID_FILTER),
+    ICON(FONTAWESOME_ICON_SOLID_FIRE),
+    ICON(FONTAWESOME_ICON_SOLID_FIRE_EXTINGUISHER),
+    ICON(FONTAWESOME_ICON_SOLID_FLAG),
+    ICON(FONTAWESOME_ICON_SOLID_FLAG_CHECKERED),
+    ICON(FONTAWESOME_ICON_SOLID_FLASK),
+    ICON(FONTAWESOME_ICON_SOLID_FOLDER),
+    ICON(FONTAWESOME_ICON_SOLID_FOLDER_OPEN),
+    ICON(FONTAWESOME_ICON_SOLID_FONT),
+    ICON(FONTAWESOME_ICON_SOLID_FOOTBALL_BALL),
+    ICON(FONTAWESOME_ICON_SOLID_FORWARD),
+    ICON(FONTAWESOME_ICON_SOLID_FROWN),
+    ICON(FONTAWESOME_ICON_SOLID_FUTBOL),
+    ICON(FONTAWESOME_ICON_SOLID_GAMEPAD),
+    ICON(FONTAWESOME_ICON_SOLID_GAVEL),
+    ICON(FONTAWESOME_ICON_SOLID_GEM),
+    ICON(FONTAWESOME_ICON_SOLID_GENDERLESS),
+    ICON(FONTAWESOME_ICON_SOLID_GIFT),
+    ICON(FONTAWESOME_ICON_SOLID_GLASS_MARTINI),
+    ICON(FONTAWESOME_ICON_SOLID_GLOBE),
+    ICON(FONTAWESOME_ICON_SOLID_GOLF_BALL),
+    ICON(FONTAWESOME_ICON_SOLID_GRADUATION_CAP),
+    ICON(FONTAWESOME_ICON_SOLID_H_SQUARE),
+    ICON(FONTAWESOME_ICON_SOLID_HAND_LIZARD),
+    ICON(FONTAWESOME_ICON_SOLID_HAND_PAPER),
+    ICON(FONTAWESOME_ICON_SOLID_HAND_PEACE),
+    ICON(FONTAWESOME_ICON_SOLID_HAND_POINT_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_HAND_POINT_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_HAND_POINT_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_HAND_POINT_UP),
+    ICON(FONTAWESOME_ICON_SOLID_HAND_POINTER),
+    ICON(FONTAWESOME_ICON_SOLID_HAND_ROCK),
+    ICON(FONTAWESOME_ICON_SOLID_HAND_SCISSORS),
+    ICON(FONTAWESOME_ICON_SOLID_HAND_SPOCK),
+    ICON(FONTAWESOME_ICON_SOLID_HANDSHAKE),
+    ICON(FONTAWESOME_ICON_SOLID_HASHTAG),
+    ICON(FONTAWESOME_ICON_SOLID_HDD),
+    ICON(FONTAWESOME_ICON_SOLID_HEADING),
+    ICON(FONTAWESOME_ICON_SOLID_HEADPHONES),
+    ICON(FONTAWESOME_ICON_SOLID_HEART),
+    ICON(FONTAWESOME_ICON_SOLID_HEARTBEAT),
+    ICON(FONTAWESOME_ICON_SOLID_HISTORY),
+    ICON(FONTAWESOME_ICON_SOLID_HOCKEY_PUCK),
+    ICON(FONTAWESOME_ICON_SOLID_HOME),
+    ICON(FONTAWESOME_ICON_SOLID_HOSPITAL),
+    ICON(FONTAWESOME_ICON_SOLID_HOURGLASS),
+    ICON(FONTAWESOME_ICON_SOLID_HOURGLASS_END),
+    ICON(FONTAWESOME_ICON_SOLID_HOURGLASS_HALF),
+    ICON(FONTAWESOME_ICON_SOLID_HOURGLASS_START),
+    ICON(FONTAWESOME_ICON_SOLID_I_CURSOR),
+    ICON(FONTAWESOME_ICON_SOLID_ID_BADGE),
+    ICON(FONTAWESOME_ICON_SOLID_ID_CARD),
+    ICON(FONTAWESOME_ICON_SOLID_IMAGE),
+    ICON(FONTAWESOME_ICON_SOLID_IMAGES),
+    ICON(FONTAWESOME_ICON_SOLID_INBOX),
+    ICON(FONTAWESOME_ICON_SOLID_INDENT),
+    ICON(FONTAWESOME_ICON_SOLID_INDUSTRY),
+    ICON(FONTAWESOME_ICON_SOLID_INFO),
+    ICON(FONTAWESOME_ICON_SOLID_INFO_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_ITALIC),
+    ICON(FONTAWESOME_ICON_SOLID_KEY),
+    ICON(FONTAWESOME_ICON_SOLID_KEYBOARD),
+    ICON(FONTAWESOME_ICON_SOLID_LANGUAGE),
+    ICON(FONTAWESOME_ICON_SOLID_LAPTOP),
+    ICON(FONTAWESOME_ICON_SOLID_LEAF),
+    ICON(FONTAWESOME_ICON_SOLID_LEMON),
+    ICON(FONTAWESOME_ICON_SOLID_LEVEL_DOWN_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_LEVEL_UP_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_LIFE_RING),
+    ICON(FONTAWESOME_ICON_SOLID_LIGHTBULB),
+    ICON(FONTAWESOME_ICON_SOLID_LINK),
+    ICON(FONTAWESOME_ICON_SOLID_LIRA_SIGN),
+    ICON(FONTAWESOME_ICON_SOLID_LIST),
+    ICON(FONTAWESOME_ICON_SOLID_LIST_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_LIST_OL),
+    ICON(FONTAWESOME_ICON_SOLID_LIST_UL),
+    ICON(FONTAWESOME_ICON_SOLID_LOCATION_ARROW),
+    ICON(FONTAWESOME_ICON_SOLID_LOCK),
+    ICON(FONTAWESOME_ICON_SOLID_LOCK_OPEN),
+    ICON(FONTAWESOME_ICON_SOLID_LONG_ARROW_ALT_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_LONG_ARROW_ALT_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_LONG_ARROW_ALT_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_LONG_ARROW_ALT_UP),
+    ICON(FONTAWESOME_ICON_SOLID_LOW_VISION),
+    ICON(FONTAWESOME_ICON_SOLID_MAGIC),
+    ICON(FONTAWESOME_ICON_SOLID_MAGNET),
+    ICON(FONTAWESOME_ICON_SOLID_MALE),
+    ICON(FONTAWESOME_ICON_SOLID_MAP),
+    ICON(FONTAWESOME_ICON_SOLID_MAP_MARKER),
+    ICON(FONTAWESOME_ICON_SOLID_MAP_MARKER_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_MAP_PIN),
+    ICON(FONTAWESOME_ICON_SOLID_MAP_SIGNS),
+    ICON(FONTAWESOME_ICON_SOLID_MARS),
+    ICON(FONTAWESOME_ICON_SOLID_MARS_DOUBLE),
+    ICON(FONTAWESOME_ICON_SOLID_MARS_STROKE),
+    ICON(FONTAWESOME_ICON_SOLID_MARS_STROKE_H),
+    ICON(FONTAWESOME_ICON_SOLID_MARS_STROKE_V),
+    ICON(FONTAWESOME_ICON_SOLID_MEDKIT),
+    ICON(FONTAWESOME_ICON_SOLID_MEH),
+    ICON(FONTAWESOME_ICON_SOLID_MERCURY),
+    ICON(FONTAWESOME_ICON_SOLID_MICROCHIP),
+    ICON(FONTAWESOME_ICON_SOLID_MICROPHONE),
+    ICON(FONTAWESOME_ICON_SOLID_MICROPHONE_SLASH),
+    ICON(FONTAWESOME_ICON_SOLID_MINUS),
+    ICON(FONTAWESOME_ICON_SOLID_MINUS_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_MINUS_SQUARE),
+    ICON(FONTAWESOME_ICON_SOLID_MOBILE),
+    ICON(FONTAWESOME_ICON_SOLID_MOBILE_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_MONEY_BILL_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_MOON),
+    ICON(FONTAWESOME_ICON_SOLID_MOTORCYCLE),
+    ICON(FONTAWESOME_ICON_SOLID_MOUSE_POINTER),
+    ICON(FONTAWESOME_ICON_SOLID_MUSIC),
+    ICON(FONTAWESOME_ICON_SOLID_NEUTER),
+    ICON(FONTAWESOME_ICON_SOLID_NEWSPAPER),
+    ICON(FONTAWESOME_ICON_SOLID_OBJECT_GROUP),
+    ICON(FONTAWESOME_ICON_SOLID_OBJECT_UNGROUP),
+    ICON(FONTAWESOME_ICON_SOLID_OUTDENT),
+    ICON(FONTAWESOME_ICON_SOLID_PAINT_BRUSH),
+    ICON(FONTAWESOME_ICON_SOLID_PAPER_PLANE),
+    ICON(FONTAWESOME_ICON_SOLID_PAPERCLIP),
+    ICON(FONTAWESOME_ICON_SOLID_PARAGRAPH),
+    ICON(FONTAWESOME_ICON_SOLID_PASTE),
+    ICON(FONTAWESOME_ICON_SOLID_PAUSE),
+    ICON(FONTAWESOME_ICON_SOLID_PAUSE_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_PAW),
+    ICON(FONTAWESOME_ICON_SOLID_PEN_SQUARE),
+    ICON(FONTAWESOME_ICON_SOLID_PENCIL_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_PERCENT),
+    ICON(FONTAWESOME_ICON_SOLID_PHONE),
+    ICON(FONTAWESOME_ICON_SOLID_PHONE_SQUARE),
+    ICON(FONTAWESOME_ICON_SOLID_PHONE_VOLUME),
+    ICON(FONTAWESOME_ICON_SOLID_PLANE),
+    ICON(FONTAWESOME_ICON_SOLID_PLAY),
+    ICON(FONTAWESOME_ICON_SOLID_PLAY_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_PLUG),
+    ICON(FONTAWESOME_ICON_SOLID_PLUS),
+    ICON(FONTAWESOME_ICON_SOLID_PLUS_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_PLUS_SQUARE),
+    ICON(FONTAWESOME_ICON_SOLID_PODCAST),
+    ICON(FONTAWESOME_ICON_SOLID_POUND_SIGN),
+    ICON(FONTAWESOME_ICON_SOLID_POWER_OFF),
+    ICON(FONTAWESOME_ICON_SOLID_PRINT),
+    ICON(FONTAWESOME_ICON_SOLID_PUZZLE_PIECE),
+    ICON(FONTAWESOME_ICON_SOLID_QRCODE),
+    ICON(FONTAWESOME_ICON_SOLID_QUESTION),
+    ICON(FONTAWESOME_ICON_SOLID_QUESTION_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_QUIDDITCH),
+    ICON(FONTAWESOME_ICON_SOLID_QUOTE_LEFT),
+    ICON(FONTAWESOME_ICON_SOLID_QUOTE_RIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_RANDOM),
+    ICON(FONTAWESOME_ICON_SOLID_RECYCLE),
+    ICON(FONTAWESOME_ICON_SOLID_REDO),
+    ICON(FONTAWESOME_ICON_SOLID_REDO_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_REGISTERED),
+    ICON(FONTAWESOME_ICON_SOLID_REPLY),
+    ICON(FONTAWESOME_ICON_SOLID_REPLY_ALL),
+    ICON(FONTAWESOME_ICON_SOLID_RETWEET),
+    ICON(FONTAWESOME_ICON_SOLID_ROAD),
+    ICON(FONTAWESOME_ICON_SOLID_ROCKET),
+    ICON(FONTAWESOME_ICON_SOLID_RSS),
+    ICON(FONTAWESOME_ICON_SOLID_RSS_SQUARE),
+    ICON(FONTAWESOME_ICON_SOLID_RUBLE_SIGN),
+    ICON(FONTAWESOME_ICON_SOLID_RUPEE_SIGN),
+    ICON(FONTAWESOME_ICON_SOLID_SAVE),
+    ICON(FONTAWESOME_ICON_SOLID_SEARCH),
+    ICON(FONTAWESOME_ICON_SOLID_SEARCH_MINUS),
+    ICON(FONTAWESOME_ICON_SOLID_SEARCH_PLUS),
+    ICON(FONTAWESOME_ICON_SOLID_SERVER),
+    ICON(FONTAWESOME_ICON_SOLID_SHARE),
+    ICON(FONTAWESOME_ICON_SOLID_SHARE_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_SHARE_ALT_SQUARE),
+    ICON(FONTAWESOME_ICON_SOLID_SHARE_SQUARE),
+    ICON(FONTAWESOME_ICON_SOLID_SHEKEL_SIGN),
+    ICON(FONTAWESOME_ICON_SOLID_SHIELD_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_SHIP),
+    ICON(FONTAWESOME_ICON_SOLID_SHOPPING_BAG),
+    ICON(FONTAWESOME_ICON_SOLID_SHOPPING_BASKET),
+    ICON(FONTAWESOME_ICON_SOLID_SHOPPING_CART),
+    ICON(FONTAWESOME_ICON_SOLID_SHOWER),
+    ICON(FONTAWESOME_ICON_SOLID_SIGN_IN_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_SIGN_LANGUAGE),
+    ICON(FONTAWESOME_ICON_SOLID_SIGN_OUT_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_SIGNAL),
+    ICON(FONTAWESOME_ICON_SOLID_SITEMAP),
+    ICON(FONTAWESOME_ICON_SOLID_SLIDERS_H),
+    ICON(FONTAWESOME_ICON_SOLID_SMILE),
+    ICON(FONTAWESOME_ICON_SOLID_SNOWFLAKE),
+    ICON(FONTAWESOME_ICON_SOLID_SORT),
+    ICON(FONTAWESOME_ICON_SOLID_SORT_ALPHA_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_SORT_ALPHA_UP),
+    ICON(FONTAWESOME_ICON_SOLID_SORT_AMOUNT_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_SORT_AMOUNT_UP),
+    ICON(FONTAWESOME_ICON_SOLID_SORT_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_SORT_NUMERIC_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_SORT_NUMERIC_UP),
+    ICON(FONTAWESOME_ICON_SOLID_SORT_UP),
+    ICON(FONTAWESOME_ICON_SOLID_SPACE_SHUTTLE),
+    ICON(FONTAWESOME_ICON_SOLID_SPINNER),
+    ICON(FONTAWESOME_ICON_SOLID_SQUARE),
+    ICON(FONTAWESOME_ICON_SOLID_SQUARE_FULL),
+    ICON(FONTAWESOME_ICON_SOLID_STAR),
+    ICON(FONTAWESOME_ICON_SOLID_STAR_HALF),
+    ICON(FONTAWESOME_ICON_SOLID_STEP_BACKWARD),
+    ICON(FONTAWESOME_ICON_SOLID_STEP_FORWARD),
+    ICON(FONTAWESOME_ICON_SOLID_STETHOSCOPE),
+    ICON(FONTAWESOME_ICON_SOLID_STICKY_NOTE),
+    ICON(FONTAWESOME_ICON_SOLID_STOP),
+    ICON(FONTAWESOME_ICON_SOLID_STOP_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_STOPWATCH),
+    ICON(FONTAWESOME_ICON_SOLID_STREET_VIEW),
+    ICON(FONTAWESOME_ICON_SOLID_STRIKETHROUGH),
+    ICON(FONTAWESOME_ICON_SOLID_SUBSCRIPT),
+    ICON(FONTAWESOME_ICON_SOLID_SUBWAY),
+    ICON(FONTAWESOME_ICON_SOLID_SUITCASE),
+    ICON(FONTAWESOME_ICON_SOLID_SUN),
+    ICON(FONTAWESOME_ICON_SOLID_SUPERSCRIPT),
+    ICON(FONTAWESOME_ICON_SOLID_SYNC),
+    ICON(FONTAWESOME_ICON_SOLID_SYNC_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_TABLE),
+    ICON(FONTAWESOME_ICON_SOLID_TABLE_TENNIS),
+    ICON(FONTAWESOME_ICON_SOLID_TABLET),
+    ICON(FONTAWESOME_ICON_SOLID_TABLET_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_TACHOMETER_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_TAG),
+    ICON(FONTAWESOME_ICON_SOLID_TAGS),
+    ICON(FONTAWESOME_ICON_SOLID_TASKS),
+    ICON(FONTAWESOME_ICON_SOLID_TAXI),
+    ICON(FONTAWESOME_ICON_SOLID_TERMINAL),
+    ICON(FONTAWESOME_ICON_SOLID_TEXT_HEIGHT),
+    ICON(FONTAWESOME_ICON_SOLID_TEXT_WIDTH),
+    ICON(FONTAWESOME_ICON_SOLID_TH),
+    ICON(FONTAWESOME_ICON_SOLID_TH_LARGE),
+    ICON(FONTAWESOME_ICON_SOLID_TH_LIST),
+    ICON(FONTAWESOME_ICON_SOLID_THERMOMETER_EMPTY),
+    ICON(FONTAWESOME_ICON_SOLID_THERMOMETER_FULL),
+    ICON(FONTAWESOME_ICON_SOLID_THERMOMETER_HALF),
+    ICON(FONTAWESOME_ICON_SOLID_THERMOMETER_QUARTER),
+    ICON(FONTAWESOME_ICON_SOLID_THERMOMETER_THREE_QUARTERS),
+    ICON(FONTAWESOME_ICON_SOLID_THUMBS_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_THUMBS_UP),
+    ICON(FONTAWESOME_ICON_SOLID_THUMBTACK),
+    ICON(FONTAWESOME_ICON_SOLID_TICKET_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_TIMES),
+    ICON(FONTAWESOME_ICON_SOLID_TIMES_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_TINT),
+    ICON(FONTAWESOME_ICON_SOLID_TOGGLE_OFF),
+    ICON(FONTAWESOME_ICON_SOLID_TOGGLE_ON),
+    ICON(FONTAWESOME_ICON_SOLID_TRADEMARK),
+    ICON(FONTAWESOME_ICON_SOLID_TRAIN),
+    ICON(FONTAWESOME_ICON_SOLID_TRANSGENDER),
+    ICON(FONTAWESOME_ICON_SOLID_TRANSGENDER_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_TRASH),
+    ICON(FONTAWESOME_ICON_SOLID_TRASH_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_TREE),
+    ICON(FONTAWESOME_ICON_SOLID_TROPHY),
+    ICON(FONTAWESOME_ICON_SOLID_TRUCK),
+    ICON(FONTAWESOME_ICON_SOLID_TTY),
+    ICON(FONTAWESOME_ICON_SOLID_TV),
+    ICON(FONTAWESOME_ICON_SOLID_UMBRELLA),
+    ICON(FONTAWESOME_ICON_SOLID_UNDERLINE),
+    ICON(FONTAWESOME_ICON_SOLID_UNDO),
+    ICON(FONTAWESOME_ICON_SOLID_UNDO_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_UNIVERSAL_ACCESS),
+    ICON(FONTAWESOME_ICON_SOLID_UNIVERSITY),
+    ICON(FONTAWESOME_ICON_SOLID_UNLINK),
+    ICON(FONTAWESOME_ICON_SOLID_UNLOCK),
+    ICON(FONTAWESOME_ICON_SOLID_UNLOCK_ALT),
+    ICON(FONTAWESOME_ICON_SOLID_UPLOAD),
+    ICON(FONTAWESOME_ICON_SOLID_USER),
+    ICON(FONTAWESOME_ICON_SOLID_USER_CIRCLE),
+    ICON(FONTAWESOME_ICON_SOLID_USER_MD),
+    ICON(FONTAWESOME_ICON_SOLID_USER_PLUS),
+    ICON(FONTAWESOME_ICON_SOLID_USER_SECRET),
+    ICON(FONTAWESOME_ICON_SOLID_USER_TIMES),
+    ICON(FONTAWESOME_ICON_SOLID_USERS),
+    ICON(FONTAWESOME_ICON_SOLID_UTENSIL_SPOON),
+    ICON(FONTAWESOME_ICON_SOLID_UTENSILS),
+    ICON(FONTAWESOME_ICON_SOLID_VENUS),
+    ICON(FONTAWESOME_ICON_SOLID_VENUS_DOUBLE),
+    ICON(FONTAWESOME_ICON_SOLID_VENUS_MARS),
+    ICON(FONTAWESOME_ICON_SOLID_VIDEO),
+    ICON(FONTAWESOME_ICON_SOLID_VOLLEYBALL_BALL),
+    ICON(FONTAWESOME_ICON_SOLID_VOLUME_DOWN),
+    ICON(FONTAWESOME_ICON_SOLID_VOLUME_OFF),
+    ICON(FONTAWESOME_ICON_SOLID_VOLUME_UP),
+    ICON(FONTAWESOME_ICON_SOLID_WHEELCHAIR),
+    ICON(FONTAWESOME_ICON_SOLID_WIFI),
+    ICON(FONTAWESOME_ICON_SOLID_WINDOW_CLOSE),
+    ICON(FONTAWESOME_ICON_SOLID_WINDOW_MAXIMIZE),
+    ICON(FONTAWESOME_ICON_SOLID_WINDOW_MINIMIZE),
+    ICON(FONTAWESOME_ICON_SOLID_WINDOW_RESTORE),
+    ICON(FONTAWESOME_ICON_SOLID_WON_SIGN),
+    ICON(FONTAWESOME_ICON_SOLID_WRENCH),
+    ICON(FONTAWESOME_ICON_SOLID_YEN_SIGN),
+    ICON(FONTAWESOME_ICON_SQUARE),
+    ICON(FONTAWESOME_ICON_STAR),
+    ICON(FONTAWESOME_ICON_STAR_HALF),
+    ICON(FONTAWESOME_ICON_STICKY_NOTE),
+    ICON(FONTAWESOME_ICON_STOP_CIRCLE),
+    ICON(FONTAWESOME_ICON_SUN),
+    ICON(FONTAWESOME_ICON_THUMBS_DOWN),
+    ICON(FONTAWESOME_ICON_THUMBS_UP),
+    ICON(FONTAWESOME_ICON_TIMES_CIRCLE),
+    ICON(FONTAWESOME_ICON_TRASH_ALT),
+    ICON(FONTAWESOME_ICON_USER),
+    ICON(FONTAWESOME_ICON_USER_CIRCLE),
+    ICON(FONTAWESOME_ICON_WINDOW_CLOSE),
+    ICON(FONTAWESOME_ICON_WINDOW_MAXIMIZE),
+    ICON(FONTAWESOME_ICON_WINDOW_MINIMIZE),
+    ICON(FONTAWESOME_ICON_WINDOW_RESTORE),
+};
+#undef ICON
+
+static std::vector<std::pair<std::string, int>> allIcons() {
+    return std::vector<std::pair<std::string, int>>(std::begin(ICONS), std::end(ICONS));
+}
+
 
 int main(int /* argc */, char ** /* argv */) {
     nanogui::init();
 
     /* scoped variables */ {
-        static constexpr int width      = 1000;
-        static constexpr int half_width = width / 2;
-        static constexpr int height     = 800;
+        static constexpr int width  = 1000;
+        static constexpr int height = 800;
 
         // create a fixed size screen with one window
         FontawesomeScreen *screen = new FontawesomeScreen({width, height}, "NanoGUI Fontawesome Icons", false);
@@ -114,951 +1166,10 @@ int main(int /* argc */, char ** /* argv */) {
         Window *window = new Window(screen, "");
         window->setPosition({0, 0});
         window->setFixedSize({width, height});
+        window->setLayout(new BoxLayout(Orientation::Vertical, Alignment::Minimum, 10));
 
-        // attach a vertical scroll panel
-        auto vscroll = new VScrollPanel(window);
-        vscroll->setFixedSize({width, height});
-
-        // vscroll should only have *ONE* child. this is what `wrapper` is for
-        auto wrapper = new Widget(vscroll);
-        wrapper->setFixedSize({width, height});
-        wrapper->setLayout(new GridLayout());// defaults: 2 columns
-
-        ////////////////////////////////////////////////////////////////////////
-        ////////////////////////////////////////////////////////////////////////
-        ////////////////////////////////////////////////////////////////////////
-        ADD_ICON(wrapper, FONTAWESOME_ICON_ADDRESS_BOOK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_ADDRESS_CARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_ARROW_ALT_CIRCLE_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_ARROW_ALT_CIRCLE_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_ARROW_ALT_CIRCLE_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_ARROW_ALT_CIRCLE_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BELL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BELL_SLASH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BOOKMARK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_500PX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ACCESSIBLE_ICON, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ACCUSOFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ADN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ADVERSAL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_AFFILIATETHEME, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ALGOLIA, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_AMAZON, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_AMAZON_PAY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_AMILIA, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ANDROID, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ANGELLIST, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ANGRYCREATIVE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ANGULAR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_APP_STORE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_APP_STORE_IOS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_APPER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_APPLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_APPLE_PAY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ASYMMETRIK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_AUDIBLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_AUTOPREFIXER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_AVIANEX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_AVIATO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_AWS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BANDCAMP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BEHANCE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BEHANCE_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BIMOBJECT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BITBUCKET, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BITCOIN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BITY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BLACK_TIE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BLACKBERRY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BLOGGER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BLOGGER_B, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BLUETOOTH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BLUETOOTH_B, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BTC, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BUROMOBELEXPERTE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_BUYSELLADS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CC_AMAZON_PAY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CC_AMEX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CC_APPLE_PAY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CC_DINERS_CLUB, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CC_DISCOVER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CC_JCB, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CC_MASTERCARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CC_PAYPAL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CC_STRIPE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CC_VISA, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CENTERCODE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CHROME, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CLOUDSCALE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CLOUDSMITH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CLOUDVERSIFY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CODEPEN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CODIEPIE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CONNECTDEVELOP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CONTAO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CPANEL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CREATIVE_COMMONS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CSS3, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CSS3_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_CUTTLEFISH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_D_AND_D, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DASHCUBE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DELICIOUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DEPLOYDOG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DESKPRO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DEVIANTART, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DIGG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DIGITAL_OCEAN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DISCORD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DISCOURSE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DOCHUB, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DOCKER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DRAFT2DIGITAL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DRIBBBLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DRIBBBLE_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DROPBOX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DRUPAL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_DYALOG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_EARLYBIRDS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_EDGE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ELEMENTOR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_EMBER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_EMPIRE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ENVIRA, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ERLANG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ETHEREUM, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ETSY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_EXPEDITEDSSL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FACEBOOK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FACEBOOK_F, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FACEBOOK_MESSENGER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FACEBOOK_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FIREFOX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FIRST_ORDER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FIRSTDRAFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FLICKR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FLIPBOARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FLY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FONT_AWESOME, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FONT_AWESOME_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FONT_AWESOME_FLAG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FONTICONS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FONTICONS_FI, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FORT_AWESOME, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FORT_AWESOME_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FORUMBEE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FOURSQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FREE_CODE_CAMP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_FREEBSD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GET_POCKET, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GG_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GIT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GIT_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GITHUB, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GITHUB_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GITHUB_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GITKRAKEN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GITLAB, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GITTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GLIDE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GLIDE_G, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GOFORE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GOODREADS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GOODREADS_G, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GOOGLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GOOGLE_DRIVE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GOOGLE_PLAY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GOOGLE_PLUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GOOGLE_PLUS_G, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GOOGLE_PLUS_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GOOGLE_WALLET, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GRATIPAY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GRAV, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GRIPFIRE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GRUNT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_GULP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_HACKER_NEWS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_HACKER_NEWS_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_HIPS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_HIRE_A_HELPER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_HOOLI, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_HOTJAR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_HOUZZ, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_HTML5, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_HUBSPOT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_IMDB, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_INSTAGRAM, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_INTERNET_EXPLORER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_IOXHOST, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ITUNES, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ITUNES_NOTE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_JENKINS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_JOGET, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_JOOMLA, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_JS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_JS_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_JSFIDDLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_KEYCDN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_KICKSTARTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_KICKSTARTER_K, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_KORVUE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_LARAVEL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_LASTFM, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_LASTFM_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_LEANPUB, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_LESS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_LINE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_LINKEDIN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_LINKEDIN_IN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_LINODE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_LINUX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_LYFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MAGENTO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MAXCDN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MEDAPPS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MEDIUM, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MEDIUM_M, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MEDRT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MEETUP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MICROSOFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MIX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MIXCLOUD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MIZUNI, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MODX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_MONERO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_NAPSTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_NINTENDO_SWITCH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_NODE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_NODE_JS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_NPM, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_NS8, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_NUTRITIONIX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ODNOKLASSNIKI, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ODNOKLASSNIKI_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_OPENCART, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_OPENID, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_OPERA, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_OPTIN_MONSTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_OSI, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PAGE4, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PAGELINES, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PALFED, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PATREON, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PAYPAL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PERISCOPE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PHABRICATOR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PHOENIX_FRAMEWORK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PHP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PIED_PIPER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PIED_PIPER_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PIED_PIPER_PP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PINTEREST, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PINTEREST_P, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PINTEREST_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PLAYSTATION, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PRODUCT_HUNT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PUSHED, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_PYTHON, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_QQ, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_QUINSCAPE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_QUORA, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_RAVELRY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_REACT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_REBEL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_RED_RIVER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_REDDIT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_REDDIT_ALIEN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_REDDIT_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_RENDACT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_RENREN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_REPLYD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_RESOLVING, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ROCKETCHAT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_ROCKRMS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SAFARI, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SASS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SCHLIX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SCRIBD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SEARCHENGIN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SELLCAST, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SELLSY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SERVICESTACK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SHIRTSINBULK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SIMPLYBUILT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SISTRIX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SKYATLAS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SKYPE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SLACK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SLACK_HASH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SLIDESHARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SNAPCHAT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SNAPCHAT_GHOST, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SNAPCHAT_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SOUNDCLOUD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SPEAKAP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SPOTIFY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STACK_EXCHANGE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STACK_OVERFLOW, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STAYLINKED, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STEAM, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STEAM_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STEAM_SYMBOL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STICKER_MULE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STRAVA, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STRIPE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STRIPE_S, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STUDIOVINARI, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STUMBLEUPON, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_STUMBLEUPON_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SUPERPOWERS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_SUPPLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_TELEGRAM, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_TELEGRAM_PLANE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_TENCENT_WEIBO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_THEMEISLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_TRELLO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_TRIPADVISOR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_TUMBLR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_TUMBLR_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_TWITCH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_TWITTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_TWITTER_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_TYPO3, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_UBER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_UIKIT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_UNIREGISTRY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_UNTAPPD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_USB, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_USSUNNAH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VAADIN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VIACOIN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VIADEO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VIADEO_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VIBER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VIMEO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VIMEO_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VIMEO_V, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VINE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VNV, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_VUEJS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WEIBO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WEIXIN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WHATSAPP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WHATSAPP_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WHMCS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WIKIPEDIA_W, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WINDOWS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WORDPRESS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WORDPRESS_SIMPLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WPBEGINNER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WPEXPLORER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_WPFORMS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_XBOX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_XING, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_XING_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_Y_COMBINATOR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_YAHOO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_YANDEX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_YANDEX_INTERNATIONAL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_YELP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_YOAST, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_YOUTUBE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BRANDS_YOUTUBE_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_BUILDING, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CALENDAR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CALENDAR_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CALENDAR_CHECK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CALENDAR_MINUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CALENDAR_PLUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CALENDAR_TIMES, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CARET_SQUARE_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CARET_SQUARE_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CARET_SQUARE_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CARET_SQUARE_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CHART_BAR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CHECK_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CHECK_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CLIPBOARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CLOCK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CLONE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CLOSED_CAPTIONING, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_COMMENT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_COMMENT_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_COMMENTS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_COMPASS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_COPY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_COPYRIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_CREDIT_CARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_DOT_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_EDIT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_ENVELOPE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_ENVELOPE_OPEN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_EYE_SLASH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FILE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FILE_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FILE_ARCHIVE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FILE_AUDIO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FILE_CODE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FILE_EXCEL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FILE_IMAGE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FILE_PDF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FILE_POWERPOINT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FILE_VIDEO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FILE_WORD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FLAG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FOLDER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FOLDER_OPEN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FROWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_FUTBOL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_GEM, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HAND_LIZARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HAND_PAPER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HAND_PEACE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HAND_POINT_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HAND_POINT_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HAND_POINT_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HAND_POINT_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HAND_POINTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HAND_ROCK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HAND_SCISSORS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HAND_SPOCK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HANDSHAKE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HDD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HEART, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HOSPITAL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_HOURGLASS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_ID_BADGE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_ID_CARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_IMAGE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_IMAGES, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_KEYBOARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_LEMON, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_LIFE_RING, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_LIGHTBULB, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_LIST_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_MAP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_MEH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_MINUS_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_MONEY_BILL_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_MOON, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_NEWSPAPER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_OBJECT_GROUP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_OBJECT_UNGROUP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_PAPER_PLANE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_PAUSE_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_PLAY_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_PLUS_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_QUESTION_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_REGISTERED, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SAVE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SHARE_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SMILE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SNOWFLAKE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ADDRESS_BOOK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ADDRESS_CARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ADJUST, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ALIGN_CENTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ALIGN_JUSTIFY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ALIGN_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ALIGN_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_AMBULANCE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_AMERICAN_SIGN_LANGUAGE_INTERPRETING, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ANCHOR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ANGLE_DOUBLE_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ANGLE_DOUBLE_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ANGLE_DOUBLE_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ANGLE_DOUBLE_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ANGLE_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ANGLE_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ANGLE_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ANGLE_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARCHIVE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_ALT_CIRCLE_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_ALT_CIRCLE_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_ALT_CIRCLE_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_ALT_CIRCLE_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_CIRCLE_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_CIRCLE_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_CIRCLE_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_CIRCLE_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROW_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROWS_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROWS_ALT_H, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ARROWS_ALT_V, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ASSISTIVE_LISTENING_SYSTEMS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ASTERISK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_AT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_AUDIO_DESCRIPTION, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BACKWARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BALANCE_SCALE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BAN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BARCODE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BARS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BASEBALL_BALL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BASKETBALL_BALL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BATH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BATTERY_EMPTY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BATTERY_FULL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BATTERY_HALF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BATTERY_QUARTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BATTERY_THREE_QUARTERS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BED, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BEER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BELL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BELL_SLASH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BICYCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BINOCULARS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BIRTHDAY_CAKE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BLIND, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BOLD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BOLT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BOMB, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BOOK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BOOKMARK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BOWLING_BALL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BRAILLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BRIEFCASE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BUG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BUILDING, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BULLHORN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BULLSEYE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_BUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CALCULATOR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CALENDAR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CALENDAR_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CALENDAR_CHECK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CALENDAR_MINUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CALENDAR_PLUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CALENDAR_TIMES, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CAMERA, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CAMERA_RETRO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CAR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CARET_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CARET_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CARET_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CARET_SQUARE_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CARET_SQUARE_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CARET_SQUARE_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CARET_SQUARE_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CARET_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CART_ARROW_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CART_PLUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CERTIFICATE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHART_AREA, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHART_BAR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHART_LINE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHART_PIE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHECK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHECK_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHECK_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHESS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHESS_BISHOP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHESS_BOARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHESS_KING, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHESS_KNIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHESS_PAWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHESS_QUEEN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHESS_ROOK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHEVRON_CIRCLE_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHEVRON_CIRCLE_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHEVRON_CIRCLE_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHEVRON_CIRCLE_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHEVRON_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHEVRON_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHEVRON_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHEVRON_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CHILD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CIRCLE_NOTCH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CLIPBOARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CLOCK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CLONE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CLOSED_CAPTIONING, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CLOUD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CLOUD_DOWNLOAD_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CLOUD_UPLOAD_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CODE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CODE_BRANCH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_COFFEE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_COG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_COGS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_COLUMNS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_COMMENT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_COMMENT_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_COMMENTS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_COMPASS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_COMPRESS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_COPY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_COPYRIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CREDIT_CARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CROP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CROSSHAIRS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CUBE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CUBES, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_CUT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_DATABASE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_DEAF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_DESKTOP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_DOLLAR_SIGN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_DOT_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_DOWNLOAD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EDIT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EJECT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ELLIPSIS_H, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ELLIPSIS_V, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ENVELOPE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ENVELOPE_OPEN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ENVELOPE_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ERASER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EURO_SIGN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EXCHANGE_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EXCLAMATION, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EXCLAMATION_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EXCLAMATION_TRIANGLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EXPAND, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EXPAND_ARROWS_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EXTERNAL_LINK_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EXTERNAL_LINK_SQUARE_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EYE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EYE_DROPPER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_EYE_SLASH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FAST_BACKWARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FAST_FORWARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FAX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FEMALE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FIGHTER_JET, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILE_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILE_ARCHIVE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILE_AUDIO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILE_CODE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILE_EXCEL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILE_IMAGE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILE_PDF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILE_POWERPOINT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILE_VIDEO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILE_WORD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILM, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FILTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FIRE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FIRE_EXTINGUISHER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FLAG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FLAG_CHECKERED, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FLASK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FOLDER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FOLDER_OPEN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FONT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FOOTBALL_BALL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FORWARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FROWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_FUTBOL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_GAMEPAD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_GAVEL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_GEM, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_GENDERLESS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_GIFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_GLASS_MARTINI, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_GLOBE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_GOLF_BALL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_GRADUATION_CAP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_H_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HAND_LIZARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HAND_PAPER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HAND_PEACE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HAND_POINT_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HAND_POINT_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HAND_POINT_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HAND_POINT_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HAND_POINTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HAND_ROCK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HAND_SCISSORS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HAND_SPOCK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HANDSHAKE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HASHTAG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HDD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HEADING, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HEADPHONES, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HEART, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HEARTBEAT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HISTORY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HOCKEY_PUCK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HOME, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HOSPITAL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HOURGLASS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HOURGLASS_END, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HOURGLASS_HALF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_HOURGLASS_START, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_I_CURSOR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ID_BADGE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ID_CARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_IMAGE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_IMAGES, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_INBOX, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_INDENT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_INDUSTRY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_INFO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_INFO_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ITALIC, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_KEY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_KEYBOARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LANGUAGE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LAPTOP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LEAF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LEMON, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LEVEL_DOWN_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LEVEL_UP_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LIFE_RING, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LIGHTBULB, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LINK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LIRA_SIGN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LIST, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LIST_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LIST_OL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LIST_UL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LOCATION_ARROW, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LOCK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LOCK_OPEN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LONG_ARROW_ALT_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LONG_ARROW_ALT_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LONG_ARROW_ALT_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LONG_ARROW_ALT_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_LOW_VISION, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MAGIC, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MAGNET, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MALE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MAP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MAP_MARKER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MAP_MARKER_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MAP_PIN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MAP_SIGNS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MARS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MARS_DOUBLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MARS_STROKE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MARS_STROKE_H, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MARS_STROKE_V, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MEDKIT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MEH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MERCURY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MICROCHIP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MICROPHONE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MICROPHONE_SLASH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MINUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MINUS_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MINUS_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MOBILE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MOBILE_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MONEY_BILL_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MOON, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MOTORCYCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MOUSE_POINTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_MUSIC, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_NEUTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_NEWSPAPER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_OBJECT_GROUP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_OBJECT_UNGROUP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_OUTDENT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PAINT_BRUSH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PAPER_PLANE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PAPERCLIP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PARAGRAPH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PASTE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PAUSE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PAUSE_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PAW, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PEN_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PENCIL_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PERCENT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PHONE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PHONE_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PHONE_VOLUME, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PLANE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PLAY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PLAY_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PLUG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PLUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PLUS_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PLUS_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PODCAST, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_POUND_SIGN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_POWER_OFF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PRINT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_PUZZLE_PIECE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_QRCODE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_QUESTION, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_QUESTION_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_QUIDDITCH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_QUOTE_LEFT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_QUOTE_RIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_RANDOM, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_RECYCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_REDO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_REDO_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_REGISTERED, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_REPLY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_REPLY_ALL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_RETWEET, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ROAD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_ROCKET, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_RSS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_RSS_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_RUBLE_SIGN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_RUPEE_SIGN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SAVE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SEARCH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SEARCH_MINUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SEARCH_PLUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SERVER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SHARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SHARE_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SHARE_ALT_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SHARE_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SHEKEL_SIGN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SHIELD_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SHIP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SHOPPING_BAG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SHOPPING_BASKET, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SHOPPING_CART, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SHOWER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SIGN_IN_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SIGN_LANGUAGE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SIGN_OUT_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SIGNAL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SITEMAP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SLIDERS_H, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SMILE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SNOWFLAKE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SORT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SORT_ALPHA_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SORT_ALPHA_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SORT_AMOUNT_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SORT_AMOUNT_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SORT_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SORT_NUMERIC_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SORT_NUMERIC_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SORT_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SPACE_SHUTTLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SPINNER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SQUARE_FULL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_STAR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_STAR_HALF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_STEP_BACKWARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_STEP_FORWARD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_STETHOSCOPE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_STICKY_NOTE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_STOP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_STOP_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_STOPWATCH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_STREET_VIEW, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_STRIKETHROUGH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SUBSCRIPT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SUBWAY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SUITCASE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SUN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SUPERSCRIPT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SYNC, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_SYNC_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TABLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TABLE_TENNIS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TABLET, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TABLET_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TACHOMETER_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TAG, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TAGS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TASKS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TAXI, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TERMINAL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TEXT_HEIGHT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TEXT_WIDTH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TH_LARGE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TH_LIST, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_THERMOMETER_EMPTY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_THERMOMETER_FULL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_THERMOMETER_HALF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_THERMOMETER_QUARTER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_THERMOMETER_THREE_QUARTERS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_THUMBS_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_THUMBS_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_THUMBTACK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TICKET_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TIMES, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TIMES_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TINT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TOGGLE_OFF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TOGGLE_ON, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TRADEMARK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TRAIN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TRANSGENDER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TRANSGENDER_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TRASH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TRASH_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TREE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TROPHY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TRUCK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TTY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_TV, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UMBRELLA, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UNDERLINE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UNDO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UNDO_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UNIVERSAL_ACCESS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UNIVERSITY, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UNLINK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UNLOCK, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UNLOCK_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UPLOAD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_USER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_USER_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_USER_MD, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_USER_PLUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_USER_SECRET, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_USER_TIMES, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_USERS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UTENSIL_SPOON, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_UTENSILS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_VENUS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_VENUS_DOUBLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_VENUS_MARS, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_VIDEO, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_VOLLEYBALL_BALL, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_VOLUME_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_VOLUME_OFF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_VOLUME_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_WHEELCHAIR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_WIFI, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_WINDOW_CLOSE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_WINDOW_MAXIMIZE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_WINDOW_MINIMIZE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_WINDOW_RESTORE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_WON_SIGN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_WRENCH, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SOLID_YEN_SIGN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SQUARE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_STAR, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_STAR_HALF, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_STICKY_NOTE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_STOP_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_SUN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_THUMBS_DOWN, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_THUMBS_UP, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_TIMES_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_TRASH_ALT, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_USER, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_USER_CIRCLE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_WINDOW_CLOSE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_WINDOW_MAXIMIZE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_WINDOW_MINIMIZE, half_width);
-        ADD_ICON(wrapper, FONTAWESOME_ICON_WINDOW_RESTORE, half_width);
-        ////////////////////////////////////////////////////////////////////////
-        ////////////////////////////////////////////////////////////////////////
-        ////////////////////////////////////////////////////////////////////////
+        // however many icons there are, only the boxes that fit are created
+        new IconBrowser(window, allIcons(), width - 20, height - 20);
 
         screen->performLayout();
         screen->setVisible(true);
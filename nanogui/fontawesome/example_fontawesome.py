@@ -5,7 +5,7 @@
 import gc
 
 import nanogui
-from nanogui import Screen, Window, Widget, GridLayout, VScrollPanel, Button, TextBox, BoxLayout, Orientation, Theme
+from nanogui import Screen, Window, Widget, GridLayout, Button, TextBox, Label, Slider, BoxLayout, Orientation, Alignment, Theme
 from nanogui import fontawesome
 
 
@@ -53,31 +53,122 @@ class EscapeScreen(nanogui.Screen):
 
 
 class IconBox(nanogui.Widget):
-    def __init__(self, parent, name, icon, width):
+    def __init__(self, parent, width, height):
         super(IconBox, self).__init__(parent)
 
-        self.setLayout(nanogui.BoxLayout(nanogui.Orientation.Horizontal))
+        self.setLayout(BoxLayout(Orientation.Horizontal))
 
-        b = nanogui.Button(self, "", icon)
-        b.setFixedWidth(40)
+        self.button = Button(self, "", 0)
+        self.button.setFixedSize((40, height))
 
-        text = nanogui.TextBox(self, name)
-        text.setDefaultValue(name)
-        text.setEditable(True)
+        self.text = TextBox(self, "")
+        self.text.setEditable(True)
         # Return false essentially makes it not possible to actually edit this text
         # box, but keeping it editable=true allows selection for copy-paste.  If the
         # text box is not editable, then the user cannot highlight it.
-        text.setCallback(lambda x: False)
-        text.setFont("mono-bold")
-        text.setFixedWidth(width - 40)
+        self.text.setCallback(lambda x: False)
+        self.text.setFont("mono-bold")
+        self.text.setFixedSize((width - 40, height))
+
+    # Boxes are recycled: this makes the box show a different icon.
+    def setIcon(self, name, icon):
+        self.button.setIcon(icon)
+        self.text.setValue(name)
+        self.text.setDefaultValue(name)
+
+
+class IconBrowser(nanogui.Widget):
+    """
+    Shows a (filtered) window of the icons of ``module``.  Only as many IconBoxes
+    as fit on screen are ever created, scrolling and filtering just recycles them,
+    so neither layout nor drawing gets slower as the font grows.
+    """
+
+    def __init__(self, parent, module, width, height, columns=2, row_height=28):
+        super(IconBrowser, self).__init__(parent)
+        self.module = module
+        # Only the names are kept, the value of an icon is looked up when shown
+        self.names = [key for key in dir(module) if key.startswith("ICON_")]
+        self.visible = self.names
+        self.columns = columns
+        self.first_row = 0
+
+        self.setLayout(BoxLayout(Orientation.Vertical, Alignment.Minimum, 0, 6))
+
+        tools = Widget(self)
+        tools.setLayout(BoxLayout(Orientation.Horizontal, Alignment.Middle, 0, 6))
+        search = TextBox(tools, "")
+        search.setEditable(True)
+        search.setPlaceholder("filter (press enter)")
+        search.setAlignment(TextBox.Alignment.Left)
+        search.setFixedWidth(width // 2)
+
+        def set_filter(value):
+            self.setFilter(value)
+            return True
+
+        search.setCallback(set_filter)
+        self.count = Label(tools, "")
+        self.count.setFixedWidth(width // 2 - 6)
+
+        self.scroll = Slider(self)
+        self.scroll.setFixedWidth(width)
+        self.scroll.setCallback(
+            lambda value: self.scrollTo(int(round(value * self.maxFirstRow())))
+        )
+
+        grid = Widget(self)
+        grid.setLayout(GridLayout(Orientation.Horizontal, columns, Alignment.Minimum, 0, 2))
+        # whatever is left below the filter and the slider
+        rows = max((height - 70) // (row_height + 2), 1)
+        self.boxes = [
+            IconBox(grid, width // columns - 2, row_height)
+            for _ in range(rows * columns)
+        ]
+
+        self.setFilter("")
+
+    # Only show the icons whose name contains `value` (ignoring case, '-' matches '_').
+    def setFilter(self, value):
+        needle = value.upper().replace("-", "_").replace(" ", "_")
+        self.visible = [name for name in self.names if needle in name]
+        self.first_row = 0
+        self.update()
+
+    def scrollTo(self, row):
+        self.first_row = row
+        self.update()
+
+    def scrollEvent(self, p, rel):
+        if rel[1] == 0:
+            return super(IconBrowser, self).scrollEvent(p, rel)
+        self.scrollTo(self.first_row - int(round(rel[1] * 3)))
+        return True
+
+    def maxFirstRow(self):
+        rows = (len(self.visible) + self.columns - 1) // self.columns
+        return max(rows - len(self.boxes) // self.columns, 0)
+
+    def update(self):
+        max_row = self.maxFirstRow()
+        self.first_row = min(max(self.first_row, 0), max_row)
+        start = self.first_row * self.columns
+        for i, box in enumerate(self.boxes):
+            index = start + i
+            box.setVisible(index < len(self.visible))
+            if index < len(self.visible):
+                name = self.visible[index]
+                box.setIcon(name, getattr(self.module, name))
+
+        self.scroll.setValue(float(self.first_row) / max_row if max_row > 0 else 0.0)
+        self.count.setCaption("{0} of {1} icons".format(len(self.visible), len(self.names)))
 
 
 if __name__ == "__main__":
     nanogui.init()
 
-    width      = 1000
-    half_width = width // 2
-    height     = 800
+    width  = 1000
+    height = 800
 
     # create a fixed size screen with one window
     screen = EscapeScreen((width, height), "NanoGUI Fontawesome Icons", False)
@@ -96,22 +187,10 @@ if __name__ == "__main__":
     window = Window(screen, "")
     window.setPosition((0, 0))
     window.setFixedSize((width, height))
+    window.setLayout(BoxLayout(Orientation.Vertical, Alignment.Minimum, 10))
 
-    # attach a vertical scroll panel
-    vscroll = VScrollPanel(window)
-    vscroll.setFixedSize((width, height))
-
-    # vscroll should only have *ONE* child. this is what `wrapper` is for
-    wrapper = Widget(vscroll)
-    wrapper.setFixedSize((width, height))
-    wrapper.setLayout(GridLayout())  # defaults: 2 columns
-
-    # NOTE: don't __dict__ crawl in real code!
-    # this is just because it's more convenient to do this for enumerating all
-    # of the icons -- see cpp example for alternative...
-    for key in fontawesome.__dict__.keys():
-        if key.startswith("ICON_"):
-            IconBox(wrapper, key, fontawesome.__dict__[key], half_width)
+    # however many icons there are, only the boxes that fit are created
+    browser = IconBrowser(window, fontawesome, width - 20, height - 20)
 
     screen.performLayout()
     screen.drawAll()
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Subset a compiled font down to the icons an application actually uses.
+
+The C++ and Python sources of the application are scanned for references to the
+generated utilities (``FONTAWESOME_ICON_*``, ``FontawesomeIcon::*`` and
+``fontawesome.ICON_*`` for the ``fontawesome`` font), and a font holding only those icons is written along
+with the matching header, python bindings and examples (rendered by
+:func:`generate.generate`).  The subset keeps the original codepoints, so code
+written against the full font works unchanged against the subset.
+
+Only the glyph outlines and advances are copied, through :class:`ttf.TrueTypeFont`
+and :func:`ttf.build_font`; no hinting or layout tables survive (the fonts built
+here have none to begin with).
+
+Example::
+
+    ./subset.py ~/my_app/src ~/my_app/python --font-name fontawesome
+
+Icons that are only ever looked up dynamically (e.g. by crawling
+``fontawesome.__dict__``) cannot be found by the scan, list them with ``--keep``.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import os
+import re
+import sys
+import time
+
+import generate
+import ttf
+
+
+class SubsetError(Exception):
+    """Raised by :func:`subset` when the font cannot be subset."""
+
+
+# Files worth scanning, everything else (build trees, images, ...) is skipped
+# without being opened.
+SOURCE_EXTENSIONS = frozenset([
+    ".h", ".hh", ".hpp", ".hxx", ".inl", ".ipp",
+    ".c", ".cc", ".cpp", ".cxx", ".m", ".mm",
+    ".py", ".pyi", ".pyx"
+])
+
+# Directories that never hold sources of the application.
+SKIP_DIRECTORIES = frozenset([".git", ".hg", ".svn", "__pycache__", "node_modules"])
+
+# Below this many files the process pool costs more than it saves.
+PARALLEL_THRESHOLD = 256
+
+
+def usage_pattern(font_name):
+    """
+    Return the compiled ``bytes`` regular expression matching a reference to an
+    icon of ``font_name``: the ``{FONT_NAME}_ICON_X`` macro or ``{FontName}Icon::X``
+    enumerator from the header, or the ``{font_name}.ICON_X`` attribute from the
+    python bindings.  The (only) group is the ``X``.
+    """
+    return re.compile(
+        r"\b(?:{NAME}_ICON_|{Name}Icon::|{name}\.ICON_)([A-Z0-9_]+)\b".format(
+            NAME=re.escape(font_name.upper()),
+            Name=re.escape(font_name.capitalize()),
+            name=re.escape(font_name)
+        ).encode("ascii")
+    )
+
+
+def generated_file_names(font_name):
+    """The basenames of the files :func:`generate.generate` writes for ``font_name``."""
+    return frozenset([
+        "{0}.h".format(font_name),
+        "constants_{0}.cpp".format(font_name),
+        "example_{0}.cpp".format(font_name),
+        "example_{0}.py".format(font_name)
+    ])
+
+
+def find_sources(roots, exclude=()):
+    """
+    Return the sorted paths of every source file (see :data:`SOURCE_EXTENSIONS`)
+    in ``roots``, which can be directories (searched recursively) or files (taken
+    as is).  Hidden directories, :data:`SKIP_DIRECTORIES` and files whose
+    basename is in ``exclude`` are skipped.
+    """
+    sources = []
+    pending = []
+    for root in roots:
+        if os.path.isdir(root):
+            pending.append(root)
+        elif os.path.isfile(root):
+            sources.append(root)
+        else:
+            raise SubsetError("[{0}] does not exist.".format(root))
+
+    # os.scandir hands back the file type with the name, so nothing but the
+    # directories is ever stat'ed.
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError as e:
+            raise SubsetError("could not list [{0}]: {1}".format(directory, e)) from e
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.name.startswith(".") and entry.name not in SKIP_DIRECTORIES:
+                    pending.append(entry.path)
+            elif (os.path.splitext(entry.name)[1] in SOURCE_EXTENSIONS and
+                  entry.name not in exclude):
+                sources.append(entry.path)
+    return sorted(sources)
+
+
+def _scan_files(job):
+    """
+    Process pool entry point: ``job`` is ``(paths, font_name)``.  Returns
+    ``({identifier: path}, num_bytes)`` for the first file each identifier was
+    seen in.
+    """
+    paths, font_name = job
+    pattern = usage_pattern(font_name)
+    # Cheap substring checks rule out most files before the regex runs.
+    needles = (
+        "{0}_ICON_".format(font_name.upper()).encode("ascii"),
+        "{0}Icon::".format(font_name.capitalize()).encode("ascii"),
+        "{0}.ICON_".format(font_name).encode("ascii")
+    )
+    found = {}
+    num_bytes = 0
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        num_bytes += len(data)
+        if not any(needle in data for needle in needles):
+            continue
+        for match in pattern.findall(data):
+            found.setdefault(match.decode("ascii"), path)
+    return found, num_bytes
+
+
+def scan_sources(font_name, paths, jobs=None):
+    """
+    Return ``({identifier: path}, num_bytes)`` for the icon references to
+    ``font_name`` in ``paths``, where ``identifier`` is the ``X`` of
+    ``{FONT_NAME}_ICON_X`` and ``path`` is the first file it was found in.
+    Large sets of files are read in a process pool of ``jobs`` workers.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(paths) < PARALLEL_THRESHOLD:
+        return _scan_files((paths, font_name))
+
+    # A few chunks per worker balances the load without pickling every path.
+    chunk = max(len(paths) // (4 * jobs), 1)
+    chunks = [(paths[i:i + chunk], font_name) for i in range(0, len(paths), chunk)]
+    found = {}
+    num_bytes = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # map() keeps the chunk order, so "first file" is still well defined.
+        for chunk_found, chunk_bytes in pool.map(_scan_files, chunks):
+            for identifier, path in chunk_found.items():
+                found.setdefault(identifier, path)
+            num_bytes += chunk_bytes
+    return found, num_bytes
+
+
+def icon_identifier(icon_name):
+    """The ``X`` in ``{FONT_NAME}_ICON_X`` for ``icon_name``, as in :func:`generate.make_cdefs`."""
+    return generate.icon_identifier(icon_name)
+
+
+def subset_font(font_path, keep, family):
+    """
+    Return the bytes of a font named ``family`` holding only the icons of the font
+    at ``font_path`` whose names are in ``keep``, at their original codepoints.
+    The ``.notdef`` glyph (and ``space``, if mapped) are always kept.
+    """
+    with ttf.TrueTypeFont(font_path) as font:
+        names = font.glyph_names()
+        advances = font.advances()
+        ascent, descent = font.vertical_metrics()
+        units_per_em = font.units_per_em
+
+        kept = [(".notdef", None, 0)]
+        for code, gid in sorted(font.cmap().items()):
+            # Named as in ttf.TrueTypeFont.icons(), which generate.py reads
+            name = names[gid] if gid < len(names) else None
+            if name is None:
+                name = "uni{0:04X}".format(code) if code <= 0xFFFF else "u{0:X}".format(code)
+            if code == 0x20 or (ttf.is_private_use(code) and name in keep):
+                kept.append((name, code, gid))
+
+        glyphs = [
+            ttf.Glyph(name, code, ttf.decode_glyph(font.glyph_data(gid)), advances[gid])
+            for name, code, gid in kept
+        ]
+
+    return ttf.build_font(family, glyphs, units_per_em=units_per_em, ascent=ascent,
+                          descent=descent)
+
+
+def subset(font_name, font_path, roots, out_dir, license, jobs=None, keep=(),
+           strict=False, style="define", metrics=False, lookup=False, icon_manifest=False):
+    """
+    Write ``{font_name}.ttf`` to ``out_dir`` with only the icons of the font at
+    ``font_path`` referenced by the sources in ``roots`` (or named in ``keep``,
+    by icon name or identifier), then render the matching header, python
+    bindings and examples next to it with :func:`generate.generate` (in
+    ``style``, see :data:`generate.STYLES`, with the icon metrics if ``metrics``
+    is set, the name / codepoint lookups if ``lookup`` is set and the binary icon
+    manifest if ``icon_manifest`` is set).
+
+    References to icons the font does not have are reported in the result, and
+    raise :class:`SubsetError` when ``strict`` is set.  Returns a dict with the
+    keys
+
+    ``ttf`` / ``ttf_written``
+        The path of the subset font, and whether it changed.
+    ``icons`` / ``total_icons``
+        The names of the icons kept, and how many the full font has.
+    ``unknown``
+        ``{identifier: path}`` for the references the font has no icon for.
+    ``files`` / ``scanned_bytes`` / ``scan_seconds``
+        How many source files (and bytes) were scanned, and how long it took.
+    ``full_size`` / ``subset_size``
+        The size of the full and subset font in bytes.
+    ``generate``
+        The result of :func:`generate.generate`.
+    ``seconds``
+        Wall clock time spent.
+    """
+    start = time.time()
+    if not os.path.exists(font_path):
+        raise SubsetError(
+            "[{0}] does not exist.  Make sure you already generated it (with `rake`).".format(
+                font_path
+            )
+        )
+
+    try:
+        icons = ttf.read_icons(font_path)
+        # icons sharing the glyph of another, see svg2ttf.py --dedupe
+        aliases = ttf.read_aliases(font_path)
+    except (IOError, OSError, ttf.TTFError) as e:
+        raise SubsetError("could not read [{0}]: {1}".format(font_path, e)) from e
+    by_identifier = {}
+    for name in [name for name, _ in icons] + sorted(aliases):
+        by_identifier.setdefault(icon_identifier(name), []).append(name)
+
+    # The generated utilities reference every icon, never count them as usage.
+    sources = find_sources(roots, exclude=generated_file_names(font_name))
+    scan_start = time.time()
+    found, scanned_bytes = scan_sources(font_name, sources, jobs=jobs)
+    scan_seconds = time.time() - scan_start
+
+    for name in keep:
+        found.setdefault(icon_identifier(name), "--keep")
+
+    used = set()
+    unknown = {}
+    for identifier, path in found.items():
+        if identifier in by_identifier:
+            used.update(by_identifier[identifier])
+        else:
+            unknown[identifier] = path
+
+    if unknown and strict:
+        raise SubsetError("\n".join(
+            "[{0}] has no icon for {1}_ICON_{2} (used in [{3}]).".format(
+                font_path, font_name.upper(), identifier, path
+            )
+            for identifier, path in sorted(unknown.items())
+        ))
+    if not used:
+        raise SubsetError(
+            "No references to the {0} icons found in [{1}] source files.".format(
+                font_name, len(sources)
+            )
+        )
+
+    try:
+        # an alias needs the icon whose glyph it shares, which the subset then has too
+        glyph_names = set(aliases.get(name, name) for name in used)
+        data = subset_font(font_path, glyph_names, font_name)
+        os.makedirs(out_dir, exist_ok=True)
+        subset_path = os.path.join(out_dir, "{0}.ttf".format(font_name))
+        # Leave an identical font alone, so its mtime does not trigger a rebuild.
+        ttf_written = generate.sha256_of_file(subset_path) != hashlib.sha256(data).hexdigest()
+        if ttf_written:
+            ttf.atomic_write(subset_path, data)
+        used_aliases = dict((name, aliases[name]) for name in used if name in aliases)
+        aliases_path = ttf.aliases_path(subset_path)
+        if used_aliases:
+            aliases_data = ttf.encode_aliases(used_aliases)
+            if generate.sha256_of_file(aliases_path) != hashlib.sha256(aliases_data).hexdigest():
+                ttf.atomic_write(aliases_path, aliases_data)
+        elif os.path.exists(aliases_path):
+            os.remove(aliases_path)
+    except (IOError, OSError, ttf.TTFError) as e:
+        raise SubsetError("could not subset [{0}]: {1}".format(font_path, e)) from e
+
+    try:
+        generated = generate.generate(font_name, subset_path, out_dir, license,
+                                      expected_count=len(used | glyph_names), style=style,
+                                      metrics=metrics, lookup=lookup,
+                                      icon_manifest=icon_manifest)
+    except generate.GenerateError as e:
+        raise SubsetError(str(e)) from e
+
+    return {
+        "ttf": subset_path,
+        "ttf_written": ttf_written,
+        "icons": sorted(used),
+        "total_icons": len(icons) + len(aliases),
+        "unknown": unknown,
+        "files": len(sources),
+        "scanned_bytes": scanned_bytes,
+        "scan_seconds": scan_seconds,
+        "full_size": os.path.getsize(font_path),
+        "subset_size": len(data),
+        "generate": generated,
+        "seconds": time.time() - start
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Subset a compiled font to the icons used by a set of C++ / Python sources."
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="Source directories (searched recursively) or files to scan for icon references."
+    )
+    parser.add_argument(
+        "--font-name",
+        default=generate.FONT_NAME,
+        help="Font to subset (default: {0}).".format(generate.FONT_NAME)
+    )
+    parser.add_argument(
+        "--font",
+        help="The compiled font to subset (default: compiled_fonts/<font>/<font>.ttf)."
+    )
+    parser.add_argument(
+        "--out-dir",
+        help="Where the subset font and utilities are written (default: subset/<font>)."
+    )
+    parser.add_argument(
+        "--license",
+        default=generate.FONT_LICENSE,
+        help="License information for the font (default: the FONT_LICENSE variable in generate.py)."
+    )
+    parser.add_argument(
+        "--keep",
+        action="append",
+        default=[],
+        metavar="ICON",
+        help="Also keep ICON (e.g. one only looked up dynamically), can be repeated."
+    )
+    parser.add_argument(
+        "--style",
+        choices=generate.STYLES,
+        default="define",
+        help="Style of the trimmed header, bindings and example, as in generate.py "
+             "(default: %(default)s)."
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Also emit the advance and bounding box of every kept icon, as in generate.py."
+    )
+    parser.add_argument(
+        "--lookup",
+        action="store_true",
+        help="Also emit the name <-> codepoint lookups of the kept icons, as in generate.py."
+    )
+    parser.add_argument(
+        "--icon-manifest",
+        action="store_true",
+        help="Also write the binary manifest of the kept icons, as in generate.py."
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fail when a source references an icon the font does not have."
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes scanning sources (default: %(default)s)."
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    font_name = args.font_name
+    here = os.path.dirname(os.path.abspath(__file__))
+    font_path = args.font or os.path.join(
+        here, "compiled_fonts", font_name, "{0}.ttf".format(font_name)
+    )
+    out_dir = args.out_dir or os.path.join(here, "subset", font_name)
+    try:
+        result = subset(font_name, font_path, args.sources, out_dir, args.license,
+                        jobs=args.jobs, keep=args.keep, strict=args.strict,
+                        style=args.style, metrics=args.metrics,
+                        lookup=args.lookup, icon_manifest=args.icon_manifest)
+    except SubsetError as e:
+        sys.stderr.write("Critical: {0}\n".format(e))
+        sys.exit(1)
+
+    print("Scanned [{0}] files ({1:.1f} MiB) in {2:.2f}s.".format(
+        result["files"], result["scanned_bytes"] / (1024.0 * 1024.0), result["scan_seconds"]
+    ))
+    for identifier, path in sorted(result["unknown"].items()):
+        sys.stderr.write("Warning: no icon for {0}_ICON_{1} (used in [{2}]).\n".format(
+            font_name.upper(), identifier, os.path.relpath(path) if path != "--keep" else path
+        ))
+    print("Kept [{0}] of [{1}] icons: {2} -> {3} bytes ({4:.0%} smaller).".format(
+        len(result["icons"]), result["total_icons"], result["full_size"],
+        result["subset_size"], 1.0 - result["subset_size"] / float(result["full_size"])
+    ))
+    print("{0} [{1}].".format(
+        "Wrote" if result["ttf_written"] else "Unchanged, skipped", os.path.relpath(result["ttf"])
+    ))
+    for path in result["generate"]["written"]:
+        print("Wrote [{0}].".format(os.path.relpath(path)))
+    for path in result["generate"]["skipped"]:
+        print("Unchanged, skipped [{0}].".format(os.path.relpath(path)))
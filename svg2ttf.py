@@ -0,0 +1,1932 @@
+#!/usr/bin/env python3
+"""
+Compile ``icons/<font>/*.svg`` into ``compiled_fonts/<font>/<font>.ttf`` and the
+matching css, without fontcustom, FontForge or Ruby.  The options are read from
+``config/fontcustom.yml`` (or any config written by ``manufacture.py``), so this
+is a drop in replacement for ``rake``.
+
+Each SVG is converted to a TrueType glyph independently, in a process pool:
+
+1. The ``<path>`` elements and basic shapes are parsed (including arcs and
+   transforms) into cubic / quadratic / line segments.
+2. The outlines are scaled so that the height of the ``viewBox`` is the em, and
+   flipped so that the top of the ``viewBox`` is the ascent.
+3. Cubic curves are approximated by quadratic ones (TrueType only has those).
+
+The glyphs are then assembled by :func:`ttf.build_font`.  Codepoints come from
+the :class:`CodepointRegistry` in ``icons/<font>.codepoints.json``: new icons
+are numbered in sorted name order from ``U+F100`` (as fontcustom does for a
+fresh build), and existing icons keep their codepoint.  Past ``U+F8FF``, the
+numbering continues from ``U+E000`` to ``U+F0FF`` (the rest of the BMP Private Use
+Area), then in the Supplementary Private Use Areas (``U+F0000`` and up).
+"""
+
+import argparse
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import xml.etree.ElementTree as ElementTree
+
+try:
+    import numpy as np
+except ImportError:  # only needed to simplify, reported by simplify_glyphs
+    np = None
+
+import ttf
+
+
+class SVGError(Exception):
+    """Raised when an SVG icon cannot be converted to a glyph."""
+
+
+# The defaults fontcustom uses for options missing from the config.
+DEFAULT_OPTIONS = {
+    "font_em": 512,
+    "font_ascent": 448,
+    "font_descent": 64,
+    "autowidth": False,
+    "no_hash": False,
+    "css_selector": ".icon-{{glyph}}",
+    "preprocessor_path": ""
+}
+
+# The options the fonts merged into one must agree on, those of the merged font.
+MERGED_OPTIONS = ("font_em", "font_ascent", "font_descent", "no_hash")
+
+# fontcustom starts numbering icons here
+FIRST_CODEPOINT = 0xF100
+
+# Maximum distance (in font units) between a cubic curve and the quadratic
+# curves approximating it.
+DEFAULT_TOLERANCE = 0.5
+
+
+########################################################################################
+# config/fontcustom.yml                                                                #
+########################################################################################
+def _yaml_scalar(value):
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    if value in ("true", "false"):
+        return value == "true"
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def read_config(path):
+    """
+    Return the options in a fontcustom config file as a dict.  Only the subset of
+    YAML that fontcustom configs use is understood: ``key: value`` pairs, one
+    level of nested mappings (``input`` / ``output``) and ``- item`` lists.
+    """
+    config = {}
+    parent = None
+    with open(path, "r") as yml:
+        for line in yml:
+            stripped = line.rstrip()
+            if not stripped.strip() or stripped.lstrip().startswith("#"):
+                continue
+
+            indented = line[0] in " \t"
+            if stripped.lstrip().startswith("- "):
+                if parent is None:
+                    raise ValueError("[{0}]: list item without a key: {1}".format(path, line))
+                if not isinstance(config[parent], list):
+                    config[parent] = []
+                config[parent].append(_yaml_scalar(stripped.lstrip()[2:]))
+                continue
+
+            key, sep, value = stripped.strip().partition(":")
+            if not sep:
+                raise ValueError("[{0}]: cannot parse line: {1}".format(path, line))
+            if indented and parent is not None:
+                config[parent][key.strip()] = _yaml_scalar(value)
+            elif value.strip():
+                config[key.strip()] = _yaml_scalar(value)
+                parent = None
+            else:
+                config[key.strip()] = {}
+                parent = key.strip()
+    return config
+
+
+def font_options(config):
+    """The :data:`DEFAULT_OPTIONS`, with those set in the fontcustom ``config`` instead."""
+    options = dict(DEFAULT_OPTIONS)
+    options.update((k, v) for k, v in config.items() if k in DEFAULT_OPTIONS)
+    return options
+
+
+def config_svg_dir(config, font_name, root):
+    """The directory of the icons of ``font_name`` in the fontcustom ``config``."""
+    # input is either one directory, or a mapping of directories
+    svg_dir = config.get("input", "icons/{0}".format(font_name))
+    if isinstance(svg_dir, dict):
+        svg_dir = svg_dir["vectors"]
+    return os.path.join(root, svg_dir)
+
+
+def _font_stem(font_name, font, options):
+    """The name of the ``.ttf`` of ``font`` (bytes) without its extension."""
+    # Without no_hash fontcustom adds the content hash to the file names, so that
+    # browsers never use a stale font
+    if options["no_hash"]:
+        return font_name
+    return "{0}_{1}".format(font_name, hashlib.md5(font).hexdigest())
+
+
+def _remove_replaced_outputs(fonts_dir, font_name, ttf_path):
+    """
+    Remove the other fonts of ``font_name`` in ``fonts_dir`` than ``ttf_path``:
+    those of earlier compiles (with another content hash), and the ``.woff``,
+    ``.woff2``, ``.eot``, ``.svg``, ``-preview.html`` and ``.scss`` fontcustom
+    writes next to them, which describe another font.  Returns the paths removed.
+    """
+    replaced = re.compile(
+        r"^(?:{0}(?:_[0-9a-f]{{32}})?(?:\.ttf|\.woff2?|\.eot|\.svg|-preview\.html)"
+        r"|_{0}\.scss)$".format(re.escape(font_name))
+    )
+    removed = []
+    for entry in sorted(os.listdir(fonts_dir)):
+        path = os.path.join(fonts_dir, entry)
+        if not replaced.match(entry) or os.path.normcase(path) == os.path.normcase(ttf_path):
+            continue
+        for stale in (path, ttf.aliases_path(path)) if entry.endswith(".ttf") else (path,):
+            if os.path.exists(stale):
+                os.remove(stale)
+                removed.append(stale)
+    return removed
+
+
+########################################################################################
+# SVG parsing                                                                          #
+########################################################################################
+_NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_SEPARATOR_RE = re.compile(r"[\s,]*")
+_COMMAND_RE = re.compile(r"[\s,]*([MmZzLlHhVvCcSsQqTtAa])")
+
+
+class _PathLexer(object):
+    """Reads numbers, arc flags and commands from SVG path data."""
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def at_end(self):
+        self.pos = _SEPARATOR_RE.match(self.data, self.pos).end()
+        return self.pos >= len(self.data)
+
+    def command(self):
+        match = _COMMAND_RE.match(self.data, self.pos)
+        if match is None:
+            return None
+        self.pos = match.end()
+        return match.group(1)
+
+    def number(self):
+        self.pos = _SEPARATOR_RE.match(self.data, self.pos).end()
+        match = _NUMBER_RE.match(self.data, self.pos)
+        if match is None:
+            raise SVGError("expected a number at offset {0} of path data".format(self.pos))
+        self.pos = match.end()
+        return float(match.group(0))
+
+    def flag(self):
+        # Arc flags are a single 0 or 1 and need no separator: "a1 1 0 00-1 1"
+        self.pos = _SEPARATOR_RE.match(self.data, self.pos).end()
+        if self.pos >= len(self.data) or self.data[self.pos] not in "01":
+            raise SVGError("expected an arc flag at offset {0} of path data".format(self.pos))
+        self.pos += 1
+        return self.data[self.pos - 1] == "1"
+
+
+def arc_to_cubics(p0, rx, ry, rotation, large_arc, sweep, p1):
+    """
+    Return the cubic segments ``[(c1, c2, end), ...]`` approximating an SVG
+    elliptical arc from ``p0`` to ``p1`` (SVG 1.1 implementation notes F.6).
+    """
+    x0, y0 = p0
+    x1, y1 = p1
+    if p0 == p1:
+        return []
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0:
+        return [(p0, p1, p1)]
+
+    phi = math.radians(rotation % 360)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    dx, dy = (x0 - x1) / 2.0, (y0 - y1) / 2.0
+    x0p = cos_phi * dx + sin_phi * dy
+    y0p = -sin_phi * dx + cos_phi * dy
+
+    # Scale the radii up if there is no ellipse through both points
+    radii = (x0p * x0p) / (rx * rx) + (y0p * y0p) / (ry * ry)
+    if radii > 1:
+        rx *= math.sqrt(radii)
+        ry *= math.sqrt(radii)
+
+    numerator = rx * rx * ry * ry - rx * rx * y0p * y0p - ry * ry * x0p * x0p
+    denominator = rx * rx * y0p * y0p + ry * ry * x0p * x0p
+    coef = math.sqrt(max(numerator / denominator, 0.0))
+    if large_arc == sweep:
+        coef = -coef
+    cxp = coef * rx * y0p / ry
+    cyp = -coef * ry * x0p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (x0 + x1) / 2.0
+    cy = sin_phi * cxp + cos_phi * cyp + (y0 + y1) / 2.0
+
+    def angle(ux, uy, vx, vy):
+        return math.atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+
+    theta = angle(1, 0, (x0p - cxp) / rx, (y0p - cyp) / ry)
+    delta = angle((x0p - cxp) / rx, (y0p - cyp) / ry, (-x0p - cxp) / rx, (-y0p - cyp) / ry)
+    if not sweep and delta > 0:
+        delta -= 2 * math.pi
+    elif sweep and delta < 0:
+        delta += 2 * math.pi
+
+    # At most a quarter turn per cubic keeps the error tiny
+    count = max(int(math.ceil(abs(delta) / (math.pi / 2) - 1e-9)), 1)
+    step = delta / count
+    k = 4.0 / 3.0 * math.tan(step / 4)
+
+    def point(t):
+        cos_t, sin_t = math.cos(t), math.sin(t)
+        return (cx + rx * cos_phi * cos_t - ry * sin_phi * sin_t,
+                cy + rx * sin_phi * cos_t + ry * cos_phi * sin_t)
+
+    def derivative(t):
+        cos_t, sin_t = math.cos(t), math.sin(t)
+        return (-rx * cos_phi * sin_t - ry * sin_phi * cos_t,
+                -rx * sin_phi * sin_t + ry * cos_phi * cos_t)
+
+    cubics = []
+    start = p0
+    for i in range(count):
+        t0 = theta + i * step
+        t1 = t0 + step
+        d0, d1 = derivative(t0), derivative(t1)
+        end = p1 if i == count - 1 else point(t1)
+        cubics.append((
+            (start[0] + k * d0[0], start[1] + k * d0[1]),
+            (end[0] - k * d1[0], end[1] - k * d1[1]),
+            end
+        ))
+        start = end
+    return cubics
+
+
+def parse_path(data):
+    """
+    Parse SVG path data into a list of subpaths.  Each subpath is
+    ``(start, segments, closed)`` where ``segments`` holds ``("L", p)``,
+    ``("Q", c, p)`` and ``("C", c1, c2, p)`` tuples in absolute coordinates.
+    """
+    lexer = _PathLexer(data)
+    subpaths = []
+    segments = None
+    start = current = (0.0, 0.0)
+    last_control = None  # reflected by S / T
+    last_command = None
+
+    def finish(closed):
+        if segments:
+            subpaths.append((start, segments, closed))
+
+    while not lexer.at_end():
+        command = lexer.command()
+        if command is None:
+            # implicit repetition of the previous command
+            if last_command is None:
+                raise SVGError("path data does not start with a command")
+            command = {"M": "L", "m": "l"}.get(last_command, last_command)
+            if command in "Zz":
+                raise SVGError("unexpected number after a closepath")
+        relative = command.islower()
+        op = command.upper()
+
+        def xy():
+            x, y = lexer.number(), lexer.number()
+            if relative:
+                return (current[0] + x, current[1] + y)
+            return (x, y)
+
+        if op == "Z":
+            if segments:
+                finish(True)
+            segments = None
+            current = start
+            last_control = None
+        elif op == "M":
+            if segments:
+                finish(False)
+            segments = []
+            current = start = xy()
+            last_control = None
+        else:
+            if segments is None:
+                # drawing after a closepath continues from the subpath start
+                segments = []
+                start = current
+            if op == "L":
+                current = xy()
+                segments.append(("L", current))
+                last_control = None
+            elif op == "H":
+                x = lexer.number()
+                current = (current[0] + x if relative else x, current[1])
+                segments.append(("L", current))
+                last_control = None
+            elif op == "V":
+                y = lexer.number()
+                current = (current[0], current[1] + y if relative else y)
+                segments.append(("L", current))
+                last_control = None
+            elif op == "C":
+                c1, c2, p = xy(), xy(), xy()
+                segments.append(("C", c1, c2, p))
+                current, last_control = p, ("C", c2)
+            elif op == "S":
+                c1 = current
+                if last_control is not None and last_control[0] == "C":
+                    c1 = (2 * current[0] - last_control[1][0], 2 * current[1] - last_control[1][1])
+                c2, p = xy(), xy()
+                segments.append(("C", c1, c2, p))
+                current, last_control = p, ("C", c2)
+            elif op == "Q":
+                c, p = xy(), xy()
+                segments.append(("Q", c, p))
+                current, last_control = p, ("Q", c)
+            elif op == "T":
+                c = current
+                if last_control is not None and last_control[0] == "Q":
+                    c = (2 * current[0] - last_control[1][0], 2 * current[1] - last_control[1][1])
+                p = xy()
+                segments.append(("Q", c, p))
+                current, last_control = p, ("Q", c)
+            elif op == "A":
+                rx, ry, rotation = lexer.number(), lexer.number(), lexer.number()
+                large_arc, sweep = lexer.flag(), lexer.flag()
+                p = xy()
+                for c1, c2, end in arc_to_cubics(current, rx, ry, rotation, large_arc, sweep, p):
+                    segments.append(("C", c1, c2, end))
+                current = p
+                last_control = None
+        last_command = command
+
+    if segments:
+        finish(False)
+    return subpaths
+
+
+_TRANSFORM_RE = re.compile(r"(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)")
+
+
+def _multiply(a, b):
+    """Compose the affine matrices ``(a, b, c, d, e, f)``: ``a`` after ``b``."""
+    return (
+        a[0] * b[0] + a[2] * b[1], a[1] * b[0] + a[3] * b[1],
+        a[0] * b[2] + a[2] * b[3], a[1] * b[2] + a[3] * b[3],
+        a[0] * b[4] + a[2] * b[5] + a[4], a[1] * b[4] + a[3] * b[5] + a[5]
+    )
+
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def parse_transform(value):
+    """Return the affine matrix ``(a, b, c, d, e, f)`` of an SVG ``transform``."""
+    matrix = IDENTITY
+    for name, args in _TRANSFORM_RE.findall(value or ""):
+        values = [float(v) for v in _NUMBER_RE.findall(args)]
+        if name == "matrix" and len(values) == 6:
+            m = tuple(values)
+        elif name == "translate" and values:
+            m = (1, 0, 0, 1, values[0], values[1] if len(values) > 1 else 0)
+        elif name == "scale" and values:
+            m = (values[0], 0, 0, values[1] if len(values) > 1 else values[0], 0, 0)
+        elif name == "rotate" and values:
+            a = math.radians(values[0])
+            m = (math.cos(a), math.sin(a), -math.sin(a), math.cos(a), 0, 0)
+            if len(values) == 3:
+                cx, cy = values[1], values[2]
+                m = _multiply((1, 0, 0, 1, cx, cy), _multiply(m, (1, 0, 0, 1, -cx, -cy)))
+        elif name == "skewX" and values:
+            m = (1, 0, math.tan(math.radians(values[0])), 1, 0, 0)
+        elif name == "skewY" and values:
+            m = (1, math.tan(math.radians(values[0])), 0, 1, 0, 0)
+        else:
+            raise SVGError("invalid transform: {0}({1})".format(name, args))
+        matrix = _multiply(matrix, m)
+    return matrix
+
+
+def _length(value, default=0.0):
+    if value is None:
+        return default
+    match = _NUMBER_RE.match(value.strip())
+    if match is None:
+        raise SVGError("invalid length: {0}".format(value))
+    return float(match.group(0))
+
+
+def _shape_path(tag, element):
+    """Return equivalent path data for the SVG basic shapes, ``None`` otherwise."""
+    get = element.get
+    if tag == "path":
+        return get("d", "")
+    if tag == "rect":
+        x, y = _length(get("x")), _length(get("y"))
+        w, h = _length(get("width")), _length(get("height"))
+        rx, ry = get("rx"), get("ry")
+        rx = _length(rx if rx is not None else ry)
+        ry = _length(ry if ry is not None else get("rx"))
+        rx, ry = min(rx, w / 2), min(ry, h / 2)
+        if w <= 0 or h <= 0:
+            return ""
+        if rx <= 0 or ry <= 0:
+            return "M{0} {1}h{2}v{3}h{4}z".format(x, y, w, h, -w)
+        return ("M{x0} {y}H{x1}A{rx} {ry} 0 0 1 {x2} {y0}V{y1}A{rx} {ry} 0 0 1 {x1} {y2}"
+                "H{x0}A{rx} {ry} 0 0 1 {x} {y1}V{y0}A{rx} {ry} 0 0 1 {x0} {y}z").format(
+            x=x, y=y, rx=rx, ry=ry, x0=x + rx, x1=x + w - rx, x2=x + w,
+            y0=y + ry, y1=y + h - ry, y2=y + h
+        )
+    if tag in ("circle", "ellipse"):
+        cx, cy = _length(get("cx")), _length(get("cy"))
+        if tag == "circle":
+            rx = ry = _length(get("r"))
+        else:
+            rx, ry = _length(get("rx")), _length(get("ry"))
+        if rx <= 0 or ry <= 0:
+            return ""
+        return "M{0} {1}A{2} {3} 0 1 0 {4} {1}A{2} {3} 0 1 0 {0} {1}z".format(
+            cx - rx, cy, rx, ry, cx + rx
+        )
+    if tag in ("polygon", "polyline"):
+        points = _NUMBER_RE.findall(get("points", ""))
+        if len(points) < 4:
+            return ""
+        pairs = ["{0} {1}".format(points[i], points[i + 1]) for i in range(0, len(points) - 1, 2)]
+        # polylines are filled like polygons, fonts have no strokes
+        return "M" + "L".join(pairs) + "z"
+    return None
+
+
+# Elements whose content is never drawn directly.
+_SKIPPED_ELEMENTS = set([
+    "defs", "clipPath", "mask", "symbol", "style", "title", "desc", "metadata",
+    "linearGradient", "radialGradient", "pattern", "marker", "filter", "script"
+])
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def read_svg(data):
+    """
+    Parse the bytes of an SVG file.  Returns ``(view_box, shapes)`` where
+    ``view_box`` is ``(x, y, width, height)`` and ``shapes`` is a list of
+    ``(subpaths, evenodd)`` in viewBox coordinates (transforms applied).
+    """
+    try:
+        root = ElementTree.fromstring(data)
+    except ElementTree.ParseError as e:
+        raise SVGError("not well formed: {0}".format(e))
+    if _local(root.tag) != "svg":
+        raise SVGError("the root element is <{0}>, not <svg>".format(_local(root.tag)))
+
+    view_box = root.get("viewBox")
+    if view_box:
+        values = [float(v) for v in _NUMBER_RE.findall(view_box)]
+        if len(values) != 4 or values[2] <= 0 or values[3] <= 0:
+            raise SVGError("invalid viewBox: {0}".format(view_box))
+        view_box = tuple(values)
+    else:
+        width, height = _length(root.get("width"), 0), _length(root.get("height"), 0)
+        if width <= 0 or height <= 0:
+            raise SVGError("no viewBox, width or height")
+        view_box = (0.0, 0.0, width, height)
+
+    shapes = []
+
+    def visit(element, matrix, fill, fill_rule):
+        tag = _local(element.tag)
+        if tag in _SKIPPED_ELEMENTS:
+            return
+        style = dict(
+            (k.strip(), v.strip()) for k, _, v in
+            (item.partition(":") for item in element.get("style", "").split(";")) if k.strip()
+        )
+        fill = style.get("fill", element.get("fill", fill))
+        fill_rule = style.get("fill-rule", element.get("fill-rule", fill_rule))
+        if style.get("display", element.get("display")) == "none":
+            return
+        matrix = _multiply(matrix, parse_transform(element.get("transform")))
+
+        path_data = _shape_path(tag, element)
+        if path_data is not None:
+            if fill != "none":
+                subpaths = parse_path(path_data)
+                if matrix != IDENTITY:
+                    subpaths = [_transform_subpath(subpath, matrix) for subpath in subpaths]
+                if subpaths:
+                    shapes.append((subpaths, fill_rule == "evenodd"))
+            return
+        for child in element:
+            visit(child, matrix, fill, fill_rule)
+
+    visit(root, IDENTITY, None, "nonzero")
+    return view_box, shapes
+
+
+def _transform_subpath(subpath, matrix):
+    a, b, c, d, e, f = matrix
+
+    def apply(p):
+        return (a * p[0] + c * p[1] + e, b * p[0] + d * p[1] + f)
+
+    start, segments, closed = subpath
+    return (
+        apply(start),
+        [(segment[0],) + tuple(apply(p) for p in segment[1:]) for segment in segments],
+        closed
+    )
+
+
+def check_svg(data):
+    """
+    Check the bytes of an SVG icon without converting it.  Returns ``(errors,
+    warnings)``, lists of messages: ``errors`` are whatever :func:`read_svg`
+    rejects (malformed XML, an invalid viewBox, transform or path), transforms it
+    would ignore, and embedded raster images, which a font cannot hold.
+    ``warnings`` are a missing viewBox (the icon is then scaled by its width and
+    height), transforms that flatten what they apply to, and icons that draw
+    nothing.  Nothing is normalized: :func:`read_svg` applies the viewBox and
+    transforms when the icon is converted.
+    """
+    try:
+        _, shapes = read_svg(data)
+    except (SVGError, ValueError) as e:
+        return [str(e)], []
+
+    errors = []
+    warnings = []
+    root = ElementTree.fromstring(data)
+    if not root.get("viewBox"):
+        warnings.append("no viewBox, scaled by its width and height")
+    images = sum(1 for element in root.iter() if _local(element.tag) == "image")
+    if images:
+        errors.append("embeds {0} raster <image> element(s), which a font cannot hold".format(
+            images
+        ))
+    for element in root.iter():
+        transform = element.get("transform")
+        if transform is None:
+            continue
+        # parse_transform skips over what it does not recognize
+        if _TRANSFORM_RE.sub("", transform).strip(" \t\r\n,"):
+            errors.append("invalid transform of <{0}>: {1}".format(_local(element.tag), transform))
+            continue
+        a, b, c, d, _, _ = parse_transform(transform)
+        if abs(a * d - b * c) < 1e-12:
+            warnings.append("the transform of <{0}> flattens it: {1}".format(
+                _local(element.tag), element.get("transform")
+            ))
+    if not shapes:
+        warnings.append("draws nothing")
+    return errors, warnings
+
+
+########################################################################################
+# Outline conversion                                                                   #
+########################################################################################
+def cubic_to_quadratics(p0, p1, p2, p3, tolerance):
+    """
+    Approximate the cubic ``p0 p1 p2 p3`` by ``n`` quadratics of equal parameter
+    length, with ``n`` chosen so the error stays below ``tolerance``.  Returns
+    ``[(control, end), ...]``.
+    """
+    # The error of the midpoint approximation of one cubic piece is bounded by
+    # sqrt(3) / 36 * |p3 - 3 p2 + 3 p1 - p0| and shrinks with n ** 3.
+    dx = p3[0] - 3 * p2[0] + 3 * p1[0] - p0[0]
+    dy = p3[1] - 3 * p2[1] + 3 * p1[1] - p0[1]
+    error = math.sqrt(3) / 36 * math.hypot(dx, dy)
+    n = max(int(math.ceil((error / tolerance) ** (1.0 / 3.0))), 1) if error > 0 else 1
+
+    quads = []
+    for i in range(n):
+        t0, t1 = float(i) / n, float(i + 1) / n
+        q0, q1, q2, q3 = _cubic_piece(p0, p1, p2, p3, t0, t1)
+        control = ((3 * (q1[0] + q2[0]) - q0[0] - q3[0]) / 4.0,
+                   (3 * (q1[1] + q2[1]) - q0[1] - q3[1]) / 4.0)
+        quads.append((control, q3))
+    return quads
+
+
+def _cubic_piece(p0, p1, p2, p3, t0, t1):
+    """The control points of the part of a cubic between ``t0`` and ``t1``."""
+    def point(t):
+        mt = 1 - t
+        return tuple(
+            mt * mt * mt * a + 3 * mt * mt * t * b + 3 * mt * t * t * c + t * t * t * d
+            for a, b, c, d in zip(p0, p1, p2, p3)
+        )
+
+    def derivative(t):
+        mt = 1 - t
+        return tuple(
+            3 * mt * mt * (b - a) + 6 * mt * t * (c - b) + 3 * t * t * (d - c)
+            for a, b, c, d in zip(p0, p1, p2, p3)
+        )
+
+    scale = (t1 - t0) / 3.0
+    q0, q3 = point(t0), point(t1)
+    d0, d1 = derivative(t0), derivative(t1)
+    q1 = (q0[0] + scale * d0[0], q0[1] + scale * d0[1])
+    q2 = (q3[0] - scale * d1[0], q3[1] - scale * d1[1])
+    return q0, q1, q2, q3
+
+
+def _signed_area(points):
+    area = 0.0
+    for i in range(len(points)):
+        x0, y0 = points[i - 1][:2]
+        x1, y1 = points[i][:2]
+        area += x0 * y1 - x1 * y0
+    return area / 2.0
+
+
+def _inside(point, polygon):
+    """Even-odd point in polygon test."""
+    x, y = point[:2]
+    inside = False
+    for i in range(len(polygon)):
+        x0, y0 = polygon[i - 1][:2]
+        x1, y1 = polygon[i][:2]
+        if (y0 > y) != (y1 > y) and x < x0 + (y - y0) * (x1 - x0) / (y1 - y0):
+            inside = not inside
+    return inside
+
+
+def _contour(start, segments, transform, tolerance):
+    """Convert one subpath to TrueType ``(x, y, on_curve)`` points."""
+    points = [(transform(start), True)]
+    current = start
+    for segment in segments:
+        if segment[0] == "L":
+            points.append((transform(segment[1]), True))
+        elif segment[0] == "Q":
+            points.append((transform(segment[1]), False))
+            points.append((transform(segment[2]), True))
+        else:
+            for control, end in cubic_to_quadratics(current, segment[1], segment[2],
+                                                    segment[3], tolerance):
+                points.append((transform(control), False))
+                points.append((transform(end), True))
+        current = segment[-1]
+
+    # Round to the font grid, then drop duplicates and the on-curve points that
+    # TrueType implies between two off-curve points.
+    rounded = []
+    for (x, y), on_curve in points:
+        point = (int(round(x)), int(round(y)), on_curve)
+        if rounded and rounded[-1][:2] == point[:2] and rounded[-1][2] and on_curve:
+            continue
+        rounded.append(point)
+    while len(rounded) > 1 and rounded[-1][:2] == rounded[0][:2] and rounded[-1][2]:
+        rounded.pop()
+
+    # The first point (where the subpath starts) is always kept on-curve.
+    contour = rounded[:1]
+    count = len(rounded)
+    for i in range(1, count):
+        point = rounded[i]
+        before, after = rounded[i - 1], rounded[(i + 1) % count]
+        if (point[2] and not before[2] and not after[2] and
+                before[0] + after[0] == 2 * point[0] and
+                before[1] + after[1] == 2 * point[1]):
+            continue
+        contour.append(point)
+    return contour
+
+
+def svg_to_glyph(name, data, options, tolerance=DEFAULT_TOLERANCE):
+    """
+    Convert the bytes of one SVG icon to a :class:`ttf.Glyph` (without a
+    codepoint), laid out the way fontcustom's FontForge script does.
+    """
+    view_box, shapes = read_svg(data)
+    vb_x, vb_y, _, vb_height = view_box
+    em = options["font_em"]
+    ascent = options["font_ascent"]
+    scale = float(em) / vb_height
+
+    def transform(p):
+        return ((p[0] - vb_x) * scale, ascent - (p[1] - vb_y) * scale)
+
+    contours = []
+    for subpaths, evenodd in shapes:
+        shape = []
+        for start, segments, _ in subpaths:
+            contour = _contour(start, segments, transform, tolerance)
+            if len(contour) >= 3:
+                shape.append(contour)
+        if not shape:
+            continue
+
+        # TrueType fills with the non-zero rule, outer contours clockwise.  For
+        # even-odd shapes every contour is oriented by its nesting depth; for
+        # non-zero ones the relative directions matter, so the whole shape is
+        # only reversed when its largest contour runs counter clockwise.
+        areas = [_signed_area(contour) for contour in shape]
+        if evenodd:
+            for i, contour in enumerate(shape):
+                depth = sum(
+                    1 for j, other in enumerate(shape)
+                    if j != i and abs(areas[j]) > abs(areas[i]) and _inside(contour[0], other)
+                )
+                clockwise = depth % 2 == 0
+                if (areas[i] < 0) != clockwise:
+                    contour.reverse()
+        else:
+            largest = max(range(len(shape)), key=lambda i: abs(areas[i]))
+            if areas[largest] > 0:
+                for contour in shape:
+                    contour.reverse()
+        contours.extend(shape)
+
+    glyph = ttf.Glyph(name, None, contours, em)
+    if not contours:
+        return glyph
+
+    x_min, _, x_max, _ = glyph.bounds()
+    if options["autowidth"]:
+        shift = x_min
+        glyph.advance = x_max - x_min
+    else:
+        # Like fontcustom: glyphs whose width is a multiple of a "design pixel"
+        # (1/16 em) are moved left onto the pixel grid.
+        design_px = em // 16
+        shift = x_min % design_px if (x_max - x_min) % design_px == 0 else 0
+    if shift:
+        glyph.contours = [[(x - shift, y, on) for x, y, on in c] for c in contours]
+    return glyph
+
+
+def _compile_svg(job):
+    """Process pool entry point: ``job`` is ``(name, path, data, options, tolerance)``."""
+    name, path, data, options, tolerance = job
+    try:
+        return svg_to_glyph(name, data, options, tolerance), None
+    except (SVGError, ValueError) as e:
+        return None, "[{0}]: {1}".format(path, e)
+
+
+########################################################################################
+# Simplification                                                                       #
+########################################################################################
+# --simplify tolerance in font units: 1/256 em with the default font_em, under a
+# quarter of a pixel for icons of up to 64 pixels
+DEFAULT_SIMPLIFY_TOLERANCE = 2.0
+
+
+def simplify_glyphs(glyphs, tolerance=DEFAULT_SIMPLIFY_TOLERANCE):
+    """
+    Remove the points of the ``glyphs`` (:class:`ttf.Glyph`, changed in place)
+    that move the outline by at most ``tolerance`` font units: on-curve points
+    between two on-curve points they are (nearly) in line with, and the control
+    point of a quadratic that is (nearly) straight, which becomes a line.  The
+    points stay on the font grid, the first point and at least three points of
+    every contour are kept.  Every pass removes at most every other point of a
+    run of removable points, until nothing more can go; the error every segment
+    already carries counts against the tolerance, so that removals do not add up
+    to more than it.  The points of all glyphs are processed at once with NumPy.
+    Returns ``(before, after)``, the number of points.
+    """
+    if np is None:
+        raise SVGError("NumPy is needed to simplify the outlines: `pip install numpy`.")
+    if tolerance <= 0:
+        raise SVGError("the simplification tolerance must be positive")
+
+    contours = [contour for glyph in glyphs for contour in glyph.contours]
+    lengths = np.array([len(contour) for contour in contours], dtype=np.intp)
+    points = np.array(
+        [point for contour in contours for point in contour], dtype=np.int64
+    ).reshape(-1, 3)
+    before = len(points)
+    contour_of = np.repeat(np.arange(len(contours)), lengths)
+    # How far the segment ending at every point may be from the original outline
+    error = np.zeros(len(points))
+
+    while len(points):
+        starts = np.cumsum(lengths) - lengths
+        index = np.arange(len(points))
+        start = starts[contour_of]
+        position = index - start
+        length = lengths[contour_of]
+        previous = points[start + (position - 1) % length]
+        after = start + (position + 1) % length
+        following = points[after]
+
+        x, y, on = points[:, 0], points[:, 1], points[:, 2].astype(bool)
+        ax, ay = previous[:, 0], previous[:, 1]
+        bx, by = following[:, 0], following[:, 1]
+        chord_x, chord_y = (bx - ax).astype(np.float64), (by - ay).astype(np.float64)
+        chord = chord_x * chord_x + chord_y * chord_y
+        safe = np.where(chord > 0, chord, 1)
+        along = ((x - ax) * chord_x + (y - ay) * chord_y) / safe
+        distance = np.where(
+            chord > 0,
+            np.abs(chord_x * (y - ay) - chord_y * (x - ax)) / np.sqrt(safe),
+            np.hypot(x - ax, y - ay)
+        )
+        # A quadratic is at most half as far from its chord as its control point
+        merged = np.where(on, distance, distance / 2) + np.maximum(error, error[after])
+        removable = (
+            previous[:, 2].astype(bool) & following[:, 2].astype(bool) &
+            (along >= 0) & (along <= 1) & (position > 0) & (merged <= tolerance)
+        )
+
+        # Only every other point of a run, the rest is measured again next pass
+        run_start = removable & ~np.concatenate(([False], removable[:-1]))
+        nth = index - np.maximum.accumulate(np.where(run_start, index, 0))
+        remove = removable & (nth % 2 == 0)
+        left = lengths - np.bincount(contour_of[remove], minlength=len(lengths))
+        remove &= (left >= 3)[contour_of]
+        if not remove.any():
+            break
+        error[after[remove]] = merged[remove]
+        keep = ~remove
+        points = points[keep]
+        error = error[keep]
+        contour_of = contour_of[keep]
+        lengths = np.bincount(contour_of, minlength=len(lengths))
+
+    rows = points.tolist()
+    contour = 0
+    offset = 0
+    for glyph in glyphs:
+        simplified = []
+        for _ in glyph.contours:
+            count = int(lengths[contour])
+            simplified.append([(x, y, bool(on)) for x, y, on in rows[offset:offset + count]])
+            contour += 1
+            offset += count
+        glyph.contours = simplified
+    return before, len(points)
+
+
+def _simplify(glyphs, tolerance):
+    """:func:`simplify_glyphs` if ``tolerance`` is set, returns the points before and after."""
+    if tolerance:
+        return simplify_glyphs(glyphs, tolerance)
+    points = sum(len(contour) for glyph in glyphs for contour in glyph.contours)
+    return points, points
+
+
+def simplify_report(config, tolerances, jobs=None):
+    """
+    Compile the font of ``config`` into a temporary directory without simplifying,
+    then simplified with each of ``tolerances``.  Every glyph is converted once
+    up front, so the times compare simplifying and assembling the font.  Returns
+    ``[(tolerance, points, ttf_bytes, simplify_seconds, seconds), ...]``,
+    the first with a ``tolerance`` of ``None``.
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    results = []
+    scratch = tempfile.mkdtemp(prefix="svg2ttf-simplify-")
+    try:
+        timed = dict(config)
+        timed["output"] = {"fonts": scratch, "css": scratch}
+        registry = os.path.join(scratch, "codepoints.json")
+        cache = GlyphCache(os.path.join(scratch, "cache"))
+        compile_font(timed, jobs=jobs, root=root, cache=cache, registry_file=registry)
+        for tolerance in [None] + list(tolerances):
+            result = compile_font(timed, jobs=jobs, root=root, cache=cache,
+                                  registry_file=registry, simplify=tolerance)
+            results.append((tolerance, result["points"], os.path.getsize(result["ttf"]),
+                            result["simplify_seconds"], result["seconds"]))
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return results
+
+
+########################################################################################
+# Duplicate glyphs                                                                     #
+########################################################################################
+def outline_key(glyph):
+    """
+    The sha256 of the outline and advance of ``glyph``, normalized so that glyphs
+    only differing in the point each contour starts at, or in the order of their
+    contours, have the same key.
+    """
+    contours = []
+    for contour in glyph.contours:
+        if not contour:
+            continue
+        points = [(x, y, bool(on)) for x, y, on in contour]
+        start = min(range(len(points)), key=points.__getitem__)
+        contours.append(tuple(points[start:] + points[:start]))
+    contours.sort()
+    return hashlib.sha256(repr((glyph.advance, contours)).encode("ascii")).digest()
+
+
+def dedupe_glyphs(glyphs, existing=None):
+    """
+    Return ``(unique, aliases)``: the ``glyphs`` to keep, and ``{alias: name}``
+    naming, for each of the others, the kept glyph with the same outline (see
+    :func:`outline_key`) whose codepoint it shares.
+
+    ``existing`` is the ``{name: (codepoint, rank)}`` of
+    :meth:`CodepointRegistry.existing`, so that deduping never gives an icon a
+    new codepoint: the glyphs of a codepoint already given out stay, the one
+    owning it (lowest rank) named by it, and only new icons become aliases (of
+    the icon with the lowest codepoint).  A codepoint claimed by two different
+    outlines (an alias whose icon changed) stays with the outline of its owner.
+    Without ``existing``, the first glyph of each outline is kept.
+    """
+    existing = existing or {}
+    order = dict((glyph.name, index) for index, glyph in enumerate(glyphs))
+    keys = dict((glyph.name, outline_key(glyph)) for glyph in glyphs)
+    claims = {}
+    for glyph in glyphs:
+        code, rank = existing.get(glyph.name, (None, None))
+        if code is not None:
+            claims[code] = min(claims.get(code, (rank, order[glyph.name], keys[glyph.name])),
+                               (rank, order[glyph.name], keys[glyph.name]))
+
+    groups = {}
+    for glyph in glyphs:
+        code, rank = existing.get(glyph.name, (None, None))
+        if code is not None and claims[code][2] != keys[glyph.name]:
+            code = None
+        groups.setdefault(keys[glyph.name], {}).setdefault(code, []).append(
+            ((rank, order[glyph.name]), glyph.name)
+        )
+
+    aliases = {}
+    for by_code in groups.values():
+        new = sorted(by_code.pop(None, []))
+        names = [min(members)[1] for _, members in sorted(by_code.items())]
+        for members in by_code.values():
+            for _, name in sorted(members)[1:]:
+                aliases[name] = min(members)[1]
+        if not names:
+            names.append(new.pop(0)[1])
+        for _, name in new:
+            aliases[name] = names[0]
+    return [glyph for glyph in glyphs if glyph.name not in aliases], aliases
+
+
+def _write_aliases(ttf_path, aliases):
+    """Write the :func:`ttf.aliases_path` of ``ttf_path``, or remove it without ``aliases``."""
+    path = ttf.aliases_path(ttf_path)
+    if aliases:
+        ttf.atomic_write(path, ttf.encode_aliases(aliases))
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+########################################################################################
+# Glyph cache                                                                          #
+########################################################################################
+# Bump whenever the conversion changes, so that stale outlines are never reused.
+CACHE_VERSION = 1
+CACHE_MAGIC = b"S2TG"
+DEFAULT_CACHE_DIR = ".svg2ttf-cache"
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+# glyphs a GlyphCache keeps in memory, a few times the icons of every font
+DEFAULT_MEMORY_ENTRIES = 8192
+
+
+class GlyphCache(object):
+    """
+    An on-disk cache of converted glyphs, keyed by the sha256 of the SVG bytes
+    and of the options that change the outlines.  Every entry is one file
+    holding the advance and the encoded ``glyf`` data, so entries are tiny and
+    written atomically (several builds may share one cache).
+
+    The modification time of an entry is refreshed on every hit, and once the
+    cache holds more than ``max_bytes`` the least recently used entries are
+    removed by :meth:`evict`.  With ``memory``, the last glyphs read or written
+    (``memory`` of them, or ``DEFAULT_MEMORY_ENTRIES`` when ``True``) are also
+    kept in memory, so that a long running build (``manufacture.py --watch``)
+    does not read the entries of unchanged icons again.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_CACHE_SIZE, memory=False):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # key -> (contours, advance) by least recent use, callers may rename or
+        # re-outline the glyphs they get but never change the contours in place
+        self.memory = OrderedDict() if memory else None
+        self.memory_entries = DEFAULT_MEMORY_ENTRIES if memory is True else memory
+        # only a write grows the cache, see evict()
+        self.written = False
+
+    @staticmethod
+    def key(data, options, tolerance):
+        digest = hashlib.sha256(data)
+        digest.update("|{0}|{1}|{2}|{3}|{4}".format(
+            CACHE_VERSION, options["font_em"], options["font_ascent"],
+            options["autowidth"], tolerance
+        ).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    def get(self, key, name):
+        """Return the cached :class:`ttf.Glyph` named ``name``, or ``None``."""
+        if self.memory is not None and key in self.memory:
+            self.memory.move_to_end(key)
+            contours, advance = self.memory[key]
+            return ttf.Glyph(name, None, contours, advance)
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if data[:4] != CACHE_MAGIC:
+                return None
+            advance = struct.unpack_from(">H", data, 4)[0]
+            glyph = ttf.Glyph(name, None, ttf.decode_glyph(data[6:]), advance)
+            os.utime(path, None)
+        except (IOError, OSError, struct.error, IndexError, ttf.TTFError):
+            return None
+        self._remember(key, glyph)
+        return glyph
+
+    def _remember(self, key, glyph):
+        if self.memory is not None:
+            self.memory[key] = (glyph.contours, glyph.advance)
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.memory_entries:
+                self.memory.popitem(last=False)
+
+    def put(self, key, glyph):
+        self._remember(key, glyph)
+        self.written = True
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        ttf.atomic_write(path, CACHE_MAGIC + struct.pack(">H", glyph.advance) +
+                         ttf.encode_glyph(glyph))
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits, returns how
+        many.  Only looks at the cache when an entry was written since the last
+        time, as hits do not make it any bigger.
+        """
+        if not self.written:
+            return 0
+        self.written = False
+        entries = []
+        total = 0
+        for dirpath, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue  # evicted by a concurrent build
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+            total -= size
+        return removed
+
+
+########################################################################################
+# Font assembly                                                                        #
+########################################################################################
+def compile_glyphs(svg_dir, options, jobs=None, tolerance=DEFAULT_TOLERANCE, cache=None):
+    """
+    Convert every ``.svg`` in ``svg_dir`` (sorted by name) to a glyph, using a
+    pool of ``jobs`` processes (default: one per CPU, ``1`` compiles in this
+    process).  With a :class:`GlyphCache`, only the icons missing from it are
+    converted.  Raises :class:`SVGError` listing every icon that failed.
+
+    Returns ``(glyphs, cached)`` where ``cached`` is the number of cache hits.
+    """
+    names = sorted(entry[:-len(".svg")] for entry in os.listdir(svg_dir) if entry.endswith(".svg"))
+    glyphs = [None] * len(names)
+    keys = [None] * len(names)
+    work = []
+    errors = []
+    for i, name in enumerate(names):
+        path = os.path.join(svg_dir, name + ".svg")
+        try:
+            with open(path, "rb") as svg:
+                data = svg.read()
+        except (IOError, OSError) as e:
+            errors.append("[{0}]: {1}".format(path, e))
+            continue
+        if cache is not None:
+            keys[i] = cache.key(data, options, tolerance)
+            glyphs[i] = cache.get(keys[i], name)
+        if glyphs[i] is None:
+            work.append((i, (name, path, data, options, tolerance)))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(work) < 2:
+        results = [_compile_svg(job) for _, job in work]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(
+                _compile_svg, [job for _, job in work],
+                chunksize=max(len(work) // (4 * jobs), 1)
+            ))
+
+    for (i, _), (glyph, error) in zip(work, results):
+        if error is not None:
+            errors.append(error)
+            continue
+        glyphs[i] = glyph
+        if cache is not None:
+            cache.put(keys[i], glyph)
+
+    if errors:
+        raise SVGError("could not convert {0} icons:\n{1}".format(len(errors), "\n".join(errors)))
+    if cache is not None:
+        cache.evict()
+    return glyphs, len(names) - len(work)
+
+
+########################################################################################
+# Codepoint registry                                                                   #
+########################################################################################
+REGISTRY_VERSION = 1
+
+# The order icons are numbered in: from FIRST_CODEPOINT up to U+F8FF as fontcustom
+# does, the rest of the BMP Private Use Area (U+E000 up), then the supplementary ones.
+NUMBERING_RANGES = ((FIRST_CODEPOINT, ttf.PRIVATE_USE_RANGES[0][1]),
+                    (ttf.PRIVATE_USE_RANGES[0][0], FIRST_CODEPOINT - 1)) + \
+    ttf.PRIVATE_USE_RANGES[1:]
+
+
+def next_private_use(code, count=1):
+    """
+    Return the first of ``count`` consecutive private use codepoints (in one of
+    :data:`ttf.PRIVATE_USE_RANGES`) from ``code`` on, or ``None`` if there is no
+    room left.
+    """
+    for start, end in ttf.PRIVATE_USE_RANGES:
+        first = max(code, start)
+        if first + count - 1 <= end:
+            return first
+    return None
+
+
+def _numbering_rank(code, ranges):
+    """``(index of the range holding code, code)``, ordered as ``ranges`` number them."""
+    for index, (first, last) in enumerate(ranges):
+        if code is not None and first <= code <= last:
+            return index, code
+    return None
+
+
+def next_numbered(code, ranges=NUMBERING_RANGES):
+    """
+    Return the codepoint numbered after ``code`` (the first one for ``None``) in
+    ``ranges``, ``(first, last)`` pairs in numbering order, or ``None`` if there
+    is none left.  A ``code`` outside of ``ranges`` counts as ``None``.
+    """
+    rank = _numbering_rank(code, ranges)
+    if rank is None:
+        return ranges[0][0]
+    index, code = rank
+    if code < ranges[index][1]:
+        return code + 1
+    return ranges[index + 1][0] if index + 1 < len(ranges) else None
+
+
+def registry_path(svg_dir):
+    """``icons/<font>`` keeps its codepoints in ``icons/<font>.codepoints.json``."""
+    svg_dir = os.path.normpath(svg_dir)
+    return os.path.join(os.path.dirname(svg_dir),
+                        "{0}.codepoints.json".format(os.path.basename(svg_dir)))
+
+
+class CodepointRegistry(object):
+    """
+    The persistent ``name -> codepoint`` assignments of a font, so that adding or
+    removing icons never renumbers the others.  Icons keep their codepoint
+    forever: new icons take the next free codepoint, and removed icons become
+    tombstones whose codepoint is never handed out again (an icon that comes
+    back gets its old codepoint).  Aliases (icons sharing the glyph of another,
+    see :func:`dedupe_glyphs`) are kept with the codepoint they share, which an
+    alias keeps when it gets its own glyph, unless an icon has it.
+
+    The registry is a small json file meant to be committed next to the icons.
+    ``codepoint_range`` is the ``(first, last)`` codepoints it may hand out, or
+    ``None`` for the :data:`NUMBERING_RANGES`.  Only registries of a font merged
+    with others (see :func:`merge_fonts`) have their own range.
+    """
+
+    def __init__(self, path, codepoints=None, tombstones=None, codepoint_range=None,
+                 aliases=None):
+        self.path = path
+        self.codepoints = dict(codepoints or {})
+        self.tombstones = dict(tombstones or {})
+        self.aliases = dict(aliases or {})
+        self.codepoint_range = codepoint_range
+        self.changed = False
+
+    @classmethod
+    def load(cls, path, seed_font=None):
+        """
+        Read the registry at ``path``.  A missing registry starts from the
+        codepoints of ``seed_font`` (the previously compiled font) when it exists,
+        so switching to a registry does not renumber anything either.
+        """
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (IOError, OSError):
+            registry = cls(path)
+            if seed_font is not None and os.path.exists(seed_font):
+                registry.codepoints = dict(ttf.read_icons(seed_font))
+                registry.changed = True
+            return registry
+        except ValueError as e:
+            raise SVGError("[{0}] is not valid json: {1}".format(path, e))
+
+        if not isinstance(data, dict) or data.get("version") != REGISTRY_VERSION:
+            raise SVGError("[{0}] is not a version {1} codepoint registry.".format(
+                path, REGISTRY_VERSION
+            ))
+        try:
+            codepoint_range = data.get("range")
+            return cls(
+                path,
+                dict((name, int(code, 16)) for name, code in data["codepoints"].items()),
+                dict((name, int(code, 16)) for name, code in data["tombstones"].items()),
+                codepoint_range and tuple(int(code, 16) for code in codepoint_range),
+                dict((name, int(code, 16)) for name, code in data.get("aliases", {}).items())
+            )
+        except (KeyError, AttributeError, TypeError, ValueError) as e:
+            raise SVGError("[{0}] is not a valid codepoint registry: {1}".format(path, e))
+
+    def existing(self):
+        """
+        ``{name: (codepoint, rank)}`` of every name in the registry: rank 0 for
+        the codepoint of an icon, 1 for the one an alias shares, 2 for a tombstone.
+        """
+        known = dict((name, (code, 2)) for name, code in self.tombstones.items())
+        known.update((name, (code, 1)) for name, code in self.aliases.items())
+        known.update((name, (code, 0)) for name, code in self.codepoints.items())
+        return known
+
+    def assign(self, names):
+        """
+        Return ``{name: codepoint}`` for ``names``, updating the registry.  A new
+        name takes the codepoint it had as an alias, or as a tombstone, unless
+        another icon has it.
+        """
+        names = set(names)
+        for name in sorted(set(self.codepoints) - names):
+            self.tombstones[name] = self.codepoints.pop(name)
+            self.changed = True
+        taken = set(self.codepoints.values())
+        for name in sorted(names - set(self.codepoints)):
+            for code in (self.aliases.get(name), self.tombstones.get(name)):
+                if code is not None and code not in taken:
+                    self.codepoints[name] = code
+                    if self.tombstones.get(name) == code:
+                        del self.tombstones[name]
+                    taken.add(code)
+                    self.changed = True
+                    break
+
+        # new icons are numbered after the last codepoint ever handed out
+        ranges = (self.codepoint_range,) if self.codepoint_range else NUMBERING_RANGES
+        used = set(self.codepoints.values()) | set(self.tombstones.values()) | set(
+            self.aliases.values()
+        )
+        ranks = [rank for rank in (_numbering_rank(code, ranges) for code in used) if rank]
+        next_code = next_numbered(max(ranks)[1] if ranks else None, ranges)
+        for name in sorted(names - set(self.codepoints)):
+            if next_code is None:
+                raise SVGError(
+                    "No free private use codepoint left for [{0}] in {1}.".format(
+                        name, ", ".join("U+{0:04X}..U+{1:04X}".format(first, last)
+                                        for first, last in ranges)
+                    )
+                )
+            self.codepoints[name] = next_code
+            next_code = next_numbered(next_code, ranges)
+            self.changed = True
+        return dict((name, self.codepoints[name]) for name in names)
+
+    def set_aliases(self, aliases):
+        """
+        Record the ``{alias: codepoint}`` of the aliases, an alias that is gone
+        becomes a tombstone of the codepoint it shared.
+        """
+        for name in sorted(set(self.aliases) - set(aliases) - set(self.codepoints)):
+            self.tombstones[name] = self.aliases[name]
+        if aliases != self.aliases:
+            self.aliases = dict(aliases)
+            self.changed = True
+
+    def save(self):
+        """Write the registry (only if it changed), returns whether it was written."""
+        if not self.changed:
+            return False
+        data = {
+            "version": REGISTRY_VERSION,
+            "codepoints": dict((n, "{0:x}".format(c)) for n, c in self.codepoints.items()),
+            "tombstones": dict((n, "{0:x}".format(c)) for n, c in self.tombstones.items())
+        }
+        if self.codepoint_range is not None:
+            data["range"] = ["{0:x}".format(code) for code in self.codepoint_range]
+        if self.aliases:
+            data["aliases"] = dict((n, "{0:x}".format(c)) for n, c in self.aliases.items())
+        ttf.atomic_write(self.path,
+                         (json.dumps(data, indent=2, sort_keys=True) + "\n").encode("utf-8"))
+        self.changed = False
+        return True
+
+
+def assign_codepoints(glyphs, registry, aliases=None):
+    """
+    Give every glyph its codepoint from the :class:`CodepointRegistry`, and record
+    the ``{alias: name}`` ``aliases`` with the codepoint of their glyph.
+    """
+    codepoints = registry.assign(glyph.name for glyph in glyphs)
+    for glyph in glyphs:
+        glyph.codepoint = codepoints[glyph.name]
+    registry.set_aliases(dict(
+        (alias, codepoints[name]) for alias, name in (aliases or {}).items()
+    ))
+
+
+def render_css(font_name, font_file, glyphs, options, names=None, aliases=()):
+    """
+    The part of fontcustom's css template that ``generate.py --css`` reads.  The
+    selector of each glyph is made from the ``css_selector`` option, unless the
+    selectors are given in ``names``.  ``aliases`` are ``(name, glyph)`` pairs of
+    more icons (selectors, with ``names``) showing the codepoint of ``glyph``.
+    """
+    lines = [textwrap.dedent('''\
+        /*
+          Icon Font: {name}
+        */
+
+        @font-face {{
+          font-family: "{name}";
+          src: url("{path}{file}") format("truetype");
+          font-weight: normal;
+          font-style: normal;
+        }}
+
+        [data-icon]:before {{ content: attr(data-icon); }}
+
+    ''').format(name=font_name, path=options["preprocessor_path"] or "./", file=font_file)]
+
+    if names is None:
+        selector = options["css_selector"].replace("{{font_name}}", font_name)
+        names = [selector.replace("{{glyph}}", glyph.name) for glyph in glyphs]
+        aliases = [(selector.replace("{{glyph}}", name), glyph) for name, glyph in aliases]
+    glyphs = list(glyphs) + [glyph for _, glyph in aliases]
+    names = list(names) + [name for name, _ in aliases]
+    lines.append("[data-icon]:before,\n")
+    lines.append("".join("{0}:before,\n".format(name) for name in names[:-1]))
+    if names:
+        lines.append("{0}:before {{\n".format(names[-1]))
+    lines.append(textwrap.dedent('''\
+          display: inline-block;
+          font-family: "{name}";
+          font-style: normal;
+          font-weight: normal;
+          font-variant: normal;
+          line-height: 1;
+          text-decoration: inherit;
+          text-rendering: optimizeLegibility;
+          text-transform: none;
+          -moz-osx-font-smoothing: grayscale;
+          -webkit-font-smoothing: antialiased;
+          font-smoothing: antialiased;
+        }}
+
+    ''').format(name=font_name))
+    lines.extend(
+        '{0}:before {{ content: "\\{1:x}"; }}\n'.format(name, glyph.codepoint)
+        for name, glyph in zip(names, glyphs)
+    )
+    return "".join(lines)
+
+
+def compile_font(config, jobs=None, tolerance=DEFAULT_TOLERANCE, root=None, cache=None,
+                 registry_file=None, simplify=None, dedupe=False):
+    """
+    Compile the font described by the fontcustom ``config`` dict (see
+    :func:`read_config`), with paths relative to ``root`` (default: the
+    directory of this file), reusing the outlines in ``cache`` (a
+    :class:`GlyphCache`) when given.  The codepoints are kept in
+    ``registry_file`` (default: :func:`registry_path` of the icons).  With
+    ``simplify``, the outlines are simplified to within that many font units by
+    :func:`simplify_glyphs` (the cache keeps them as converted).  With ``dedupe``,
+    icons with the same outline as another (see :func:`dedupe_glyphs`) share its
+    glyph and codepoint, and are listed in the :func:`ttf.aliases_path` of the font
+    (icons that have a codepoint keep it, see :func:`dedupe_glyphs`).  Writes the
+    ``.ttf`` (named ``{font_name}_{md5}.ttf`` unless the ``no_hash`` option is set)
+    and the css, removes the outputs they replace (see
+    :func:`_remove_replaced_outputs`), and returns a dict with the ``ttf`` and
+    ``css`` paths written, the paths ``removed``, the number of ``glyphs`` (not
+    counting the ``aliases``) and of those taken from the cache (``cached``), the
+    number of outline ``points`` before and after simplifying (``points_before``,
+    ``points``), and the ``seconds`` spent converting, simplifying and in total.
+    """
+    start = time.time()
+    root = root or os.path.dirname(os.path.abspath(__file__))
+    options = font_options(config)
+    font_name = config.get("font_name")
+    if not font_name:
+        raise SVGError("the config has no font_name")
+
+    # output is either one directory, or a mapping of directories
+    svg_dir = config_svg_dir(config, font_name, root)
+    output = config.get("output", {})
+    if not isinstance(output, dict):
+        output = {"fonts": output, "css": output}
+    fonts_dir = os.path.join(root, output.get("fonts", "compiled_fonts/{0}".format(font_name)))
+    css_dir = os.path.join(root, output.get("css", fonts_dir))
+
+    glyphs, cached = compile_glyphs(svg_dir, options, jobs=jobs, tolerance=tolerance,
+                                    cache=cache)
+    if not glyphs:
+        raise SVGError("there are no .svg icons in {0}".format(svg_dir))
+    converted = time.time()
+    points_before, points = _simplify(glyphs, simplify)
+    simplified = time.time()
+
+    # The previously compiled font seeds a missing registry
+    registry = CodepointRegistry.load(
+        registry_file or registry_path(svg_dir),
+        seed_font=os.path.join(fonts_dir, "{0}.ttf".format(font_name))
+    )
+    aliases = {}
+    if dedupe:
+        glyphs, aliases = dedupe_glyphs(glyphs, registry.existing())
+    assign_codepoints(glyphs, registry, aliases)
+
+    em = options["font_em"]
+    font = ttf.build_font(
+        font_name,
+        [ttf.Glyph(".notdef", None, [], em), ttf.Glyph("space", 0x20, [], em // 4)] + glyphs,
+        units_per_em=em,
+        ascent=options["font_ascent"],
+        descent=options["font_descent"]
+    )
+
+    ttf_path = os.path.join(fonts_dir, "{0}.ttf".format(_font_stem(font_name, font, options)))
+    css_path = os.path.join(css_dir, "{0}.css".format(font_name))
+    font_file = os.path.relpath(ttf_path, css_dir).replace(os.sep, "/")
+
+    for directory in (fonts_dir, css_dir):
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+    # an interrupted (or concurrent) build never leaves a truncated font behind
+    ttf.atomic_write(ttf_path, font)
+    by_name = dict((glyph.name, glyph) for glyph in glyphs)
+    ttf.atomic_write(css_path, render_css(font_name, font_file, glyphs, options, aliases=[
+        (alias, by_name[name]) for alias, name in sorted(aliases.items())
+    ]).encode("utf-8"))
+    _write_aliases(ttf_path, aliases)
+    registry.save()
+    # never remove an icon, should the config compile into the icons directory
+    removed = []
+    if os.path.normcase(os.path.abspath(fonts_dir)) != os.path.normcase(os.path.abspath(svg_dir)):
+        removed = _remove_replaced_outputs(fonts_dir, font_name, ttf_path)
+
+    return {
+        "ttf": ttf_path,
+        "css": css_path,
+        "removed": removed,
+        "glyphs": len(glyphs),
+        "aliases": len(aliases),
+        "cached": cached,
+        "points_before": points_before,
+        "points": points,
+        "convert_seconds": converted - start,
+        "simplify_seconds": simplified - converted,
+        "seconds": time.time() - start
+    }
+
+
+def benchmark(config_path, config, jobs, repeat):
+    """
+    Time :func:`compile_font` against ``fontcustom compile`` (when it is
+    installed) for the same config, writing to temporary directories.  The
+    native compiler is timed without a cache, and with every glyph cached.
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    results = []
+    scratch = tempfile.mkdtemp(prefix="svg2ttf-benchmark-")
+    try:
+        timed = dict(config)
+        timed["output"] = {"fonts": os.path.join(scratch, "native"),
+                           "css": os.path.join(scratch, "native")}
+        registry = os.path.join(scratch, "codepoints.json")
+        runs = [("native, 1 process", 1)]
+        if jobs > 1:
+            runs.append(("native, {0} processes".format(jobs), jobs))
+        for label, workers in runs:
+            best = None
+            for _ in range(repeat):
+                seconds = compile_font(timed, jobs=workers, root=root, registry_file=registry)["seconds"]
+                best = seconds if best is None else min(best, seconds)
+            results.append((label, best))
+
+        cache = GlyphCache(os.path.join(scratch, "cache"))
+        compile_font(timed, jobs=jobs, root=root, cache=cache, registry_file=registry)
+        best = None
+        for _ in range(repeat):
+            seconds = compile_font(timed, jobs=jobs, root=root, cache=cache, registry_file=registry)["seconds"]
+            best = seconds if best is None else min(best, seconds)
+        results.append(("native, cached", best))
+
+        fontcustom = shutil.which("fontcustom")
+        if fontcustom is None:
+            results.append(("fontcustom", None))
+        else:
+            output = os.path.join(scratch, "fontcustom")
+            best = None
+            for _ in range(repeat):
+                begin = time.time()
+                subprocess.check_call(
+                    [fontcustom, "compile", "--config={0}".format(config_path),
+                     "--output={0}".format(output),
+                     "--manifest={0}".format(os.path.join(scratch, "manifest.json")),
+                     "--force"],
+                    cwd=root, stdout=subprocess.DEVNULL
+                )
+                seconds = time.time() - begin
+                best = seconds if best is None else min(best, seconds)
+            results.append(("fontcustom", best))
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return results
+
+
+
+# A made up icon: a bar and a ring, both varying with ``{size}``.
+########################################################################################
+# Merged fonts                                                                         #
+########################################################################################
+# Every font merged into one gets its own range of the Private Use Areas, from here
+# up in whole steps, with at least one step left over for icons added later.
+MERGE_FIRST_CODEPOINT = 0xE000
+MERGE_RANGE_STEP = 0x100
+
+
+def merged_registry_path(icons_dir, merged_name, font_name):
+    """
+    The codepoints of ``font_name`` in the merged font ``merged_name`` are kept in
+    ``icons/<merged>.<font>.codepoints.json``.
+    """
+    return os.path.join(icons_dir, "{0}.{1}.codepoints.json".format(merged_name, font_name))
+
+
+def merge_fonts(merged_name, font_names, jobs=None, tolerance=DEFAULT_TOLERANCE, root=None,
+                cache=None, simplify=None, dedupe=False, configs=None):
+    """
+    Compile the icons of every font in ``font_names`` (``icons/<font>``) into the
+    single font ``compiled_fonts/<merged_name>/<merged_name>.ttf``, so that an
+    application loads (and fontstash rasterizes into) one font instead of one per
+    icon font.  Paths, ``jobs``, ``tolerance``, ``cache``, ``simplify`` and
+    ``dedupe`` are as in :func:`compile_font` (an icon may be an alias of one of
+    another font).
+
+    The icons of each font are converted with the options of its fontcustom
+    config, from ``configs`` (``{font: config}``, see :func:`read_config`) or else
+    ``config/fontcustom-<font>.yml`` when there is one.  The fonts must agree on
+    the :data:`MERGED_OPTIONS`, which the merged font gets (without ``no_hash``
+    it is named ``<merged_name>_<md5>.ttf``).
+
+    Each font gets its own range of private use codepoints, recorded in its
+    :func:`merged_registry_path` so that it never moves.  Ranges of fonts that
+    were merged before are never handed out again, even when they are not in
+    ``font_names`` any more.  The glyphs are named ``<font>-<icon>``, and the css
+    keeps the ``.<font>-icon-<icon>`` selector of every icon, so
+    ``generate.generate(..., merged=merged_name)`` reads the icons of each font
+    back from either.
+
+    Returns a dict with the ``ttf`` and ``css`` paths, the paths ``removed`` (see
+    :func:`_remove_replaced_outputs`), the codepoint ``ranges``
+    ``{font: (first, last)}``, the number of ``glyphs`` and of those taken from
+    the cache (``cached``), the number of ``aliases``, the outline ``points_before``
+    and ``points`` (after simplifying), and the ``seconds`` spent.
+    """
+    start = time.time()
+    root = root or os.path.dirname(os.path.abspath(__file__))
+    if not font_names or len(set(font_names)) != len(font_names):
+        raise SVGError("merging needs a list of distinct fonts, not {0}".format(font_names))
+    if merged_name in font_names:
+        raise SVGError("the merged font [{0}] cannot also be one of the fonts it merges".format(
+            merged_name
+        ))
+    font_configs = {}
+    for font_name in font_names:
+        config = (configs or {}).get(font_name)
+        if config is None:
+            config_path = os.path.join(root, "config", "fontcustom-{0}.yml".format(font_name))
+            config = read_config(config_path) if os.path.exists(config_path) else {}
+        font_configs[font_name] = config
+    options = font_options(font_configs[font_names[0]])
+    for font_name in font_names[1:]:
+        differ = [
+            key for key in MERGED_OPTIONS
+            if font_options(font_configs[font_name])[key] != options[key]
+        ]
+        if differ:
+            raise SVGError("[{0}] and [{1}] cannot be merged, their {2} differ.".format(
+                font_names[0], font_name, ", ".join(differ)
+            ))
+    icons_dir = os.path.join(root, "icons")
+
+    registry_re = re.compile(r"^{0}\.([a-zA-Z][a-zA-Z0-9]*)\.codepoints\.json$".format(
+        re.escape(merged_name)
+    ))
+    registries = {}
+    for entry in sorted(os.listdir(icons_dir)):
+        match = registry_re.match(entry)
+        if match:
+            registries[match.group(1)] = CodepointRegistry.load(os.path.join(icons_dir, entry))
+    next_first = max(
+        [registry.codepoint_range[1] for registry in registries.values()
+         if registry.codepoint_range is not None] + [MERGE_FIRST_CODEPOINT - 1]
+    ) + 1
+
+    fonts = []
+    selectors = {}
+    cached = 0
+    for font_name in font_names:
+        config = font_configs[font_name]
+        svg_dir = config_svg_dir(config, font_name, root)
+        font_glyphs, font_cached = compile_glyphs(svg_dir, font_options(config), jobs=jobs,
+                                                  tolerance=tolerance, cache=cache)
+        if not font_glyphs:
+            raise SVGError("there are no .svg icons in {0}".format(svg_dir))
+        cached += font_cached
+        for glyph in font_glyphs:
+            icon = glyph.name
+            glyph.name = "{0}-{1}".format(font_name, icon)
+            selectors[glyph.name] = ".{0}-icon-{1}".format(font_name, icon)
+        fonts.append((font_name, font_glyphs))
+
+    glyphs = [glyph for _, font_glyphs in fonts for glyph in font_glyphs]
+    points_before, points = _simplify(glyphs, simplify)
+    aliases = {}
+    if dedupe:
+        existing = {}
+        for font_name, registry in registries.items():
+            existing.update(("{0}-{1}".format(font_name, name), known)
+                            for name, known in registry.existing().items())
+        glyphs, aliases = dedupe_glyphs(glyphs, existing)
+
+    ranges = {}
+    for font_name, font_glyphs in fonts:
+        registry = registries.get(font_name)
+        if registry is None:
+            registry = registries[font_name] = CodepointRegistry(
+                merged_registry_path(icons_dir, merged_name, font_name)
+            )
+        if registry.codepoint_range is None:
+            # a range never straddles two private use areas
+            steps = (len(font_glyphs) + MERGE_RANGE_STEP - 1) // MERGE_RANGE_STEP + 1
+            first = next_private_use(next_first, steps * MERGE_RANGE_STEP)
+            if first is None:
+                raise SVGError(
+                    "The Private Use Area has no room left for the [{0}] icons of [{1}].".format(
+                        len(font_glyphs), font_name
+                    )
+                )
+            registry.codepoint_range = (first, first + steps * MERGE_RANGE_STEP - 1)
+            registry.changed = True
+            next_first = registry.codepoint_range[1] + 1
+        # the registry knows the icons by their own names
+        start = len(font_name) + 1
+        kept = [glyph for glyph in font_glyphs if glyph.name not in aliases]
+        codepoints = registry.assign(glyph.name[start:] for glyph in kept)
+        for glyph in kept:
+            glyph.codepoint = codepoints[glyph.name[start:]]
+        ranges[font_name] = registry.codepoint_range
+    by_name = dict((glyph.name, glyph) for glyph in glyphs)
+    for font_name, font_glyphs in fonts:
+        start = len(font_name) + 1
+        registries[font_name].set_aliases(dict(
+            (glyph.name[start:], by_name[aliases[glyph.name]].codepoint)
+            for glyph in font_glyphs if glyph.name in aliases
+        ))
+
+    em = options["font_em"]
+    font = ttf.build_font(
+        merged_name,
+        [ttf.Glyph(".notdef", None, [], em), ttf.Glyph("space", 0x20, [], em // 4)] + glyphs,
+        units_per_em=em,
+        ascent=options["font_ascent"],
+        descent=options["font_descent"]
+    )
+
+    fonts_dir = os.path.join(root, "compiled_fonts", merged_name)
+    if not os.path.isdir(fonts_dir):
+        os.makedirs(fonts_dir)
+    ttf_path = os.path.join(fonts_dir, "{0}.ttf".format(
+        _font_stem(merged_name, font, options)
+    ))
+    css_path = os.path.join(fonts_dir, "{0}.css".format(merged_name))
+    ttf.atomic_write(ttf_path, font)
+    ttf.atomic_write(css_path, render_css(
+        merged_name, os.path.basename(ttf_path), glyphs, options,
+        names=[selectors[glyph.name] for glyph in glyphs],
+        aliases=[(selectors[alias], by_name[name]) for alias, name in sorted(aliases.items())]
+    ).encode("utf-8"))
+    _write_aliases(ttf_path, aliases)
+    for font_name in font_names:
+        registries[font_name].save()
+
+    return {
+        "ttf": ttf_path,
+        "css": css_path,
+        "removed": _remove_replaced_outputs(fonts_dir, merged_name, ttf_path),
+        "ranges": ranges,
+        "glyphs": len(glyphs),
+        "aliases": len(aliases),
+        "cached": cached,
+        "points_before": points_before,
+        "points": points,
+        "seconds": time.time() - start
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compile icons/<font>/*.svg into a TrueType font and css (replaces `rake`)."
+    )
+    parser.add_argument(
+        "--config",
+        default=os.path.join("config", "fontcustom.yml"),
+        help="The fontcustom config to use (default: %(default)s)."
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes converting icons (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Maximum error in font units when approximating cubic curves (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--simplify",
+        type=float,
+        nargs="?",
+        const=DEFAULT_SIMPLIFY_TOLERANCE,
+        metavar="TOLERANCE",
+        help="Remove the outline points that move it by at most TOLERANCE font units "
+             "(default: %(const)s), needs NumPy."
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Give icons with the same outline as another its glyph and codepoint, the "
+             "generated utilities still name them all."
+    )
+    parser.add_argument(
+        "--simplify-report",
+        nargs="?",
+        const="1,2,4,8",
+        metavar="TOLERANCES",
+        help="Compare the points, font size and compile time without --simplify and "
+             "with each of these comma separated tolerances (default: %(const)s) "
+             "instead of building."
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help="Where converted glyphs are cached (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+        help="Maximum size of the glyph cache in MiB, least recently used glyphs are "
+             "removed first (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Convert every icon, without reading or writing the glyph cache."
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Compare the compile time against `fontcustom compile` instead of building."
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per measurement with --benchmark, the best is reported (default: %(default)s)."
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.simplify is not None and args.simplify <= 0:
+        parser.error("--simplify must be positive")
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    config_path = os.path.join(here, args.config)
+    try:
+        config = read_config(config_path)
+    except (IOError, OSError, ValueError) as e:
+        sys.stderr.write("Critical: could not read the config {0}: {1}\n".format(config_path, e))
+        sys.exit(1)
+
+    try:
+        if args.simplify_report:
+            try:
+                tolerances = [float(value) for value in args.simplify_report.split(",") if value]
+            except ValueError:
+                parser.error("--simplify-report expects comma separated tolerances")
+            results = simplify_report(config, tolerances, jobs=args.jobs)
+            _, base_points, base_size, _, _ = results[0]
+            print("Simplifying the outlines of {0}:".format(config["font_name"]))
+            print("  {0:>9} {1:>15} {2:>17} {3:>10} {4:>10}".format(
+                "tolerance", "points", "ttf bytes", "simplify", "compile"
+            ))
+            row = "  {0:>9} {1:>7} ({2:>5.1f}%) {3:>8} ({4:>5.1f}%) {5:>9.3f}s {6:>9.3f}s"
+            for tolerance, points, size, simplify_seconds, seconds in results:
+                print(row.format(
+                    "-" if tolerance is None else "{0:g}".format(tolerance),
+                    points, 100.0 * points / base_points, size, 100.0 * size / base_size,
+                    simplify_seconds, seconds
+                ))
+            sys.exit(0)
+
+        if args.benchmark:
+            for label, seconds in benchmark(config_path, config, args.jobs, args.repeat):
+                if seconds is None:
+                    print("{0:<24} not installed, skipped".format(label))
+                else:
+                    print("{0:<24} {1:8.3f}s".format(label, seconds))
+            sys.exit(0)
+
+        cache = None
+        if not args.no_cache:
+            cache = GlyphCache(os.path.join(here, args.cache_dir),
+                               max_bytes=args.cache_size * 1024 * 1024)
+        result = compile_font(config, jobs=args.jobs, tolerance=args.tolerance, root=here,
+                              cache=cache, simplify=args.simplify, dedupe=args.dedupe)
+    except (SVGError, ttf.TTFError, IOError, OSError, subprocess.CalledProcessError) as e:
+        sys.stderr.write("Critical: {0}\n".format(e))
+        sys.exit(1)
+
+    print("Compiled [{0}] icons ([{1}] cached) in {2:.2f}s ({3:.2f}s converting).".format(
+        result["glyphs"], result["cached"], result["seconds"], result["convert_seconds"]
+    ))
+    if args.simplify:
+        print("Simplified [{0}] outline points to [{1}] in {2:.2f}s.".format(
+            result["points_before"], result["points"], result["simplify_seconds"]
+        ))
+    if args.dedupe:
+        print("Found [{0}] icons with the outline of another, now aliases of it.".format(
+            result["aliases"]
+        ))
+    print("Wrote [{0}].".format(os.path.relpath(result["ttf"])))
+    print("Wrote [{0}].".format(os.path.relpath(result["css"])))
+    for path in result["removed"]:
+        print("Removed [{0}], replaced by the compiled font.".format(os.path.relpath(path)))
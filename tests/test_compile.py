@@ -0,0 +1,32 @@
+import os
+import shutil
+
+import svg2ttf
+
+ICONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                     "icons", "fontawesome")
+
+
+def test_a_compile_removes_the_outputs_it_replaces(tmp_path):
+    svg_dir = tmp_path / "icons" / "demo"
+    fonts_dir = tmp_path / "compiled_fonts" / "demo"
+    os.makedirs(str(svg_dir))
+    os.makedirs(str(fonts_dir))
+    shutil.copy(os.path.join(ICONS, "bell.svg"), str(svg_dir))
+    for name in ("demo.woff", "demo.woff2", "demo.eot", "demo.svg", "demo-preview.html",
+                 "_demo.scss", "other.woff"):
+        (fonts_dir / name).write_bytes(b"fontcustom")
+    config = {"font_name": "demo", "no_hash": False}
+
+    first = svg2ttf.compile_font(config, jobs=1, root=str(tmp_path))
+    assert sorted(os.listdir(str(fonts_dir))) == sorted(
+        [os.path.basename(first["ttf"]), "demo.css", "other.woff"]
+    )
+
+    shutil.copy(os.path.join(ICONS, "bookmark.svg"), str(svg_dir))
+    second = svg2ttf.compile_font(config, jobs=1, root=str(tmp_path))
+    assert second["ttf"] != first["ttf"]
+    assert second["removed"] == [first["ttf"]]
+    assert sorted(os.listdir(str(fonts_dir))) == sorted(
+        [os.path.basename(second["ttf"]), "demo.css", "other.woff"]
+    )
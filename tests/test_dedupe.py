@@ -0,0 +1,52 @@
+import os
+import shutil
+
+import svg2ttf
+import ttf
+
+ICONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                     "icons", "fontawesome")
+
+
+def _add_icon(root, name, source):
+    shutil.copy(os.path.join(ICONS, "{0}.svg".format(source)),
+                os.path.join(root, "icons", "demo", "{0}.svg".format(name)))
+
+
+def _build(root):
+    result = svg2ttf.compile_font({"font_name": "demo"}, jobs=1, root=str(root),
+                                  dedupe=True)
+    icons = dict(ttf.read_icons(result["ttf"]))
+    for alias, name in ttf.read_aliases(result["ttf"]).items():
+        icons[alias] = icons[name]
+    return icons
+
+
+def test_adding_a_duplicate_keeps_every_codepoint(tmp_path):
+    os.makedirs(str(tmp_path / "icons" / "demo"))
+    _add_icon(str(tmp_path), "zeta", "bell")
+    _add_icon(str(tmp_path), "star", "bookmark")
+    before = _build(tmp_path)
+
+    # alpha sorts first and has the outline of zeta
+    _add_icon(str(tmp_path), "alpha", "bell")
+    after = _build(tmp_path)
+    assert dict((name, after[name]) for name in before) == before
+    assert after["alpha"] == after["zeta"]
+
+    # alpha gets a codepoint of its own when it is not a duplicate any more
+    _add_icon(str(tmp_path), "alpha", "address-book")
+    again = _build(tmp_path)
+    assert dict((name, again[name]) for name in before) == before
+    assert again["alpha"] not in after.values()
+
+
+def test_removing_the_aliased_icon_keeps_the_alias_codepoint(tmp_path):
+    os.makedirs(str(tmp_path / "icons" / "demo"))
+    _add_icon(str(tmp_path), "zeta", "bell")
+    _add_icon(str(tmp_path), "alpha", "bell")
+    before = _build(tmp_path)
+
+    os.remove(str(tmp_path / "icons" / "demo" / "zeta.svg"))
+    after = _build(tmp_path)
+    assert after == {"alpha": before["alpha"]}
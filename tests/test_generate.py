@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+import generate
+
+TTF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                   "compiled_fonts", "fontawesome", "fontawesome.ttf")
+
+
+def _generate(out_dir, **kwargs):
+    return generate.generate("fontawesome", TTF, str(out_dir), generate.FONT_LICENSE, **kwargs)
+
+
+def test_only_the_outputs_no_longer_asked_for_are_removed(tmp_path):
+    with_manifest = _generate(tmp_path, icon_manifest=True)
+    (tmp_path / "notes.txt").write_bytes(b"")
+
+    result = _generate(tmp_path)
+    assert result["removed"] == sorted(set(with_manifest["outputs"]) - set(result["outputs"]))
+    assert sorted(os.listdir(str(tmp_path))) == sorted(
+        [generate.BUILD_MANIFEST_NAME, "notes.txt"] +
+        [os.path.basename(path) for path in result["outputs"]]
+    )
+    assert _generate(tmp_path, force=True)["removed"] == []
+
+
+def test_a_failed_removal_is_retried(tmp_path, monkeypatch):
+    _generate(tmp_path, icon_manifest=True)
+
+    def remove(path):
+        raise OSError("[{0}] is busy".format(path))
+
+    with monkeypatch.context() as patch:
+        patch.setattr(generate.os, "remove", remove)
+        with pytest.raises(generate.GenerateError):
+            _generate(tmp_path)
+    assert len(_generate(tmp_path)["removed"]) == 2
+    assert not os.path.exists(str(tmp_path / "icon_manifest.h"))
@@ -0,0 +1,35 @@
+import svg2ttf
+import ttf
+
+
+def _glyph(name, width):
+    return ttf.Glyph(name, None, [[(0, 0, 1), (width, 0, 1), (width, 100, 1)]], width)
+
+
+def test_memory_keeps_the_most_recently_used_entries(tmp_path):
+    cache = svg2ttf.GlyphCache(str(tmp_path), memory=2)
+    cache.put("aa00", _glyph("a", 10))
+    cache.put("bb00", _glyph("b", 20))
+    assert cache.get("aa00", "a").advance == 10
+    cache.put("cc00", _glyph("c", 30))
+    assert list(cache.memory) == ["aa00", "cc00"]
+    # the disk still has the entry the memory forgot
+    assert cache.get("bb00", "b").advance == 20
+    assert list(cache.memory) == ["cc00", "bb00"]
+
+
+def test_evict_only_after_a_write(tmp_path):
+    cache = svg2ttf.GlyphCache(str(tmp_path), max_bytes=0)
+    cache.put("aa00", _glyph("a", 10))
+    cache.put("bb00", _glyph("b", 20))
+    assert cache.evict() == 2
+    assert cache.get("aa00", "a") is None
+
+    cache.max_bytes = svg2ttf.DEFAULT_CACHE_SIZE
+    cache.put("aa00", _glyph("a", 10))
+    cache.evict()
+    cache.max_bytes = 0
+    # hits alone never make the cache bigger
+    assert cache.get("aa00", "a") is not None
+    assert cache.evict() == 0
+    assert cache.get("aa00", "a") is not None
@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+import generate
+import iconmanifest
+import ttf
+
+FONT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                    "compiled_fonts", "fontawesome", "fontawesome.ttf")
+
+
+def _write(tmp_path, data):
+    path = tmp_path / "test.icons"
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_a_manifest_round_trips(tmp_path):
+    icons = ttf.read_icons(FONT)
+    metrics, em_size = generate.read_icon_metrics(FONT, icons)
+    path = _write(tmp_path, iconmanifest.build_manifest(icons, metrics, em_size))
+
+    with iconmanifest.IconManifest(path) as manifest:
+        assert manifest.has_metrics
+        assert manifest.em_size == pytest.approx(em_size)
+        assert list(manifest.icons()) == sorted(icons, key=lambda icon: icon[1])
+        for (name, codepoint), icon_metrics in zip(icons, metrics):
+            assert manifest.codepoint(name) == codepoint
+            assert manifest.name(codepoint) == name
+            assert manifest.metrics(codepoint) == pytest.approx(icon_metrics, abs=1e-6)
+        with pytest.raises(KeyError):
+            manifest.codepoint("no-such-icon")
+        with pytest.raises(KeyError):
+            manifest.name(0x20)
+
+
+def test_aliases_and_names_that_are_not_ascii(tmp_path):
+    icons = [("zeta", 0xF101), ("étoile", 0xF100), ("alpha", 0xF101)]
+    path = _write(tmp_path, iconmanifest.build_manifest(icons))
+
+    with iconmanifest.IconManifest(path) as manifest:
+        assert not manifest.has_metrics
+        assert len(manifest) == 3
+        assert manifest.codepoint("étoile") == 0xF100
+        assert manifest.codepoint("alpha") == manifest.codepoint("zeta") == 0xF101
+        # the first of the icons sharing a codepoint
+        assert manifest.name(0xF101) == "zeta"
+        with pytest.raises(iconmanifest.ManifestError):
+            manifest.metrics(0xF100)
+
+
+def test_an_empty_manifest(tmp_path):
+    with iconmanifest.IconManifest(_write(tmp_path, iconmanifest.build_manifest([]))) as manifest:
+        assert len(manifest) == 0
+        assert list(manifest.icons()) == []
+
+
+def test_every_icon_needs_its_own_name():
+    with pytest.raises(iconmanifest.ManifestError):
+        iconmanifest.build_manifest([("bell", 0xF100), ("bell", 0xF101)])
+
+
+def test_invalid_manifests_are_errors(tmp_path):
+    data = iconmanifest.build_manifest([("bell", 0xF100), ("star", 0xF101)])
+    for invalid in (b"NGIM", b"XXXX" + data[4:], data[:-4]):
+        with pytest.raises(iconmanifest.ManifestError):
+            iconmanifest.IconManifest(_write(tmp_path, invalid))
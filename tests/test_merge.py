@@ -0,0 +1,49 @@
+import os
+import shutil
+
+import svg2ttf
+import ttf
+
+ICONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                     "icons", "fontawesome")
+
+
+def _add_icons(root, font_name, names):
+    svg_dir = os.path.join(str(root), "icons", font_name)
+    if not os.path.isdir(svg_dir):
+        os.makedirs(svg_dir)
+    for name in names:
+        shutil.copy(os.path.join(ICONS, "{0}.svg".format(name)), svg_dir)
+
+
+def _merge(root, font_names):
+    result = svg2ttf.merge_fonts("both", font_names, jobs=1, root=str(root))
+    codepoints = {}
+    for name, code in ttf.read_icons(result["ttf"]):
+        font_name, icon = name.split("-", 1)
+        codepoints.setdefault(font_name, {})[icon] = code
+    return result["ranges"], codepoints
+
+
+def _disjoint(ranges):
+    ordered = sorted(ranges.values())
+    return all(before[1] < after[0] for before, after in zip(ordered, ordered[1:]))
+
+
+def test_merged_fonts_get_disjoint_ranges_that_never_move(tmp_path):
+    _add_icons(tmp_path, "one", ["bell", "bookmark", "star"])
+    _add_icons(tmp_path, "two", ["heart", "bell"])
+    ranges, codepoints = _merge(tmp_path, ["one", "two"])
+    assert _disjoint(ranges)
+    for font_name, (first, last) in ranges.items():
+        assert all(first <= code <= last for code in codepoints[font_name].values())
+    assert sorted(codepoints["one"]) == ["bell", "bookmark", "star"]
+
+    # a font added later, and one dropped, leave the other ranges alone
+    _add_icons(tmp_path, "three", ["bell"])
+    _add_icons(tmp_path, "two", ["bookmark"])
+    again, again_codepoints = _merge(tmp_path, ["two", "three"])
+    assert again["two"] == ranges["two"]
+    assert _disjoint(dict(ranges, three=again["three"]))
+    assert dict((icon, again_codepoints["two"][icon]) for icon in codepoints["two"]) == \
+        codepoints["two"]
@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+import generate
+import ttf
+
+FONT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                    "compiled_fonts", "fontawesome", "fontawesome.ttf")
+
+
+def _slot(seeds, value):
+    # the lookup of the generated {name}IconHash tables, see generate.perfect_hash
+    count = len(seeds)
+    seed = seeds[value % count]
+    if seed < 0:
+        return -seed - 1
+    scramble = (seed * generate.SEED_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF
+    return generate.icon_mix(value ^ scramble) % count
+
+
+def _check(names):
+    hashes = [generate.icon_hash(name.encode("utf-8")) for name in names]
+    seeds, slots = generate.perfect_hash(hashes)
+    assert sorted(slots) == list(range(len(names)))
+    for index, value in enumerate(hashes):
+        assert slots[_slot(seeds, value)] == index
+
+
+def test_every_icon_name_has_its_own_slot():
+    _check([name for name, _ in ttf.read_icons(FONT)])
+
+
+def test_every_name_of_a_large_set_has_its_own_slot():
+    _check(["icon-{0}".format(i) for i in range(20000)])
+
+
+def test_codepoints_have_their_own_slot():
+    codepoints = [codepoint for _, codepoint in ttf.read_icons(FONT)]
+    seeds, slots = generate.perfect_hash(codepoints)
+    for index, codepoint in enumerate(codepoints):
+        assert slots[_slot(seeds, codepoint)] == index
+
+
+def test_repeated_keys_are_rejected():
+    with pytest.raises(generate.GenerateError):
+        generate.perfect_hash([1, 2, 3, 2])
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+import svg2ttf
+
+
+def _assign(path, names):
+    registry = svg2ttf.CodepointRegistry.load(str(path))
+    codepoints = registry.assign(names)
+    registry.save()
+    return codepoints
+
+
+def test_adding_icons_keeps_every_codepoint(tmp_path):
+    path = tmp_path / "font.codepoints.json"
+    before = _assign(path, ["bell", "star"])
+    after = _assign(path, ["alpha", "bell", "star", "zeta"])
+    assert dict((name, after[name]) for name in before) == before
+    assert len(set(after.values())) == 4
+    assert min(after["alpha"], after["zeta"]) > max(before.values())
+
+
+def test_removed_icons_keep_their_codepoint(tmp_path):
+    path = tmp_path / "font.codepoints.json"
+    before = _assign(path, ["bell", "star", "zeta"])
+    after = _assign(path, ["bell", "zeta", "alpha"])
+    assert after["bell"] == before["bell"] and after["zeta"] == before["zeta"]
+    # the codepoint of star is never given to another icon
+    assert after["alpha"] not in before.values()
+    assert _assign(path, ["bell", "star", "zeta", "alpha"]) == dict(after, star=before["star"])
+
+
+def test_the_bmp_private_use_area_fills_up_before_the_supplementary_ones(tmp_path):
+    registry = svg2ttf.CodepointRegistry(str(tmp_path / "font.codepoints.json"),
+                                         {"bell": 0xF8FE})
+    assert registry.assign(["bell", "star", "zeta"]) == {
+        "bell": 0xF8FE, "star": 0xF8FF, "zeta": 0xE000
+    }
+    registry.codepoints["last"] = 0xF0FF
+    assert registry.assign(["bell", "star", "zeta", "last", "next"])["next"] == 0xF0000
+
+    # never back into the BMP once past it, even after removing icons
+    registry.assign(["bell", "next"])
+    assert registry.assign(["bell", "next", "other"])["other"] == 0xF0001
+
+
+def test_the_registry_round_trips(tmp_path):
+    path = tmp_path / "font.codepoints.json"
+    registry = svg2ttf.CodepointRegistry(str(path), codepoint_range=(0xE000, 0xE0FF))
+    registry.assign(["bell", "star"])
+    registry.assign(["bell"])
+    registry.set_aliases({"ring": 0xE000})
+    assert registry.save()
+    assert not registry.save()
+
+    loaded = svg2ttf.CodepointRegistry.load(str(path))
+    assert loaded.codepoints == {"bell": 0xE000}
+    assert loaded.tombstones == {"star": 0xE001}
+    assert loaded.aliases == {"ring": 0xE000}
+    assert loaded.codepoint_range == (0xE000, 0xE0FF)
+
+
+def test_a_full_range_is_an_error(tmp_path):
+    registry = svg2ttf.CodepointRegistry(str(tmp_path / "font.codepoints.json"),
+                                         codepoint_range=(0xE000, 0xE001))
+    registry.assign(["a", "b"])
+    with pytest.raises(svg2ttf.SVGError):
+        registry.assign(["a", "b", "c"])
+
+
+def test_an_invalid_registry_is_an_error(tmp_path):
+    path = tmp_path / "font.codepoints.json"
+    path.write_text(json.dumps({"version": svg2ttf.REGISTRY_VERSION, "codepoints": []}))
+    with pytest.raises(svg2ttf.SVGError):
+        svg2ttf.CodepointRegistry.load(str(path))
@@ -0,0 +1,80 @@
+import copy
+import os
+
+import pytest
+
+import svg2ttf
+import ttf
+
+np = pytest.importorskip("numpy")
+
+FONT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                    "compiled_fonts", "fontawesome", "fontawesome.ttf")
+
+
+def _sample(contour, steps=16):
+    """Points along the outline of a TrueType ``contour``, every quadratic cut in ``steps``."""
+    points = [(float(x), float(y), bool(on)) for x, y, on in contour]
+    # make the implied on-curve points between two control points explicit
+    full = []
+    for i, (x, y, on) in enumerate(points):
+        px, py, pon = points[i - 1]
+        if not on and not pon:
+            full.append(((x + px) / 2, (y + py) / 2, True))
+        full.append((x, y, on))
+    start = next(i for i, point in enumerate(full) if point[2])
+    full = full[start:] + full[:start] + [full[start]]
+    samples = []
+    i = 0
+    while i < len(full) - 1:
+        x0, y0, _ = full[i]
+        x1, y1, on = full[i + 1]
+        if on:
+            samples.append((x0, y0))
+            i += 1
+            continue
+        x2, y2, _ = full[i + 2]
+        for t in np.linspace(0, 1, steps, endpoint=False):
+            samples.append(((1 - t) ** 2 * x0 + 2 * t * (1 - t) * x1 + t * t * x2,
+                            (1 - t) ** 2 * y0 + 2 * t * (1 - t) * y1 + t * t * y2))
+        i += 2
+    samples.append(samples[0])
+    return np.array(samples)
+
+
+def _distance(points, polyline):
+    """The largest distance from ``points`` to the segments of ``polyline``."""
+    a = polyline[:-1][None, :, :]
+    ab = (polyline[1:] - polyline[:-1])[None, :, :]
+    ap = points[:, None, :] - a
+    length = np.maximum((ab * ab).sum(axis=2), 1e-12)
+    t = np.clip((ap * ab).sum(axis=2) / length, 0, 1)
+    nearest = ap - t[:, :, None] * ab
+    return np.sqrt((nearest * nearest).sum(axis=2)).min(axis=1).max()
+
+
+@pytest.mark.parametrize("tolerance", [0.5, 2.0])
+def test_simplified_outlines_stay_within_the_tolerance(tolerance):
+    with ttf.TrueTypeFont(FONT) as font:
+        glyphs = [
+            ttf.Glyph(name, None, ttf.decode_glyph(font.glyph_data(gid)), 0)
+            for gid, name in enumerate(font.glyph_names())
+        ][2::40]
+    original = copy.deepcopy(glyphs)
+    before, after = svg2ttf.simplify_glyphs(glyphs, tolerance)
+    assert after < before
+
+    # sampling the curves adds a little error of its own
+    slack = 0.05
+    for old, new in zip(original, glyphs):
+        assert len(new.contours) == len(old.contours)
+        for old_contour, new_contour in zip(old.contours, new.contours):
+            assert len(new_contour) >= min(3, len(old_contour))
+            old_outline, new_outline = _sample(old_contour), _sample(new_contour)
+            assert _distance(old_outline, new_outline) <= tolerance + slack
+            assert _distance(new_outline, old_outline) <= tolerance + slack
+
+
+def test_the_tolerance_must_be_positive():
+    with pytest.raises(svg2ttf.SVGError):
+        svg2ttf.simplify_glyphs([], 0)
@@ -0,0 +1,42 @@
+import os
+
+import generate
+import subset
+import ttf
+
+TTF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                   "compiled_fonts", "fontawesome", "fontawesome.ttf")
+
+
+def test_usage_pattern_finds_every_reference_style():
+    pattern = subset.usage_pattern("fontawesome")
+    source = (b"button->setIcon(FONTAWESOME_ICON_BELL_SLASH);\n"
+              b"auto star = FontawesomeIcon::STAR;\n"
+              b"Button(window, icon=fontawesome.ICON_HEART)\n"
+              b"MY_FONTAWESOME_ICON_TRASH FONTAWESOME_ICON_ fontawesome.icon_bell\n")
+    assert pattern.findall(source) == [b"BELL_SLASH", b"STAR", b"HEART"]
+
+
+def test_subset_keeps_the_icons_the_sources_use(tmp_path):
+    src = tmp_path / "src"
+    os.makedirs(str(src / "python"))
+    os.makedirs(str(src / ".git"))
+    (src / "main.cpp").write_bytes(b"new Button(w, \"\", FONTAWESOME_ICON_BELL);\n"
+                                   b"int unknown = FONTAWESOME_ICON_NO_SUCH_ICON;\n")
+    (src / "python" / "app.py").write_bytes(b"b.set_icon(fontawesome.ICON_STAR)\n")
+    # the generated utilities and the other files are not usage
+    (src / "fontawesome.h").write_bytes(b"#define FONTAWESOME_ICON_HEART 0xf004\n")
+    (src / ".git" / "old.cpp").write_bytes(b"FONTAWESOME_ICON_HEART\n")
+    (src / "notes.txt").write_bytes(b"FONTAWESOME_ICON_HEART\n")
+
+    result = subset.subset("fontawesome", TTF, [str(src)], str(tmp_path / "out"),
+                           generate.FONT_LICENSE, jobs=1, keep=["bookmark"])
+    assert result["icons"] == ["bell", "bookmark", "star"]
+    assert result["unknown"] == {"NO_SUCH_ICON": str(src / "main.cpp")}
+    assert result["files"] == 2
+
+    # at their codepoints in the full font
+    full = dict(ttf.read_icons(TTF))
+    assert sorted(ttf.read_icons(result["ttf"])) == [
+        (name, full[name]) for name in result["icons"]
+    ]
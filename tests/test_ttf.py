@@ -0,0 +1,57 @@
+import pytest
+
+import ttf
+
+TTFont = pytest.importorskip("fontTools.ttLib").TTFont
+
+
+def _square(name, codepoint, size):
+    return ttf.Glyph(name, codepoint, [[(0, 0, 1), (size, 0, 1), (size, size, 0),
+                                        (0, size, 1)]], size + 10)
+
+
+def _font(tmp_path, codepoints):
+    glyphs = [ttf.Glyph(".notdef", None, [], 512), ttf.Glyph("space", 0x20, [], 128)] + [
+        _square("icon-{0:x}".format(code), code, 100 + i) for i, code in enumerate(codepoints)
+    ]
+    path = tmp_path / "test.ttf"
+    path.write_bytes(ttf.build_font("test", glyphs))
+    return str(path), glyphs
+
+
+def _check_cmap(tmp_path, codepoints):
+    path, glyphs = _font(tmp_path, codepoints)
+    expected = sorted(("icon-{0:x}".format(code), code) for code in codepoints)
+    assert sorted(ttf.read_icons(path)) == expected
+
+    font = TTFont(path)
+    assert font.getBestCmap() == dict(
+        [(0x20, "space")] + [(code, name) for name, code in expected]
+    )
+    with ttf.TrueTypeFont(path) as reader:
+        assert reader.glyph_names() == font.getGlyphOrder()
+        for gid, glyph in enumerate(glyphs):
+            assert reader.glyph_bounds(gid) == glyph.bounds()
+            assert ttf.decode_glyph(reader.glyph_data(gid)) == glyph.contours
+
+    glyf = font["glyf"]
+    for glyph in glyphs[2:]:
+        coordinates, ends, flags = glyf[glyph.name].getCoordinates(glyf)
+        assert list(ends) == [len(glyph.contours[0]) - 1]
+        assert [(x, y, flag & 1) for (x, y), flag in zip(coordinates, flags)] == [
+            (x, y, on) for x, y, on in glyph.contours[0]
+        ]
+
+
+def test_bmp_cmap_round_trip(tmp_path):
+    # runs of consecutive codepoints and gaps between them
+    _check_cmap(tmp_path, [0xF100, 0xF101, 0xF102, 0xF200, 0xF8FF])
+
+
+def test_supplementary_cmap_round_trip(tmp_path):
+    _check_cmap(tmp_path, [0xF8FE, 0xF8FF, 0xF0000, 0xF0001, 0x10FFFD])
+
+
+def test_same_glyphs_same_bytes():
+    glyphs = [ttf.Glyph(".notdef", None, [], 512), _square("a", 0xF100, 100)]
+    assert ttf.build_font("test", glyphs) == ttf.build_font("test", list(glyphs))
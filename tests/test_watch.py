@@ -0,0 +1,143 @@
+import os
+import shutil
+import types
+
+import manufacture
+import watch
+
+ICONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                     "icons", "fontawesome")
+
+
+class Stop(Exception):
+    pass
+
+
+class FakeWatcher(object):
+    """Hands out ``(time, paths)`` events on a fake clock, stops when there are none left."""
+
+    kind = "fake"
+
+    def __init__(self, events):
+        self.events = list(events)
+        self.now = 0.0
+
+    def read(self, timeout=None):
+        if self.events and (timeout is None or self.events[0][0] <= self.now + timeout):
+            at, paths = self.events.pop(0)
+            self.now = max(self.now, at)
+            return set(paths)
+        if timeout is None:
+            raise Stop()
+        self.now += timeout
+        return set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+def _batches(monkeypatch, events, **kwargs):
+    watcher = FakeWatcher(events)
+    monkeypatch.setattr(watch, "time", types.SimpleNamespace(monotonic=lambda: watcher.now))
+    batches = []
+    try:
+        watch.watch(watcher, lambda paths, first: batches.append((first, sorted(paths))),
+                    **kwargs)
+    except Stop:
+        pass
+    return batches
+
+
+def test_a_batch_ends_once_nothing_changed_for_debounce(monkeypatch):
+    events = [(0.0, ["a"]), (0.0625, ["b"]), (0.125, ["a", "c"]), (0.5, ["d"])]
+    assert _batches(monkeypatch, events, debounce=0.125, max_latency=4) == [
+        (0.0, ["a", "b", "c"]), (0.5, ["d"])
+    ]
+
+
+def test_a_batch_ends_max_latency_after_its_first_change(monkeypatch):
+    events = [(i * 0.125, [str(i)]) for i in range(8)]
+    assert _batches(monkeypatch, events, debounce=0.25, max_latency=0.5) == [
+        (0.0, ["0", "1", "2", "3", "4"]), (0.625, ["5", "6", "7"])
+    ]
+
+
+def test_a_batch_ends_once_it_holds_max_queue_paths(monkeypatch):
+    events = [(0.0, ["a"]), (0.0, ["b", "c"]), (0.0, ["d"]), (0.0, ["e"])]
+    assert _batches(monkeypatch, events, debounce=1, max_latency=4, max_queue=3) == [
+        (0.0, ["a", "b", "c"]), (0.0, ["d", "e"])
+    ]
+
+
+def test_polling_reports_added_changed_and_removed_files(tmp_path):
+    (tmp_path / "a.svg").write_bytes(b"<svg/>")
+    (tmp_path / "b.svg").write_bytes(b"<svg/>")
+    watcher = watch.PollingWatcher([str(tmp_path)], interval=0)
+    assert watcher.read(0) == set()
+
+    (tmp_path / "a.svg").write_bytes(b"<svg></svg>")
+    (tmp_path / "c.svg").write_bytes(b"<svg/>")
+    os.remove(str(tmp_path / "b.svg"))
+    assert watcher.read(0) == set(str(tmp_path / name) for name in ("a.svg", "b.svg", "c.svg"))
+    assert watcher.read(0) == set()
+
+
+def test_watch_fonts_rebuilds_the_fonts_whose_svgs_changed(tmp_path, monkeypatch, capsys):
+    icons = dict((name, tmp_path / "icons" / name) for name in ("one", "two"))
+    for directory in icons.values():
+        os.makedirs(str(directory))
+        shutil.copy(os.path.join(ICONS, "bell.svg"), str(directory))
+    (icons["two"] / "notes.txt").write_bytes(b"")
+    (icons["two"] / "broken.svg").write_bytes(b"<svg")
+    batches = [
+        # the other files and directories are not icons of a font
+        [str(icons["one"] / "bell.svg"), str(icons["two"] / "notes.txt"),
+         str(tmp_path / "icons" / "three" / "bell.svg")],
+        # a watched directory itself, when events were lost
+        [str(icons["two"])],
+        [str(icons["two"] / "notes.txt")],
+        # not rebuilt until the error is fixed
+        [str(icons["one"] / "bell.svg"), str(icons["two"] / "broken.svg")]
+    ]
+    built = []
+
+    def build_font(here, fontName, fontLicense, numIcons, *args, **kwargs):
+        built.append((fontName, fontLicense, numIcons))
+        return fontName, True, 0.0, "", None
+
+    monkeypatch.setattr(manufacture, "build_font", build_font)
+    monkeypatch.setattr(watch, "open_watcher", lambda directories, poll: FakeWatcher([]))
+    monkeypatch.setattr(watch, "watch", lambda watcher, rebuild, **kwargs: [
+        (rebuild(set(paths), 0.0), built.append(None)) for paths in batches
+    ])
+    manufacture.watch_fonts(str(tmp_path), [("one", "MIT", 1), ("two", "OFL", 2)])
+    assert built == [
+        ("one", "MIT", 1), None,
+        ("two", "OFL", 2), None,
+        None,
+        ("one", "MIT", 1), None
+    ]
+    assert "[two] 2 changes, not rebuilt" in capsys.readouterr().out
+
+
+def test_watch_fonts_rebuilds_the_merged_font_once(tmp_path, monkeypatch):
+    for name in ("one", "two"):
+        os.makedirs(str(tmp_path / "icons" / name))
+        shutil.copy(os.path.join(ICONS, "bell.svg"), str(tmp_path / "icons" / name))
+    merged = []
+
+    def manufacture_merged(here, mergedName, fonts, *args, **kwargs):
+        merged.append((mergedName, fonts))
+        return True
+
+    monkeypatch.setattr(manufacture, "manufacture_merged", manufacture_merged)
+    monkeypatch.setattr(watch, "open_watcher", lambda directories, poll: FakeWatcher([]))
+    monkeypatch.setattr(watch, "watch", lambda watcher, rebuild, **kwargs: rebuild(set([
+        str(tmp_path / "icons" / "one" / "bell.svg"), str(tmp_path / "icons" / "two" / "bell.svg")
+    ]), 0.0))
+    manufacture.watch_fonts(str(tmp_path), [("one", "MIT", 1), ("two", "OFL", 1)],
+                            mergedName="both")
+    assert merged == [("both", [("one", "MIT", 1), ("two", "OFL", 1)])]
@@ -0,0 +1,865 @@
+#!/usr/bin/env python3
+"""
+A small, dependency-free reader for the TrueType / OpenType fonts compiled from
+``icons/<font>``.  Only the tables needed by ``generate.py`` (and the outlines
+and metrics ``subset.py`` copies) are parsed, and the font file is
+memory-mapped so large fonts are never copied into memory.
+
+:func:`build_font` is the matching writer used by ``svg2ttf.py``: it assembles
+a minimal, unhinted TrueType font from a list of :class:`Glyph`.
+
+Example::
+
+    with TrueTypeFont("compiled_fonts/fontawesome/fontawesome.ttf") as font:
+        for name, codepoint in font.icons():
+            print(name, hex(codepoint))
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+
+class TTFError(Exception):
+    """Raised when a font file cannot be parsed."""
+
+
+# The 258 standard Macintosh glyph names, referenced by index from a format 2.0
+# ``post`` table (indices < 258).  See the OpenType ``post`` specification.
+MAC_GLYPH_NAMES = (
+    ".notdef .null nonmarkingreturn space exclam quotedbl numbersign dollar "
+    "percent ampersand quotesingle parenleft parenright asterisk plus comma "
+    "hyphen period slash zero one two three four five six seven eight nine colon "
+    "semicolon less equal greater question at A B C D E F G H I J K L M N O P Q "
+    "R S T U V W X Y Z bracketleft backslash bracketright asciicircum underscore "
+    "grave a b c d e f g h i j k l m n o p q r s t u v w x y z braceleft bar "
+    "braceright asciitilde Adieresis Aring Ccedilla Eacute Ntilde Odieresis "
+    "Udieresis aacute agrave acircumflex adieresis atilde aring ccedilla eacute "
+    "egrave ecircumflex edieresis iacute igrave icircumflex idieresis ntilde "
+    "oacute ograve ocircumflex odieresis otilde uacute ugrave ucircumflex "
+    "udieresis dagger degree cent sterling section bullet paragraph germandbls "
+    "registered copyright trademark acute dieresis notequal AE Oslash infinity "
+    "plusminus lessequal greaterequal yen mu partialdiff summation product pi "
+    "integral ordfeminine ordmasculine Omega ae oslash questiondown exclamdown "
+    "logicalnot radical florin approxequal Delta guillemotleft guillemotright "
+    "ellipsis nonbreakingspace Agrave Atilde Otilde OE oe endash emdash "
+    "quotedblleft quotedblright quoteleft quoteright divide lozenge ydieresis "
+    "Ydieresis fraction currency guilsinglleft guilsinglright fi fl daggerdbl "
+    "periodcentered quotesinglbase quotedblbase perthousand Acircumflex "
+    "Ecircumflex Aacute Edieresis Egrave Iacute Icircumflex Idieresis Igrave "
+    "Oacute Ocircumflex apple Ograve Uacute Ucircumflex Ugrave dotlessi "
+    "circumflex tilde macron breve dotaccent ring cedilla hungarumlaut ogonek "
+    "caron Lslash lslash Scaron scaron Zcaron zcaron brokenbar Eth eth Yacute "
+    "yacute Thorn thorn minus multiply onesuperior twosuperior threesuperior "
+    "onehalf onequarter threequarters franc Gbreve gbreve Idotaccent Scedilla "
+    "scedilla Cacute cacute Ccaron ccaron dcroat"
+).split()
+
+# sfnt versions we know how to read: TrueType outlines, 'true' (old Apple), and
+# CFF outlines ('OTTO').  Only the cmap / post tables are needed for names.
+SFNT_VERSIONS = (b"\x00\x01\x00\x00", b"true", b"OTTO")
+
+
+# The BMP Private Use Area and the Supplementary Private Use Areas A and B.
+PRIVATE_USE_RANGES = ((0xE000, 0xF8FF), (0xF0000, 0xFFFFD), (0x100000, 0x10FFFD))
+
+
+def is_private_use(codepoint):
+    for start, end in PRIVATE_USE_RANGES:
+        if start <= codepoint <= end:
+            return True
+    return False
+
+
+class TrueTypeFont(object):
+    """
+    A memory-mapped TrueType / OpenType font.
+
+    ``path`` is the font file to open.  Use as a context manager, or call
+    :meth:`close` when done.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._loca = None
+        self._file = open(path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < 12:
+                raise TTFError("[{0}] is too small to be a font.".format(path))
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except:
+            self._file.close()
+            raise
+
+        try:
+            self.tables = self._read_table_directory()
+        except:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read_table_directory(self):
+        data = self._data
+        version = data[0:4]
+        if version not in SFNT_VERSIONS:
+            raise TTFError(
+                "[{0}] is not a TrueType / OpenType font (version {1!r}).".format(
+                    self.path, version
+                )
+            )
+
+        num_tables = struct.unpack_from(">H", data, 4)[0]
+        if 12 + 16 * num_tables > len(data):
+            raise TTFError("[{0}] has a truncated table directory.".format(self.path))
+
+        tables = {}
+        for i in range(num_tables):
+            tag, _, offset, length = struct.unpack_from(">4sIII", data, 12 + 16 * i)
+            if offset + length > len(data):
+                raise TTFError(
+                    "[{0}]: table {1} extends past the end of the file.".format(
+                        self.path, tag.decode("latin-1")
+                    )
+                )
+            tables[tag.decode("latin-1")] = (offset, length)
+        return tables
+
+    def _table(self, tag):
+        try:
+            return self.tables[tag]
+        except KeyError:
+            raise TTFError("[{0}] has no '{1}' table.".format(self.path, tag))
+
+    @property
+    def num_glyphs(self):
+        offset, _ = self._table("maxp")
+        return struct.unpack_from(">H", self._data, offset + 4)[0]
+
+    @property
+    def units_per_em(self):
+        offset, _ = self._table("head")
+        return struct.unpack_from(">H", self._data, offset + 18)[0]
+
+    def glyph_names(self):
+        """
+        Return a list with the name of every glyph, indexed by glyph id.  Glyphs
+        without a name in the ``post`` table (or fonts with a version 3.0
+        ``post`` table) get ``None``.
+        """
+        num_glyphs = self.num_glyphs
+        names = [None] * num_glyphs
+        if "post" not in self.tables:
+            return names
+
+        data = self._data
+        offset, length = self.tables["post"]
+        version = struct.unpack_from(">I", data, offset)[0]
+        if version == 0x00010000:
+            for gid in range(min(num_glyphs, len(MAC_GLYPH_NAMES))):
+                names[gid] = MAC_GLYPH_NAMES[gid]
+        elif version == 0x00020000:
+            count = struct.unpack_from(">H", data, offset + 32)[0]
+            indices = struct.unpack_from(">{0}H".format(count), data, offset + 34)
+
+            # The custom names are pascal strings following the index array.
+            custom = []
+            pos = offset + 34 + 2 * count
+            end = offset + length
+            while pos < end:
+                n = data[pos]
+                custom.append(data[pos + 1:pos + 1 + n].decode("latin-1"))
+                pos += 1 + n
+
+            for gid, index in enumerate(indices[:num_glyphs]):
+                if index < 258:
+                    names[gid] = MAC_GLYPH_NAMES[index]
+                elif index - 258 < len(custom):
+                    names[gid] = custom[index - 258]
+        # 2.5 is deprecated and 3.0 stores no names
+
+        return names
+
+    def cmap(self):
+        """
+        Return a dict mapping every codepoint in the best Unicode ``cmap``
+        subtable to its glyph id.  Format 12 (full Unicode) is preferred over
+        format 4 (BMP only).
+        """
+        data = self._data
+        base, _ = self._table("cmap")
+        num_subtables = struct.unpack_from(">H", data, base + 2)[0]
+
+        # Rank (platform, encoding) pairs: higher is better.
+        ranks = {(3, 10): 4, (0, 4): 4, (0, 6): 4, (3, 1): 2, (0, 3): 2, (0, 1): 1,
+                 (0, 0): 1}
+        best = None
+        for i in range(num_subtables):
+            platform, encoding, offset = struct.unpack_from(">HHI", data, base + 4 + 8 * i)
+            fmt = struct.unpack_from(">H", data, base + offset)[0]
+            if fmt not in (4, 12):
+                continue
+            rank = ranks.get((platform, encoding), 0) + (1 if fmt == 12 else 0)
+            if rank > 0 and (best is None or rank > best[0]):
+                best = (rank, fmt, base + offset)
+
+        if best is None:
+            raise TTFError(
+                "[{0}] has no Unicode cmap subtable of format 4 or 12.".format(self.path)
+            )
+
+        _, fmt, offset = best
+        if fmt == 4:
+            return self._cmap_format_4(offset)
+        return self._cmap_format_12(offset)
+
+    def _cmap_format_4(self, offset):
+        data = self._data
+        seg_count = struct.unpack_from(">H", data, offset + 6)[0] // 2
+        ends_at = offset + 14
+        starts_at = ends_at + 2 * seg_count + 2  # skip reservedPad
+        deltas_at = starts_at + 2 * seg_count
+        range_offsets_at = deltas_at + 2 * seg_count
+
+        fmt = ">{0}H".format(seg_count)
+        ends = struct.unpack_from(fmt, data, ends_at)
+        starts = struct.unpack_from(fmt, data, starts_at)
+        deltas = struct.unpack_from(fmt, data, deltas_at)
+        range_offsets = struct.unpack_from(fmt, data, range_offsets_at)
+
+        mapping = {}
+        for seg in range(seg_count):
+            start, end = starts[seg], ends[seg]
+            if start == 0xFFFF:
+                continue
+            delta, range_offset = deltas[seg], range_offsets[seg]
+            if range_offset == 0:
+                for code in range(start, end + 1):
+                    gid = (code + delta) & 0xFFFF
+                    if gid:
+                        mapping[code] = gid
+            else:
+                # idRangeOffset is relative to its own position in the array
+                glyph_ids_at = range_offsets_at + 2 * seg + range_offset
+                count = end - start + 1
+                glyph_ids = struct.unpack_from(">{0}H".format(count), data, glyph_ids_at)
+                for code, gid in zip(range(start, end + 1), glyph_ids):
+                    if gid:
+                        gid = (gid + delta) & 0xFFFF
+                        if gid:
+                            mapping[code] = gid
+        return mapping
+
+    def _cmap_format_12(self, offset):
+        data = self._data
+        num_groups = struct.unpack_from(">I", data, offset + 12)[0]
+        groups = struct.unpack_from(">{0}I".format(3 * num_groups), data, offset + 16)
+
+        mapping = {}
+        for i in range(0, 3 * num_groups, 3):
+            start, end, gid = groups[i], groups[i + 1], groups[i + 2]
+            for code in range(start, end + 1):
+                mapping[code] = gid + code - start
+        return mapping
+
+    def vertical_metrics(self, typographic=True):
+        """
+        Return ``(ascent, descent)`` in font units, with ``descent`` positive as
+        :func:`build_font` expects.  The typographic values in ``OS/2`` are
+        preferred over the (clipping) values in ``hhea``, unless ``typographic`` is
+        ``False`` (fontstash, and so NanoVG, sizes text by the ``hhea`` values).
+        """
+        if typographic and "OS/2" in self.tables:
+            offset, length = self.tables["OS/2"]
+            if length >= 72:
+                ascent, descent = struct.unpack_from(">hh", self._data, offset + 68)
+                return ascent, -descent
+        offset, _ = self._table("hhea")
+        ascent, descent = struct.unpack_from(">hh", self._data, offset + 4)
+        return ascent, -descent
+
+    def advances(self):
+        """Return a list with the advance width of every glyph, indexed by glyph id."""
+        offset, _ = self._table("hhea")
+        num_metrics = struct.unpack_from(">H", self._data, offset + 34)[0]
+        offset, _ = self._table("hmtx")
+        advances = list(struct.unpack_from(
+            ">{0}H".format(2 * num_metrics), self._data, offset
+        )[0::2])
+        # Glyphs past numberOfHMetrics repeat the last advance
+        advances.extend([advances[-1]] * (self.num_glyphs - num_metrics))
+        return advances
+
+    def _glyph_offsets(self):
+        if self._loca is None:
+            head, _ = self._table("head")
+            long_offsets = struct.unpack_from(">h", self._data, head + 50)[0]
+            offset, _ = self._table("loca")
+            count = self.num_glyphs + 1
+            if long_offsets:
+                self._loca = struct.unpack_from(">{0}I".format(count), self._data, offset)
+            else:
+                self._loca = tuple(
+                    2 * o for o in struct.unpack_from(">{0}H".format(count), self._data, offset)
+                )
+        return self._loca
+
+    def glyph_data(self, gid):
+        """
+        Return the raw ``glyf`` record of glyph ``gid`` (empty for glyphs without
+        an outline), suitable for :func:`decode_glyph`.
+        """
+        loca = self._glyph_offsets()
+        if not 0 <= gid < len(loca) - 1:
+            raise TTFError("[{0}] has no glyph {1}.".format(self.path, gid))
+        offset, length = self._table("glyf")
+        start, end = loca[gid], loca[gid + 1]
+        if end < start or end > length:
+            raise TTFError("[{0}]: glyph {1} extends past the 'glyf' table.".format(
+                self.path, gid
+            ))
+        return bytes(self._data[offset + start:offset + end])
+
+    def glyph_bounds(self, gid):
+        """
+        Return the ``(xMin, yMin, xMax, yMax)`` of glyph ``gid`` in font units, as
+        recorded in its ``glyf`` header (all zero for glyphs without an outline).
+        """
+        data = self.glyph_data(gid)
+        if not data:
+            return 0, 0, 0, 0
+        return struct.unpack_from(">4h", data, 2)
+
+    def icons(self, private_use_only=True):
+        """
+        Return ``[(name, codepoint), ...]`` for every mapped glyph, sorted by
+        codepoint.  Glyphs whose name is missing from the ``post`` table are named
+        ``uniXXXX`` (or ``uXXXXX``) after their codepoint.
+
+        Icon fonts place every icon in a Private Use Area; the handful of other
+        glyphs (e.g. ``space``) are skipped unless ``private_use_only=False``.
+        """
+        names = self.glyph_names()
+        icons = []
+        for code, gid in sorted(self.cmap().items()):
+            if private_use_only and not is_private_use(code):
+                continue
+            name = names[gid] if gid < len(names) else None
+            if name is None:
+                name = "uni{0:04X}".format(code) if code <= 0xFFFF else "u{0:X}".format(code)
+            icons.append((name, code))
+        return icons
+
+
+class Glyph(object):
+    """
+    A simple (non-composite) TrueType glyph, as produced by ``svg2ttf.py`` and
+    consumed by :func:`build_font`.
+
+    ``contours`` is a list of contours, each a list of ``(x, y, on_curve)``
+    points in font units.  ``codepoint`` is ``None`` for unmapped glyphs.
+    """
+
+    __slots__ = ("name", "codepoint", "contours", "advance")
+
+    def __init__(self, name, codepoint, contours, advance):
+        self.name = name
+        self.codepoint = codepoint
+        self.contours = contours
+        self.advance = advance
+
+    def bounds(self):
+        """Return ``(xMin, yMin, xMax, yMax)``, all zero for an empty glyph."""
+        xs = [x for contour in self.contours for x, _, _ in contour]
+        ys = [y for contour in self.contours for _, y, _ in contour]
+        if not xs:
+            return 0, 0, 0, 0
+        return min(xs), min(ys), max(xs), max(ys)
+
+
+# Simple glyph flags, see the OpenType ``glyf`` specification.
+ON_CURVE_POINT = 0x01
+X_SHORT_VECTOR = 0x02
+Y_SHORT_VECTOR = 0x04
+REPEAT_FLAG = 0x08
+X_IS_SAME_OR_POSITIVE_X_SHORT_VECTOR = 0x10
+Y_IS_SAME_OR_POSITIVE_Y_SHORT_VECTOR = 0x20
+
+
+def _encode_coordinate(delta, short_flag, same_flag):
+    """Return ``(flags, packed)`` for one x or y delta of a simple glyph."""
+    if delta == 0:
+        return same_flag, b""
+    if -255 <= delta <= 255:
+        if delta > 0:
+            return short_flag | same_flag, struct.pack(">B", delta)
+        return short_flag, struct.pack(">B", -delta)
+    return 0, struct.pack(">h", delta)
+
+
+def encode_glyph(glyph):
+    """Return the ``glyf`` table data for ``glyph`` (empty for an empty glyph)."""
+    contours = [contour for contour in glyph.contours if contour]
+    if not contours:
+        return b""
+
+    x_min, y_min, x_max, y_max = glyph.bounds()
+    data = [struct.pack(">hhhhh", len(contours), x_min, y_min, x_max, y_max)]
+
+    end = -1
+    end_points = []
+    for contour in contours:
+        end += len(contour)
+        end_points.append(end)
+    data.append(struct.pack(">{0}H".format(len(end_points)), *end_points))
+    data.append(struct.pack(">H", 0))  # no instructions
+
+    flags = []
+    xs = []
+    ys = []
+    last_x = last_y = 0
+    for contour in contours:
+        for x, y, on_curve in contour:
+            x_flag, x_data = _encode_coordinate(
+                x - last_x, X_SHORT_VECTOR, X_IS_SAME_OR_POSITIVE_X_SHORT_VECTOR
+            )
+            y_flag, y_data = _encode_coordinate(
+                y - last_y, Y_SHORT_VECTOR, Y_IS_SAME_OR_POSITIVE_Y_SHORT_VECTOR
+            )
+            flags.append(x_flag | y_flag | (ON_CURVE_POINT if on_curve else 0))
+            xs.append(x_data)
+            ys.append(y_data)
+            last_x, last_y = x, y
+
+    # Runs of identical flags are stored once, followed by a repeat count.
+    packed_flags = bytearray()
+    i = 0
+    while i < len(flags):
+        flag = flags[i]
+        run = 1
+        while i + run < len(flags) and flags[i + run] == flag and run < 256:
+            run += 1
+        if run > 1:
+            packed_flags.append(flag | REPEAT_FLAG)
+            packed_flags.append(run - 1)
+        else:
+            packed_flags.append(flag)
+        i += run
+
+    data.append(bytes(packed_flags))
+    data.append(b"".join(xs))
+    data.append(b"".join(ys))
+    return b"".join(data)
+
+
+def decode_glyph(data):
+    """
+    Return the contours (``[[(x, y, on_curve), ...], ...]``) of the simple glyph
+    in ``data``, the inverse of :func:`encode_glyph`.  Composite glyphs raise
+    :class:`TTFError`.
+    """
+    if not data:
+        return []
+
+    num_contours = struct.unpack_from(">h", data, 0)[0]
+    if num_contours < 0:
+        raise TTFError("Composite glyphs are not supported.")
+
+    end_points = struct.unpack_from(">{0}H".format(num_contours), data, 10)
+    num_points = end_points[-1] + 1 if end_points else 0
+    pos = 10 + 2 * num_contours
+    pos += 2 + struct.unpack_from(">H", data, pos)[0]  # skip the instructions
+
+    flags = []
+    while len(flags) < num_points:
+        flag = data[pos]
+        pos += 1
+        flags.append(flag)
+        if flag & REPEAT_FLAG:
+            flags.extend([flag] * data[pos])
+            pos += 1
+
+    coordinates = []
+    for short_flag, same_flag in ((X_SHORT_VECTOR, X_IS_SAME_OR_POSITIVE_X_SHORT_VECTOR),
+                                  (Y_SHORT_VECTOR, Y_IS_SAME_OR_POSITIVE_Y_SHORT_VECTOR)):
+        values = []
+        value = 0
+        for flag in flags[:num_points]:
+            if flag & short_flag:
+                delta = data[pos]
+                pos += 1
+                value += delta if flag & same_flag else -delta
+            elif not flag & same_flag:
+                value += struct.unpack_from(">h", data, pos)[0]
+                pos += 2
+            values.append(value)
+        coordinates.append(values)
+
+    contours = []
+    start = 0
+    for end in end_points:
+        contours.append([
+            (coordinates[0][i], coordinates[1][i], bool(flags[i] & ON_CURVE_POINT))
+            for i in range(start, end + 1)
+        ])
+        start = end + 1
+    return contours
+
+
+def _checksum(data):
+    """The OpenType table checksum: the sum of the big endian uint32s, mod 2**32."""
+    data += b"\0" * (-len(data) % 4)
+    return sum(struct.unpack(">{0}I".format(len(data) // 4), data)) & 0xFFFFFFFF
+
+
+def _cmap_runs(mapping):
+    """Group ``[(codepoint, gid), ...]`` into runs where both increase by one."""
+    runs = []
+    for code, gid in mapping:
+        if runs and code == runs[-1][1] + 1 and gid == runs[-1][2] + code - runs[-1][0]:
+            runs[-1][1] = code
+        else:
+            runs.append([code, code, gid])
+    return runs
+
+
+def _cmap_format_4(mapping):
+    """Encode the BMP part of ``[(codepoint, gid), ...]`` as a format 4 subtable."""
+    segments = [
+        (start, end, (gid - start) & 0xFFFF)
+        for start, end, gid in _cmap_runs([(c, g) for c, g in mapping if c <= 0xFFFE])
+    ]
+    segments.append((0xFFFF, 0xFFFF, 1))
+
+    seg_count = len(segments)
+    entry_selector = max(seg_count.bit_length() - 1, 0)
+    search_range = 2 * (1 << entry_selector)
+    length = 16 + 8 * seg_count
+    if length > 0xFFFF:
+        raise TTFError("Too many cmap segments for a format 4 subtable.")
+
+    fmt = ">{0}H".format(seg_count)
+    return b"".join([
+        struct.pack(">7H", 4, length, 0, 2 * seg_count, search_range, entry_selector,
+                    2 * seg_count - search_range),
+        struct.pack(fmt, *[end for _, end, _ in segments]),
+        struct.pack(">H", 0),
+        struct.pack(fmt, *[start for start, _, _ in segments]),
+        struct.pack(fmt, *[delta for _, _, delta in segments]),
+        struct.pack(fmt, *([0] * seg_count))
+    ])
+
+
+def _cmap_format_12(mapping):
+    """Encode ``[(codepoint, gid), ...]`` as a format 12 subtable."""
+    runs = _cmap_runs(mapping)
+    return struct.pack(">HHIII", 12, 0, 16 + 12 * len(runs), 0, len(runs)) + b"".join(
+        struct.pack(">III", start, end, gid) for start, end, gid in runs
+    )
+
+
+def _name_table(family):
+    """A Windows / Unicode BMP ``name`` table for a single ``Regular`` style."""
+    strings = [
+        (1, family),
+        (2, "Regular"),
+        (3, "{0}:Regular".format(family)),
+        (4, family),
+        (5, "Version 1.0"),
+        (6, family)
+    ]
+    records = []
+    storage = b""
+    for name_id, value in strings:
+        encoded = value.encode("utf-16-be")
+        records.append(struct.pack(">6H", 3, 1, 0x409, name_id, len(encoded), len(storage)))
+        storage += encoded
+    header = struct.pack(">3H", 0, len(records), 6 + 12 * len(records))
+    return header + b"".join(records) + storage
+
+
+def _post_table(glyphs, underline_position, underline_thickness):
+    """A version 2.0 ``post`` table naming every glyph."""
+    standard = dict((name, index) for index, name in enumerate(MAC_GLYPH_NAMES))
+    indices = []
+    custom = []
+    for glyph in glyphs:
+        if glyph.name in standard:
+            indices.append(standard[glyph.name])
+        else:
+            indices.append(258 + len(custom))
+            custom.append(glyph.name.encode("latin-1"))
+    for name in custom:
+        if len(name) > 255:
+            raise TTFError("Glyph name [{0}] is too long.".format(name.decode("latin-1")))
+
+    return b"".join([
+        struct.pack(">IIhhIIIII", 0x00020000, 0, underline_position, underline_thickness,
+                    0, 0, 0, 0, 0),
+        struct.pack(">H", len(glyphs)),
+        struct.pack(">{0}H".format(len(indices)), *indices),
+        b"".join(struct.pack(">B", len(name)) + name for name in custom)
+    ])
+
+
+def build_font(family, glyphs, units_per_em=512, ascent=448, descent=64):
+    """
+    Return the bytes of a TrueType font named ``family`` holding ``glyphs`` (a
+    list of :class:`Glyph`, in glyph id order).  The first glyph should be
+    ``.notdef``.  ``descent`` is positive, as in ``config/fontcustom.yml``.
+
+    The font has no hinting and fixed (zero) timestamps, so the same glyphs
+    always produce the same bytes.
+    """
+    if not glyphs:
+        raise TTFError("A font needs at least one glyph (.notdef).")
+
+    glyf = []
+    loca = []
+    offset = 0
+    x_min = y_min = x_max = y_max = None
+    max_points = max_contours = 0
+    hmtx = []
+    min_lsb = min_rsb = max_extent = None
+    for glyph in glyphs:
+        data = encode_glyph(glyph)
+        data += b"\0" * (-len(data) % 4)
+        loca.append(offset)
+        glyf.append(data)
+        offset += len(data)
+
+        g_x_min, g_y_min, g_x_max, g_y_max = glyph.bounds()
+        hmtx.append(struct.pack(">Hh", glyph.advance, g_x_min))
+        if data:
+            x_min = g_x_min if x_min is None else min(x_min, g_x_min)
+            y_min = g_y_min if y_min is None else min(y_min, g_y_min)
+            x_max = g_x_max if x_max is None else max(x_max, g_x_max)
+            y_max = g_y_max if y_max is None else max(y_max, g_y_max)
+            min_lsb = g_x_min if min_lsb is None else min(min_lsb, g_x_min)
+            rsb = glyph.advance - g_x_max
+            min_rsb = rsb if min_rsb is None else min(min_rsb, rsb)
+            max_extent = g_x_max if max_extent is None else max(max_extent, g_x_max)
+            max_points = max(max_points, sum(len(c) for c in glyph.contours))
+            max_contours = max(max_contours, len([c for c in glyph.contours if c]))
+    loca.append(offset)
+    if x_min is None:
+        x_min = y_min = x_max = y_max = min_lsb = min_rsb = max_extent = 0
+
+    num_glyphs = len(glyphs)
+    advance_max = max(glyph.advance for glyph in glyphs)
+    mapping = sorted(
+        (glyph.codepoint, gid) for gid, glyph in enumerate(glyphs)
+        if glyph.codepoint is not None
+    )
+
+    # (platform, encoding) records must be sorted, both point at shared data
+    subtables = [((0, 3), (3, 1)), _cmap_format_4(mapping)]
+    if mapping and mapping[-1][0] > 0xFFFF:
+        subtables = [((0, 3), (3, 1)), _cmap_format_4(mapping),
+                     ((0, 4), (3, 10)), _cmap_format_12(mapping)]
+    records = []
+    cmap_data = b""
+    data_offset = 4 + 8 * sum(len(subtables[i]) for i in range(0, len(subtables), 2))
+    for i in range(0, len(subtables), 2):
+        for platform, encoding in subtables[i]:
+            records.append((platform, encoding, data_offset + len(cmap_data)))
+        cmap_data += subtables[i + 1]
+    records.sort()
+    cmap = struct.pack(">HH", 0, len(records)) + b"".join(
+        struct.pack(">HHI", *record) for record in records
+    ) + cmap_data
+
+    bmp = [code for code, _ in mapping if code <= 0xFFFF]
+    line_gap = 0
+    os2 = struct.pack(
+        ">HhHHHhhhhhhhhhhh10sIIII4sHHHhhhHHIIhhHHH",
+        4,                                          # version
+        int(sum(g.advance for g in glyphs) / num_glyphs),  # xAvgCharWidth
+        400,                                        # usWeightClass: normal
+        5,                                          # usWidthClass: medium
+        0,                                          # fsType: installable
+        units_per_em // 5, units_per_em // 5, 0, units_per_em // 10,  # subscript
+        units_per_em // 5, units_per_em // 5, 0, units_per_em // 2,   # superscript
+        units_per_em // 20, units_per_em // 4,      # strikeout size / position
+        0,                                          # sFamilyClass
+        b"\0" * 10,                                 # panose
+        0, 0, 0, 0,                                 # ulUnicodeRange1-4
+        b"NGUI",                                    # achVendID
+        0x40,                                       # fsSelection: REGULAR
+        min(bmp) if bmp else 0xFFFF,                # usFirstCharIndex
+        max(bmp) if bmp else 0xFFFF,                # usLastCharIndex
+        ascent, -descent, line_gap,                 # sTypo*
+        max(y_max, 0), max(-y_min, 0),              # usWin*
+        1, 0,                                       # ulCodePageRange: latin 1
+        0, 0,                                       # sxHeight, sCapHeight
+        0, 0x20, 1                                  # usDefaultChar, usBreakChar, usMaxContext
+    )
+
+    tables = {
+        "OS/2": os2,
+        "cmap": cmap,
+        "glyf": b"".join(glyf),
+        "head": struct.pack(
+            ">IIIIHHqqhhhhHHhhh",
+            0x00010000, 0x00010000,     # version, fontRevision
+            0,                          # checkSumAdjustment, patched below
+            0x5F0F3CF5,                 # magicNumber
+            0x000B,                     # flags
+            units_per_em,
+            0, 0,                       # created, modified
+            x_min, y_min, x_max, y_max,
+            0,                          # macStyle
+            8,                          # lowestRecPPEM
+            2,                          # fontDirectionHint
+            1,                          # indexToLocFormat: long offsets
+            0                           # glyphDataFormat
+        ),
+        "hhea": struct.pack(
+            ">IhhhHhhhhhh4hhH",
+            0x00010000, max(ascent, y_max), -max(descent, -y_min), line_gap,
+            advance_max, min_lsb, min_rsb, max_extent,
+            1, 0, 0,                    # caretSlopeRise / Run, caretOffset
+            0, 0, 0, 0,                 # reserved
+            0,                          # metricDataFormat
+            num_glyphs                  # numberOfHMetrics
+        ),
+        "hmtx": b"".join(hmtx),
+        "loca": struct.pack(">{0}I".format(len(loca)), *loca),
+        "maxp": struct.pack(
+            ">IHHHHHHHHHHHHHH",
+            0x00010000, num_glyphs, max_points, max_contours, 0, 0,
+            2, 0, 0, 0, 0, 0, 0, 0, 0
+        ),
+        "name": _name_table(family),
+        "post": _post_table(glyphs, -descent // 2, units_per_em // 20)
+    }
+
+    # Table directory followed by the 4-byte aligned tables, sorted by tag.
+    tags = sorted(tables)
+    num_tables = len(tags)
+    entry_selector = num_tables.bit_length() - 1
+    search_range = 16 * (1 << entry_selector)
+    header = struct.pack(">4sHHHH", b"\x00\x01\x00\x00", num_tables, search_range,
+                         entry_selector, 16 * num_tables - search_range)
+    directory = []
+    body = []
+    offset = 12 + 16 * num_tables
+    head_offset = None
+    for tag in tags:
+        data = tables[tag]
+        if tag == "head":
+            head_offset = offset
+        directory.append(struct.pack(">4sIII", tag.encode("latin-1"), _checksum(data),
+                                     offset, len(data)))
+        data += b"\0" * (-len(data) % 4)
+        body.append(data)
+        offset += len(data)
+
+    font = bytearray(header + b"".join(directory) + b"".join(body))
+    adjustment = (0xB1B0AFBA - _checksum(bytes(font))) & 0xFFFFFFFF
+    struct.pack_into(">I", font, head_offset + 8, adjustment)
+    return bytes(font)
+
+
+def read_icons(path):
+    """Convenience wrapper: ``[(name, codepoint), ...]`` from the font at ``path``."""
+    with TrueTypeFont(path) as font:
+        return font.icons()
+
+
+ALIASES_VERSION = 1
+
+
+def aliases_path(path):
+    """
+    Icons sharing the glyph (and codepoint) of another icon of the font at ``path``
+    (see ``svg2ttf.py --dedupe``) are listed next to it, in ``fontname.aliases.json``.
+    """
+    return os.path.splitext(path)[0] + ".aliases.json"
+
+
+def read_aliases(path):
+    """
+    Return ``{alias: name}`` from the :func:`aliases_path` of the font at ``path``,
+    ``name`` being the glyph the icon ``alias`` shares.  Empty when there is none.
+    """
+    alias_file = aliases_path(path)
+    try:
+        with open(alias_file, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except ValueError as e:
+        raise TTFError("[{0}] is not valid json: {1}".format(alias_file, e))
+    if not isinstance(data, dict) or data.get("version") != ALIASES_VERSION or \
+            not isinstance(data.get("aliases"), dict):
+        raise TTFError("[{0}] is not a version {1} alias file.".format(alias_file, ALIASES_VERSION))
+    return data["aliases"]
+
+
+def encode_aliases(aliases):
+    """The contents of the :func:`aliases_path` file listing the ``{alias: name}``."""
+    return (json.dumps({"version": ALIASES_VERSION, "aliases": aliases}, indent=2,
+                       sort_keys=True) + "\n").encode("utf-8")
+
+
+def atomic_write(path, data):
+    """
+    Write ``data`` (bytes) to ``path`` by writing a temporary file in the same
+    directory and renaming it over the destination.  Readers (and build systems
+    watching mtimes) never observe a partially written file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".{0}.".format(os.path.basename(path)), suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+
+        # mkstemp always creates 0600, use what a plain open(path, "w") would
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except OSError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.stderr.write("Usage: {0} path/to/font.ttf\n".format(sys.argv[0]))
+        sys.exit(1)
+
+    try:
+        for name, code in read_icons(sys.argv[1]):
+            print("{0:<50} 0x{1:08X}".format(name, code))
+    except (IOError, OSError, TTFError) as e:
+        sys.stderr.write("Critical: {0}\n".format(e))
+        sys.exit(1)
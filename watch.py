@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Watch directories for changed files, for ``./manufacture.py --watch``.
+
+On Linux the directories are watched with inotify (through :mod:`ctypes`, no
+package needed), elsewhere, or when inotify is unavailable (no more watches
+allowed, some network file systems), they are scanned every ``poll_interval``
+seconds instead.  Either way :func:`watch` collects the changes into batches:
+saving an SVG in an editor is often several events (write, rename, attributes),
+and copying a set of icons in is hundreds, but each batch rebuilds once.
+
+A batch is handed over once nothing changed for ``debounce`` seconds, at the
+latest ``max_latency`` seconds after its first change, or as soon as it holds
+``max_queue`` changed paths, whichever comes first.
+
+Example::
+
+    with open_watcher(["icons/fontawesome"]) as watcher:
+        watch(watcher, lambda paths, first: print(sorted(paths)))
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+
+
+class WatchError(Exception):
+    """Raised when the directories cannot be watched."""
+
+
+DEFAULT_DEBOUNCE = 0.1
+DEFAULT_MAX_LATENCY = 0.5
+DEFAULT_MAX_QUEUE = 500
+DEFAULT_POLL_INTERVAL = 0.5
+
+# inotify(7) event masks
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+
+# What changes a file for good: writes that finished, renames and removals (a
+# file being written only counts once it is closed).
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE | IN_ATTRIB |
+              IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+_EVENT = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class InotifyWatcher(object):
+    """
+    Watches ``directories`` (not recursively) with inotify.  Raises
+    :class:`WatchError` when inotify is unavailable.
+    """
+
+    kind = "inotify"
+
+    def __init__(self, directories):
+        if not sys.platform.startswith("linux"):
+            raise WatchError("inotify needs Linux")
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            init, add_watch = libc.inotify_init1, libc.inotify_add_watch
+        except (OSError, AttributeError) as e:
+            raise WatchError("inotify is unavailable: {0}".format(e))
+
+        self.fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise WatchError("inotify_init1: {0}".format(os.strerror(ctypes.get_errno())))
+        self.directories = {}
+        try:
+            for directory in directories:
+                wd = add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+                if wd < 0:
+                    code = ctypes.get_errno()
+                    hint = " (raise fs.inotify.max_user_watches)" if code == errno.ENOSPC else ""
+                    raise WatchError("cannot watch [{0}]: {1}{2}".format(
+                        directory, os.strerror(code), hint
+                    ))
+                self.directories[wd] = directory
+        except:
+            self.close()
+            raise
+
+    def fileno(self):
+        return self.fd
+
+    def read(self, timeout=None):
+        """
+        Wait up to ``timeout`` seconds (forever if ``None``) for changes, returns
+        the set of changed paths (empty if there were none).  When the kernel
+        dropped events, every watched directory counts as changed.
+        """
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, _READ_SIZE)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+                offset += _EVENT.size + length
+                if mask & IN_Q_OVERFLOW:
+                    changed.update(self.directories.values())
+                elif mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                    raise WatchError("[{0}] was moved or removed.".format(
+                        self.directories.get(wd, "?")
+                    ))
+                elif wd in self.directories and name:
+                    changed.add(os.path.join(self.directories[wd], os.fsdecode(name)))
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class PollingWatcher(object):
+    """
+    Watches ``directories`` (not recursively) by comparing the size and
+    modification time of their files every ``interval`` seconds.
+    """
+
+    kind = "polling"
+
+    def __init__(self, directories, interval=DEFAULT_POLL_INTERVAL):
+        self.directories = list(directories)
+        self.interval = interval
+        self.snapshot = self._scan()
+        self.scanned = time.monotonic()
+
+    def _scan(self):
+        snapshot = {}
+        for directory in self.directories:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue  # removed while scanning
+                        snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError as e:
+                raise WatchError("cannot scan [{0}]: {1}".format(directory, e))
+        return snapshot
+
+    def read(self, timeout=None):
+        """As :meth:`InotifyWatcher.read`, changes show up at the next scan."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.scanned + self.interval - time.monotonic()
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+            if wait > 0:
+                time.sleep(wait)
+            now = time.monotonic()
+            if now >= self.scanned + self.interval:
+                snapshot = self._scan()
+                self.scanned = now
+                changed = set(
+                    path for path in set(snapshot) | set(self.snapshot)
+                    if snapshot.get(path) != self.snapshot.get(path)
+                )
+                self.snapshot = snapshot
+                if changed:
+                    return changed
+            if deadline is not None and now >= deadline:
+                return set()
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_watcher(directories, poll_interval=None):
+    """
+    An :class:`InotifyWatcher` of ``directories``, or a :class:`PollingWatcher`
+    when inotify is unavailable or ``poll_interval`` is given.
+    """
+    if poll_interval is None:
+        try:
+            return InotifyWatcher(directories)
+        except WatchError:
+            poll_interval = DEFAULT_POLL_INTERVAL
+    return PollingWatcher(directories, poll_interval)
+
+
+def watch(watcher, rebuild, debounce=DEFAULT_DEBOUNCE, max_latency=DEFAULT_MAX_LATENCY,
+          max_queue=DEFAULT_MAX_QUEUE):
+    """
+    Call ``rebuild(paths, first)`` with every batch of changed ``paths`` read from
+    ``watcher``, ``first`` being the :func:`time.monotonic` time of the first
+    change of the batch (see the module documentation for when a batch ends).
+    Changes made while rebuilding go into the next batch.  Runs until
+    interrupted.
+    """
+    while True:
+        paths = watcher.read()
+        if not paths:
+            continue
+        first = last = time.monotonic()
+        while len(paths) < max_queue:
+            remaining = min(last + debounce, first + max_latency) - time.monotonic()
+            if remaining <= 0:
+                break
+            more = watcher.read(remaining)
+            if more:
+                paths |= more
+                last = time.monotonic()
+        rebuild(paths, first)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Print the batches of changes in directories, as manufacture.py --watch "
+                    "would rebuild them."
+    )
+    parser.add_argument("directories", nargs="+", help="The directories to watch.")
+    parser.add_argument(
+        "--poll",
+        type=float,
+        nargs="?",
+        const=DEFAULT_POLL_INTERVAL,
+        metavar="SECONDS",
+        help="Scan the directories every SECONDS instead of using inotify "
+             "(default: %(const)s)."
+    )
+    args = parser.parse_args()
+
+    def show(paths, first):
+        print("{0} changes in {1:.3f}s:".format(len(paths), time.monotonic() - first))
+        for path in sorted(paths):
+            print("    {0}".format(path))
+
+    try:
+        with open_watcher(args.directories, args.poll) as watcher:
+            print("Watching with {0}, Ctrl+C to stop.".format(watcher.kind))
+            watch(watcher, show)
+    except WatchError as e:
+        sys.stderr.write("Critical: {0}\n".format(e))
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass